@@ -9,6 +9,9 @@ This module provides:
 - run_followup_planner: Follow-up planner for completed specs
 - Memory management (Graphiti + file-based fallback)
 - Session management and post-processing
+- Prefetching the next subtask's prompt during a session
+- Parallel subtask sessions for parallel-safe phases
+- Building several specs concurrently (run.py --specs)
 - Utility functions for git and plan management
 """
 
@@ -29,18 +32,42 @@ from .memory_manager import (
 )
 from .planner import run_followup_planner
 
+# Background post-session work
+from .post_session_queue import PostSessionQueue
+
+# Prompt prefetching
+from .prefetch import (
+    SubtaskPrefetcher,
+    build_prompt_bundle,
+)
+
 # Session management
 from .session import (
     post_session_processing,
     run_agent_session,
 )
 
+# Concurrent spec builds
+from .spec_pool import (
+    SpecBuild,
+    SpecBuildResult,
+    run_spec_builds,
+)
+
+# Parallel subtasks
+from .subtask_pool import (
+    SubtaskWorkerResult,
+    run_parallel_subtasks,
+)
+
 # Utility functions
 from .utils import (
     find_phase_for_subtask,
     find_subtask_in_plan,
     get_commit_count,
+    get_commit_count_async,
     get_latest_commit,
+    get_latest_commit_async,
     load_implementation_plan,
     sync_plan_to_source,
 )
@@ -57,9 +84,23 @@ __all__ = [
     # Session
     "run_agent_session",
     "post_session_processing",
+    # Background post-session work
+    "PostSessionQueue",
+    # Prompt prefetching
+    "SubtaskPrefetcher",
+    "build_prompt_bundle",
+    # Parallel subtasks
+    "run_parallel_subtasks",
+    "SubtaskWorkerResult",
+    # Concurrent spec builds
+    "run_spec_builds",
+    "SpecBuild",
+    "SpecBuildResult",
     # Utils
     "get_latest_commit",
     "get_commit_count",
+    "get_latest_commit_async",
+    "get_commit_count_async",
     "load_implementation_plan",
     "find_subtask_in_plan",
     "find_phase_for_subtask",
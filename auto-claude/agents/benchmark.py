@@ -0,0 +1,347 @@
+"""
+Session Replay Benchmark
+========================
+
+Measures run_agent_session against recorded message streams.
+
+A recording is the list of messages a session received from the Claude
+Agent SDK, serialized to JSON (see serialize_message). The benchmark replays
+it through a fake client, so the same stream can be measured on two commits
+without a model in the loop. Without a recording, a synthetic stream of
+text blocks and tool calls is generated.
+
+For the replay it records wall time, how often task_logs.json was written,
+bytes written and peak RSS (see merge.benchmark.measure_stage). Console
+output, including the task logger's streaming markers, is discarded. The
+report is JSON so runs from two commits can be compared with --compare.
+
+Recording format (a JSON list):
+    [
+      {"type": "AssistantMessage", "content": [
+        {"type": "TextBlock", "text": "Reading the file..."},
+        {"type": "ToolUseBlock", "name": "Read", "input": {"file_path": "a.py"}}
+      ]},
+      {"type": "UserMessage", "content": [
+        {"type": "ToolResultBlock", "content": "...", "is_error": false}
+      ]}
+    ]
+
+Usage:
+    cd auto-claude
+    python -m agents.benchmark --text-blocks 5000 --tool-calls 500
+    python -m agents.benchmark --recording session.json --output after.json
+    python -m agents.benchmark --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import tempfile
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from merge.benchmark import StageMetrics, measure_stage
+from task_logger import LogPhase, clear_task_logger
+from task_logger.storage import LogStorage
+
+from .session import run_agent_session
+
+# Relative change below which --compare doesn't flag a metric
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+# Metrics compared between reports
+COMPARED_METRICS = ("wall_seconds", "log_writes", "bytes_written", "peak_rss_kb")
+
+# Block attributes kept in recordings
+_BLOCK_FIELDS = ("text", "name", "input", "content", "is_error", "tool_use_id")
+
+
+@dataclass
+class ReplayConfig:
+    """Shape of a synthetic message stream."""
+
+    text_blocks: int = 2000
+    text_chars: int = 200  # Characters per text block
+    tool_calls: int = 200
+    result_chars: int = 2000  # Characters per tool result
+
+
+def serialize_message(msg: Any) -> dict[str, Any]:
+    """
+    Convert an SDK message to its recording form.
+
+    Args:
+        msg: Message received from ClaudeSDKClient.receive_response()
+
+    Returns:
+        JSON-serializable dict (see the module docstring)
+    """
+    content = getattr(msg, "content", None)
+    record: dict[str, Any] = {"type": type(msg).__name__}
+    if isinstance(content, list):
+        record["content"] = [
+            {
+                "type": type(block).__name__,
+                **{
+                    name: getattr(block, name)
+                    for name in _BLOCK_FIELDS
+                    if hasattr(block, name)
+                },
+            }
+            for block in content
+        ]
+    elif content is not None:
+        record["content"] = content
+    return record
+
+
+def _revive(record: dict[str, Any]) -> Any:
+    """Turn a recorded message or block back into an object of the same type name."""
+    fields = dict(record)
+    type_name = fields.pop("type")
+    if isinstance(fields.get("content"), list):
+        fields["content"] = [
+            _revive(item) if isinstance(item, dict) and "type" in item else item
+            for item in fields["content"]
+        ]
+    # run_agent_session dispatches on type(obj).__name__
+    return type(type_name, (), fields)()
+
+
+def synthetic_recording(config: ReplayConfig) -> list[dict[str, Any]]:
+    """
+    Generate a message stream with text blocks and tool calls interleaved.
+
+    Args:
+        config: Stream shape
+
+    Returns:
+        Recording (see the module docstring)
+    """
+    messages = []
+    text = ("The change looks right so far. " * (config.text_chars // 31 + 1))[
+        : config.text_chars
+    ]
+    result = ("line of tool output\n" * (config.result_chars // 20 + 1))[
+        : config.result_chars
+    ]
+    # Spread the tool calls evenly between the text blocks
+    every = config.text_blocks // config.tool_calls if config.tool_calls else 0
+    tools_left = config.tool_calls
+    for i in range(config.text_blocks):
+        messages.append(
+            {
+                "type": "AssistantMessage",
+                "content": [{"type": "TextBlock", "text": text}],
+            }
+        )
+        if tools_left and every and (i + 1) % every == 0:
+            tools_left -= 1
+            messages.append(
+                {
+                    "type": "AssistantMessage",
+                    "content": [
+                        {
+                            "type": "ToolUseBlock",
+                            "name": "Read",
+                            "input": {"file_path": f"src/module_{i}.py"},
+                        }
+                    ],
+                }
+            )
+            messages.append(
+                {
+                    "type": "UserMessage",
+                    "content": [
+                        {
+                            "type": "ToolResultBlock",
+                            "content": result,
+                            "is_error": False,
+                        }
+                    ],
+                }
+            )
+    messages.append({"type": "ResultMessage"})
+    return messages
+
+
+class ReplayClient:
+    """Stands in for ClaudeSDKClient, yielding a recorded message stream."""
+
+    def __init__(self, recording: list[dict[str, Any]]):
+        self.messages = [_revive(record) for record in recording]
+
+    async def query(self, message: str) -> None:
+        pass
+
+    async def receive_response(self) -> AsyncIterator[Any]:
+        for msg in self.messages:
+            yield msg
+
+
+@contextmanager
+def count_log_writes() -> Iterator[dict[str, int]]:
+    """Count LogStorage.save calls (each one rewrites task_logs.json)."""
+    original_save = LogStorage.save
+    counter = {"count": 0}
+
+    def counting_save(self):
+        counter["count"] += 1
+        original_save(self)
+
+    LogStorage.save = counting_save
+    try:
+        yield counter
+    finally:
+        LogStorage.save = original_save
+
+
+def run_replay(
+    recording: list[dict[str, Any]], work_dir: Path | None = None
+) -> dict[str, Any]:
+    """
+    Replay a message stream through run_agent_session and measure it.
+
+    Args:
+        recording: Messages to replay (see the module docstring)
+        work_dir: Directory for the spec directory (default: a temporary
+            directory that is removed afterwards)
+
+    Returns:
+        JSON-serializable report
+    """
+    if work_dir is None:
+        with tempfile.TemporaryDirectory(prefix="session-bench-") as tmp:
+            return run_replay(recording, Path(tmp))
+
+    spec_dir = Path(work_dir) / "spec"
+    spec_dir.mkdir(parents=True, exist_ok=True)
+    client = ReplayClient(recording)
+    metrics = StageMetrics()
+    clear_task_logger()
+    try:
+        with (
+            count_log_writes() as writes,
+            contextlib.redirect_stdout(io.StringIO()),
+            measure_stage(metrics),
+        ):
+            status, response = asyncio.run(
+                run_agent_session(client, "replay", spec_dir, phase=LogPhase.CODING)
+            )
+    finally:
+        clear_task_logger()
+
+    return {
+        "messages": len(recording),
+        "status": status,
+        "response_chars": len(response),
+        "replay": {
+            "wall_seconds": metrics.wall_seconds,
+            "log_writes": writes["count"],
+            "bytes_written": metrics.bytes_written,
+            "peak_rss_kb": metrics.peak_rss_kb,
+        },
+    }
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """
+    Compare the replay metrics of two reports.
+
+    Args:
+        baseline: Report from the reference commit
+        current: Report from the commit under test
+        threshold: Relative increase that counts as a regression
+
+    Returns:
+        One entry per metric with both values, the relative change, and
+        whether it regressed
+    """
+    rows = []
+    old, new = baseline.get("replay", {}), current.get("replay", {})
+    for metric in COMPARED_METRICS:
+        before, after = old.get(metric), new.get(metric)
+        if before is None or after is None:
+            continue
+        change = (after - before) / before if before else 0.0
+        rows.append(
+            {
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "change": change,
+                "regressed": change > threshold,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark run_agent_session on a recorded message stream"
+    )
+    parser.add_argument(
+        "--recording", type=Path, help="Recorded messages (default: synthetic)"
+    )
+    parser.add_argument(
+        "--text-blocks", type=int, default=2000, help="Synthetic text blocks"
+    )
+    parser.add_argument(
+        "--text-chars", type=int, default=200, help="Characters per text block"
+    )
+    parser.add_argument("--tool-calls", type=int, default=200, help="Synthetic tools")
+    parser.add_argument(
+        "--result-chars", type=int, default=2000, help="Characters per tool result"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="Baseline report to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Relative increase reported as a regression",
+    )
+    args = parser.parse_args()
+
+    if args.recording:
+        recording = json.loads(args.recording.read_text())
+        report_config: dict[str, Any] = {"recording": str(args.recording)}
+    else:
+        config = ReplayConfig(
+            text_blocks=args.text_blocks,
+            text_chars=args.text_chars,
+            tool_calls=args.tool_calls,
+            result_chars=args.result_chars,
+        )
+        recording = synthetic_recording(config)
+        report_config = asdict(config)
+
+    report = {"config": report_config, **run_replay(recording)}
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        report["comparison"] = compare_reports(baseline, report, args.threshold)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+
+    if any(row["regressed"] for row in report.get("comparison", [])):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,13 @@ Main autonomous agent loop that runs the coder agent to implement subtasks.
 
 import asyncio
 import logging
+from functools import partial
 from pathlib import Path
 
 from core.client import create_client
+from core.plan_store import get_plan_store
+from core.rate_limiter import get_rate_limiter
+from core.subtask_scheduler import SubtaskScheduler
 from linear_updater import (
     LinearTaskState,
     is_linear_enabled,
@@ -22,18 +26,12 @@ from progress import (
     count_subtasks,
     count_subtasks_detailed,
     get_current_phase,
-    get_next_subtask,
     is_build_complete,
     print_build_complete_banner,
     print_progress_summary,
     print_session_header,
 )
-from prompt_generator import (
-    format_context_for_prompt,
-    generate_planner_prompt,
-    generate_subtask_prompt,
-    load_subtask_context,
-)
+from prompt_generator import generate_planner_prompt
 from prompts import is_first_run
 from recovery import RecoveryManager
 from task_logger import (
@@ -54,12 +52,15 @@ from ui import (
 )
 
 from .base import AUTO_CONTINUE_DELAY_SECONDS, HUMAN_INTERVENTION_FILE
-from .memory_manager import debug_memory_system_status, get_graphiti_context
+from .memory_manager import debug_memory_system_status
+from .post_session_queue import PostSessionQueue
+from .prefetch import SubtaskPrefetcher, build_prompt_bundle
 from .session import post_session_processing, run_agent_session
+from .subtask_pool import run_parallel_subtasks
 from .utils import (
     find_phase_for_subtask,
-    get_commit_count,
-    get_latest_commit,
+    get_commit_count_async,
+    get_latest_commit_async,
     load_implementation_plan,
     sync_plan_to_source,
 )
@@ -67,6 +68,34 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+async def _finish_build(
+    spec_dir: Path,
+    status_manager: StatusManager,
+    task_logger,
+    linear_task: LinearTaskState | None,
+    post_session_queue: PostSessionQueue,
+) -> None:
+    """Report a completed build (banner, status, task log and Linear)."""
+    # Earlier sessions' memory and Linear updates go first
+    await post_session_queue.flush()
+
+    print_build_complete_banner(spec_dir)
+    status_manager.update(state=BuildState.COMPLETE)
+
+    # End coding phase in task logger
+    if task_logger:
+        task_logger.end_phase(
+            LogPhase.CODING,
+            success=True,
+            message="All subtasks completed successfully",
+        )
+
+    # Notify Linear that build is complete (moving to QA)
+    if linear_task and linear_task.task_id:
+        await linear_build_complete(spec_dir)
+        print_status("Linear notified: build complete, ready for QA", "success")
+
+
 async def run_autonomous_agent(
     project_dir: Path,
     spec_dir: Path,
@@ -74,6 +103,8 @@ async def run_autonomous_agent(
     max_iterations: int | None = None,
     verbose: bool = False,
     source_spec_dir: Path | None = None,
+    subtask_workers: int = 1,
+    status_manager: StatusManager | None = None,
 ) -> None:
     """
     Run the autonomous agent loop with automatic memory management.
@@ -81,6 +112,9 @@ async def run_autonomous_agent(
     The agent can use subagents (via Task tool) for parallel execution if needed.
     This is decided by the agent itself based on the task complexity.
 
+    With subtask_workers > 1, pending subtasks of a parallel_safe phase also
+    run as concurrent sessions, each in its own worktree (see subtask_pool).
+
     Args:
         project_dir: Root directory for the project
         spec_dir: Directory containing the spec (auto-claude/specs/001-name/)
@@ -88,12 +122,33 @@ async def run_autonomous_agent(
         max_iterations: Maximum number of iterations (None for unlimited)
         verbose: Whether to show detailed output
         source_spec_dir: Original spec directory in main project (for syncing from worktree)
+        subtask_workers: Maximum concurrent subtask sessions (1 runs serially)
+        status_manager: Where to report build status (default: the project's
+            status file; multi-spec builds pass a SpecStatusManager)
     """
     # Initialize recovery manager (handles memory persistence)
     recovery_manager = RecoveryManager(spec_dir, project_dir)
 
+    # One scheduler for the whole run, kept up to date from the plan store
+    plan_store = get_plan_store(spec_dir)
+    scheduler = SubtaskScheduler(plan_store.get() or {})
+
+    # Insight extraction, memory saves and Linear comments run in the
+    # background while the next session runs
+    post_session_queue = PostSessionQueue()
+
+    # Builds the next subtask's prompt while the current session runs
+    prefetcher = SubtaskPrefetcher(
+        spec_dir,
+        project_dir,
+        recovery_manager,
+        scheduler=scheduler,
+        post_session_queue=post_session_queue,
+    )
+
     # Initialize status manager for ccstatusline
-    status_manager = StatusManager(project_dir)
+    if status_manager is None:
+        status_manager = StatusManager(project_dir)
     status_manager.set_active(spec_dir.name, BuildState.BUILDING)
 
     # Initialize task logger for persistent logging
@@ -109,6 +164,8 @@ async def run_autonomous_agent(
         total=subtasks["total"],
         in_progress=subtasks["in_progress"],
     )
+    if subtask_workers > 1:
+        status_manager.update_workers(0, subtask_workers)
 
     # Check Linear integration status
     linear_task = None
@@ -186,261 +243,356 @@ async def run_autonomous_agent(
     # Main loop
     iteration = 0
 
-    while True:
-        iteration += 1
-
-        # Check for human intervention (PAUSE file)
-        pause_file = spec_dir / HUMAN_INTERVENTION_FILE
-        if pause_file.exists():
-            print("\n" + "=" * 70)
-            print("  PAUSED BY HUMAN")
-            print("=" * 70)
+    # Show API request queue wait times in the status file
+    def show_rate_limit(stats) -> None:
+        info = stats.to_dict()
+        status_manager.update_rate_limit(
+            info["waiting"], info["last_wait_seconds"], info["average_wait_seconds"]
+        )
 
-            pause_content = pause_file.read_text().strip()
-            if pause_content:
-                print(f"\nMessage: {pause_content}")
+    remove_rate_limit_listener = get_rate_limiter().add_listener(show_rate_limit)
+    stop_following_plan = scheduler.follow(plan_store)
+
+    try:
+        while True:
+            iteration += 1
+
+            # Check for human intervention (PAUSE file)
+            pause_file = spec_dir / HUMAN_INTERVENTION_FILE
+            if pause_file.exists():
+                print("\n" + "=" * 70)
+                print("  PAUSED BY HUMAN")
+                print("=" * 70)
+
+                pause_content = pause_file.read_text().strip()
+                if pause_content:
+                    print(f"\nMessage: {pause_content}")
+
+                print("\nTo resume, delete the PAUSE file:")
+                print(f"  rm {pause_file}")
+                print("\nThen run again:")
+                print(f"  python auto-claude/run.py --spec {spec_dir.name}")
+                return
+
+            # Check max iterations
+            if max_iterations and iteration > max_iterations:
+                print(f"\nReached max iterations ({max_iterations})")
+                print("To continue, run the script again without --max-iterations")
+                break
 
-            print("\nTo resume, delete the PAUSE file:")
-            print(f"  rm {pause_file}")
-            print("\nThen run again:")
-            print(f"  python auto-claude/run.py --spec {spec_dir.name}")
-            return
+            # Pick up plan edits made by the last session
+            plan_store.get()
 
-        # Check max iterations
-        if max_iterations and iteration > max_iterations:
-            print(f"\nReached max iterations ({max_iterations})")
-            print("To continue, run the script again without --max-iterations")
-            break
-
-        # Get the next subtask to work on
-        next_subtask = get_next_subtask(spec_dir)
-        subtask_id = next_subtask.get("id") if next_subtask else None
-        phase_name = next_subtask.get("phase_name") if next_subtask else None
-
-        # Update status for this session
-        status_manager.update_session(iteration)
-        if phase_name:
-            current_phase = get_current_phase(spec_dir)
-            if current_phase:
-                status_manager.update_phase(
-                    current_phase.get("name", ""),
-                    current_phase.get("phase", 0),
-                    current_phase.get("total", 0),
+            # Independent subtasks of a parallel-safe phase run side by side
+            batch = (
+                scheduler.claim(subtask_workers)
+                if subtask_workers > 1 and not first_run
+                else []
+            )
+            if len(batch) == 1:
+                # Runs as a normal session below
+                scheduler.release(batch[0]["id"])
+            if len(batch) > 1:
+                if is_planning_phase:
+                    is_planning_phase = False
+                    current_log_phase = LogPhase.CODING
+                    if task_logger:
+                        task_logger.end_phase(
+                            LogPhase.PLANNING,
+                            success=True,
+                            message="Implementation plan created",
+                        )
+                        task_logger.start_phase(
+                            LogPhase.CODING, "Starting implementation..."
+                        )
+
+                status_manager.update_session(iteration)
+                await run_parallel_subtasks(
+                    project_dir=project_dir,
+                    spec_dir=spec_dir,
+                    subtasks=batch,
+                    model=model,
+                    session_num=iteration,
+                    recovery_manager=recovery_manager,
+                    status_manager=status_manager,
+                    max_workers=subtask_workers,
+                    verbose=verbose,
+                    linear_enabled=linear_task is not None
+                    and linear_task.task_id is not None,
+                    source_spec_dir=source_spec_dir,
+                    post_session_queue=post_session_queue,
+                    scheduler=scheduler,
                 )
-        status_manager.update_subtasks(in_progress=1)
-
-        # Print session header
-        print_session_header(
-            session_num=iteration,
-            is_planner=first_run,
-            subtask_id=subtask_id,
-            subtask_desc=next_subtask.get("description") if next_subtask else None,
-            phase_name=phase_name,
-            attempt=recovery_manager.get_attempt_count(subtask_id) + 1
-            if subtask_id
-            else 1,
-        )
-
-        # Capture state before session for post-processing
-        commit_before = get_latest_commit(project_dir)
-        commit_count_before = get_commit_count(project_dir)
-
-        # Get the phase-specific model and thinking level (respects task_metadata.json configuration)
-        # first_run means we're in planning phase, otherwise coding phase
-        current_phase = "planning" if first_run else "coding"
-        phase_model = get_phase_model(spec_dir, current_phase, model)
-        phase_thinking_budget = get_phase_thinking_budget(spec_dir, current_phase)
-
-        # Create client (fresh context) with phase-specific model and thinking
-        client = create_client(
-            project_dir,
-            spec_dir,
-            phase_model,
-            max_thinking_tokens=phase_thinking_budget,
-        )
-
-        # Generate appropriate prompt
-        if first_run:
-            prompt = generate_planner_prompt(spec_dir, project_dir)
-            first_run = False
-            current_log_phase = LogPhase.PLANNING
 
-            # Set session info in logger
-            if task_logger:
-                task_logger.set_session(iteration)
-        else:
-            # Switch to coding phase after planning
-            if is_planning_phase:
-                is_planning_phase = False
-                current_log_phase = LogPhase.CODING
-                if task_logger:
-                    task_logger.end_phase(
-                        LogPhase.PLANNING,
-                        success=True,
-                        message="Implementation plan created",
+                if is_build_complete(spec_dir):
+                    await _finish_build(
+                        spec_dir,
+                        status_manager,
+                        task_logger,
+                        linear_task,
+                        post_session_queue,
                     )
-                    task_logger.start_phase(
-                        LogPhase.CODING, "Starting implementation..."
+                    break
+
+                print_progress_summary(spec_dir)
+                status_manager.update(state=BuildState.BUILDING)
+                print("\nPreparing next session...\n")
+                await asyncio.sleep(1)
+                continue
+
+            # Get the next subtask to work on
+            claimed = scheduler.claim(1)
+            next_subtask = claimed[0] if claimed else None
+            subtask_id = next_subtask.get("id") if next_subtask else None
+            phase_name = next_subtask.get("phase_name") if next_subtask else None
+
+            # Update status for this session
+            status_manager.update_session(iteration)
+            if phase_name:
+                current_phase = get_current_phase(spec_dir)
+                if current_phase:
+                    status_manager.update_phase(
+                        current_phase.get("name", ""),
+                        current_phase.get("phase", 0),
+                        current_phase.get("total", 0),
                     )
+            status_manager.update_subtasks(in_progress=1)
 
-            if not next_subtask:
-                print("No pending subtasks found - build may be complete!")
-                break
-
-            # Get attempt count for recovery context
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
+            # Print session header
+            print_session_header(
+                session_num=iteration,
+                is_planner=first_run,
+                subtask_id=subtask_id,
+                subtask_desc=next_subtask.get("description") if next_subtask else None,
+                phase_name=phase_name,
+                attempt=recovery_manager.get_attempt_count(subtask_id) + 1
+                if subtask_id
+                else 1,
             )
 
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
-
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
+            # Capture state before session for post-processing
+            commit_before, commit_count_before = await asyncio.gather(
+                get_latest_commit_async(project_dir),
+                get_commit_count_async(project_dir),
             )
 
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
-
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
+            # Get the phase-specific model and thinking level (respects task_metadata.json configuration)
+            # first_run means we're in planning phase, otherwise coding phase
+            current_phase = "planning" if first_run else "coding"
+            phase_model = get_phase_model(spec_dir, current_phase, model)
+            phase_thinking_budget = get_phase_thinking_budget(spec_dir, current_phase)
+
+            # Create client (fresh context) with phase-specific model and thinking
+            client = create_client(
+                project_dir,
+                spec_dir,
+                phase_model,
+                max_thinking_tokens=phase_thinking_budget,
             )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
-
-            # Show what we're working on
-            print(f"Working on: {highlight(subtask_id)}")
-            print(f"Description: {next_subtask.get('description', 'No description')}")
-            if attempt_count > 0:
-                print_status(f"Previous attempts: {attempt_count}", "warning")
-            print()
 
-        # Set subtask info in logger
-        if task_logger and subtask_id:
-            task_logger.set_subtask(subtask_id)
-            task_logger.set_session(iteration)
+            # Generate appropriate prompt
+            if first_run:
+                prompt = generate_planner_prompt(spec_dir, project_dir)
+                first_run = False
+                current_log_phase = LogPhase.PLANNING
 
-        # Run session with async context manager
-        async with client:
-            status, response = await run_agent_session(
-                client, prompt, spec_dir, verbose, phase=current_log_phase
-            )
+                # Set session info in logger
+                if task_logger:
+                    task_logger.set_session(iteration)
+            else:
+                # Switch to coding phase after planning
+                if is_planning_phase:
+                    is_planning_phase = False
+                    current_log_phase = LogPhase.CODING
+                    if task_logger:
+                        task_logger.end_phase(
+                            LogPhase.PLANNING,
+                            success=True,
+                            message="Implementation plan created",
+                        )
+                        task_logger.start_phase(
+                            LogPhase.CODING, "Starting implementation..."
+                        )
+
+                if not next_subtask:
+                    print("No pending subtasks found - build may be complete!")
+                    break
+
+                # Get attempt count for recovery context
+                attempt_count = recovery_manager.get_attempt_count(subtask_id)
+                recovery_hints = (
+                    recovery_manager.get_recovery_hints(subtask_id)
+                    if attempt_count > 0
+                    else None
+                )
 
-        # === POST-SESSION PROCESSING (100% reliable) ===
-        if subtask_id and not first_run:
-            linear_is_enabled = (
-                linear_task is not None and linear_task.task_id is not None
-            )
-            success = await post_session_processing(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=iteration,
-                commit_before=commit_before,
-                commit_count_before=commit_count_before,
-                recovery_manager=recovery_manager,
-                linear_enabled=linear_is_enabled,
-                status_manager=status_manager,
-                source_spec_dir=source_spec_dir,
-            )
+                # Find the phase for this subtask
+                plan = load_implementation_plan(spec_dir)
+                phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
 
-            # Check for stuck subtasks
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            if not success and attempt_count >= 3:
-                recovery_manager.mark_subtask_stuck(
-                    subtask_id, f"Failed after {attempt_count} attempts"
-                )
-                print()
-                print_status(
-                    f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
-                    "error",
+                # Generate focused, minimal prompt for this subtask, with relevant
+                # file context and Graphiti memory context (if enabled). Reuse the
+                # one prefetched during the previous session if it's still valid.
+                bundle = await prefetcher.take(
+                    next_subtask, phase or {}, attempt_count, recovery_hints
                 )
-                print(muted("Consider: manual intervention or skipping this subtask"))
-
-                # Record stuck subtask in Linear (if enabled)
-                if linear_is_enabled:
-                    await linear_task_stuck(
-                        spec_dir=spec_dir,
-                        subtask_id=subtask_id,
-                        attempt_count=attempt_count,
+                if bundle is None:
+                    bundle = await build_prompt_bundle(
+                        spec_dir,
+                        project_dir,
+                        next_subtask,
+                        phase or {},
+                        attempt_count,
+                        recovery_hints,
+                        post_session_queue=post_session_queue,
                     )
-                    print_status("Linear notified of stuck subtask", "info")
-        elif is_planning_phase and source_spec_dir:
-            # After planning phase, sync the newly created implementation plan back to source
-            if sync_plan_to_source(spec_dir, source_spec_dir):
-                print_status("Implementation plan synced to main project", "success")
-
-        # Handle session status
-        if status == "complete":
-            print_build_complete_banner(spec_dir)
-            status_manager.update(state=BuildState.COMPLETE)
+                prompt = bundle.prompt
+                if bundle.graphiti_context:
+                    print_status("Graphiti memory context loaded", "success")
 
-            # End coding phase in task logger
-            if task_logger:
-                task_logger.end_phase(
-                    LogPhase.CODING,
-                    success=True,
-                    message="All subtasks completed successfully",
+                # Show what we're working on
+                print(f"Working on: {highlight(subtask_id)}")
+                print(
+                    f"Description: {next_subtask.get('description', 'No description')}"
                 )
+                if attempt_count > 0:
+                    print_status(f"Previous attempts: {attempt_count}", "warning")
+                if bundle.budget is not None:
+                    print_status(f"Prompt context: {bundle.budget.summary()}", "info")
+                print()
 
-            # Notify Linear that build is complete (moving to QA)
-            if linear_task and linear_task.task_id:
-                await linear_build_complete(spec_dir)
-                print_status("Linear notified: build complete, ready for QA", "success")
+            # Set subtask info in logger
+            if task_logger and subtask_id:
+                task_logger.set_subtask(subtask_id)
+                task_logger.set_session(iteration)
 
-            break
+            # Speculatively prepare the subtask likely to come next
+            if subtask_id:
+                prefetcher.start(subtask_id)
 
-        elif status == "continue":
-            print(
-                muted(
-                    f"\nAgent will auto-continue in {AUTO_CONTINUE_DELAY_SECONDS}s..."
+            # Run session with async context manager
+            async with client:
+                status, response = await run_agent_session(
+                    client, prompt, spec_dir, verbose, phase=current_log_phase
                 )
-            )
-            print_progress_summary(spec_dir)
 
-            # Update state back to building
-            status_manager.update(state=BuildState.BUILDING)
-
-            # Show next subtask info
-            next_subtask = get_next_subtask(spec_dir)
-            if next_subtask:
-                subtask_id = next_subtask.get("id")
-                print(
-                    f"\nNext: {highlight(subtask_id)} - {next_subtask.get('description')}"
+            # === POST-SESSION PROCESSING (100% reliable) ===
+            if subtask_id and not first_run:
+                linear_is_enabled = (
+                    linear_task is not None and linear_task.task_id is not None
+                )
+                success = await post_session_processing(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=iteration,
+                    commit_before=commit_before,
+                    commit_count_before=commit_count_before,
+                    recovery_manager=recovery_manager,
+                    linear_enabled=linear_is_enabled,
+                    status_manager=status_manager,
+                    source_spec_dir=source_spec_dir,
+                    post_session_queue=post_session_queue,
                 )
 
+                # Check for stuck subtasks
                 attempt_count = recovery_manager.get_attempt_count(subtask_id)
-                if attempt_count > 0:
+                if not success and attempt_count >= 3:
+                    recovery_manager.mark_subtask_stuck(
+                        subtask_id, f"Failed after {attempt_count} attempts"
+                    )
+                    print()
                     print_status(
-                        f"WARNING: {attempt_count} previous attempt(s)", "warning"
+                        f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
+                        "error",
+                    )
+                    print(
+                        muted("Consider: manual intervention or skipping this subtask")
                     )
 
-            await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+                    # Record stuck subtask in Linear (if enabled), after
+                    # this session's own comment
+                    if linear_is_enabled:
+                        post_session_queue.submit(
+                            f"Linear stuck notice for {subtask_id}",
+                            partial(
+                                linear_task_stuck,
+                                spec_dir=spec_dir,
+                                subtask_id=subtask_id,
+                                attempt_count=attempt_count,
+                            ),
+                            key="linear",
+                        )
+            elif is_planning_phase and source_spec_dir:
+                # After planning phase, sync the newly created implementation plan back to source
+                if sync_plan_to_source(spec_dir, source_spec_dir):
+                    print_status(
+                        "Implementation plan synced to main project", "success"
+                    )
 
-        elif status == "error":
-            print_status("Session encountered an error", "error")
-            print(muted("Will retry with a fresh session..."))
-            status_manager.update(state=BuildState.ERROR)
-            await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+            # Hand the subtask back to the scheduler unless it's now completed
+            if subtask_id:
+                plan_store.get()
+                if scheduler.status(subtask_id) == "completed":
+                    scheduler.mark_completed(subtask_id)
+                else:
+                    scheduler.release(subtask_id)
+
+            # Handle session status
+            if status == "complete":
+                await _finish_build(
+                    spec_dir,
+                    status_manager,
+                    task_logger,
+                    linear_task,
+                    post_session_queue,
+                )
+                break
+
+            elif status == "continue":
+                print(
+                    muted(
+                        f"\nAgent will auto-continue in {AUTO_CONTINUE_DELAY_SECONDS}s..."
+                    )
+                )
+                print_progress_summary(spec_dir)
+
+                # Update state back to building
+                status_manager.update(state=BuildState.BUILDING)
+
+                # Show next subtask info
+                ready = scheduler.next_ready(1)
+                next_subtask = ready[0] if ready else None
+                if next_subtask:
+                    subtask_id = next_subtask.get("id")
+                    print(
+                        f"\nNext: {highlight(subtask_id)} - {next_subtask.get('description')}"
+                    )
 
-        # Small delay between sessions
-        if max_iterations is None or iteration < max_iterations:
-            print("\nPreparing next session...\n")
-            await asyncio.sleep(1)
+                    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+                    if attempt_count > 0:
+                        print_status(
+                            f"WARNING: {attempt_count} previous attempt(s)", "warning"
+                        )
+
+                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+
+            elif status == "error":
+                print_status("Session encountered an error", "error")
+                print(muted("Will retry with a fresh session..."))
+                status_manager.update(state=BuildState.ERROR)
+                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+
+            # Small delay between sessions
+            if max_iterations is None or iteration < max_iterations:
+                print("\nPreparing next session...\n")
+                await asyncio.sleep(1)
+    finally:
+        remove_rate_limit_listener()
+        stop_following_plan()
+        prefetcher.cancel()
+        # Nothing queued is lost when the build ends or is interrupted
+        await post_session_queue.flush()
 
     # Final summary
     content = [
@@ -0,0 +1,190 @@
+"""
+Background Post-Session Queue
+=============================
+
+Runs the slow parts of post-session processing in the background.
+
+After a session, only the plan and status checks decide what runs next.
+Insight extraction (an extra LLM call), memory saves (Graphiti) and Linear
+comments don't, so they run here while the next session streams:
+- At most MAX_CONCURRENT_JOBS jobs run at a time
+- A failed job is retried up to MAX_JOB_ATTEMPTS times, with backoff
+- Jobs with the same key (e.g. all Linear comments) run in submission order
+- flush() waits for everything submitted so far; the coder calls it before
+  the build finishes and when it's interrupted, so nothing is lost
+- wait_for_key() waits for the jobs of one key, e.g. memory saves before
+  Graphiti is queried for the next prompt
+
+Usage:
+    queue = PostSessionQueue()
+    queue.submit("memory:1.1", save_memory, key="memory")
+    ...
+    await queue.flush()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from debug import debug, debug_warning
+
+logger = logging.getLogger(__name__)
+
+MODULE = "agents.post_session_queue"
+
+# Background jobs running at the same time
+MAX_CONCURRENT_JOBS = 2
+
+# Attempts per job before it's given up
+MAX_JOB_ATTEMPTS = 3
+
+# Delay before the first retry (doubled for each later one)
+RETRY_DELAY_SECONDS = 2.0
+
+# How long flush() waits by default before giving up on unfinished jobs
+FLUSH_TIMEOUT_SECONDS = 300.0
+
+
+@dataclass
+class JobFailure:
+    """A background job that failed every attempt."""
+
+    name: str
+    attempts: int
+    error: str
+
+
+class PostSessionQueue:
+    """Bounded, retrying background queue for post-session work."""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_JOBS,
+        max_attempts: int = MAX_JOB_ATTEMPTS,
+        retry_delay: float = RETRY_DELAY_SECONDS,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        self._tasks: set[asyncio.Task] = set()
+        # Last task submitted per key, so jobs with the same key run in order
+        self._last_by_key: dict[str, asyncio.Task] = {}
+        self.failures: list[JobFailure] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs not finished yet."""
+        return sum(1 for task in self._tasks if not task.done())
+
+    def submit(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[object]],
+        key: str | None = None,
+    ) -> asyncio.Task:
+        """
+        Schedule a job to run in the background.
+
+        The job is retried when it raises. It's called again for each attempt,
+        so it should only redo the parts that haven't succeeded yet.
+
+        Args:
+            name: Name for logs and failure reports
+            job: Async function to run
+            key: Jobs with the same key run one after another, in order
+
+        Returns:
+            The task running the job
+        """
+        previous = self._last_by_key.get(key) if key else None
+        task = asyncio.create_task(self._run(name, job, previous))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if key:
+            self._last_by_key[key] = task
+        debug(MODULE, "Queued background job", job=name, pending=self.pending)
+        return task
+
+    async def _run(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[object]],
+        previous: asyncio.Task | None,
+    ) -> None:
+        if previous is not None:
+            # Its outcome doesn't matter, only that it went first
+            await asyncio.wait([previous])
+
+        for attempt in range(1, self.max_attempts + 1):
+            async with self._semaphore:
+                try:
+                    await job()
+                    debug(MODULE, "Background job done", job=name, attempt=attempt)
+                    return
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+            if attempt < self.max_attempts:
+                debug_warning(
+                    MODULE, "Background job failed, retrying", job=name, error=error
+                )
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+
+        logger.warning(f"Background job {name} failed: {error}")
+        self.failures.append(JobFailure(name, self.max_attempts, error))
+
+    async def wait_for_key(
+        self, key: str, timeout: float | None = FLUSH_TIMEOUT_SECONDS
+    ) -> bool:
+        """
+        Wait for the jobs submitted so far with a key (including retries).
+
+        Unlike flush(), jobs still running at the timeout are left running.
+
+        Args:
+            key: Key the jobs were submitted with
+            timeout: Seconds to wait at most (None waits forever)
+
+        Returns:
+            True if they all finished
+        """
+        # Jobs with the same key run in order, so the last one finishes last
+        task = self._last_by_key.get(key)
+        if task is None or task.done():
+            return True
+        debug(MODULE, "Waiting for background jobs", key=key)
+        done, _ = await asyncio.wait([task], timeout=timeout)
+        if not done:
+            debug_warning(MODULE, "Background jobs still running", key=key)
+        return bool(done)
+
+    async def flush(self, timeout: float | None = FLUSH_TIMEOUT_SECONDS) -> bool:
+        """
+        Wait for every job submitted so far (including retries).
+
+        Args:
+            timeout: Seconds to wait at most (None waits forever)
+
+        Returns:
+            True if all jobs finished, False if some were still running at
+            the timeout (they're cancelled)
+        """
+        if not self._tasks:
+            return True
+        tasks = set(self._tasks)
+        debug(MODULE, "Flushing background jobs", pending=len(tasks))
+        done, unfinished = await asyncio.wait(tasks, timeout=timeout)
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            logger.warning(
+                f"{len(unfinished)} post-session job(s) didn't finish in time"
+            )
+        # Jobs submitted while flushing
+        if self._tasks - tasks and not unfinished:
+            return await self.flush(timeout)
+        return not unfinished
@@ -0,0 +1,455 @@
+"""
+Subtask Prompt Prefetching
+==========================
+
+Builds the prompt for the likely next subtask while the current session runs.
+
+Between sessions the coder loop used to assemble the next prompt on the
+critical path: generating the subtask prompt, reading the relevant parts of
+each referenced file and querying Graphiti (a network round trip). The prefetcher
+starts that work as soon as a session starts, for the subtask the scheduler
+would hand out once the current one completes, so the next session can start
+with a warm prompt.
+
+A prefetched bundle is only used if it's still valid when the next session
+starts:
+- The next subtask, its phase, attempt count and recovery hints are the ones
+  it was built for (otherwise it's thrown away)
+- The referenced files haven't changed since they were read (otherwise just
+  the file context is re-read)
+
+Graphiti context fetched with the bundle predates the current session's
+insights, so it's fetched again when the bundle is taken, once the queued
+memory saves are done. That query is on the critical path again; the file
+context is only re-read if the new Graphiti section changes the tokens left
+for it.
+
+Each bundle is built within the agent's context budget (see
+prompts_pkg.context_budget), whose breakdown is logged for the session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.plan_store import get_plan_store
+from core.subtask_scheduler import SubtaskScheduler
+from debug import debug, debug_warning
+from prompt_generator import (
+    format_context_for_prompt,
+    generate_subtask_prompt,
+    load_subtask_context,
+)
+from prompts_pkg.context_budget import (
+    GRAPHITI_MAX_SHARE,
+    RECOVERY_HINTS_MAX_TOKENS,
+    ContextBudget,
+    estimate_tokens,
+    warm_symbol_cache,
+)
+from recovery import RecoveryManager
+
+from .memory_manager import get_graphiti_context
+from .post_session_queue import PostSessionQueue
+from .utils import find_phase_for_subtask
+
+MODULE = "agents.prefetch"
+
+# How long a prompt waits for queued memory saves before querying Graphiti
+MEMORY_SAVE_WAIT_SECONDS = 60.0
+
+# Subtask fields that don't go into the prompt: status bookkeeping, and the
+# phase fields the scheduler adds (the phase is compared separately)
+_IGNORED_SUBTASK_FIELDS = (
+    "status",
+    "notes",
+    "updated_at",
+    "started_at",
+    "phase_id",
+    "phase_name",
+    "phase_num",
+)
+
+
+@dataclass
+class PromptBundle:
+    """Everything the coder prompt for one subtask is assembled from."""
+
+    subtask_id: str
+    # Subtask, phase and recovery state the bundle was built for
+    inputs: str
+    base_prompt: str
+    file_context: str
+    # (mtime_ns, size) per referenced file when it was read, None if missing
+    file_fingerprints: dict[str, tuple[int, int] | None] = field(default_factory=dict)
+    graphiti_context: str | None = None
+    # Tokens per section, and the tokens the files were given
+    budget: ContextBudget | None = None
+    file_budget: int | None = None
+
+    @property
+    def prompt(self) -> str:
+        prompt = self.base_prompt
+        if self.file_context:
+            prompt += "\n\n" + self.file_context
+        if self.graphiti_context:
+            prompt += "\n\n" + self.graphiti_context
+        return prompt
+
+
+def _prompt_inputs(
+    subtask: dict, phase: dict, attempt_count: int, recovery_hints: list[str] | None
+) -> str:
+    stable = {k: v for k, v in subtask.items() if k not in _IGNORED_SUBTASK_FIELDS}
+    stable_phase = {k: v for k, v in phase.items() if k != "subtasks"}
+    return json.dumps(
+        [stable, stable_phase, attempt_count, recovery_hints],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _referenced_files(subtask: dict) -> list[str]:
+    return [
+        *subtask.get("patterns_from", []),
+        *subtask.get("files_to_modify", []),
+    ]
+
+
+def _fingerprint_files(
+    project_dir: Path, paths: list[str]
+) -> dict[str, tuple[int, int] | None]:
+    fingerprints = {}
+    for path in paths:
+        try:
+            stat = os.stat(project_dir / path)
+            fingerprints[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            fingerprints[path] = None
+    return fingerprints
+
+
+def _load_file_context(
+    spec_dir: Path, project_dir: Path, subtask: dict, max_tokens: int | None = None
+) -> tuple[str, dict[str, tuple[int, int] | None], int]:
+    """Read the referenced files, fingerprinting them first."""
+    # Fingerprint before reading, so a write during the read invalidates
+    fingerprints = _fingerprint_files(project_dir, _referenced_files(subtask))
+    # With a token budget the relevance ranking decides, not a line cap
+    context = load_subtask_context(
+        spec_dir,
+        project_dir,
+        subtask,
+        max_file_lines=None if max_tokens is not None else 200,
+        max_tokens=max_tokens,
+    )
+    omitted = context.get("omitted_tokens", 0)
+    if context.get("patterns") or context.get("files_to_modify"):
+        return format_context_for_prompt(context), fingerprints, omitted
+    return "", fingerprints, omitted
+
+
+async def _no_graphiti_context() -> None:
+    return None
+
+
+async def _fresh_graphiti_context(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    post_session_queue: PostSessionQueue | None,
+) -> str | None:
+    """Query Graphiti once the previous sessions' memory saves are done."""
+    if post_session_queue is not None:
+        await post_session_queue.wait_for_key(
+            "memory", timeout=MEMORY_SAVE_WAIT_SECONDS
+        )
+    return await get_graphiti_context(spec_dir, project_dir, subtask)
+
+
+def _refit_graphiti(bundle: PromptBundle, graphiti_context: str | None) -> int | None:
+    """
+    Put newer Graphiti context into a bundle, within its budget.
+
+    Returns:
+        Tokens left for the file context (None if unlimited)
+    """
+    budget = bundle.budget
+    if budget is None:
+        bundle.graphiti_context = graphiti_context
+        return bundle.file_budget
+
+    files_used = budget.used.get("files", 0)
+    files_omitted = budget.omitted.get("files", 0)
+    budget.discard("files")
+    budget.discard("graphiti")
+    bundle.graphiti_context = budget.fit_text(
+        "graphiti", graphiti_context, max_share=GRAPHITI_MAX_SHARE
+    )
+    file_budget = budget.remaining
+    # Kept unless the files are re-read
+    budget.record("files", files_used, files_omitted)
+    return file_budget
+
+
+async def build_prompt_bundle(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    phase: dict,
+    attempt_count: int = 0,
+    recovery_hints: list[str] | None = None,
+    agent: str = "coder",
+    include_graphiti: bool = True,
+    post_session_queue: PostSessionQueue | None = None,
+) -> PromptBundle:
+    """
+    Assemble the coder prompt for a subtask, within the agent's context budget.
+
+    The instructions are kept whole; recovery hints, Graphiti context and
+    then the referenced files get what's left of the budget.
+
+    Args:
+        spec_dir: Spec directory
+        project_dir: Project root
+        subtask: The subtask to implement
+        phase: The phase containing it
+        attempt_count: Number of previous attempts
+        recovery_hints: Hints from previous failed attempts
+        agent: Agent type whose budget applies
+        include_graphiti: Whether to add Graphiti memory context
+        post_session_queue: Queue whose memory saves Graphiti waits for
+
+    Returns:
+        PromptBundle whose prompt is ready to send
+    """
+    budget = ContextBudget.for_agent(agent)
+    hints = budget.fit_items(
+        "recovery_hints", recovery_hints, RECOVERY_HINTS_MAX_TOKENS
+    )
+    base_prompt = generate_subtask_prompt(
+        spec_dir=spec_dir,
+        project_dir=project_dir,
+        subtask=subtask,
+        phase=phase,
+        attempt_count=attempt_count,
+        recovery_hints=hints,
+    )
+    budget.record(
+        "instructions",
+        max(0, estimate_tokens(base_prompt) - budget.used.get("recovery_hints", 0)),
+    )
+
+    # Splitting the files into symbol ranges and the Graphiti query don't
+    # depend on each other; choosing ranges waits for Graphiti's share
+    _, graphiti_context = await asyncio.gather(
+        asyncio.to_thread(warm_symbol_cache, project_dir, _referenced_files(subtask)),
+        _fresh_graphiti_context(spec_dir, project_dir, subtask, post_session_queue)
+        if include_graphiti
+        else _no_graphiti_context(),
+    )
+    graphiti_context = budget.fit_text(
+        "graphiti", graphiti_context, max_share=GRAPHITI_MAX_SHARE
+    )
+
+    file_budget = budget.remaining
+    file_context, fingerprints, omitted = await asyncio.to_thread(
+        _load_file_context, spec_dir, project_dir, subtask, file_budget
+    )
+    budget.record("files", estimate_tokens(file_context), omitted)
+
+    debug(
+        MODULE,
+        "Prompt context budget",
+        subtask_id=subtask.get("id"),
+        **budget.to_dict(),
+    )
+    return PromptBundle(
+        subtask_id=subtask.get("id"),
+        inputs=_prompt_inputs(subtask, phase, attempt_count, recovery_hints),
+        base_prompt=base_prompt,
+        file_context=file_context,
+        file_fingerprints=fingerprints,
+        graphiti_context=graphiti_context,
+        budget=budget,
+        file_budget=file_budget,
+    )
+
+
+class SubtaskPrefetcher:
+    """Speculatively builds the prompt bundle for the next subtask."""
+
+    def __init__(
+        self,
+        spec_dir: Path,
+        project_dir: Path,
+        recovery_manager: RecoveryManager,
+        scheduler: SubtaskScheduler | None = None,
+        post_session_queue: PostSessionQueue | None = None,
+    ):
+        """
+        Args:
+            spec_dir: The build's spec directory
+            project_dir: The build's working directory
+            recovery_manager: Recovery manager for attempt counts and hints
+            scheduler: The build's scheduler (one is built per prediction
+                from the plan if not given)
+            post_session_queue: Queue whose memory saves the Graphiti
+                context is refreshed after
+        """
+        self.spec_dir = spec_dir
+        self.project_dir = project_dir
+        self.recovery_manager = recovery_manager
+        self.scheduler = scheduler
+        self.post_session_queue = post_session_queue
+        self._task: asyncio.Task | None = None
+        self._subtask_id: str | None = None
+
+    def predict_next(self, current_subtask_id: str | None) -> dict | None:
+        """The subtask the scheduler would hand out once the current one completes."""
+        if self.scheduler is not None:
+            if current_subtask_id:
+                ready = self.scheduler.next_ready_after(current_subtask_id, 1)
+            else:
+                ready = self.scheduler.next_ready(1)
+            return ready[0] if ready else None
+
+        plan = get_plan_store(self.spec_dir).get()
+        if not plan:
+            return None
+        scheduler = SubtaskScheduler(plan)
+        if current_subtask_id:
+            scheduler.mark_completed(current_subtask_id)
+        ready = scheduler.next_ready(1)
+        return ready[0] if ready else None
+
+    def start(self, current_subtask_id: str | None) -> str | None:
+        """
+        Start prefetching for the subtask likely to follow the current one.
+
+        Args:
+            current_subtask_id: Subtask the session that's starting works on
+
+        Returns:
+            Id of the subtask being prefetched, None if there is none
+        """
+        self.cancel()
+        subtask = self.predict_next(current_subtask_id)
+        if subtask is None:
+            return None
+
+        subtask_id = subtask["id"]
+        plan = get_plan_store(self.spec_dir).get() or {}
+        phase = find_phase_for_subtask(plan, subtask_id) or {}
+        attempt_count = self.recovery_manager.get_attempt_count(subtask_id)
+        recovery_hints = (
+            self.recovery_manager.get_recovery_hints(subtask_id)
+            if attempt_count > 0
+            else None
+        )
+        self._subtask_id = subtask_id
+        self._task = asyncio.create_task(
+            build_prompt_bundle(
+                self.spec_dir,
+                self.project_dir,
+                subtask,
+                phase,
+                attempt_count,
+                recovery_hints,
+            )
+        )
+        debug(MODULE, "Prefetching next subtask prompt", subtask_id=subtask_id)
+        return subtask_id
+
+    def cancel(self) -> None:
+        """Drop any prefetch in flight or waiting to be used."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._subtask_id = None
+
+    async def take(
+        self,
+        subtask: dict,
+        phase: dict,
+        attempt_count: int = 0,
+        recovery_hints: list[str] | None = None,
+    ) -> PromptBundle | None:
+        """
+        Get the prefetched bundle for a subtask, if it's still valid.
+
+        Waits for a prefetch that's still running. Graphiti context is
+        fetched again, and referenced files that changed since the prefetch
+        (or that get a different share of the budget) are re-read.
+
+        Args:
+            subtask: The subtask about to run (from the current plan)
+            phase: The phase containing it
+            attempt_count: Its current attempt count
+            recovery_hints: Its current recovery hints
+
+        Returns:
+            A valid PromptBundle, or None if the prefetch missed
+        """
+        task, subtask_id = self._task, self._subtask_id
+        self._task = None
+        self._subtask_id = None
+        if task is None:
+            return None
+        if subtask_id != subtask.get("id"):
+            task.cancel()
+            debug(
+                MODULE,
+                "Prefetch missed: different subtask",
+                prefetched=subtask_id,
+                next=subtask.get("id"),
+            )
+            return None
+
+        try:
+            bundle = await task
+        except asyncio.CancelledError:
+            return None
+        except Exception as e:
+            debug_warning(MODULE, "Prefetch failed", error=str(e))
+            return None
+
+        if bundle.inputs != _prompt_inputs(
+            subtask, phase, attempt_count, recovery_hints
+        ):
+            debug(MODULE, "Prefetch missed: subtask changed", subtask_id=subtask_id)
+            return None
+
+        file_budget = _refit_graphiti(
+            bundle,
+            await _fresh_graphiti_context(
+                self.spec_dir, self.project_dir, subtask, self.post_session_queue
+            ),
+        )
+
+        current = _fingerprint_files(self.project_dir, _referenced_files(subtask))
+        if current != bundle.file_fingerprints or file_budget != bundle.file_budget:
+            debug(MODULE, "Re-reading referenced files", subtask_id=subtask_id)
+            (
+                bundle.file_context,
+                bundle.file_fingerprints,
+                omitted,
+            ) = await asyncio.to_thread(
+                _load_file_context,
+                self.spec_dir,
+                self.project_dir,
+                subtask,
+                file_budget,
+            )
+            bundle.file_budget = file_budget
+            if bundle.budget is not None:
+                bundle.budget.record(
+                    "files", estimate_tokens(bundle.file_context), omitted
+                )
+
+        debug(MODULE, "Using prefetched prompt", subtask_id=subtask_id)
+        return bundle
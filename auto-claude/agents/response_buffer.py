@@ -0,0 +1,64 @@
+"""
+Response Buffer
+===============
+
+Assembles streamed response text without repeated string concatenation.
+
+`text += chunk` copies the whole response for every chunk, so a session with
+thousands of text blocks does quadratic work. ResponseBuffer keeps the chunks
+and joins them once, when the full text is asked for. It also keeps a bounded
+tail of the most recent text, for checks that only care about how the
+response ends.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+# Characters of recent text kept for tail checks
+RESPONSE_TAIL_CHARS = 4000
+
+
+class ResponseBuffer:
+    """Collects streamed text chunks; joins them once on demand."""
+
+    def __init__(self, tail_chars: int = RESPONSE_TAIL_CHARS):
+        self.tail_chars = tail_chars
+        self._chunks: list[str] = []
+        self._length = 0
+        self._joined: str | None = None
+        # Most recent chunks, holding at least tail_chars characters if
+        # that many have been appended
+        self._tail: deque[str] = deque()
+        self._tail_length = 0
+
+    def append(self, text: str) -> None:
+        """Add a chunk of response text."""
+        if not text:
+            return
+        self._chunks.append(text)
+        self._length += len(text)
+        self._joined = None
+
+        if self.tail_chars <= 0:
+            return
+        self._tail.append(text)
+        self._tail_length += len(text)
+        while self._tail_length - len(self._tail[0]) >= self.tail_chars:
+            self._tail_length -= len(self._tail.popleft())
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def tail(self) -> str:
+        """The last tail_chars characters of the response."""
+        return "".join(self._tail)[-self.tail_chars :] if self.tail_chars > 0 else ""
+
+    def getvalue(self) -> str:
+        """The full response text."""
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+            # Keep the joined string as the only chunk
+            self._chunks = [self._joined] if self._joined else []
+        return self._joined
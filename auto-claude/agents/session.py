@@ -6,7 +6,11 @@ Handles running agent sessions and post-session processing including
 memory updates, recovery tracking, and Linear integration.
 """
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeSDKClient
@@ -34,10 +38,12 @@ from ui import (
 )
 
 from .memory_manager import save_session_memory
+from .post_session_queue import PostSessionQueue
+from .response_buffer import ResponseBuffer
 from .utils import (
     find_subtask_in_plan,
-    get_commit_count,
-    get_latest_commit,
+    get_commit_count_async,
+    get_latest_commit_async,
     load_implementation_plan,
     sync_plan_to_source,
 )
@@ -45,6 +51,101 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+def _session_memory_job(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask_id: str,
+    session_num: int,
+    commit_before: str | None,
+    commit_after: str | None,
+    success: bool,
+    recovery_manager: RecoveryManager,
+) -> Callable[[], Awaitable[None]]:
+    """
+    Build the job extracting session insights and saving them to memory.
+
+    Insights are extracted once; a retry only repeats the save.
+    """
+    extracted: dict[str, dict | None] = {}
+
+    async def job() -> None:
+        if "insights" not in extracted:
+            # Extract rich insights from session (LLM-powered analysis),
+            # even from failed sessions (valuable for future attempts)
+            try:
+                extracted["insights"] = await extract_session_insights(
+                    spec_dir=spec_dir,
+                    project_dir=project_dir,
+                    subtask_id=subtask_id,
+                    session_num=session_num,
+                    commit_before=commit_before,
+                    commit_after=commit_after,
+                    success=success,
+                    recovery_manager=recovery_manager,
+                )
+            except Exception as e:
+                logger.warning(f"Insight extraction failed: {e}")
+                extracted["insights"] = None
+            insights = extracted["insights"]
+            if success and insights:
+                insight_count = len(insights.get("file_insights", []))
+                pattern_count = len(insights.get("patterns_discovered", []))
+                if insight_count > 0 or pattern_count > 0:
+                    print_status(
+                        f"Extracted {insight_count} file insights, {pattern_count} patterns",
+                        "success",
+                    )
+
+        # Save session memory (Graphiti=primary, file-based=fallback)
+        save_success, storage_type = await save_session_memory(
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            success=success,
+            subtasks_completed=[subtask_id] if success else [],
+            discoveries=extracted["insights"],
+        )
+        if not save_success:
+            raise RuntimeError(f"Failed to save session memory for {subtask_id}")
+        if storage_type == "graphiti":
+            print_status("Session saved to Graphiti memory", "success")
+        elif success:
+            print_status("Session saved to file-based memory (fallback)", "info")
+
+    return job
+
+
+def _linear_job(
+    comment: Callable[[], Awaitable[bool]],
+) -> Callable[[], Awaitable[None]]:
+    """Build the job recording a session result as a Linear comment."""
+
+    async def job() -> None:
+        if not await comment():
+            raise RuntimeError("Linear comment was not added")
+        print_status("Linear progress recorded", "success")
+
+    return job
+
+
+async def _run_or_submit(
+    queue: PostSessionQueue | None,
+    name: str,
+    job: Callable[[], Awaitable[None]],
+    key: str,
+) -> None:
+    """Submit a job to the background queue, or run it once inline without one."""
+    if queue is not None:
+        queue.submit(name, job, key=key)
+        return
+    try:
+        await job()
+    except Exception as e:
+        logger.warning(f"{name} failed: {e}")
+        print_status(f"{name} failed", "warning")
+
+
 async def post_session_processing(
     spec_dir: Path,
     project_dir: Path,
@@ -56,12 +157,18 @@ async def post_session_processing(
     linear_enabled: bool = False,
     status_manager: StatusManager | None = None,
     source_spec_dir: Path | None = None,
+    post_session_queue: PostSessionQueue | None = None,
 ) -> bool:
     """
     Process session results and update memory automatically.
 
     This runs in Python (100% reliable) instead of relying on agent compliance.
 
+    Only the plan and status checks and recovery tracking decide what runs
+    next, so they're done here. Insight extraction, the memory save and the
+    Linear comment are submitted to post_session_queue and run alongside the
+    next session; without a queue they run here before returning.
+
     Args:
         spec_dir: Spec directory containing memory/
         project_dir: Project root for git operations
@@ -73,6 +180,7 @@ async def post_session_processing(
         linear_enabled: Whether Linear integration is enabled
         status_manager: Optional status manager for ccstatusline
         source_spec_dir: Original spec directory (for syncing back from worktree)
+        post_session_queue: Optional queue for the background work
 
     Returns:
         True if subtask was completed successfully
@@ -98,14 +206,18 @@ async def post_session_processing(
     subtask_status = subtask.get("status", "pending")
 
     # Check for new commits
-    commit_after = get_latest_commit(project_dir)
-    commit_count_after = get_commit_count(project_dir)
+    commit_after, commit_count_after = await asyncio.gather(
+        get_latest_commit_async(project_dir),
+        get_commit_count_async(project_dir),
+    )
     new_commits = commit_count_after - commit_count_before
 
     print_key_value("Subtask status", subtask_status)
     print_key_value("New commits", str(new_commits))
 
-    if subtask_status == "completed":
+    success = subtask_status == "completed"
+
+    if success:
         # Success! Record the attempt and good commit
         print_status(f"Subtask {subtask_id} completed successfully", "success")
 
@@ -131,66 +243,16 @@ async def post_session_processing(
             recovery_manager.record_good_commit(commit_after, subtask_id)
             print_status(f"Recorded good commit: {commit_after[:8]}", "success")
 
-        # Record Linear session result (if enabled)
+        # Record Linear session result (if enabled), with the counts as of now
         if linear_enabled:
-            # Get progress counts for the comment
             subtasks_detail = count_subtasks_detailed(spec_dir)
-            await linear_subtask_completed(
+            linear_comment = partial(
+                linear_subtask_completed,
                 spec_dir=spec_dir,
                 subtask_id=subtask_id,
                 completed_count=subtasks_detail["completed"],
                 total_count=subtasks_detail["total"],
             )
-            print_status("Linear progress recorded", "success")
-
-        # Extract rich insights from session (LLM-powered analysis)
-        try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=True,
-                recovery_manager=recovery_manager,
-            )
-            insight_count = len(extracted_insights.get("file_insights", []))
-            pattern_count = len(extracted_insights.get("patterns_discovered", []))
-            if insight_count > 0 or pattern_count > 0:
-                print_status(
-                    f"Extracted {insight_count} file insights, {pattern_count} patterns",
-                    "success",
-                )
-        except Exception as e:
-            logger.warning(f"Insight extraction failed: {e}")
-            extracted_insights = None
-
-        # Save session memory (Graphiti=primary, file-based=fallback)
-        try:
-            save_success, storage_type = await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=True,
-                subtasks_completed=[subtask_id],
-                discoveries=extracted_insights,
-            )
-            if save_success:
-                if storage_type == "graphiti":
-                    print_status("Session saved to Graphiti memory", "success")
-                else:
-                    print_status(
-                        "Session saved to file-based memory (fallback)", "info"
-                    )
-            else:
-                print_status("Failed to save session memory", "warning")
-        except Exception as e:
-            logger.warning(f"Error saving session memory: {e}")
-            print_status("Memory save failed", "warning")
-
-        return True
 
     elif subtask_status == "in_progress":
         # Session ended without completion
@@ -211,48 +273,15 @@ async def post_session_processing(
                 f"Recorded partial progress commit: {commit_after[:8]}", "info"
             )
 
-        # Record Linear session result (if enabled)
         if linear_enabled:
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            await linear_subtask_failed(
+            linear_comment = partial(
+                linear_subtask_failed,
                 spec_dir=spec_dir,
                 subtask_id=subtask_id,
-                attempt=attempt_count,
+                attempt=recovery_manager.get_attempt_count(subtask_id),
                 error_summary="Session ended without completion",
             )
 
-        # Extract insights even from failed sessions (valuable for future attempts)
-        try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=False,
-                recovery_manager=recovery_manager,
-            )
-        except Exception as e:
-            logger.debug(f"Insight extraction failed for incomplete session: {e}")
-            extracted_insights = None
-
-        # Save failed session memory (to track what didn't work)
-        try:
-            await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=False,
-                subtasks_completed=[],
-                discoveries=extracted_insights,
-            )
-        except Exception as e:
-            logger.debug(f"Failed to save incomplete session memory: {e}")
-
-        return False
-
     else:
         # Subtask still pending or failed
         print_status(
@@ -267,47 +296,41 @@ async def post_session_processing(
             error=f"Subtask status is {subtask_status}",
         )
 
-        # Record Linear session result (if enabled)
         if linear_enabled:
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            await linear_subtask_failed(
+            linear_comment = partial(
+                linear_subtask_failed,
                 spec_dir=spec_dir,
                 subtask_id=subtask_id,
-                attempt=attempt_count,
+                attempt=recovery_manager.get_attempt_count(subtask_id),
                 error_summary=f"Subtask status: {subtask_status}",
             )
 
-        # Extract insights even from completely failed sessions
-        try:
-            extracted_insights = await extract_session_insights(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                commit_before=commit_before,
-                commit_after=commit_after,
-                success=False,
-                recovery_manager=recovery_manager,
-            )
-        except Exception as e:
-            logger.debug(f"Insight extraction failed for failed session: {e}")
-            extracted_insights = None
-
-        # Save failed session memory (to track what didn't work)
-        try:
-            await save_session_memory(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask_id=subtask_id,
-                session_num=session_num,
-                success=False,
-                subtasks_completed=[],
-                discoveries=extracted_insights,
-            )
-        except Exception as e:
-            logger.debug(f"Failed to save failed session memory: {e}")
+    # Linear comments keep their order; memory saves (which track what
+    # didn't work too) keep theirs
+    if linear_enabled:
+        await _run_or_submit(
+            post_session_queue,
+            f"Linear update for {subtask_id}",
+            _linear_job(linear_comment),
+            key="linear",
+        )
+    await _run_or_submit(
+        post_session_queue,
+        f"Memory save for {subtask_id}",
+        _session_memory_job(
+            spec_dir,
+            project_dir,
+            subtask_id,
+            session_num,
+            commit_before,
+            commit_after,
+            success,
+            recovery_manager,
+        ),
+        key="memory",
+    )
 
-        return False
+    return success
 
 
 async def run_agent_session(
@@ -356,165 +379,168 @@ async def run_agent_session(
         await client.query(message)
         debug_success("session", "Query sent successfully")
 
-        # Collect response text and show tool use
-        response_text = ""
+        # Collect response text (joined once at the end) and show tool use.
+        # Log entries are written to task_logs.json in batches.
+        response = ResponseBuffer()
         debug("session", "Starting to receive response stream...")
-        async for msg in client.receive_response():
-            msg_type = type(msg).__name__
-            message_count += 1
-            debug_detailed(
-                "session",
-                f"Received message #{message_count}",
-                msg_type=msg_type,
-            )
+        with task_logger.batched_writes() if task_logger else nullcontext():
+            async for msg in client.receive_response():
+                msg_type = type(msg).__name__
+                message_count += 1
+                debug_detailed(
+                    "session",
+                    f"Received message #{message_count}",
+                    msg_type=msg_type,
+                )
 
-            # Handle AssistantMessage (text and tool use)
-            if msg_type == "AssistantMessage" and hasattr(msg, "content"):
-                for block in msg.content:
-                    block_type = type(block).__name__
-
-                    if block_type == "TextBlock" and hasattr(block, "text"):
-                        response_text += block.text
-                        print(block.text, end="", flush=True)
-                        # Log text to task logger (persist without double-printing)
-                        if task_logger and block.text.strip():
-                            task_logger.log(
-                                block.text,
-                                LogEntryType.TEXT,
-                                phase,
-                                print_to_console=False,
-                            )
-                    elif block_type == "ToolUseBlock" and hasattr(block, "name"):
-                        tool_name = block.name
-                        tool_input = None
-                        tool_count += 1
-
-                        # Extract meaningful tool input for display
-                        if hasattr(block, "input") and block.input:
-                            inp = block.input
-                            if isinstance(inp, dict):
-                                if "pattern" in inp:
-                                    tool_input = f"pattern: {inp['pattern']}"
-                                elif "file_path" in inp:
-                                    fp = inp["file_path"]
-                                    if len(fp) > 50:
-                                        fp = "..." + fp[-47:]
-                                    tool_input = fp
-                                elif "command" in inp:
-                                    cmd = inp["command"]
-                                    if len(cmd) > 50:
-                                        cmd = cmd[:47] + "..."
-                                    tool_input = cmd
-                                elif "path" in inp:
-                                    tool_input = inp["path"]
-
-                        debug(
-                            "session",
-                            f"Tool call #{tool_count}: {tool_name}",
-                            tool_input=tool_input,
-                            full_input=str(block.input)[:500]
-                            if hasattr(block, "input")
-                            else None,
-                        )
-
-                        # Log tool start (handles printing too)
-                        if task_logger:
-                            task_logger.tool_start(
-                                tool_name, tool_input, phase, print_to_console=True
+                # Handle AssistantMessage (text and tool use)
+                if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                    for block in msg.content:
+                        block_type = type(block).__name__
+
+                        if block_type == "TextBlock" and hasattr(block, "text"):
+                            response.append(block.text)
+                            print(block.text, end="", flush=True)
+                            # Log text to task logger (persist without double-printing)
+                            if task_logger and block.text.strip():
+                                task_logger.log(
+                                    block.text,
+                                    LogEntryType.TEXT,
+                                    phase,
+                                    print_to_console=False,
+                                )
+                        elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                            tool_name = block.name
+                            tool_input = None
+                            tool_count += 1
+
+                            # Extract meaningful tool input for display
+                            if hasattr(block, "input") and block.input:
+                                inp = block.input
+                                if isinstance(inp, dict):
+                                    if "pattern" in inp:
+                                        tool_input = f"pattern: {inp['pattern']}"
+                                    elif "file_path" in inp:
+                                        fp = inp["file_path"]
+                                        if len(fp) > 50:
+                                            fp = "..." + fp[-47:]
+                                        tool_input = fp
+                                    elif "command" in inp:
+                                        cmd = inp["command"]
+                                        if len(cmd) > 50:
+                                            cmd = cmd[:47] + "..."
+                                        tool_input = cmd
+                                    elif "path" in inp:
+                                        tool_input = inp["path"]
+
+                            debug(
+                                "session",
+                                f"Tool call #{tool_count}: {tool_name}",
+                                tool_input=tool_input,
+                                full_input=str(block.input)[:500]
+                                if hasattr(block, "input")
+                                else None,
                             )
-                        else:
-                            print(f"\n[Tool: {tool_name}]", flush=True)
 
-                        if verbose and hasattr(block, "input"):
-                            input_str = str(block.input)
-                            if len(input_str) > 300:
-                                print(f"   Input: {input_str[:300]}...", flush=True)
+                            # Log tool start (handles printing too)
+                            if task_logger:
+                                task_logger.tool_start(
+                                    tool_name, tool_input, phase, print_to_console=True
+                                )
                             else:
-                                print(f"   Input: {input_str}", flush=True)
-                        current_tool = tool_name
-
-            # Handle UserMessage (tool results)
-            elif msg_type == "UserMessage" and hasattr(msg, "content"):
-                for block in msg.content:
-                    block_type = type(block).__name__
-
-                    if block_type == "ToolResultBlock":
-                        result_content = getattr(block, "content", "")
-                        is_error = getattr(block, "is_error", False)
-
-                        # Check if command was blocked by security hook
-                        if "blocked" in str(result_content).lower():
-                            debug_error(
-                                "session",
-                                f"Tool BLOCKED: {current_tool}",
-                                result=str(result_content)[:300],
-                            )
-                            print(f"   [BLOCKED] {result_content}", flush=True)
-                            if task_logger and current_tool:
-                                task_logger.tool_end(
-                                    current_tool,
-                                    success=False,
-                                    result="BLOCKED",
-                                    detail=str(result_content),
-                                    phase=phase,
+                                print(f"\n[Tool: {tool_name}]", flush=True)
+
+                            if verbose and hasattr(block, "input"):
+                                input_str = str(block.input)
+                                if len(input_str) > 300:
+                                    print(f"   Input: {input_str[:300]}...", flush=True)
+                                else:
+                                    print(f"   Input: {input_str}", flush=True)
+                            current_tool = tool_name
+
+                # Handle UserMessage (tool results)
+                elif msg_type == "UserMessage" and hasattr(msg, "content"):
+                    for block in msg.content:
+                        block_type = type(block).__name__
+
+                        if block_type == "ToolResultBlock":
+                            result_content = getattr(block, "content", "")
+                            is_error = getattr(block, "is_error", False)
+
+                            # Check if command was blocked by security hook
+                            if "blocked" in str(result_content).lower():
+                                debug_error(
+                                    "session",
+                                    f"Tool BLOCKED: {current_tool}",
+                                    result=str(result_content)[:300],
                                 )
-                        elif is_error:
-                            # Show errors (truncated)
-                            error_str = str(result_content)[:500]
-                            debug_error(
-                                "session",
-                                f"Tool error: {current_tool}",
-                                error=error_str[:200],
-                            )
-                            print(f"   [Error] {error_str}", flush=True)
-                            if task_logger and current_tool:
-                                # Store full error in detail for expandable view
-                                task_logger.tool_end(
-                                    current_tool,
-                                    success=False,
-                                    result=error_str[:100],
-                                    detail=str(result_content),
-                                    phase=phase,
+                                print(f"   [BLOCKED] {result_content}", flush=True)
+                                if task_logger and current_tool:
+                                    task_logger.tool_end(
+                                        current_tool,
+                                        success=False,
+                                        result="BLOCKED",
+                                        detail=str(result_content),
+                                        phase=phase,
+                                    )
+                            elif is_error:
+                                # Show errors (truncated)
+                                error_str = str(result_content)[:500]
+                                debug_error(
+                                    "session",
+                                    f"Tool error: {current_tool}",
+                                    error=error_str[:200],
                                 )
-                        else:
-                            # Tool succeeded
-                            debug_detailed(
-                                "session",
-                                f"Tool success: {current_tool}",
-                                result_length=len(str(result_content)),
-                            )
-                            if verbose:
-                                result_str = str(result_content)[:200]
-                                print(f"   [Done] {result_str}", flush=True)
+                                print(f"   [Error] {error_str}", flush=True)
+                                if task_logger and current_tool:
+                                    # Store full error in detail for expandable view
+                                    task_logger.tool_end(
+                                        current_tool,
+                                        success=False,
+                                        result=error_str[:100],
+                                        detail=str(result_content),
+                                        phase=phase,
+                                    )
                             else:
-                                print("   [Done]", flush=True)
-                            if task_logger and current_tool:
-                                # Store full result in detail for expandable view (only for certain tools)
-                                # Skip storing for very large outputs like Glob results
-                                detail_content = None
-                                if current_tool in (
-                                    "Read",
-                                    "Grep",
-                                    "Bash",
-                                    "Edit",
-                                    "Write",
-                                ):
-                                    result_str = str(result_content)
-                                    # Only store if not too large (detail truncation happens in logger)
-                                    if (
-                                        len(result_str) < 50000
-                                    ):  # 50KB max before truncation
-                                        detail_content = result_str
-                                task_logger.tool_end(
-                                    current_tool,
-                                    success=True,
-                                    detail=detail_content,
-                                    phase=phase,
+                                # Tool succeeded
+                                debug_detailed(
+                                    "session",
+                                    f"Tool success: {current_tool}",
+                                    result_length=len(str(result_content)),
                                 )
-
-                        current_tool = None
+                                if verbose:
+                                    result_str = str(result_content)[:200]
+                                    print(f"   [Done] {result_str}", flush=True)
+                                else:
+                                    print("   [Done]", flush=True)
+                                if task_logger and current_tool:
+                                    # Store full result in detail for expandable view (only for certain tools)
+                                    # Skip storing for very large outputs like Glob results
+                                    detail_content = None
+                                    if current_tool in (
+                                        "Read",
+                                        "Grep",
+                                        "Bash",
+                                        "Edit",
+                                        "Write",
+                                    ):
+                                        result_str = str(result_content)
+                                        # Only store if not too large (detail truncation happens in logger)
+                                        if (
+                                            len(result_str) < 50000
+                                        ):  # 50KB max before truncation
+                                            detail_content = result_str
+                                    task_logger.tool_end(
+                                        current_tool,
+                                        success=True,
+                                        detail=detail_content,
+                                        phase=phase,
+                                    )
+
+                            current_tool = None
 
         print("\n" + "-" * 70 + "\n")
+        response_text = response.getvalue()
 
         # Check if build is complete
         if is_build_complete(spec_dir):
@@ -524,6 +550,7 @@ async def run_agent_session(
                 message_count=message_count,
                 tool_count=tool_count,
                 response_length=len(response_text),
+                response_tail=response.tail[-200:],
             )
             return "complete", response_text
 
@@ -533,6 +560,7 @@ async def run_agent_session(
             message_count=message_count,
             tool_count=tool_count,
             response_length=len(response_text),
+            response_tail=response.tail[-200:],
         )
         return "continue", response_text
 
@@ -0,0 +1,189 @@
+"""
+Concurrent Spec Builds
+======================
+
+Builds several specs at once in one process (run.py --specs).
+
+Each spec is built in its own worktree by its own run_autonomous_agent loop,
+with up to max_workers loops running side by side in one event loop. Each
+loop reports to a SpecStatusManager, so the project's .auto-claude-status
+file shows the progress of every spec. A spec whose build fails ends with
+an error result; the others carry on. With Graphiti enabled, the builds
+share one Graphiti client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from graphiti_config import is_graphiti_enabled
+from progress import is_build_complete
+from ui import BuildState, SpecStatusManager, StatusManager, print_status
+
+from .coder import run_autonomous_agent
+from .utils import sync_plan_to_source
+
+# Build outcomes
+OUTCOME_QA_APPROVED = "qa_approved"
+OUTCOME_QA_INCOMPLETE = "qa_incomplete"
+OUTCOME_BUILT = "built"
+OUTCOME_INCOMPLETE = "incomplete"
+OUTCOME_BLOCKED = "blocked"
+OUTCOME_ERROR = "error"
+
+# Outcomes that count as a finished build
+_SUCCESSFUL_OUTCOMES = {OUTCOME_QA_APPROVED, OUTCOME_BUILT}
+
+
+@dataclass
+class SpecBuild:
+    """One spec of a multi-spec build, with its workspace."""
+
+    spec_name: str
+    spec_dir: Path  # Inside the worktree
+    working_dir: Path
+    source_spec_dir: Path | None = None
+
+
+@dataclass
+class SpecBuildResult:
+    """How one spec's build ended."""
+
+    spec_name: str
+    outcome: str
+    working_dir: Path | None = None
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.outcome in _SUCCESSFUL_OUTCOMES
+
+
+async def build_spec(
+    build: SpecBuild,
+    model: str,
+    status_manager: StatusManager,
+    max_iterations: int | None = None,
+    verbose: bool = False,
+    skip_qa: bool = False,
+    subtask_workers: int = 1,
+) -> SpecBuildResult:
+    """
+    Build one spec and run its QA validation loop.
+
+    Errors end this spec's build only; they're returned in the result.
+
+    Args:
+        build: Spec and workspace to build in
+        model: Model to use (phase models from task_metadata.json still apply)
+        status_manager: Aggregate status of the multi-spec build
+        max_iterations: Maximum number of agent sessions (None for unlimited)
+        verbose: Enable verbose output
+        skip_qa: Skip QA validation after the build completes
+        subtask_workers: Concurrent sessions for parallel-safe phases
+
+    Returns:
+        SpecBuildResult for the spec
+    """
+    # Imported here: the QA modules aren't needed until a build completes
+    from qa_loop import run_qa_validation_loop, should_run_qa
+
+    spec_status = SpecStatusManager(status_manager, build.spec_name)
+    result = SpecBuildResult(build.spec_name, OUTCOME_ERROR, build.working_dir)
+    try:
+        await run_autonomous_agent(
+            project_dir=build.working_dir,
+            spec_dir=build.spec_dir,
+            model=model,
+            max_iterations=max_iterations,
+            verbose=verbose,
+            source_spec_dir=build.source_spec_dir,
+            subtask_workers=subtask_workers,
+            status_manager=spec_status,
+        )
+
+        if not is_build_complete(build.spec_dir):
+            result.outcome = OUTCOME_INCOMPLETE
+        elif skip_qa or not should_run_qa(build.spec_dir):
+            result.outcome = OUTCOME_BUILT
+        else:
+            spec_status.update(state=BuildState.QA)
+            approved = await run_qa_validation_loop(
+                project_dir=build.working_dir,
+                spec_dir=build.spec_dir,
+                model=model,
+                verbose=verbose,
+            )
+            sync_plan_to_source(build.spec_dir, build.source_spec_dir)
+            result.outcome = OUTCOME_QA_APPROVED if approved else OUTCOME_QA_INCOMPLETE
+            spec_status.update(
+                state=BuildState.COMPLETE if approved else BuildState.PAUSED
+            )
+    except Exception as e:
+        result.error = str(e)
+        spec_status.update(state=BuildState.ERROR)
+        print_status(f"{build.spec_name}: build failed: {e}", "error")
+        if verbose:
+            import traceback
+
+            traceback.print_exc()
+    return result
+
+
+def _shared_graphiti_client() -> contextlib.AbstractAsyncContextManager:
+    """One Graphiti client for every build (does nothing without Graphiti)."""
+    if is_graphiti_enabled():
+        try:
+            from graphiti_memory import shared_client
+
+            return shared_client()
+        except ImportError:
+            pass
+    return contextlib.nullcontext()
+
+
+async def run_spec_builds(
+    builds: list[SpecBuild],
+    model: str,
+    status_manager: StatusManager,
+    max_workers: int,
+    max_iterations: int | None = None,
+    verbose: bool = False,
+    skip_qa: bool = False,
+    subtask_workers: int = 1,
+) -> list[SpecBuildResult]:
+    """
+    Build specs concurrently, at most max_workers at a time.
+
+    Args:
+        builds: Specs to build, in start order
+        model: Model to use
+        status_manager: Aggregate status of the multi-spec build
+        max_workers: Maximum specs building at once
+        max_iterations: Maximum agent sessions per spec (None for unlimited)
+        verbose: Enable verbose output
+        skip_qa: Skip QA validation after builds complete
+        subtask_workers: Concurrent sessions for parallel-safe phases
+
+    Returns:
+        One SpecBuildResult per build, in the same order
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def run_one(build: SpecBuild) -> SpecBuildResult:
+        async with semaphore:
+            return await build_spec(
+                build,
+                model,
+                status_manager,
+                max_iterations=max_iterations,
+                verbose=verbose,
+                skip_qa=skip_qa,
+                subtask_workers=subtask_workers,
+            )
+
+    async with _shared_graphiti_client():
+        return list(await asyncio.gather(*(run_one(build) for build in builds)))
@@ -0,0 +1,514 @@
+"""
+Parallel Subtask Pool
+=====================
+
+Runs independent subtasks of a parallel-safe phase at the same time
+(--parallel N).
+
+Each worker gets its own git worktree, branched from the build's HEAD, and
+its own copy of the spec directory, so concurrent agents never write the
+same files. The pool is the only writer of the shared implementation plan
+and status file. When a worker finishes, its commits are folded back into
+the build branch - with a plain git merge when they don't overlap with the
+other workers', and through the MergeOrchestrator when they do - and its
+subtask status is copied into the plan. A subtask whose changes can't be
+merged goes back to pending and is retried on top of the merged work.
+
+File baselines are captured when a worker's worktree is created, so the
+orchestrator can merge the worker's changes and the work folded in since it
+branched as two tasks from the same starting point.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import shutil
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from core.client import create_client
+from core.git_runner import run_git
+from core.plan_store import get_plan_store
+from core.subtask_scheduler import SubtaskScheduler
+from debug import debug, debug_warning
+from linear_updater import linear_task_stuck
+from phase_config import get_phase_model, get_phase_thinking_budget
+from recovery import RecoveryManager
+from task_logger import LogPhase
+from ui import (
+    StatusManager,
+    highlight,
+    muted,
+    print_status,
+)
+
+from .post_session_queue import PostSessionQueue
+from .prefetch import build_prompt_bundle
+from .session import post_session_processing, run_agent_session
+from .utils import (
+    find_phase_for_subtask,
+    find_subtask_in_plan,
+    get_commit_count_async,
+    get_latest_commit_async,
+    load_implementation_plan,
+)
+
+logger = logging.getLogger(__name__)
+
+MODULE = "agents.subtask_pool"
+
+# Worker worktrees, inside the worktrees directory of the main repository
+SUBTASK_WORKTREES_DIR = Path(".worktrees") / ".subtasks"
+
+# Failed attempts before a subtask is marked stuck (same as the serial loop)
+MAX_SUBTASK_ATTEMPTS = 3
+
+
+@dataclass
+class SubtaskWorker:
+    """One subtask running in its own worktree."""
+
+    subtask: dict
+    worktree_path: Path
+    branch: str
+    spec_dir: Path
+    # Build commit the worktree was branched from
+    base_commit: str
+
+    @property
+    def subtask_id(self) -> str:
+        return self.subtask["id"]
+
+    @property
+    def merge_task_id(self) -> str:
+        """Task ID of the worker's changes in the MergeOrchestrator."""
+        return f"{self.spec_dir.name}-{self.subtask_id}"
+
+
+@dataclass
+class SubtaskWorkerResult:
+    """What happened to one subtask of a parallel batch."""
+
+    subtask_id: str
+    # Status the worker left the subtask in ("completed", "in_progress", ...)
+    worker_status: str
+    # "git", "orchestrator", "no_changes" or "failed"
+    merge_method: str
+    completed: bool
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _branch_name(spec_name: str, subtask_id: str) -> str:
+    safe_id = re.sub(r"[^A-Za-z0-9._-]+", "-", subtask_id).strip("-.")
+    return f"auto-claude/{spec_name}-subtask-{safe_id}"
+
+
+async def _repo_root(project_dir: Path) -> Path:
+    """Main repository of project_dir (which may itself be a worktree)."""
+    result = await run_git(
+        ["rev-parse", "--path-format=absolute", "--git-common-dir"],
+        cwd=project_dir,
+        check=True,
+    )
+    return Path(result.stdout.strip()).parent
+
+
+def set_subtask_status(
+    spec_dir: Path, subtask_id: str, status: str, notes: str | None = None
+) -> bool:
+    """
+    Set a subtask's status in the shared implementation plan.
+
+    Returns:
+        True if the subtask was found and updated
+    """
+
+    def apply(plan: dict) -> bool:
+        subtask = find_subtask_in_plan(plan, subtask_id)
+        if subtask is None:
+            return False
+        # datetime.UTC is Python 3.11+
+        now = datetime.now(timezone.utc).isoformat()  # noqa: UP017
+        subtask["status"] = status
+        if notes:
+            subtask["notes"] = notes
+        subtask["updated_at"] = now
+        plan["last_updated"] = now
+        return True
+
+    try:
+        return get_plan_store(spec_dir).update(apply)
+    except (OSError, ValueError) as e:
+        debug_warning(MODULE, "Could not update plan", error=str(e))
+        return False
+
+
+async def create_subtask_worktree(
+    project_dir: Path, spec_dir: Path, subtask: dict
+) -> SubtaskWorker:
+    """
+    Create a worktree for one subtask, branched from the build's HEAD.
+
+    The spec directory is copied into it, so the worker's agent reads and
+    updates its own copy of the plan, and the file baselines for merging it
+    back are captured in its .auto-claude directory.
+
+    Args:
+        project_dir: The build's working directory
+        spec_dir: The build's spec directory
+        subtask: Subtask dict from get_parallel_subtasks()
+
+    Returns:
+        The worker, ready to run
+    """
+    from core.workspace.dependency_cache import (
+        is_dependency_sharing_enabled,
+        share_dependencies,
+    )
+    from core.workspace.setup import copy_spec_to_worktree
+    from merge import FileEvolutionTracker
+
+    repo_root = await _repo_root(project_dir)
+    branch = _branch_name(spec_dir.name, subtask["id"])
+    worktree_path = repo_root / SUBTASK_WORKTREES_DIR / branch.rsplit("/", 1)[-1]
+
+    if worktree_path.exists():
+        # Left over from an interrupted run
+        await run_git(["worktree", "remove", "--force", str(worktree_path)], repo_root)
+        shutil.rmtree(worktree_path, ignore_errors=True)
+    await run_git(["worktree", "prune"], repo_root)
+    head = await run_git(["rev-parse", "HEAD"], cwd=project_dir, check=True)
+    base_commit = head.stdout.strip()
+    await run_git(
+        ["worktree", "add", "-B", branch, str(worktree_path), base_commit],
+        cwd=project_dir,
+        check=True,
+    )
+
+    worker_spec_dir = copy_spec_to_worktree(spec_dir, worktree_path, spec_dir.name)
+    worker = SubtaskWorker(subtask, worktree_path, branch, worker_spec_dir, base_commit)
+    tracker = FileEvolutionTracker(worktree_path)
+    await asyncio.to_thread(
+        tracker.capture_baselines,
+        worker.merge_task_id,
+        intent=subtask.get("description", ""),
+    )
+    if is_dependency_sharing_enabled():
+        await asyncio.to_thread(share_dependencies, repo_root, worktree_path)
+    debug(MODULE, "Created subtask worktree", subtask=subtask["id"], branch=branch)
+    return worker
+
+
+async def remove_subtask_worktree(project_dir: Path, worker: SubtaskWorker) -> None:
+    """Delete a worker's worktree and branch."""
+    from merge.git_object_reader import close_reader
+
+    close_reader(worker.worktree_path)
+    await run_git(
+        ["worktree", "remove", "--force", str(worker.worktree_path)], project_dir
+    )
+    if worker.worktree_path.exists():
+        shutil.rmtree(worker.worktree_path, ignore_errors=True)
+        await run_git(["worktree", "prune"], project_dir)
+    await run_git(["branch", "-D", worker.branch], project_dir)
+
+
+async def _run_worker(
+    worker: SubtaskWorker,
+    model: str,
+    recovery_manager: RecoveryManager,
+    verbose: bool,
+) -> str:
+    """
+    Run one coder session for a worker's subtask.
+
+    Returns:
+        The status the worker's agent left the subtask in
+    """
+    subtask = worker.subtask
+    spec_dir, project_dir = worker.spec_dir, worker.worktree_path
+
+    attempt_count = recovery_manager.get_attempt_count(worker.subtask_id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(worker.subtask_id)
+        if attempt_count > 0
+        else None
+    )
+    plan = load_implementation_plan(spec_dir)
+    phase = find_phase_for_subtask(plan, worker.subtask_id) if plan else {}
+
+    bundle = await build_prompt_bundle(
+        spec_dir,
+        project_dir,
+        subtask,
+        phase or {},
+        attempt_count,
+        recovery_hints,
+        include_graphiti=False,
+    )
+    prompt = bundle.prompt
+
+    client = create_client(
+        project_dir,
+        spec_dir,
+        get_phase_model(spec_dir, "coding", model),
+        max_thinking_tokens=get_phase_thinking_budget(spec_dir, "coding"),
+    )
+    async with client:
+        await run_agent_session(
+            client, prompt, spec_dir, verbose, phase=LogPhase.CODING
+        )
+
+    plan = load_implementation_plan(spec_dir)
+    worker_subtask = find_subtask_in_plan(plan, worker.subtask_id) if plan else None
+    return (worker_subtask or {}).get("status", "pending")
+
+
+async def _merge_with_orchestrator(
+    project_dir: Path, worker: SubtaskWorker, message: str
+) -> bool:
+    """
+    Fold a worker's overlapping changes in through the MergeOrchestrator.
+
+    The work merged into the build since the worker branched and the
+    worker's own changes are merged as two tasks against the baselines
+    captured in the worker's worktree. Git's merge is kept for every file it
+    could merge; only the conflicted files are taken from the orchestrator.
+    """
+    from merge import MergeOrchestrator, TaskMergeRequest
+
+    orchestrator = MergeOrchestrator(
+        project_dir,
+        storage_dir=worker.worktree_path / ".auto-claude",
+        enable_ai=True,
+    )
+    requests = [
+        TaskMergeRequest(f"{worker.spec_dir.name}-build", project_dir),
+        TaskMergeRequest(worker.merge_task_id, worker.worktree_path),
+    ]
+    report = await asyncio.to_thread(
+        orchestrator.merge_tasks,
+        requests,
+        target_branch=worker.base_commit,
+        base_ref=worker.base_commit,
+    )
+
+    await run_git(["merge", "--no-ff", "--no-commit", worker.branch], project_dir)
+    unmerged = await run_git(["diff", "--name-only", "--diff-filter=U"], project_dir)
+    conflicted = unmerged.stdout.splitlines()
+    results = [report.file_results.get(path) for path in conflicted]
+    failed = [
+        path
+        for path, result in zip(conflicted, results)
+        if result is None or not result.success or result.merged_content is None
+    ]
+    if not conflicted or failed:
+        debug_warning(
+            MODULE,
+            "Orchestrator could not merge subtask",
+            subtask=worker.subtask_id,
+            files=failed,
+            error=report.error,
+        )
+        await run_git(["merge", "--abort"], project_dir)
+        return False
+
+    for path, result in zip(conflicted, results):
+        (project_dir / path).write_text(result.merged_content, encoding="utf-8")
+    await run_git(["add", "--", *conflicted], project_dir)
+    commit = await run_git(["commit", "--no-verify", "-m", message], project_dir)
+    if not commit.ok:
+        await run_git(["merge", "--abort"], project_dir)
+    return commit.ok
+
+
+async def fold_subtask_branch(project_dir: Path, worker: SubtaskWorker) -> str:
+    """
+    Merge a worker's commits into the build branch.
+
+    Returns:
+        "git", "orchestrator", "no_changes" or "failed"
+    """
+    count = await run_git(
+        ["rev-list", "--count", f"HEAD..{worker.branch}"], project_dir
+    )
+    if count.ok and count.stdout.strip() == "0":
+        return "no_changes"
+
+    message = f"auto-claude: merge subtask {worker.subtask_id}"
+    merge = await run_git(
+        ["merge", "--no-ff", "--no-edit", "-m", message, worker.branch], project_dir
+    )
+    if merge.ok:
+        return "git"
+
+    await run_git(["merge", "--abort"], project_dir)
+    debug(MODULE, "Subtask overlaps with merged work", subtask=worker.subtask_id)
+    if await _merge_with_orchestrator(project_dir, worker, message):
+        return "orchestrator"
+    return "failed"
+
+
+async def run_parallel_subtasks(
+    project_dir: Path,
+    spec_dir: Path,
+    subtasks: list[dict],
+    model: str,
+    session_num: int,
+    recovery_manager: RecoveryManager,
+    status_manager: StatusManager,
+    max_workers: int,
+    verbose: bool = False,
+    linear_enabled: bool = False,
+    source_spec_dir: Path | None = None,
+    post_session_queue: PostSessionQueue | None = None,
+    scheduler: SubtaskScheduler | None = None,
+) -> list[SubtaskWorkerResult]:
+    """
+    Run a batch of independent subtasks concurrently and fold them back.
+
+    Args:
+        project_dir: The build's working directory
+        spec_dir: The build's spec directory
+        subtasks: Subtasks claimed from the scheduler (or from
+            get_parallel_subtasks())
+        model: Default Claude model
+        session_num: Session number shared by the batch
+        recovery_manager: Recovery manager for attempt tracking
+        status_manager: Status manager for ccstatusline
+        max_workers: The --parallel limit (shown in the status line)
+        verbose: Whether to show detailed output
+        linear_enabled: Whether Linear integration is enabled
+        source_spec_dir: Original spec directory (for syncing back from worktree)
+        post_session_queue: Optional queue for background post-session work
+        scheduler: The scheduler the subtasks were claimed from; completed
+            ones are marked in it and the rest are released
+
+    Returns:
+        One result per subtask, in batch order
+    """
+    print_status(f"Running {len(subtasks)} subtasks in parallel", "progress")
+    for subtask in subtasks:
+        print(f"  {highlight(subtask['id'])}: {subtask.get('description', '')}")
+        set_subtask_status(spec_dir, subtask["id"], "in_progress")
+    print()
+
+    workers = []
+    results = []
+    # Subtasks whose status the batch has settled, and worktrees to remove
+    settled: set[str] = set()
+    to_remove: list[SubtaskWorker] = []
+    try:
+        for subtask in subtasks:
+            try:
+                worker = await create_subtask_worktree(project_dir, spec_dir, subtask)
+            except Exception as e:
+                logger.warning(f"Could not create worktree for {subtask['id']}: {e}")
+                set_subtask_status(spec_dir, subtask["id"], "pending")
+                settled.add(subtask["id"])
+                continue
+            workers.append(worker)
+            to_remove.append(worker)
+
+        status_manager.update_workers(len(workers), max_workers)
+        status_manager.update_subtasks(in_progress=len(workers))
+        outcomes = await asyncio.gather(
+            *(_run_worker(w, model, recovery_manager, verbose) for w in workers),
+            return_exceptions=True,
+        )
+        status_manager.update_workers(0)
+
+        # Fold back one worker at a time, so each merge builds on the previous
+        for worker, outcome in zip(workers, outcomes):
+            error = str(outcome) if isinstance(outcome, BaseException) else None
+            worker_status = "error" if error else outcome
+            commit_before, commit_count_before = await asyncio.gather(
+                get_latest_commit_async(project_dir),
+                get_commit_count_async(project_dir),
+            )
+
+            merge_method = await fold_subtask_branch(project_dir, worker)
+            completed = worker_status == "completed" and merge_method != "failed"
+            if merge_method == "failed":
+                error = "Changes conflict with the other subtasks of this phase"
+            result = SubtaskWorkerResult(
+                subtask_id=worker.subtask_id,
+                worker_status=worker_status,
+                merge_method=merge_method,
+                completed=completed,
+                error=error,
+            )
+            results.append(result)
+            debug(MODULE, "Subtask worker finished", **result.to_dict())
+
+            set_subtask_status(
+                spec_dir,
+                worker.subtask_id,
+                "completed" if completed else "pending",
+                notes=error,
+            )
+            settled.add(worker.subtask_id)
+            await post_session_processing(
+                spec_dir=spec_dir,
+                project_dir=project_dir,
+                subtask_id=worker.subtask_id,
+                session_num=session_num,
+                commit_before=commit_before,
+                commit_count_before=commit_count_before,
+                recovery_manager=recovery_manager,
+                linear_enabled=linear_enabled,
+                status_manager=status_manager,
+                source_spec_dir=source_spec_dir,
+                post_session_queue=post_session_queue,
+            )
+
+            attempt_count = recovery_manager.get_attempt_count(worker.subtask_id)
+            if not completed and attempt_count >= MAX_SUBTASK_ATTEMPTS:
+                # Keep it out of later batches
+                recovery_manager.mark_subtask_stuck(
+                    worker.subtask_id, f"Failed after {attempt_count} attempts"
+                )
+                set_subtask_status(spec_dir, worker.subtask_id, "failed")
+                print_status(
+                    f"Subtask {worker.subtask_id} marked as STUCK after {attempt_count} attempts",
+                    "error",
+                )
+                if linear_enabled:
+                    await linear_task_stuck(
+                        spec_dir=spec_dir,
+                        subtask_id=worker.subtask_id,
+                        attempt_count=attempt_count,
+                    )
+
+            if completed and scheduler is not None:
+                scheduler.mark_completed(worker.subtask_id)
+
+            to_remove.remove(worker)
+            await remove_subtask_worktree(project_dir, worker)
+    finally:
+        interrupted = [s["id"] for s in subtasks if s["id"] not in settled]
+        if interrupted:
+            # Left in_progress, no later batch would pick them up again
+            status_manager.update_workers(0)
+            await run_git(["merge", "--abort"], project_dir)
+            for subtask_id in interrupted:
+                set_subtask_status(spec_dir, subtask_id, "pending")
+        for worker in to_remove:
+            try:
+                await remove_subtask_worktree(project_dir, worker)
+            except Exception as e:
+                logger.warning(f"Could not remove worktree {worker.worktree_path}: {e}")
+        if scheduler is not None:
+            # Completed ones were marked above; the rest can be claimed again
+            for subtask in subtasks:
+                scheduler.release(subtask["id"])
+
+    completed_count = sum(1 for r in results if r.completed)
+    print(muted(f"\nParallel batch: {completed_count}/{len(results)} subtasks merged"))
+    return results
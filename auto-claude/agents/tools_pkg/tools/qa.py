@@ -10,6 +10,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from core.plan_store import get_plan_store
+
 try:
     from claude_agent_sdk import tool
 
@@ -66,8 +68,8 @@ def create_qa_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
-        plan_file = spec_dir / "implementation_plan.json"
-        if not plan_file.exists():
+        store = get_plan_store(spec_dir)
+        if not store.plan_file.exists():
             return {
                 "content": [
                     {
@@ -89,37 +91,35 @@ def create_qa_tools(spec_dir: Path, project_dir: Path) -> list:
             except json.JSONDecodeError:
                 tests_passed = {}
 
-            with open(plan_file) as f:
-                plan = json.load(f)
-
-            # Get current QA session number
-            current_qa = plan.get("qa_signoff", {})
-            qa_session = current_qa.get("qa_session", 0)
-            if status in ["in_review", "rejected"]:
-                qa_session += 1
-
-            plan["qa_signoff"] = {
-                "status": status,
-                "qa_session": qa_session,
-                "issues_found": issues,
-                "tests_passed": tests_passed,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "ready_for_qa_revalidation": status == "fixes_applied",
-            }
-
-            # Update plan status to match QA result
-            # This ensures the UI shows the correct column after QA
-            if status == "approved":
-                plan["status"] = "human_review"
-                plan["planStatus"] = "review"
-            elif status == "rejected":
-                plan["status"] = "human_review"
-                plan["planStatus"] = "review"
-
-            plan["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-            with open(plan_file, "w") as f:
-                json.dump(plan, f, indent=2)
+            def apply(plan: dict) -> int:
+                # Get current QA session number
+                current_qa = plan.get("qa_signoff", {})
+                qa_session = current_qa.get("qa_session", 0)
+                if status in ["in_review", "rejected"]:
+                    qa_session += 1
+
+                plan["qa_signoff"] = {
+                    "status": status,
+                    "qa_session": qa_session,
+                    "issues_found": issues,
+                    "tests_passed": tests_passed,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "ready_for_qa_revalidation": status == "fixes_applied",
+                }
+
+                # Update plan status to match QA result
+                # This ensures the UI shows the correct column after QA
+                if status == "approved":
+                    plan["status"] = "human_review"
+                    plan["planStatus"] = "review"
+                elif status == "rejected":
+                    plan["status"] = "human_review"
+                    plan["planStatus"] = "review"
+
+                plan["last_updated"] = datetime.now(timezone.utc).isoformat()
+                return qa_session
+
+            qa_session = store.update(apply)
 
             return {
                 "content": [
@@ -10,6 +10,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from core.plan_store import get_plan_store
+
 try:
     from claude_agent_sdk import tool
 
@@ -60,8 +62,8 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
-        plan_file = spec_dir / "implementation_plan.json"
-        if not plan_file.exists():
+        store = get_plan_store(spec_dir)
+        if not store.plan_file.exists():
             return {
                 "content": [
                     {
@@ -71,12 +73,8 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
-        try:
-            with open(plan_file) as f:
-                plan = json.load(f)
-
+        def apply(plan: dict) -> bool:
             # Find and update the subtask
-            subtask_found = False
             for phase in plan.get("phases", []):
                 for subtask in phase.get("subtasks", []):
                     if subtask.get("id") == subtask_id:
@@ -84,10 +82,15 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                         if notes:
                             subtask["notes"] = notes
                         subtask["updated_at"] = datetime.now(timezone.utc).isoformat()
-                        subtask_found = True
-                        break
-                if subtask_found:
-                    break
+                        # Update plan metadata
+                        plan["last_updated"] = datetime.now(timezone.utc).isoformat()
+                        return True
+            return False
+
+        try:
+            # Read-modify-write under the plan lock, so concurrent agents
+            # don't overwrite each other's updates
+            subtask_found = store.update(apply)
 
             if not subtask_found:
                 return {
@@ -99,12 +102,6 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                     ]
                 }
 
-            # Update plan metadata
-            plan["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-            with open(plan_file, "w") as f:
-                json.dump(plan, f, indent=2)
-
             return {
                 "content": [
                     {
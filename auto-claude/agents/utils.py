@@ -5,12 +5,13 @@ Utility Functions for Agent System
 Helper functions for git operations, plan management, and file syncing.
 """
 
-import json
 import logging
-import shutil
 import subprocess
 from pathlib import Path
 
+from core.git_runner import run_git
+from core.plan_store import get_plan_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,16 +45,24 @@ def get_commit_count(project_dir: Path) -> int:
         return 0
 
 
-def load_implementation_plan(spec_dir: Path) -> dict | None:
-    """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return None
+async def get_latest_commit_async(project_dir: Path) -> str | None:
+    """Get the hash of the latest git commit without blocking the event loop."""
+    result = await run_git(["rev-parse", "HEAD"], cwd=project_dir)
+    return result.stdout.strip() if result.ok else None
+
+
+async def get_commit_count_async(project_dir: Path) -> int:
+    """Get the total number of commits without blocking the event loop."""
+    result = await run_git(["rev-list", "--count", "HEAD"], cwd=project_dir)
     try:
-        with open(plan_file) as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return None
+        return int(result.stdout.strip()) if result.ok else 0
+    except ValueError:
+        return 0
+
+
+def load_implementation_plan(spec_dir: Path) -> dict | None:
+    """Load a private copy of the implementation plan JSON."""
+    return get_plan_store(spec_dir).load()
 
 
 def find_subtask_in_plan(plan: dict, subtask_id: str) -> dict | None:
@@ -100,16 +109,17 @@ def sync_plan_to_source(spec_dir: Path, source_spec_dir: Path | None) -> bool:
     if spec_dir_resolved == source_spec_dir_resolved:
         return False  # Same directory, no sync needed
 
-    # Sync the implementation plan
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
+    # Sync the implementation plan (atomically, so the UI never reads a
+    # partial plan)
+    plan = get_plan_store(spec_dir).get()
+    if plan is None:
         return False
 
-    source_plan_file = source_spec_dir / "implementation_plan.json"
+    source_store = get_plan_store(source_spec_dir)
 
     try:
-        shutil.copy2(plan_file, source_plan_file)
-        logger.debug(f"Synced implementation plan to source: {source_plan_file}")
+        source_store.write(plan)
+        logger.debug(f"Synced implementation plan to source: {source_store.plan_file}")
         return True
     except Exception as e:
         logger.warning(f"Failed to sync implementation plan to source: {e}")
@@ -9,6 +9,7 @@ Uses the Claude Agent SDK (same as the rest of the system) for extraction.
 Falls back to generic insights if extraction fails (never blocks the build).
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -29,6 +30,8 @@ except ImportError:
     ClaudeSDKClient = None
 
 from core.auth import ensure_claude_code_oauth_token, get_auth_token
+from core.git_runner import run_git
+from core.rate_limiter import Priority, rate_limited
 
 # Default model for insight extraction (fast and cheap)
 DEFAULT_EXTRACTION_MODEL = "claude-3-5-haiku-latest"
@@ -98,15 +101,7 @@ def get_session_diff(
             text=True,
             timeout=30,
         )
-        diff = result.stdout
-
-        if len(diff) > MAX_DIFF_CHARS:
-            # Truncate and add note
-            diff = (
-                diff[:MAX_DIFF_CHARS] + f"\n\n... (truncated, {len(diff)} chars total)"
-            )
-
-        return diff if diff else "(Empty diff)"
+        return _format_diff(result.stdout)
 
     except subprocess.TimeoutExpired:
         logger.warning("Git diff timed out")
@@ -116,6 +111,14 @@ def get_session_diff(
         return f"(Failed to get diff: {e})"
 
 
+def _format_diff(diff: str) -> str:
+    if len(diff) > MAX_DIFF_CHARS:
+        # Truncate and add note
+        diff = diff[:MAX_DIFF_CHARS] + f"\n\n... (truncated, {len(diff)} chars total)"
+
+    return diff if diff else "(Empty diff)"
+
+
 def get_changed_files(
     project_dir: Path,
     commit_before: str | None,
@@ -143,14 +146,17 @@ def get_changed_files(
             text=True,
             timeout=10,
         )
-        files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
-        return files
+        return _parse_changed_files(result.stdout)
 
     except Exception as e:
         logger.warning(f"Failed to get changed files: {e}")
         return []
 
 
+def _parse_changed_files(output: str) -> list[str]:
+    return [f.strip() for f in output.strip().split("\n") if f.strip()]
+
+
 def get_commit_messages(
     project_dir: Path,
     commit_before: str | None,
@@ -168,13 +174,17 @@ def get_commit_messages(
             text=True,
             timeout=10,
         )
-        return result.stdout.strip() if result.stdout.strip() else "(No commits)"
+        return _format_commit_messages(result.stdout)
 
     except Exception as e:
         logger.warning(f"Failed to get commit messages: {e}")
         return f"(Failed: {e})"
 
 
+def _format_commit_messages(output: str) -> str:
+    return output.strip() if output.strip() else "(No commits)"
+
+
 # =============================================================================
 # Input Gathering
 # =============================================================================
@@ -233,6 +243,66 @@ def gather_extraction_inputs(
     }
 
 
+async def gather_extraction_inputs_async(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask_id: str,
+    session_num: int,
+    commit_before: str | None,
+    commit_after: str | None,
+    success: bool,
+    recovery_manager: Any,
+) -> dict:
+    """
+    Gather all inputs needed for insight extraction without blocking the event loop.
+
+    Same result as gather_extraction_inputs, with the git commands run
+    concurrently through the async git runner.
+    """
+    if not commit_before or not commit_after or commit_before == commit_after:
+        # Nothing to ask git about
+        return gather_extraction_inputs(
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            commit_before=commit_before,
+            commit_after=commit_after,
+            success=success,
+            recovery_manager=recovery_manager,
+        )
+
+    diff_result, files_result, log_result = await asyncio.gather(
+        run_git(["diff", commit_before, commit_after], cwd=project_dir, timeout=30),
+        run_git(
+            ["diff", "--name-only", commit_before, commit_after],
+            cwd=project_dir,
+            timeout=10,
+        ),
+        run_git(
+            ["log", "--oneline", f"{commit_before}..{commit_after}"],
+            cwd=project_dir,
+            timeout=10,
+        ),
+    )
+    if diff_result.timed_out:
+        logger.warning("Git diff timed out")
+        diff = "(Git diff timed out)"
+    else:
+        diff = _format_diff(diff_result.stdout)
+
+    return {
+        "subtask_id": subtask_id,
+        "subtask_description": _get_subtask_description(spec_dir, subtask_id),
+        "session_num": session_num,
+        "success": success,
+        "diff": diff,
+        "changed_files": _parse_changed_files(files_result.stdout),
+        "commit_messages": _format_commit_messages(log_result.stdout),
+        "attempt_history": _get_attempt_history(recovery_manager, subtask_id),
+    }
+
+
 def _get_subtask_description(spec_dir: Path, subtask_id: str) -> str:
     """Get subtask description from implementation plan."""
     plan_file = spec_dir / "implementation_plan.json"
@@ -373,17 +443,21 @@ async def run_insight_extraction(
     try:
         # Create a minimal SDK client for insight extraction
         # No tools needed - just text generation
-        client = ClaudeSDKClient(
-            options=ClaudeAgentOptions(
-                model=model,
-                system_prompt=(
-                    "You are an expert code analyst. You extract structured insights from coding sessions. "
-                    "Always respond with valid JSON only, no markdown formatting or explanations."
-                ),
-                allowed_tools=[],  # No tools needed for extraction
-                max_turns=1,  # Single turn extraction
-                cwd=cwd,
-            )
+        client = rate_limited(
+            ClaudeSDKClient(
+                options=ClaudeAgentOptions(
+                    model=model,
+                    system_prompt=(
+                        "You are an expert code analyst. You extract structured insights from coding sessions. "
+                        "Always respond with valid JSON only, no markdown formatting or explanations."
+                    ),
+                    allowed_tools=[],  # No tools needed for extraction
+                    max_turns=1,  # Single turn extraction
+                    cwd=cwd,
+                )
+            ),
+            model,
+            Priority.INSIGHTS,
         )
 
         # Use async context manager
@@ -501,7 +575,7 @@ async def extract_session_insights(
 
     try:
         # Gather inputs
-        inputs = gather_extraction_inputs(
+        inputs = await gather_extraction_inputs_async(
             spec_dir=spec_dir,
             project_dir=project_dir,
             subtask_id=subtask_id,
@@ -8,6 +8,7 @@ This package provides a modular CLI structure:
 - main.py: Argument parsing and command routing
 - spec_commands.py: Spec listing and management
 - build_commands.py: Build execution and follow-up tasks
+- multi_build_commands.py: Building several specs concurrently (--specs)
 - workspace_commands.py: Workspace management (merge, review, discard)
 - qa_commands.py: QA validation commands
 - utils.py: Shared utilities and configuration
@@ -61,6 +61,7 @@ def handle_build_command(
     skip_qa: bool,
     force_bypass_approval: bool,
     base_branch: str | None = None,
+    subtask_workers: int = 1,
 ) -> None:
     """
     Handle the main build command.
@@ -77,6 +78,7 @@ def handle_build_command(
         skip_qa: Skip automatic QA validation
         force_bypass_approval: Force bypass approval check
         base_branch: Base branch for worktree creation (default: current branch)
+        subtask_workers: Concurrent sessions for parallel-safe phases (--parallel)
     """
     # Lazy imports to avoid loading heavy modules
     from agent import run_autonomous_agent, sync_plan_to_source
@@ -115,6 +117,9 @@ def handle_build_command(
     else:
         print("Max iterations: Unlimited (runs until all subtasks complete)")
 
+    if subtask_workers > 1:
+        print(f"Parallel subtasks: up to {subtask_workers} (parallel-safe phases)")
+
     print()
 
     # Validate environment
@@ -231,6 +236,7 @@ def handle_build_command(
                 max_iterations=max_iterations,
                 verbose=verbose,
                 source_spec_dir=source_spec_dir,  # For syncing progress back to main project
+                subtask_workers=subtask_workers,
             )
         )
         debug_success("run.py", "Agent execution completed")
@@ -305,6 +311,7 @@ def handle_build_command(
             model=model,
             max_iterations=max_iterations,
             verbose=verbose,
+            subtask_workers=subtask_workers,
         )
     except Exception as e:
         print(f"\nFatal error: {e}")
@@ -323,6 +330,7 @@ def _handle_build_interrupt(
     model: str,
     max_iterations: int | None,
     verbose: bool,
+    subtask_workers: int = 1,
 ) -> None:
     """
     Handle keyboard interrupt during build.
@@ -335,6 +343,7 @@ def _handle_build_interrupt(
         model: Model being used
         max_iterations: Maximum iterations
         verbose: Verbose mode flag
+        subtask_workers: Concurrent sessions for parallel-safe phases
     """
     from agent import run_autonomous_agent
 
@@ -441,6 +450,7 @@ def _handle_build_interrupt(
                     model=model,
                     max_iterations=max_iterations,
                     verbose=verbose,
+                    subtask_workers=subtask_workers,
                 )
             )
             # Build completed or was interrupted again - exit
@@ -22,6 +22,11 @@ from ui import (
 
 from .build_commands import handle_build_command
 from .followup_commands import handle_followup_command
+from .multi_build_commands import (
+    DEFAULT_MAX_WORKERS,
+    handle_multi_build_command,
+    parse_spec_list,
+)
 from .qa_commands import (
     handle_qa_command,
     handle_qa_status_command,
@@ -40,6 +45,7 @@ from .workspace_commands import (
     handle_discard_command,
     handle_list_worktrees_command,
     handle_merge_command,
+    handle_merge_preflight_command,
     handle_review_command,
 )
 
@@ -58,6 +64,9 @@ Examples:
   python auto-claude/run.py --spec 001
   python auto-claude/run.py --spec 001-initial-app
 
+  # Build several specs at once, each in its own worktree
+  python auto-claude/run.py --specs 001,002,003 --max-workers 2
+
   # Workspace management (after build completes)
   python auto-claude/run.py --spec 001 --merge     # Add build to your project
   python auto-claude/run.py --spec 001 --review    # See what was built
@@ -66,6 +75,7 @@ Examples:
   # Advanced options
   python auto-claude/run.py --spec 001 --direct       # Skip workspace isolation
   python auto-claude/run.py --spec 001 --isolated     # Force workspace isolation
+  python auto-claude/run.py --spec 001 --parallel 3   # Up to 3 concurrent subtasks
 
   # Status checks
   python auto-claude/run.py --spec 001 --review-status  # Check human review status
@@ -95,6 +105,22 @@ Environment Variables:
         help="Spec to run (e.g., '001' or '001-feature-name')",
     )
 
+    parser.add_argument(
+        "--specs",
+        type=str,
+        default=None,
+        help="Comma-separated specs to build concurrently in one process "
+        "(e.g., '001,002,003'); each is built in its own worktree",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        metavar="N",
+        help=f"With --specs: build up to N specs at once (default: {DEFAULT_MAX_WORKERS})",
+    )
+
     parser.add_argument(
         "--project-dir",
         type=Path,
@@ -122,6 +148,15 @@ Environment Variables:
         help="Enable verbose output",
     )
 
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N subtasks of a parallel-safe phase at once, "
+        "each in its own worktree (default: 1)",
+    )
+
     # Workspace options
     workspace_group = parser.add_mutually_exclusive_group()
     workspace_group.add_argument(
@@ -221,6 +256,11 @@ Environment Variables:
         action="store_true",
         help="Remove all spec worktrees and their branches (with confirmation)",
     )
+    parser.add_argument(
+        "--merge-preflight",
+        action="store_true",
+        help="Check every spec branch for merge conflicts (returns JSON)",
+    )
 
     # Force bypass
     parser.add_argument(
@@ -260,6 +300,7 @@ def main() -> None:
 
     # Get model (with env var fallback)
     from phase_config import resolve_model_id
+
     model = resolve_model_id(
         args.model
         or os.environ.get("AUTO_BUILD_MODEL")
@@ -289,6 +330,18 @@ def main() -> None:
         handle_cleanup_worktrees_command(project_dir)
         return
 
+    # Handle --merge-preflight command
+    if args.merge_preflight:
+        import json
+
+        print(json.dumps(handle_merge_preflight_command(project_dir)))
+        return
+
+    # Handle --specs (concurrent multi-spec build)
+    if args.specs:
+        _run_multi_build(args, project_dir, model)
+        return
+
     # Require --spec if not listing
     if not args.spec:
         print_banner()
@@ -381,6 +434,57 @@ def main() -> None:
         skip_qa=args.skip_qa,
         force_bypass_approval=args.force,
         base_branch=args.base_branch,
+        subtask_workers=max(1, args.parallel),
+    )
+
+
+def _run_multi_build(args: argparse.Namespace, project_dir: Path, model: str) -> None:
+    """Validate --specs and build the specs concurrently."""
+    other_commands = [
+        flag
+        for flag, value in (
+            ("--spec", args.spec),
+            ("--merge", args.merge),
+            ("--review", args.review),
+            ("--discard", args.discard),
+            ("--merge-preview", args.merge_preview),
+            ("--qa", args.qa),
+            ("--qa-status", args.qa_status),
+            ("--review-status", args.review_status),
+            ("--followup", args.followup),
+            ("--direct", args.direct),
+        )
+        if value
+    ]
+    if other_commands:
+        print_banner()
+        print(f"\nError: --specs can't be combined with {', '.join(other_commands)}")
+        print("Multi-spec builds always use isolated workspaces; manage each")
+        print("build afterwards with --spec <name> --review / --merge.")
+        sys.exit(1)
+
+    spec_dirs = []
+    for identifier in dict.fromkeys(parse_spec_list(args.specs)):
+        spec_dir = find_spec(project_dir, identifier, args.dev)
+        if not spec_dir:
+            print_banner()
+            print(f"\nError: Spec '{identifier}' not found")
+            print("\nAvailable specs:")
+            print_specs_list(project_dir, args.dev)
+            sys.exit(1)
+        spec_dirs.append(spec_dir)
+
+    handle_multi_build_command(
+        project_dir=project_dir,
+        spec_dirs=spec_dirs,
+        model=model,
+        max_workers=max(1, args.max_workers),
+        max_iterations=args.max_iterations,
+        verbose=args.verbose,
+        skip_qa=args.skip_qa,
+        force_bypass_approval=args.force,
+        base_branch=args.base_branch,
+        subtask_workers=max(1, args.parallel),
     )
 
 
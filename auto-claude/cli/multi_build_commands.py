@@ -0,0 +1,238 @@
+"""
+Multi-Spec Build Commands
+=========================
+
+CLI command for building several specs at once (--specs a,b,c).
+
+Each spec is built in its own worktree, by its own run_autonomous_agent
+loop, with up to --max-workers loops running side by side in one event
+loop. Running them in one process means they share what is process-wide:
+the API rate limiter, the security profile cache and the loaded modules.
+The project is analyzed once: every worktree uses the project's index and
+security profile. The project's .auto-claude-status file shows the progress
+of every spec.
+
+The worktrees are left in place when the builds finish, to be reviewed and
+merged spec by spec (--spec X --review / --merge).
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Ensure parent directory is in path for imports (before other imports)
+_PARENT_DIR = Path(__file__).parent.parent
+if str(_PARENT_DIR) not in sys.path:
+    sys.path.insert(0, str(_PARENT_DIR))
+
+from review import ReviewState
+from ui import (
+    BuildState,
+    Icons,
+    StatusManager,
+    bold,
+    box,
+    error,
+    highlight,
+    icon,
+    muted,
+    print_status,
+    success,
+    warning,
+)
+from workspace import WorkspaceMode, setup_workspace
+
+from .utils import print_banner, validate_environment
+
+# Concurrent spec builds when --max-workers isn't given
+DEFAULT_MAX_WORKERS = 2
+
+
+def parse_spec_list(value: str) -> list[str]:
+    """Split a --specs value ('001,002, 003') into spec identifiers."""
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _print_summary(results: list) -> None:
+    """Print how each spec's build ended, and what to do next."""
+    from agents.spec_pool import (
+        OUTCOME_BLOCKED,
+        OUTCOME_BUILT,
+        OUTCOME_ERROR,
+        OUTCOME_INCOMPLETE,
+        OUTCOME_QA_APPROVED,
+        OUTCOME_QA_INCOMPLETE,
+    )
+
+    labels = {
+        OUTCOME_QA_APPROVED: success("QA approved"),
+        OUTCOME_QA_INCOMPLETE: warning("QA needs attention"),
+        OUTCOME_BUILT: success("built"),
+        OUTCOME_INCOMPLETE: warning("incomplete"),
+        OUTCOME_BLOCKED: warning("not approved for building"),
+        OUTCOME_ERROR: error("failed"),
+    }
+    content = [bold(f"{icon(Icons.SESSION)} MULTI-SPEC BUILD SUMMARY"), ""]
+    for result in results:
+        line = f"{highlight(result.spec_name)}: {labels[result.outcome]}"
+        if result.error:
+            line += muted(f" ({result.error})")
+        content.append(line)
+
+    built = [r.spec_name for r in results if r.working_dir is not None]
+    if built:
+        content.extend(["", "Review and merge each build:"])
+        for name in built:
+            content.append(f"  python auto-claude/run.py --spec {name} --review")
+            content.append(f"  python auto-claude/run.py --spec {name} --merge")
+    print()
+    print(box(content, width=70, style="heavy"))
+    print()
+
+
+def handle_multi_build_command(
+    project_dir: Path,
+    spec_dirs: list[Path],
+    model: str,
+    max_workers: int,
+    max_iterations: int | None,
+    verbose: bool,
+    skip_qa: bool,
+    force_bypass_approval: bool,
+    base_branch: str | None = None,
+    subtask_workers: int = 1,
+) -> None:
+    """
+    Handle --specs: build several specs concurrently in one process.
+
+    Every spec is built in an isolated worktree; nothing prompts, so this
+    also suits automation.
+
+    Args:
+        project_dir: Project root directory
+        spec_dirs: Spec directories to build
+        model: Model to use (may be overridden by task_metadata.json)
+        max_workers: Maximum specs building at once
+        max_iterations: Maximum agent sessions per spec (None for unlimited)
+        verbose: Enable verbose output
+        skip_qa: Skip automatic QA validation
+        force_bypass_approval: Build specs that haven't been approved
+        base_branch: Base branch for worktree creation (default: current branch)
+        subtask_workers: Concurrent sessions for parallel-safe phases (--parallel)
+    """
+    # Lazy imports to avoid loading heavy modules
+    from agents.spec_pool import (
+        OUTCOME_BLOCKED,
+        SpecBuild,
+        SpecBuildResult,
+        run_spec_builds,
+    )
+    from debug import debug, debug_section
+    from prompts_pkg.project_context import share_project_index
+    from security import share_security_profile
+
+    print_banner()
+    print(f"\nProject directory: {project_dir}")
+    print(f"Specs: {', '.join(spec_dir.name for spec_dir in spec_dirs)}")
+    print(f"Model: {model}")
+    print(f"Max workers: {max_workers}")
+    print()
+
+    results: list[SpecBuildResult] = []
+    approved_dirs = []
+    for spec_dir in spec_dirs:
+        if not validate_environment(spec_dir):
+            sys.exit(1)
+        if ReviewState.load(spec_dir).is_approval_valid(spec_dir):
+            approved_dirs.append(spec_dir)
+        elif force_bypass_approval:
+            print(
+                warning(
+                    f"{icon(Icons.WARNING)} {spec_dir.name}: bypassing approval check with --force"
+                )
+            )
+            approved_dirs.append(spec_dir)
+        else:
+            print_status(
+                f"{spec_dir.name}: not approved for building, skipping "
+                f"(review with: python auto-claude/review.py --spec-dir {spec_dir})",
+                "warning",
+            )
+            results.append(SpecBuildResult(spec_dir.name, OUTCOME_BLOCKED))
+
+    if not approved_dirs:
+        _print_summary(results)
+        sys.exit(1)
+
+    # Worktrees are created one at a time; concurrent `git worktree add`
+    # calls on one repository contend for its lock files
+    builds = []
+    for spec_dir in approved_dirs:
+        working_dir, _, localized_spec_dir = setup_workspace(
+            project_dir,
+            spec_dir.name,
+            WorkspaceMode.ISOLATED,
+            source_spec_dir=spec_dir,
+            base_branch=base_branch,
+        )
+        builds.append(
+            SpecBuild(
+                spec_name=spec_dir.name,
+                spec_dir=localized_spec_dir or spec_dir,
+                working_dir=working_dir,
+                source_spec_dir=spec_dir,
+            )
+        )
+
+    # The worktrees are checked out from the project, so they share its
+    # analysis instead of each being analyzed again
+    worktree_dirs = [build.working_dir for build in builds]
+    share_project_index(project_dir, worktree_dirs)
+    share_security_profile(project_dir, worktree_dirs)
+
+    status_manager = StatusManager(project_dir)
+    status_manager.set_active(
+        ",".join(build.spec_name for build in builds), BuildState.BUILDING
+    )
+    status_manager.update_workers(0, max_workers)
+
+    debug_section("run.py", "Starting Multi-Spec Build")
+    debug(
+        "run.py",
+        "Multi-spec build configuration",
+        specs=[build.spec_name for build in builds],
+        max_workers=max_workers,
+        model=model,
+    )
+
+    try:
+        results.extend(
+            asyncio.run(
+                run_spec_builds(
+                    builds,
+                    model,
+                    status_manager,
+                    max_workers=max_workers,
+                    max_iterations=max_iterations,
+                    verbose=verbose,
+                    skip_qa=skip_qa,
+                    subtask_workers=subtask_workers,
+                )
+            )
+        )
+    except KeyboardInterrupt:
+        status_manager.update(state=BuildState.PAUSED)
+        specs = ",".join(spec_dir.name for spec_dir in spec_dirs)
+        print("\n\nBuilds paused. Progress is saved in each spec's workspace.")
+        print(
+            f"Resume: python auto-claude/run.py --specs {specs} --max-workers {max_workers}"
+        )
+        sys.exit(0)
+
+    order = {spec_dir.name: i for i, spec_dir in enumerate(spec_dirs)}
+    results.sort(key=lambda result: order[result.spec_name])
+    failed = [result for result in results if not result.succeeded]
+    status_manager.update(state=BuildState.ERROR if failed else BuildState.COMPLETE)
+    _print_summary(results)
+    if failed:
+        sys.exit(1)
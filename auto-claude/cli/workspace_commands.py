@@ -14,7 +14,8 @@ _PARENT_DIR = Path(__file__).parent.parent
 if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
-from core.workspace.git_utils import _is_auto_claude_file, is_lock_file
+from core.workspace.git_utils import is_lock_file
+from core.workspace.merge_preflight import preflight_merge, preflight_merges
 from debug import debug_warning
 from ui import (
     Icons,
@@ -339,12 +340,39 @@ def handle_cleanup_worktrees_command(project_dir: Path) -> None:
     cleanup_all_worktrees(project_dir, confirm=True)
 
 
+def handle_merge_preflight_command(project_dir: Path) -> dict:
+    """
+    Handle the --merge-preflight command.
+
+    Checks every spec branch for git-level conflicts with the current
+    branch in one batch, for the UI's conflict badges. Nothing in the
+    working directory is touched.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        JSON-serializable dict mapping spec name to its preflight result
+    """
+    try:
+        results = preflight_merges(project_dir)
+    except Exception as e:
+        debug_error(MODULE, f"Merge preflight failed: {e}")
+        return {"success": False, "error": str(e), "specs": {}}
+
+    return {
+        "success": True,
+        "specs": {name: result.to_dict() for name, result in results.items()},
+    }
+
+
 def _check_git_merge_conflicts(project_dir: Path, spec_name: str) -> dict:
     """
     Check for git-level merge conflicts WITHOUT modifying the working directory.
 
-    Uses git merge-tree and git diff to detect conflicts in-memory,
-    which avoids triggering Vite HMR or other file watchers.
+    Uses git merge-tree to detect conflicts in-memory, which avoids
+    triggering Vite HMR or other file watchers. Results are cached per
+    (base, branch) commit pair by the merge preflight.
 
     Args:
         project_dir: Project root directory
@@ -358,8 +386,6 @@ def _check_git_merge_conflicts(project_dir: Path, spec_name: str) -> dict:
         - base_branch: str
         - spec_branch: str
     """
-    import subprocess
-
     debug(MODULE, "Checking for git-level merge conflicts (non-destructive)...")
 
     spec_branch = f"auto-claude/{spec_name}"
@@ -373,128 +399,23 @@ def _check_git_merge_conflicts(project_dir: Path, spec_name: str) -> dict:
     }
 
     try:
-        # Get the current branch (base branch)
-        base_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if base_result.returncode == 0:
-            result["base_branch"] = base_result.stdout.strip()
-
-        # Get the merge base commit
-        merge_base_result = subprocess.run(
-            ["git", "merge-base", result["base_branch"], spec_branch],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if merge_base_result.returncode != 0:
-            debug_warning(MODULE, "Could not find merge base")
+        preflight = preflight_merge(project_dir, spec_name)
+        result["base_branch"] = preflight.base_branch
+        if preflight.error:
+            debug_warning(MODULE, preflight.error)
             return result
 
-        merge_base = merge_base_result.stdout.strip()
-
-        # Count commits main is ahead
-        ahead_result = subprocess.run(
-            ["git", "rev-list", "--count", f"{merge_base}..{result['base_branch']}"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if ahead_result.returncode == 0:
-            commits_behind = int(ahead_result.stdout.strip())
-            result["commits_behind"] = commits_behind
-            if commits_behind > 0:
-                result["needs_rebase"] = True
-                debug(
-                    MODULE, f"Main is {commits_behind} commits ahead of worktree base"
-                )
-
-        # Use git merge-tree to check for conflicts WITHOUT touching working directory
-        # This is a plumbing command that does a 3-way merge in memory
-        # Note: --write-tree mode only accepts 2 branches (it auto-finds the merge base)
-        merge_tree_result = subprocess.run(
-            [
-                "git",
-                "merge-tree",
-                "--write-tree",
-                "--no-messages",
-                result["base_branch"],  # Use branch names, not commit hashes
-                spec_branch,
-            ],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        # merge-tree returns exit code 1 if there are conflicts
-        if merge_tree_result.returncode != 0:
-            result["has_conflicts"] = True
-            debug(MODULE, "Git merge-tree detected conflicts")
-
-            # Parse the output for conflicting files
-            # merge-tree --write-tree outputs conflict info to stderr
-            output = merge_tree_result.stdout + merge_tree_result.stderr
-            for line in output.split("\n"):
-                # Look for lines indicating conflicts
-                if "CONFLICT" in line:
-                    # Extract file path from conflict message
-                    import re
-
-                    match = re.search(
-                        r"(?:Merge conflict in|CONFLICT.*?:)\s*(.+?)(?:\s*$|\s+\()",
-                        line,
-                    )
-                    if match:
-                        file_path = match.group(1).strip()
-                        # Skip .auto-claude files - they should never be merged
-                        if (
-                            file_path
-                            and file_path not in result["conflicting_files"]
-                            and not _is_auto_claude_file(file_path)
-                        ):
-                            result["conflicting_files"].append(file_path)
-
-            # Fallback: if we didn't parse conflicts, use diff to find files changed in both branches
-            if not result["conflicting_files"]:
-                # Files changed in main since merge-base
-                main_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, result["base_branch"]],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                main_files = (
-                    set(main_files_result.stdout.strip().split("\n"))
-                    if main_files_result.stdout.strip()
-                    else set()
-                )
-
-                # Files changed in spec branch since merge-base
-                spec_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, spec_branch],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                spec_files = (
-                    set(spec_files_result.stdout.strip().split("\n"))
-                    if spec_files_result.stdout.strip()
-                    else set()
-                )
-
-                # Files modified in both = potential conflicts
-                # Filter out .auto-claude files - they should never be merged
-                conflicting = main_files & spec_files
-                result["conflicting_files"] = [
-                    f for f in conflicting if not _is_auto_claude_file(f)
-                ]
-                debug(
-                    MODULE, f"Found {len(conflicting)} files modified in both branches"
-                )
+        result["commits_behind"] = preflight.commits_behind
+        result["needs_rebase"] = preflight.needs_rebase
+        if preflight.needs_rebase:
+            debug(
+                MODULE,
+                f"Main is {preflight.commits_behind} commits ahead of worktree base",
+            )
 
+        result["has_conflicts"] = preflight.has_conflicts
+        result["conflicting_files"] = preflight.conflicting_files
+        if preflight.has_conflicts:
             debug(MODULE, f"Conflicting files: {result['conflicting_files']}")
         else:
             debug_success(MODULE, "Git merge-tree: no conflicts detected")
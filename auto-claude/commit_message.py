@@ -202,6 +202,8 @@ async def _call_claude_for_commit(prompt: str) -> str:
         logger.warning("claude_agent_sdk not installed")
         return ""
 
+    from core.rate_limiter import Priority, rate_limited
+
     # Respect model overrides from environment
     from phase_config import resolve_model_id
     model = resolve_model_id(
@@ -210,14 +212,18 @@ async def _call_claude_for_commit(prompt: str) -> str:
         or "haiku"
     )
 
-    client = ClaudeSDKClient(
-        options=ClaudeAgentOptions(
-            model=model,
-            system_prompt=SYSTEM_PROMPT,
-            allowed_tools=[],
-            max_turns=1,
-            max_thinking_tokens=1024,  # Low thinking for speed
-        )
+    client = rate_limited(
+        ClaudeSDKClient(
+            options=ClaudeAgentOptions(
+                model=model,
+                system_prompt=SYSTEM_PROMPT,
+                allowed_tools=[],
+                max_turns=1,
+                max_thinking_tokens=1024,  # Low thinking for speed
+            )
+        ),
+        model,
+        Priority.INSIGHTS,
     )
 
     try:
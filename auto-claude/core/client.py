@@ -7,6 +7,9 @@ Functions for creating and configuring the Claude Agent SDK client.
 
 import json
 import os
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 from auto_claude_tools import (
@@ -19,8 +22,18 @@ from auto_claude_tools import (
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from claude_agent_sdk.types import HookMatcher
 from core.auth import get_sdk_env_vars, require_auth_token
+from core.rate_limiter import (
+    Priority,
+    RateLimitedClient,
+    agent_priority,
+    rate_limited,
+)
 from linear_updater import is_linear_enabled
-from prompts_pkg.project_context import detect_project_capabilities, load_project_index
+from prompts_pkg.project_context import (
+    detect_project_capabilities,
+    load_project_index,
+    project_index_file,
+)
 from security import bash_security_hook
 from skills import (
     TOOL_GET_SKILL_DETAILS,
@@ -29,6 +42,18 @@ from skills import (
     discover_skills,
 )
 from ui import Icons, highlight, icon
+from worktree import create_sparse_checkout_hook, read_sparse_cone
+
+# Import debug utilities
+try:
+    from debug import debug
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+
+MODULE = "core.client"
 
 
 def is_graphiti_mcp_enabled() -> bool:
@@ -136,14 +161,464 @@ BUILTIN_TOOLS = [
 ]
 
 
+# Name of the security settings file written to the project directory
+SETTINGS_FILENAME = ".claude_settings.json"
+
+
+def _stat_signature(path: Path) -> tuple | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+@dataclass
+class _ProjectConfig:
+    """Client configuration that only depends on files in the project."""
+
+    # Identifies the files it was computed from
+    fingerprint: tuple
+    project_capabilities: dict
+    discovered_skills: list
+    skill_inventory_prompt: str
+
+
+class ClientConfigFactory:
+    """
+    Creates SDK clients for one project and spec directory.
+
+    The project-dependent parts of the configuration (project capabilities,
+    skills, tool allowlists, the security settings file, the auto-claude MCP
+    server) are computed once and reused by later sessions. They're
+    revalidated by fingerprinting project_index.json and .claude/skills/ on
+    every call. Only the model, thinking budget and agent type are applied
+    per session.
+    """
+
+    def __init__(self, project_dir: Path, spec_dir: Path):
+        self.project_dir = project_dir
+        self.spec_dir = spec_dir
+        self.settings_file = project_dir / SETTINGS_FILENAME
+        self._project_config: _ProjectConfig | None = None
+        self._allowed_tools: dict[tuple, list[str]] = {}
+        self._settings_written: tuple[str, tuple | None] | None = None
+        self._mcp_server = None
+        self._mcp_server_created = False
+        self._sparse_hook = None
+        self._sparse_checked = False
+        # Seconds spent setting up the last client
+        self.last_setup_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # Cached, project-dependent configuration
+    # ------------------------------------------------------------------
+
+    def _fingerprint(self) -> tuple:
+        index_file = project_index_file(self.project_dir)
+        skills_dir = self.project_dir / ".claude" / "skills"
+        skills = []
+        if skills_dir.is_dir():
+            for folder in sorted(skills_dir.iterdir()):
+                skills.append((folder.name, _stat_signature(folder / "SKILL.md")))
+        return (_stat_signature(index_file), tuple(skills))
+
+    def get_project_config(self) -> tuple[_ProjectConfig, bool]:
+        """
+        Get the project-dependent configuration, recomputing it if the
+        project index or skills changed.
+
+        Returns:
+            (config, whether the cached config was reused)
+        """
+        fingerprint = self._fingerprint()
+        config = self._project_config
+        if config is not None and config.fingerprint == fingerprint:
+            return config, True
+
+        project_index = load_project_index(self.project_dir)
+        discovered_skills = discover_skills(self.project_dir)
+        config = _ProjectConfig(
+            fingerprint=fingerprint,
+            project_capabilities=detect_project_capabilities(project_index),
+            discovered_skills=discovered_skills,
+            skill_inventory_prompt=(
+                build_skill_inventory_prompt(discovered_skills)
+                if discovered_skills
+                else ""
+            ),
+        )
+        self._project_config = config
+        self._allowed_tools.clear()
+        return config, False
+
+    def _get_allowed_tools(
+        self,
+        agent_type: str,
+        config: _ProjectConfig,
+        auto_claude_tools_enabled: bool,
+        linear_enabled: bool,
+        graphiti_mcp_enabled: bool,
+    ) -> list[str]:
+        key = (
+            agent_type,
+            auto_claude_tools_enabled,
+            linear_enabled,
+            graphiti_mcp_enabled,
+        )
+        if key in self._allowed_tools:
+            return list(self._allowed_tools[key])
+
+        # Start with agent-specific tools (includes base tools + auto-claude tools)
+        # Pass project capabilities for dynamic MCP tool filtering
+        if auto_claude_tools_enabled:
+            allowed_tools_list = get_agent_allowed_tools(
+                agent_type, config.project_capabilities
+            )
+        else:
+            allowed_tools_list = [*BUILTIN_TOOLS]
+
+        if config.discovered_skills:
+            # Add get_skill_details tool for Tier 2 on-demand loading
+            allowed_tools_list.append(TOOL_GET_SKILL_DETAILS)
+
+        # Add external MCP tools based on project capabilities
+        # This saves context window by only including relevant tools
+        allowed_tools_list.extend(CONTEXT7_TOOLS)  # Always available
+        if linear_enabled:
+            allowed_tools_list.extend(LINEAR_TOOLS)
+        if graphiti_mcp_enabled:
+            allowed_tools_list.extend(GRAPHITI_MCP_TOOLS)
+        # Note: Browser automation tools (ELECTRON_TOOLS, PUPPETEER_TOOLS) are already
+        # added by get_agent_allowed_tools() via _get_qa_mcp_tools() for QA agents
+
+        self._allowed_tools[key] = allowed_tools_list
+        return list(allowed_tools_list)
+
+    def _write_settings(self, security_settings: dict) -> bool:
+        """
+        Write the security settings file unless it already has this content.
+
+        Returns:
+            True if the file was (re)written
+        """
+        content = json.dumps(security_settings, indent=2)
+        if self._settings_written == (
+            content,
+            _stat_signature(self.settings_file),
+        ):
+            return False
+
+        temp_file = self.settings_file.with_name(
+            f".{self.settings_file.name}.{os.getpid()}.tmp"
+        )
+        temp_file.write_text(content)
+        os.replace(temp_file, self.settings_file)
+        self._settings_written = (content, _stat_signature(self.settings_file))
+        return True
+
+    def _get_mcp_server(self):
+        """The auto-claude MCP server (its tools only depend on the spec)."""
+        if not self._mcp_server_created:
+            self._mcp_server = create_auto_claude_mcp_server(
+                self.spec_dir, self.project_dir
+            )
+            self._mcp_server_created = True
+        return self._mcp_server
+
+    def _get_sparse_checkout_hook(self):
+        """In a sparse worktree, a hook that checks out what the agent touches."""
+        if not self._sparse_checked:
+            if read_sparse_cone(self.project_dir) is not None:
+                self._sparse_hook = create_sparse_checkout_hook(self.project_dir)
+            self._sparse_checked = True
+        return self._sparse_hook
+
+    # ------------------------------------------------------------------
+    # Per-session client
+    # ------------------------------------------------------------------
+
+    def create_client(
+        self,
+        model: str,
+        agent_type: str = "coder",
+        max_thinking_tokens: int | None = None,
+        priority: Priority | None = None,
+    ) -> RateLimitedClient:
+        """
+        Create a client for one session.
+
+        Args:
+            model: Claude model to use
+            agent_type: 'planner', 'coder', 'qa_reviewer' or 'qa_fixer'
+            max_thinking_tokens: Token budget for extended thinking (None = disabled)
+            priority: Rate limiter priority class (default: from agent_type)
+
+        Returns:
+            Configured ClaudeSDKClient, wrapped so its queries wait for a
+            rate limiter slot
+        """
+        started = time.perf_counter()
+        project_dir = self.project_dir
+        print(
+            f"\n{icon(Icons.SESSION)} Starting session with model: {highlight(model)}"
+        )
+
+        oauth_token = require_auth_token()
+        # Ensure SDK can access it via its expected env var
+        os.environ["CLAUDE_CODE_OAUTH_TOKEN"] = oauth_token
+
+        # Collect env vars to pass to SDK (ANTHROPIC_BASE_URL, etc.)
+        sdk_env = get_sdk_env_vars()
+
+        # Check if Linear integration is enabled
+        linear_enabled = is_linear_enabled()
+        linear_api_key = os.environ.get("LINEAR_API_KEY", "")
+
+        # Check if custom auto-claude tools are available
+        auto_claude_tools_enabled = is_tools_available()
+
+        # Check if Graphiti MCP is enabled
+        graphiti_mcp_enabled = is_graphiti_mcp_enabled()
+
+        # Check if Electron MCP is enabled (for QA agents testing Electron apps)
+        electron_mcp_enabled = is_electron_mcp_enabled()
+
+        # Project capabilities (for dynamic MCP tool selection) and skills
+        # discovered in .claude/skills/ (Tier 1: inventory only)
+        config, reused = self.get_project_config()
+        project_capabilities = config.project_capabilities
+
+        # Build the list of allowed tools
+        allowed_tools_list = self._get_allowed_tools(
+            agent_type,
+            config,
+            auto_claude_tools_enabled,
+            linear_enabled,
+            graphiti_mcp_enabled,
+        )
+        if config.discovered_skills:
+            print(f"   - Skills discovered: {len(config.discovered_skills)} available")
+
+        # Determine which browser automation tools to allow based on project type
+        # Note: Must check "not is_electron" for Puppeteer to avoid tool mismatch
+        # when Electron MCP is disabled for an Electron project
+        browser_tools_permissions = []
+        if agent_type in ("qa_reviewer", "qa_fixer"):
+            if project_capabilities.get("is_electron") and electron_mcp_enabled:
+                browser_tools_permissions = ELECTRON_TOOLS
+            elif project_capabilities.get(
+                "is_web_frontend"
+            ) and not project_capabilities.get("is_electron"):
+                # Only add Puppeteer for non-Electron web frontends
+                browser_tools_permissions = PUPPETEER_TOOLS
+
+        # Create comprehensive security settings
+        # Note: Using relative paths ("./**") restricts access to project directory
+        # since cwd is set to project_dir
+        security_settings = {
+            "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
+            "permissions": {
+                "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
+                "allow": [
+                    # Allow all file operations within the project directory
+                    "Read(./**)",
+                    "Write(./**)",
+                    "Edit(./**)",
+                    "Glob(./**)",
+                    "Grep(./**)",
+                    # Bash permission granted here, but actual commands are validated
+                    # by the bash_security_hook (see security.py for allowed commands)
+                    "Bash(*)",
+                    # Allow Context7 MCP tools for documentation lookup
+                    *CONTEXT7_TOOLS,
+                    # Allow Linear MCP tools for project management (if enabled)
+                    *(LINEAR_TOOLS if linear_enabled else []),
+                    # Allow Graphiti MCP tools for knowledge graph memory (if enabled)
+                    *(GRAPHITI_MCP_TOOLS if graphiti_mcp_enabled else []),
+                    # Allow browser automation tools based on project type
+                    *browser_tools_permissions,
+                ],
+            },
+        }
+
+        # Write settings to a file in the project directory (only when they
+        # changed since the last session)
+        settings_file = self.settings_file
+        self._write_settings(security_settings)
+
+        print(f"Security settings: {settings_file}")
+        print("   - Sandbox enabled (OS-level bash isolation)")
+        print(f"   - Filesystem restricted to: {project_dir.resolve()}")
+        print("   - Bash commands restricted to allowlist")
+        if max_thinking_tokens:
+            print(f"   - Extended thinking: {max_thinking_tokens:,} tokens")
+        else:
+            print("   - Extended thinking: disabled")
+
+        # Build list of MCP servers for display
+        mcp_servers_list = ["context7 (documentation)"]
+        if agent_type in ("qa_reviewer", "qa_fixer"):
+            if project_capabilities.get("is_electron") and electron_mcp_enabled:
+                mcp_servers_list.append(
+                    f"electron (desktop automation, port {get_electron_debug_port()})"
+                )
+            elif project_capabilities.get(
+                "is_web_frontend"
+            ) and not project_capabilities.get("is_electron"):
+                mcp_servers_list.append("puppeteer (browser automation)")
+        if linear_enabled:
+            mcp_servers_list.append("linear (project management)")
+        if graphiti_mcp_enabled:
+            mcp_servers_list.append("graphiti-memory (knowledge graph)")
+        if auto_claude_tools_enabled:
+            mcp_servers_list.append(f"auto-claude ({agent_type} tools)")
+        print(f"   - MCP servers: {', '.join(mcp_servers_list)}")
+
+        # Show detected project capabilities for QA agents
+        if agent_type in ("qa_reviewer", "qa_fixer") and any(
+            project_capabilities.values()
+        ):
+            caps = [
+                k.replace("is_", "").replace("has_", "")
+                for k, v in project_capabilities.items()
+                if v
+            ]
+            print(f"   - Project capabilities: {', '.join(caps)}")
+
+        # Configure MCP servers
+        mcp_servers = {
+            "context7": {"command": "npx", "args": ["-y", "@upstash/context7-mcp"]},
+        }
+
+        # Add browser automation MCP server based on project type
+        if agent_type in ("qa_reviewer", "qa_fixer"):
+            if project_capabilities.get("is_electron") and electron_mcp_enabled:
+                # Electron MCP for desktop apps
+                # Electron app must be started with --remote-debugging-port=<port>
+                mcp_servers["electron"] = {
+                    "command": "npm",
+                    "args": ["exec", "electron-mcp-server"],
+                }
+            elif project_capabilities.get(
+                "is_web_frontend"
+            ) and not project_capabilities.get("is_electron"):
+                # Puppeteer for web frontends (not Electron)
+                mcp_servers["puppeteer"] = {
+                    "command": "npx",
+                    "args": ["puppeteer-mcp-server"],
+                }
+
+        # Add Linear MCP server if enabled
+        if linear_enabled:
+            mcp_servers["linear"] = {
+                "type": "http",
+                "url": "https://mcp.linear.app/mcp",
+                "headers": {"Authorization": f"Bearer {linear_api_key}"},
+            }
+
+        # Add Graphiti MCP server if enabled
+        # Requires running: docker run -d -p 8000:8000 falkordb/graphiti-knowledge-graph-mcp
+        if graphiti_mcp_enabled:
+            mcp_servers["graphiti-memory"] = {
+                "type": "http",
+                "url": get_graphiti_mcp_url(),
+            }
+
+        # Add custom auto-claude MCP server if available
+        if auto_claude_tools_enabled:
+            auto_claude_mcp_server = self._get_mcp_server()
+            if auto_claude_mcp_server:
+                mcp_servers["auto-claude"] = auto_claude_mcp_server
+
+        pre_tool_use_hooks = [HookMatcher(matcher="Bash", hooks=[bash_security_hook])]
+        # In a sparse worktree, check out whatever the agent touches outside the cone
+        sparse_checkout_hook = self._get_sparse_checkout_hook()
+        if sparse_checkout_hook is not None:
+            pre_tool_use_hooks.append(
+                HookMatcher(
+                    matcher="Read|Write|Edit|MultiEdit|NotebookEdit|Glob|Grep",
+                    hooks=[sparse_checkout_hook],
+                )
+            )
+
+        client = ClaudeSDKClient(
+            options=ClaudeAgentOptions(
+                model=model,
+                system_prompt=(
+                    f"You are an expert full-stack developer building production-quality software. "
+                    f"Your working directory is: {project_dir.resolve()}\n"
+                    f"Your filesystem access is RESTRICTED to this directory only. "
+                    f"Use relative paths (starting with ./) for all file operations. "
+                    f"Never use absolute paths or try to access files outside your working directory.\n\n"
+                    f"You follow existing code patterns, write clean maintainable code, and verify "
+                    f"your work through thorough testing. You communicate progress through Git commits "
+                    f"and build-progress.txt updates."
+                    f"{config.skill_inventory_prompt}"
+                ),
+                allowed_tools=allowed_tools_list,
+                mcp_servers=mcp_servers,
+                hooks={
+                    "PreToolUse": pre_tool_use_hooks,
+                },
+                max_turns=1000,
+                cwd=str(project_dir.resolve()),
+                settings=str(settings_file.resolve()),
+                env=sdk_env,  # Pass ANTHROPIC_BASE_URL etc. to subprocess
+                max_thinking_tokens=max_thinking_tokens,  # Extended thinking budget
+            )
+        )
+
+        self.last_setup_seconds = time.perf_counter() - started
+        print(
+            f"   - Client setup: {self.last_setup_seconds * 1000:.0f}ms"
+            f" ({'cached' if reused else 'fresh'} project config)"
+        )
+        print()
+        debug(
+            MODULE,
+            "Client created",
+            agent_type=agent_type,
+            setup_ms=round(self.last_setup_seconds * 1000, 1),
+            reused_config=reused,
+        )
+        return rate_limited(
+            client,
+            model,
+            priority if priority is not None else agent_priority(agent_type),
+        )
+
+
+_factories: dict[tuple[Path, Path], ClientConfigFactory] = {}
+_factories_lock = threading.Lock()
+
+
+def get_client_factory(project_dir: Path, spec_dir: Path) -> ClientConfigFactory:
+    """
+    Get the ClientConfigFactory for a project and spec directory.
+
+    Returns:
+        The same factory for every call with the same directories, so
+        sessions of one run share its cached configuration
+    """
+    key = (Path(project_dir).resolve(), Path(spec_dir).resolve())
+    with _factories_lock:
+        factory = _factories.get(key)
+        if factory is None:
+            factory = _factories[key] = ClientConfigFactory(
+                Path(project_dir), Path(spec_dir)
+            )
+        return factory
+
+
 def create_client(
     project_dir: Path,
     spec_dir: Path,
     model: str,
     agent_type: str = "coder",
     max_thinking_tokens: int | None = None,
-) -> ClaudeSDKClient:
-    print(f"\n{icon(Icons.SESSION)} Starting session with model: {highlight(model)}")
+    priority: Priority | None = None,
+) -> RateLimitedClient:
     """
     Create a Claude Agent SDK client with multi-layered security.
 
@@ -158,9 +633,11 @@ def create_client(
                             - high: 10000 (QA review)
                             - medium: 5000 (planning, validation)
                             - None: disabled (coding)
+        priority: Rate limiter priority class (default: QA for the QA agents,
+                  coding otherwise; see core.rate_limiter)
 
     Returns:
-        Configured ClaudeSDKClient
+        Configured ClaudeSDKClient, wrapped in a RateLimitedClient
 
     Security layers (defense in depth):
     1. Sandbox - OS-level bash command isolation prevents filesystem escape
@@ -168,215 +645,13 @@ def create_client(
     3. Security hooks - Bash commands validated against an allowlist
        (see security.py for ALLOWED_COMMANDS)
     4. Tool filtering - Each agent type only sees relevant tools (prevents misuse)
-    """
-    oauth_token = require_auth_token()
-    # Ensure SDK can access it via its expected env var
-    os.environ["CLAUDE_CODE_OAUTH_TOKEN"] = oauth_token
-
-    # Collect env vars to pass to SDK (ANTHROPIC_BASE_URL, etc.)
-    sdk_env = get_sdk_env_vars()
-
-    # Check if Linear integration is enabled
-    linear_enabled = is_linear_enabled()
-    linear_api_key = os.environ.get("LINEAR_API_KEY", "")
-
-    # Check if custom auto-claude tools are available
-    auto_claude_tools_enabled = is_tools_available()
-
-    # Load project capabilities for dynamic MCP tool selection
-    # This enables context-aware tool injection based on project type
-    project_index = load_project_index(project_dir)
-    project_capabilities = detect_project_capabilities(project_index)
-
-    # Build the list of allowed tools
-    # Start with agent-specific tools (includes base tools + auto-claude tools)
-    # Pass project capabilities for dynamic MCP tool filtering
-    if auto_claude_tools_enabled:
-        allowed_tools_list = get_agent_allowed_tools(agent_type, project_capabilities)
-    else:
-        allowed_tools_list = [*BUILTIN_TOOLS]
-
-    # Discover skills from .claude/skills/ (Tier 1: inventory only)
-    discovered_skills = discover_skills(project_dir)
-    skill_inventory_prompt = ""
-    if discovered_skills:
-        skill_inventory_prompt = build_skill_inventory_prompt(discovered_skills)
-        # Add get_skill_details tool for Tier 2 on-demand loading
-        allowed_tools_list.append(TOOL_GET_SKILL_DETAILS)
-        print(f"   - Skills discovered: {len(discovered_skills)} available")
-
-    # Check if Graphiti MCP is enabled
-    graphiti_mcp_enabled = is_graphiti_mcp_enabled()
-
-    # Check if Electron MCP is enabled (for QA agents testing Electron apps)
-    electron_mcp_enabled = is_electron_mcp_enabled()
-
-    # Add external MCP tools based on project capabilities
-    # This saves context window by only including relevant tools
-    allowed_tools_list.extend(CONTEXT7_TOOLS)  # Always available
-    if linear_enabled:
-        allowed_tools_list.extend(LINEAR_TOOLS)
-    if graphiti_mcp_enabled:
-        allowed_tools_list.extend(GRAPHITI_MCP_TOOLS)
-    # Note: Browser automation tools (ELECTRON_TOOLS, PUPPETEER_TOOLS) are already
-    # added by get_agent_allowed_tools() via _get_qa_mcp_tools() for QA agents
-
-    # Determine which browser automation tools to allow based on project type
-    # Note: Must check "not is_electron" for Puppeteer to avoid tool mismatch
-    # when Electron MCP is disabled for an Electron project
-    browser_tools_permissions = []
-    if agent_type in ("qa_reviewer", "qa_fixer"):
-        if project_capabilities.get("is_electron") and electron_mcp_enabled:
-            browser_tools_permissions = ELECTRON_TOOLS
-        elif project_capabilities.get(
-            "is_web_frontend"
-        ) and not project_capabilities.get("is_electron"):
-            # Only add Puppeteer for non-Electron web frontends
-            browser_tools_permissions = PUPPETEER_TOOLS
-
-    # Create comprehensive security settings
-    # Note: Using relative paths ("./**") restricts access to project directory
-    # since cwd is set to project_dir
-    security_settings = {
-        "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
-        "permissions": {
-            "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
-            "allow": [
-                # Allow all file operations within the project directory
-                "Read(./**)",
-                "Write(./**)",
-                "Edit(./**)",
-                "Glob(./**)",
-                "Grep(./**)",
-                # Bash permission granted here, but actual commands are validated
-                # by the bash_security_hook (see security.py for allowed commands)
-                "Bash(*)",
-                # Allow Context7 MCP tools for documentation lookup
-                *CONTEXT7_TOOLS,
-                # Allow Linear MCP tools for project management (if enabled)
-                *(LINEAR_TOOLS if linear_enabled else []),
-                # Allow Graphiti MCP tools for knowledge graph memory (if enabled)
-                *(GRAPHITI_MCP_TOOLS if graphiti_mcp_enabled else []),
-                # Allow browser automation tools based on project type
-                *browser_tools_permissions,
-            ],
-        },
-    }
-
-    # Write settings to a file in the project directory
-    settings_file = project_dir / ".claude_settings.json"
-    with open(settings_file, "w") as f:
-        json.dump(security_settings, f, indent=2)
-
-    print(f"Security settings: {settings_file}")
-    print("   - Sandbox enabled (OS-level bash isolation)")
-    print(f"   - Filesystem restricted to: {project_dir.resolve()}")
-    print("   - Bash commands restricted to allowlist")
-    if max_thinking_tokens:
-        print(f"   - Extended thinking: {max_thinking_tokens:,} tokens")
-    else:
-        print("   - Extended thinking: disabled")
-
-    # Build list of MCP servers for display
-    mcp_servers_list = ["context7 (documentation)"]
-    if agent_type in ("qa_reviewer", "qa_fixer"):
-        if project_capabilities.get("is_electron") and electron_mcp_enabled:
-            mcp_servers_list.append(
-                f"electron (desktop automation, port {get_electron_debug_port()})"
-            )
-        elif project_capabilities.get(
-            "is_web_frontend"
-        ) and not project_capabilities.get("is_electron"):
-            mcp_servers_list.append("puppeteer (browser automation)")
-    if linear_enabled:
-        mcp_servers_list.append("linear (project management)")
-    if graphiti_mcp_enabled:
-        mcp_servers_list.append("graphiti-memory (knowledge graph)")
-    if auto_claude_tools_enabled:
-        mcp_servers_list.append(f"auto-claude ({agent_type} tools)")
-    print(f"   - MCP servers: {', '.join(mcp_servers_list)}")
-
-    # Show detected project capabilities for QA agents
-    if agent_type in ("qa_reviewer", "qa_fixer") and any(project_capabilities.values()):
-        caps = [
-            k.replace("is_", "").replace("has_", "")
-            for k, v in project_capabilities.items()
-            if v
-        ]
-        print(f"   - Project capabilities: {', '.join(caps)}")
-    print()
-
-    # Configure MCP servers
-    mcp_servers = {
-        "context7": {"command": "npx", "args": ["-y", "@upstash/context7-mcp"]},
-    }
-
-    # Add browser automation MCP server based on project type
-    if agent_type in ("qa_reviewer", "qa_fixer"):
-        if project_capabilities.get("is_electron") and electron_mcp_enabled:
-            # Electron MCP for desktop apps
-            # Electron app must be started with --remote-debugging-port=<port>
-            mcp_servers["electron"] = {
-                "command": "npm",
-                "args": ["exec", "electron-mcp-server"],
-            }
-        elif project_capabilities.get(
-            "is_web_frontend"
-        ) and not project_capabilities.get("is_electron"):
-            # Puppeteer for web frontends (not Electron)
-            mcp_servers["puppeteer"] = {
-                "command": "npx",
-                "args": ["puppeteer-mcp-server"],
-            }
 
-    # Add Linear MCP server if enabled
-    if linear_enabled:
-        mcp_servers["linear"] = {
-            "type": "http",
-            "url": "https://mcp.linear.app/mcp",
-            "headers": {"Authorization": f"Bearer {linear_api_key}"},
-        }
-
-    # Add Graphiti MCP server if enabled
-    # Requires running: docker run -d -p 8000:8000 falkordb/graphiti-knowledge-graph-mcp
-    if graphiti_mcp_enabled:
-        mcp_servers["graphiti-memory"] = {
-            "type": "http",
-            "url": get_graphiti_mcp_url(),
-        }
-
-    # Add custom auto-claude MCP server if available
-    auto_claude_mcp_server = None
-    if auto_claude_tools_enabled:
-        auto_claude_mcp_server = create_auto_claude_mcp_server(spec_dir, project_dir)
-        if auto_claude_mcp_server:
-            mcp_servers["auto-claude"] = auto_claude_mcp_server
-
-    return ClaudeSDKClient(
-        options=ClaudeAgentOptions(
-            model=model,
-            system_prompt=(
-                f"You are an expert full-stack developer building production-quality software. "
-                f"Your working directory is: {project_dir.resolve()}\n"
-                f"Your filesystem access is RESTRICTED to this directory only. "
-                f"Use relative paths (starting with ./) for all file operations. "
-                f"Never use absolute paths or try to access files outside your working directory.\n\n"
-                f"You follow existing code patterns, write clean maintainable code, and verify "
-                f"your work through thorough testing. You communicate progress through Git commits "
-                f"and build-progress.txt updates."
-                f"{skill_inventory_prompt}"
-            ),
-            allowed_tools=allowed_tools_list,
-            mcp_servers=mcp_servers,
-            hooks={
-                "PreToolUse": [
-                    HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
-                ],
-            },
-            max_turns=1000,
-            cwd=str(project_dir.resolve()),
-            settings=str(settings_file.resolve()),
-            env=sdk_env,  # Pass ANTHROPIC_BASE_URL etc. to subprocess
-            max_thinking_tokens=max_thinking_tokens,  # Extended thinking budget
-        )
+    The project-dependent configuration is cached per project and spec
+    directory (see ClientConfigFactory).
+    """
+    return get_client_factory(project_dir, spec_dir).create_client(
+        model,
+        agent_type=agent_type,
+        max_thinking_tokens=max_thinking_tokens,
+        priority=priority,
     )
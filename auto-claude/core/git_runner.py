@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Async Git Runner
+================
+
+Runs git commands from async code without blocking the event loop.
+
+subprocess.run inside a coroutine stalls every other task in the process
+(parallel agents, AI merges, status updates) until git exits. run_git uses
+asyncio subprocesses instead, and adds:
+
+- A per-repository limit on concurrent git processes, so many tasks
+  touching one repository don't pile up on its index and ref locks
+- A timeout, after which the process is killed
+- A structured GitResult instead of raising on non-zero exit
+
+Usage:
+    from core.git_runner import run_git
+
+    result = await run_git(["rev-parse", "HEAD"], cwd=project_dir)
+    if result.ok:
+        head = result.stdout.strip()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Import debug utilities
+try:
+    from debug import debug_detailed
+except ImportError:
+
+    def debug_detailed(*args, **kwargs):
+        pass
+
+
+MODULE = "core.git_runner"
+
+# Seconds before a git command is killed
+DEFAULT_GIT_TIMEOUT = 60.0
+
+# Concurrent git processes per repository directory
+MAX_GIT_PROCESSES_PER_REPO = 4
+
+# Semaphores are bound to an event loop, so they're kept per loop
+_repo_limits: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[Path, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+class GitCommandError(Exception):
+    """A git command failed or timed out."""
+
+    def __init__(self, result: GitResult):
+        self.result = result
+        reason = "timed out" if result.timed_out else f"exit {result.returncode}"
+        super().__init__(
+            f"git {' '.join(result.args)} failed ({reason}): {result.stderr.strip()}"
+        )
+
+
+@dataclass
+class GitResult:
+    """Outcome of one git command."""
+
+    args: list[str]
+    cwd: str
+    returncode: int
+    stdout: str
+    stderr: str
+    duration: float
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    def check(self) -> GitResult:
+        """
+        Raise if the command failed.
+
+        Returns:
+            self, so calls can be chained
+
+        Raises:
+            GitCommandError: If the command exited non-zero or timed out
+        """
+        if not self.ok:
+            raise GitCommandError(self)
+        return self
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill git and anything it started (hooks, aliases, credential helpers)."""
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def _repo_semaphore(cwd: Path) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    limits = _repo_limits.setdefault(loop, {})
+    semaphore = limits.get(cwd)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_GIT_PROCESSES_PER_REPO)
+        limits[cwd] = semaphore
+    return semaphore
+
+
+async def run_git(
+    args: list[str],
+    cwd: Path,
+    timeout: float = DEFAULT_GIT_TIMEOUT,
+    input: str | None = None,
+    check: bool = False,
+) -> GitResult:
+    """
+    Run a git command without blocking the event loop.
+
+    Args:
+        args: Arguments after "git"
+        cwd: Repository (or worktree) directory
+        timeout: Seconds before the command is killed
+        input: Text written to the command's stdin
+        check: Raise GitCommandError if the command fails
+
+    Returns:
+        GitResult (returncode -1 if git couldn't be started or timed out)
+    """
+    repo = Path(cwd).resolve()
+    async with _repo_semaphore(repo):
+        started = time.monotonic()
+        stdout = stderr = b""
+        timed_out = False
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "git",
+                *args,
+                cwd=repo,
+                stdin=asyncio.subprocess.PIPE
+                if input is not None
+                else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                # Own process group, so a timeout can kill git's children too
+                start_new_session=os.name == "posix",
+            )
+        except OSError as e:
+            returncode, stderr = -1, str(e).encode()
+        else:
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input.encode() if input is not None else None),
+                    timeout,
+                )
+                returncode = process.returncode
+            # Not the builtin TimeoutError before Python 3.11
+            except asyncio.TimeoutError:  # noqa: UP041
+                timed_out = True
+                returncode = -1
+                stderr = f"Timed out after {timeout}s".encode()
+                _kill(process)
+                await process.wait()
+            except asyncio.CancelledError:
+                _kill(process)
+                await process.wait()
+                raise
+
+    result = GitResult(
+        args=list(args),
+        cwd=str(repo),
+        returncode=returncode,
+        stdout=stdout.decode("utf-8", errors="replace"),
+        stderr=stderr.decode("utf-8", errors="replace"),
+        duration=time.monotonic() - started,
+        timed_out=timed_out,
+    )
+    debug_detailed(
+        MODULE,
+        f"git {args[0] if args else ''}",
+        returncode=result.returncode,
+        duration_ms=round(result.duration * 1000, 1),
+    )
+    if check:
+        result.check()
+    return result
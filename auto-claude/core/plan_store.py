@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Plan Store
+==========
+
+Shared, cached access to a spec's implementation_plan.json.
+
+The coder, parallel subtask workers, the agent tools and the UI all read and
+write the same plan. Before the store each of them re-parsed the file on
+every call and wrote it back in place, so two writers could lose each
+other's updates and a reader could see a half-written file.
+
+A PlanStore:
+- Parses the plan once and re-parses only when the file's mtime, inode or
+  size changes
+- Writes atomically (temp file + rename), so readers never see a partial plan
+- Serializes read-modify-write updates under an advisory lock file, so
+  concurrent writers (threads or processes) don't lose updates
+- Notifies subscribers whenever the plan changes
+
+Usage:
+    from core.plan_store import get_plan_store
+
+    store = get_plan_store(spec_dir)
+    plan = store.get()  # Shared, don't mutate
+
+    def complete(plan):
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+
+    store.update(complete)
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking
+    fcntl = None
+
+# Import debug utilities
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "core.plan_store"
+
+PLAN_FILENAME = "implementation_plan.json"
+
+# File timestamps can be coarser than the time between two writes, so a
+# plan modified this recently before it was read is re-read on the next
+# access instead of trusting the cache (same idea as git's racy-clean check)
+RACY_WINDOW_SECONDS = 1.0
+
+PlanCallback = Callable[[dict], None]
+
+
+class PlanStore:
+    """Cached, lock-protected access to one implementation_plan.json."""
+
+    def __init__(self, plan_file: Path):
+        """
+        Args:
+            plan_file: Path to implementation_plan.json
+        """
+        self.plan_file = Path(plan_file)
+        self.lock_file = self.plan_file.with_name(f".{self.plan_file.name}.lock")
+        self._lock = threading.RLock()
+        self._plan: dict | None = None
+        self._signature: tuple | None = None
+        self._read_at_ns = 0
+        self._lock_depth = 0
+        self._subscribers: list[PlanCallback] = []
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def get(self) -> dict | None:
+        """
+        Get the current plan, shared with other readers.
+
+        The returned dict must not be mutated - use update() to change the
+        plan, or load() for a private copy.
+
+        Returns:
+            The parsed plan, or None if it doesn't exist or isn't valid JSON
+        """
+        try:
+            plan, changed = self._revalidate()
+        except (OSError, ValueError):
+            return None
+        if changed:
+            self._notify(plan)
+        return plan
+
+    def load(self) -> dict | None:
+        """
+        Get a private copy of the current plan that the caller may modify.
+
+        Returns:
+            The parsed plan, or None if it doesn't exist or isn't valid JSON
+        """
+        plan = self.get()
+        return copy.deepcopy(plan) if plan is not None else None
+
+    def _revalidate(self) -> tuple[dict | None, bool]:
+        """
+        Return the cached plan, re-parsing it if the file changed.
+
+        Returns:
+            (plan, whether it changed since it was last read)
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If it isn't valid JSON (or not an object)
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.plan_file)
+            except FileNotFoundError:
+                self._set_cache(None, None)
+                return None, False
+
+            signature = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+            racy = stat.st_mtime_ns + RACY_WINDOW_SECONDS * 1e9 >= self._read_at_ns
+            if self._plan is not None and signature == self._signature and not racy:
+                return self._plan, False
+
+            read_at_ns = time.time_ns()
+            with open(self.plan_file) as f:
+                plan = json.load(f)
+            if not isinstance(plan, dict):
+                raise ValueError(f"{self.plan_file} does not contain a JSON object")
+
+            changed = plan != self._plan
+            if changed:
+                debug(MODULE, "Plan read from disk", plan_file=str(self.plan_file))
+            else:
+                # Keep handing out the same object while the content is equal
+                plan = self._plan
+            self._set_cache(plan, signature, read_at_ns)
+            return plan, changed
+
+    def _set_cache(
+        self, plan: dict | None, signature: tuple | None, read_at_ns: int = 0
+    ) -> None:
+        self._plan = plan
+        self._signature = signature
+        self._read_at_ns = read_at_ns
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def update(self, mutate: Callable[[dict], Any]) -> Any:
+        """
+        Read-modify-write the plan under the plan lock.
+
+        mutate gets a private copy of the latest plan ({} if there is no plan
+        yet) and changes it in place. The result is written atomically unless
+        mutate returns False.
+
+        Args:
+            mutate: Function that modifies the plan
+
+        Returns:
+            Whatever mutate returned
+
+        Raises:
+            OSError: If the plan can't be read or written
+            ValueError: If the existing plan isn't valid JSON
+        """
+        with self._locked():
+            current, changed = self._revalidate()
+            plan = copy.deepcopy(current) if current is not None else {}
+            result = mutate(plan)
+            written = result is not False and plan != current
+            if written:
+                self._write_locked(plan)
+
+        # Subscribers run outside the lock so they can update the plan too
+        if written:
+            self._notify(plan)
+        elif changed:
+            self._notify(current)
+        return result
+
+    def write(self, plan: dict) -> None:
+        """
+        Replace the plan atomically.
+
+        Prefer update() when the new plan is based on the old one - a plain
+        write can overwrite changes made since the plan was read.
+
+        Raises:
+            OSError: If the plan can't be written
+        """
+        plan = copy.deepcopy(plan)
+        with self._locked():
+            self._write_locked(plan)
+        self._notify(plan)
+
+    def _write_locked(self, plan: dict) -> None:
+        """Write through a temp file and rename it over the plan."""
+        self.plan_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.plan_file.parent, prefix=f".{self.plan_file.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                # mkstemp creates the file 0600; keep the plan's permissions
+                if hasattr(os, "fchmod"):
+                    try:
+                        mode = os.stat(self.plan_file).st_mode & 0o777
+                    except FileNotFoundError:
+                        mode = 0o644
+                    os.fchmod(f.fileno(), mode)
+                json.dump(plan, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.plan_file)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        stat = os.stat(self.plan_file)
+        self._set_cache(
+            plan, (stat.st_mtime_ns, stat.st_ino, stat.st_size), time.time_ns()
+        )
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the in-process lock and the advisory lock file."""
+        with self._lock:
+            # flock() isn't re-entrant across file descriptors
+            if fcntl is None or self._lock_depth:
+                yield
+                return
+            self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_file, "a") as lock:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # Change notifications
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: PlanCallback) -> Callable[[], None]:
+        """
+        Call callback with the new plan whenever it changes.
+
+        Changes made through this store are reported right away; changes made
+        by other processes are reported the next time the plan is read.
+
+        Args:
+            callback: Function taking the new plan (must not mutate it)
+
+        Returns:
+            Function that unsubscribes the callback
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def _notify(self, plan: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(plan)
+            except Exception as e:
+                debug_warning(MODULE, "Plan subscriber failed", error=str(e))
+
+
+_stores: dict[Path, PlanStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_plan_store(spec_dir: Path) -> PlanStore:
+    """
+    Get the shared PlanStore for a spec directory.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+
+    Returns:
+        The same PlanStore for every call with the same spec directory
+    """
+    plan_file = Path(os.path.abspath(Path(spec_dir) / PLAN_FILENAME))
+    with _stores_lock:
+        store = _stores.get(plan_file)
+        if store is None:
+            store = _stores[plan_file] = PlanStore(plan_file)
+        return store
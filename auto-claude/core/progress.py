@@ -8,9 +8,10 @@ Uses subtask-based implementation plans (implementation_plan.json).
 Enhanced with colored output, icons, and better visual formatting.
 """
 
-import json
 from pathlib import Path
 
+from core.plan_store import get_plan_store
+from core.subtask_scheduler import SubtaskScheduler
 from ui import (
     Icons,
     bold,
@@ -25,6 +26,9 @@ from ui import (
     warning,
 )
 
+# Ready subtasks shown in the progress summary
+UP_NEXT_COUNT = 3
+
 
 def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     """
@@ -36,27 +40,20 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     Returns:
         (completed_count, total_count)
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    plan = get_plan_store(spec_dir).get()
+    if plan is None:
         return 0, 0
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+    total = 0
+    completed = 0
 
-        total = 0
-        completed = 0
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
+    for phase in plan.get("phases", []):
+        for subtask in phase.get("subtasks", []):
+            total += 1
+            if subtask.get("status") == "completed":
+                completed += 1
 
-        return completed, total
-    except (OSError, json.JSONDecodeError):
-        return 0, 0
+    return completed, total
 
 
 def count_subtasks_detailed(spec_dir: Path) -> dict:
@@ -66,8 +63,6 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
     Returns:
         Dict with completed, in_progress, pending, failed counts
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
     result = {
         "completed": 0,
         "in_progress": 0,
@@ -76,25 +71,20 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
         "total": 0,
     }
 
-    if not plan_file.exists():
+    plan = get_plan_store(spec_dir).get()
+    if plan is None:
         return result
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
+    for phase in plan.get("phases", []):
+        for subtask in phase.get("subtasks", []):
+            result["total"] += 1
+            status = subtask.get("status", "pending")
+            if status in result:
+                result[status] += 1
+            else:
+                result["pending"] += 1
 
-        return result
-    except (OSError, json.JSONDecodeError):
-        return result
+    return result
 
 
 def is_build_complete(spec_dir: Path) -> bool:
@@ -180,57 +170,55 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json") as f:
-                plan = json.load(f)
-
-            print("\nPhases:")
-            for phase in plan.get("phases", []):
-                phase_subtasks = phase.get("subtasks", [])
-                phase_completed = sum(
-                    1 for s in phase_subtasks if s.get("status") == "completed"
+        plan = get_plan_store(spec_dir).get() or {}
+
+        print("\nPhases:")
+        for phase in plan.get("phases", []):
+            phase_subtasks = phase.get("subtasks", [])
+            phase_completed = sum(
+                1 for s in phase_subtasks if s.get("status") == "completed"
+            )
+            phase_total = len(phase_subtasks)
+            phase_name = phase.get("name", phase.get("id", "Unknown"))
+
+            if phase_completed == phase_total:
+                status = "complete"
+            elif phase_completed > 0 or any(
+                s.get("status") == "in_progress" for s in phase_subtasks
+            ):
+                status = "in_progress"
+            else:
+                # Check if blocked by dependencies
+                deps = phase.get("depends_on", [])
+                all_deps_complete = True
+                for dep_id in deps:
+                    for p in plan.get("phases", []):
+                        if p.get("id") == dep_id or p.get("phase") == dep_id:
+                            p_subtasks = p.get("subtasks", [])
+                            if not all(
+                                s.get("status") == "completed" for s in p_subtasks
+                            ):
+                                all_deps_complete = False
+                            break
+                status = "pending" if all_deps_complete else "blocked"
+
+            print_phase_status(phase_name, phase_completed, phase_total, status)
+
+        # Show next subtasks if requested (more than one when they can
+        # run in parallel)
+        if show_next and completed < total:
+            up_next = SubtaskScheduler(plan).next_ready(UP_NEXT_COUNT)
+            if up_next:
+                print()
+            for i, next_subtask in enumerate(up_next):
+                label = "Next" if i == 0 else "Also ready"
+                next_id = next_subtask.get("id", "unknown")
+                next_desc = next_subtask.get("description", "")
+                if len(next_desc) > 60:
+                    next_desc = next_desc[:57] + "..."
+                print(
+                    f"  {icon(Icons.ARROW_RIGHT)} {label}: {highlight(next_id)} - {next_desc}"
                 )
-                phase_total = len(phase_subtasks)
-                phase_name = phase.get("name", phase.get("id", "Unknown"))
-
-                if phase_completed == phase_total:
-                    status = "complete"
-                elif phase_completed > 0 or any(
-                    s.get("status") == "in_progress" for s in phase_subtasks
-                ):
-                    status = "in_progress"
-                else:
-                    # Check if blocked by dependencies
-                    deps = phase.get("depends_on", [])
-                    all_deps_complete = True
-                    for dep_id in deps:
-                        for p in plan.get("phases", []):
-                            if p.get("id") == dep_id or p.get("phase") == dep_id:
-                                p_subtasks = p.get("subtasks", [])
-                                if not all(
-                                    s.get("status") == "completed" for s in p_subtasks
-                                ):
-                                    all_deps_complete = False
-                                break
-                    status = "pending" if all_deps_complete else "blocked"
-
-                print_phase_status(phase_name, phase_completed, phase_total, status)
-
-            # Show next subtask if requested
-            if show_next and completed < total:
-                next_subtask = get_next_subtask(spec_dir)
-                if next_subtask:
-                    print()
-                    next_id = next_subtask.get("id", "unknown")
-                    next_desc = next_subtask.get("description", "")
-                    if len(next_desc) > 60:
-                        next_desc = next_desc[:57] + "..."
-                    print(
-                        f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
-                    )
-
-        except (OSError, json.JSONDecodeError):
-            pass
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
@@ -286,9 +274,9 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = get_plan_store(spec_dir).get()
 
-    if not plan_file.exists():
+    if plan is None:
         return {
             "workflow_type": None,
             "total_phases": 0,
@@ -300,103 +288,78 @@ def get_plan_summary(spec_dir: Path) -> dict:
             "phases": [],
         }
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+    summary = {
+        "workflow_type": plan.get("workflow_type"),
+        "total_phases": len(plan.get("phases", [])),
+        "total_subtasks": 0,
+        "completed_subtasks": 0,
+        "pending_subtasks": 0,
+        "in_progress_subtasks": 0,
+        "failed_subtasks": 0,
+        "phases": [],
+    }
 
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
+    for phase in plan.get("phases", []):
+        phase_info = {
+            "id": phase.get("id"),
+            "phase": phase.get("phase"),
+            "name": phase.get("name"),
+            "depends_on": phase.get("depends_on", []),
+            "subtasks": [],
+            "completed": 0,
+            "total": 0,
         }
 
-        for phase in plan.get("phases", []):
-            phase_info = {
-                "id": phase.get("id"),
-                "phase": phase.get("phase"),
-                "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
-            }
+        for subtask in phase.get("subtasks", []):
+            status = subtask.get("status", "pending")
+            summary["total_subtasks"] += 1
+            phase_info["total"] += 1
+
+            if status == "completed":
+                summary["completed_subtasks"] += 1
+                phase_info["completed"] += 1
+            elif status == "in_progress":
+                summary["in_progress_subtasks"] += 1
+            elif status == "failed":
+                summary["failed_subtasks"] += 1
+            else:
+                summary["pending_subtasks"] += 1
+
+            phase_info["subtasks"].append(
+                {
+                    "id": subtask.get("id"),
+                    "description": subtask.get("description"),
+                    "status": status,
+                    "service": subtask.get("service"),
+                }
+            )
 
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
+        summary["phases"].append(phase_info)
 
-            summary["phases"].append(phase_info)
-
-        return summary
-
-    except (OSError, json.JSONDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    return summary
 
 
 def get_current_phase(spec_dir: Path) -> dict | None:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = get_plan_store(spec_dir).get()
 
-    if not plan_file.exists():
+    if plan is None:
         return None
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            subtasks = phase.get("subtasks", [])
-            # Phase is current if it has incomplete subtasks and dependencies are met
-            has_incomplete = any(s.get("status") != "completed" for s in subtasks)
-            if has_incomplete:
-                return {
-                    "id": phase.get("id"),
-                    "phase": phase.get("phase"),
-                    "name": phase.get("name"),
-                    "completed": sum(
-                        1 for s in subtasks if s.get("status") == "completed"
-                    ),
-                    "total": len(subtasks),
-                }
-
-        return None
+    for phase in plan.get("phases", []):
+        subtasks = phase.get("subtasks", [])
+        # Phase is current if it has incomplete subtasks and dependencies are met
+        has_incomplete = any(s.get("status") != "completed" for s in subtasks)
+        if has_incomplete:
+            return {
+                "id": phase.get("id"),
+                "phase": phase.get("phase"),
+                "name": phase.get("name"),
+                "completed": sum(1 for s in subtasks if s.get("status") == "completed"),
+                "total": len(subtasks),
+            }
 
-    except (OSError, json.JSONDecodeError):
-        return None
+    return None
 
 
 def get_next_subtask(spec_dir: Path) -> dict | None:
@@ -409,50 +372,26 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    ready = SubtaskScheduler.from_spec_dir(spec_dir).next_ready(1)
+    return ready[0] if ready else None
 
-    if not plan_file.exists():
-        return None
-
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
 
-        phases = plan.get("phases", [])
-
-        # Build a map of phase completion
-        phase_complete = {}
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            subtasks = phase.get("subtasks", [])
-            phase_complete[phase_id] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
+def get_parallel_subtasks(spec_dir: Path, limit: int) -> list[dict]:
+    """
+    Find subtasks that can be worked on at the same time.
 
-        # Find next available subtask
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            depends_on = phase.get("depends_on", [])
-
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
-
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", []):
-                if subtask.get("status") == "pending":
-                    return {
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                        **subtask,
-                    }
+    Subtasks are independent when neither depends on the other (through
+    phase or subtask depends_on). Phases that aren't parallel_safe
+    contribute one subtask at a time.
 
-        return None
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+        limit: Maximum number of subtasks to return
 
-    except (OSError, json.JSONDecodeError):
-        return None
+    Returns:
+        Subtask dicts (same shape as get_next_subtask), empty if all complete
+    """
+    return SubtaskScheduler.from_spec_dir(spec_dir).next_ready(max(1, limit))
 
 
 def format_duration(seconds: float) -> str:
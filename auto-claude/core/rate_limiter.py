@@ -0,0 +1,437 @@
+"""
+API Rate Limiter
+================
+
+Process-wide scheduler for Claude SDK requests.
+
+The coder, QA, spec phases, ideation, merge resolution and insight
+extraction all create their own SDK clients. Under parallel builds they
+would otherwise start requests with no shared limit and run into rate
+limits. Every client made by create_client() (and the other client
+factories) is wrapped in a RateLimitedClient, which takes a slot from the
+RateLimiter before each query:
+- Slots come from a token bucket per model (AGENT_RATE_LIMIT_RPM slots per
+  minute, bursts of up to AGENT_RATE_LIMIT_BURST)
+- Waiting requests are served by priority class (coding > QA > ideation >
+  insights), first come first served within a class
+- A rate limit error (429) pauses the model's bucket, with exponential
+  backoff while they keep coming
+
+A slot covers one query; the turns the SDK runs for that query aren't
+metered separately. The limiter works across event loops and threads, since
+some callers (merge resolution, insight extraction) run their own loops.
+
+Usage:
+    client = rate_limited(ClaudeSDKClient(options=...), model, Priority.INSIGHTS)
+    async with client:
+        await client.query(prompt)  # Waits for a slot
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+# Import debug utilities
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "core.rate_limiter"
+
+# Defaults per model (overridden by AGENT_RATE_LIMIT_RPM / _BURST)
+DEFAULT_REQUESTS_PER_MINUTE = 50.0
+DEFAULT_BURST = 5
+
+# Pause after the first rate limit error, doubled for each one after it
+BACKOFF_BASE_SECONDS = 5.0
+BACKOFF_MAX_SECONDS = 120.0
+
+
+class Priority(IntEnum):
+    """Priority classes; lower values are served first."""
+
+    CODING = 0
+    QA = 1
+    IDEATION = 2
+    INSIGHTS = 3
+
+
+# Priority of the agent types create_client() knows about
+AGENT_PRIORITIES = {
+    "qa_reviewer": Priority.QA,
+    "qa_fixer": Priority.QA,
+}
+
+
+def agent_priority(agent_type: str) -> Priority:
+    """Priority class for a create_client() agent type (coding by default)."""
+    return AGENT_PRIORITIES.get(agent_type, Priority.CODING)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an SDK error reports a rate limit (HTTP 429)."""
+    text = str(error).lower()
+    return "429" in text or "rate limit" in text or "rate_limit" in text
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass
+class RateLimitStats:
+    """Queue wait statistics, for the status file."""
+
+    waiting: int = 0
+    last_wait_seconds: float = 0.0
+    total_wait_seconds: float = 0.0
+    grants: int = 0
+    rate_limited: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "waiting": self.waiting,
+            "last_wait_seconds": round(self.last_wait_seconds, 3),
+            "average_wait_seconds": round(self.total_wait_seconds / self.grants, 3)
+            if self.grants
+            else 0.0,
+            "grants": self.grants,
+            "rate_limited": self.rate_limited,
+        }
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    loop: asyncio.AbstractEventLoop = field(compare=False)
+    event: asyncio.Event = field(compare=False)
+    enqueued: float = field(compare=False)
+
+    def wake(self) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self.event.set)
+        except RuntimeError:
+            pass  # Its loop is closed
+
+
+@dataclass
+class _Bucket:
+    rate: float  # Slots per second
+    capacity: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    backoff: float = 0.0
+    waiters: list[_Waiter] = field(default_factory=list)
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """Token-bucket rate limits per model, with priority queueing."""
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            requests_per_minute: Slots per minute per model (0 disables
+                limiting; default AGENT_RATE_LIMIT_RPM or 50)
+            burst: Slots a model can use at once after being idle (default
+                AGENT_RATE_LIMIT_BURST or 5)
+            clock: Monotonic clock (for tests)
+        """
+        if requests_per_minute is None:
+            requests_per_minute = _env_number(
+                "AGENT_RATE_LIMIT_RPM", DEFAULT_REQUESTS_PER_MINUTE
+            )
+        if burst is None:
+            burst = int(_env_number("AGENT_RATE_LIMIT_BURST", DEFAULT_BURST))
+        self.requests_per_minute = requests_per_minute
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+        self._limits: dict[str, tuple[float, int]] = {}
+        self._seq = itertools.count()
+        self._stats = RateLimitStats()
+        self._listeners: list[Callable[[RateLimitStats], None]] = []
+
+    def configure(self, model: str, requests_per_minute: float, burst: int) -> None:
+        """Set the limits of one model (0 requests per minute disables them)."""
+        with self._lock:
+            self._limits[model] = (requests_per_minute, max(1, burst))
+            self._buckets.pop(model, None)
+
+    def _bucket(self, model: str) -> _Bucket | None:
+        bucket = self._buckets.get(model)
+        if bucket is None:
+            rpm, burst = self._limits.get(model, (self.requests_per_minute, self.burst))
+            if rpm <= 0:
+                return None
+            bucket = self._buckets[model] = _Bucket(
+                rate=rpm / 60.0,
+                capacity=float(burst),
+                tokens=float(burst),
+                updated=self._clock(),
+            )
+        return bucket
+
+    def stats(self) -> RateLimitStats:
+        """A snapshot of the queue wait statistics."""
+        with self._lock:
+            return RateLimitStats(**vars(self._stats))
+
+    def add_listener(
+        self, callback: Callable[[RateLimitStats], None]
+    ) -> Callable[[], None]:
+        """
+        Call a function with fresh statistics whenever a request is queued or
+        gets its slot.
+
+        Returns:
+            A function that removes the listener
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+        def remove() -> None:
+            with self._lock:
+                if callback in self._listeners:
+                    self._listeners.remove(callback)
+
+        return remove
+
+    def _notify(self) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+            stats = RateLimitStats(**vars(self._stats))
+        for callback in listeners:
+            try:
+                callback(stats)
+            except Exception as e:
+                debug_warning(MODULE, "Rate limit listener failed", error=str(e))
+
+    def _delay(self, bucket: _Bucket, waiter: _Waiter, now: float) -> float | None:
+        """Seconds until the waiter can have a slot (None: not its turn)."""
+        if bucket.waiters[0] is not waiter:
+            return None
+        if bucket.blocked_until > now:
+            return bucket.blocked_until - now
+        bucket.refill(now)
+        if bucket.tokens >= 1:
+            return 0.0
+        return (1 - bucket.tokens) / bucket.rate
+
+    async def acquire(self, model: str, priority: int = Priority.CODING) -> float:
+        """
+        Wait for a request slot for a model.
+
+        Args:
+            model: Model the request goes to
+            priority: Priority class of the caller
+
+        Returns:
+            Seconds spent waiting
+        """
+        waiter = _Waiter(
+            priority=int(priority),
+            seq=0,
+            loop=asyncio.get_running_loop(),
+            event=asyncio.Event(),
+            enqueued=self._clock(),
+        )
+        with self._lock:
+            bucket = self._bucket(model)
+            if bucket is None:
+                return 0.0
+            waiter.seq = next(self._seq)
+            heapq.heappush(bucket.waiters, waiter)
+            self._stats.waiting += 1
+        self._notify()
+
+        granted = False
+        try:
+            while True:
+                with self._lock:
+                    now = self._clock()
+                    delay = self._delay(bucket, waiter, now)
+                    if delay == 0:
+                        heapq.heappop(bucket.waiters)
+                        bucket.tokens -= 1
+                        waited = now - waiter.enqueued
+                        self._stats.waiting -= 1
+                        self._stats.grants += 1
+                        self._stats.last_wait_seconds = waited
+                        self._stats.total_wait_seconds += waited
+                        if bucket.waiters:
+                            bucket.waiters[0].wake()
+                        granted = True
+                        break
+                # A wake() can't be lost here: it sets the event from a loop
+                # callback, which can't run before this task awaits
+                waiter.event.clear()
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), delay)
+                # Not the builtin TimeoutError before Python 3.11
+                except asyncio.TimeoutError:  # noqa: UP041
+                    pass
+        finally:
+            if not granted:
+                with self._lock:
+                    bucket.waiters.remove(waiter)
+                    heapq.heapify(bucket.waiters)
+                    self._stats.waiting -= 1
+                    if bucket.waiters:
+                        bucket.waiters[0].wake()
+
+        if waited > 0.5:
+            debug(
+                MODULE,
+                "Waited for a request slot",
+                model=model,
+                priority=Priority(priority).name,
+                seconds=round(waited, 2),
+            )
+        self._notify()
+        return waited
+
+    def report_rate_limited(self, model: str, retry_after: float | None = None) -> None:
+        """
+        Pause a model's requests after a rate limit error.
+
+        Args:
+            model: Model that returned the error
+            retry_after: Seconds the API asked to wait (default: exponential
+                backoff)
+        """
+        with self._lock:
+            bucket = self._bucket(model)
+            if bucket is None:
+                return
+            now = self._clock()
+            bucket.backoff = min(
+                BACKOFF_MAX_SECONDS, max(BACKOFF_BASE_SECONDS, bucket.backoff * 2)
+            )
+            delay = retry_after if retry_after is not None else bucket.backoff
+            bucket.blocked_until = max(bucket.blocked_until, now + delay)
+            bucket.tokens = 0.0
+            bucket.updated = now
+            self._stats.rate_limited += 1
+        debug_warning(
+            MODULE, "Rate limited, pausing requests", model=model, delay=delay
+        )
+
+    def report_success(self, model: str) -> None:
+        """Reset a model's backoff after a request went through."""
+        with self._lock:
+            bucket = self._buckets.get(model)
+            if bucket is not None:
+                bucket.backoff = 0.0
+
+
+class RateLimitedClient:
+    """
+    Wraps a ClaudeSDKClient so each query waits for a rate limiter slot.
+
+    Everything other than query() and receive_response() is passed through
+    to the wrapped client.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        model: str,
+        priority: int = Priority.CODING,
+        limiter: RateLimiter | None = None,
+    ):
+        self._client = client
+        self.model = model
+        self.priority = Priority(priority)
+        self._limiter = limiter or get_rate_limiter()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def __aenter__(self) -> RateLimitedClient:
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> Any:
+        return await self._client.__aexit__(*exc_info)
+
+    def _check_error(self, error: BaseException) -> None:
+        if is_rate_limit_error(error):
+            self._limiter.report_rate_limited(self.model)
+
+    async def query(self, *args, **kwargs) -> Any:
+        await self._limiter.acquire(self.model, self.priority)
+        try:
+            return await self._client.query(*args, **kwargs)
+        except Exception as e:
+            self._check_error(e)
+            raise
+
+    async def receive_response(self) -> AsyncIterator[Any]:
+        try:
+            async for msg in self._client.receive_response():
+                yield msg
+        except Exception as e:
+            self._check_error(e)
+            raise
+        self._limiter.report_success(self.model)
+
+
+_limiter: RateLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """The process-wide RateLimiter."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
+
+
+def rate_limited(
+    client: Any, model: str, priority: int = Priority.CODING
+) -> RateLimitedClient:
+    """
+    Wrap an SDK client so its queries go through the process-wide limiter.
+
+    Args:
+        client: ClaudeSDKClient to wrap
+        model: Model the client uses
+        priority: Priority class of its requests
+
+    Returns:
+        RateLimitedClient around client
+    """
+    return RateLimitedClient(client, model, priority)
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Subtask Scheduler
+=================
+
+Schedules implementation plan subtasks from a dependency DAG.
+
+A subtask depends on every subtask of the phases listed in its phase's
+depends_on (and on any subtask ids in its own depends_on). The graph is
+built once; after that the scheduler keeps a count of unmet dependencies
+per subtask and a ready queue that is updated incrementally as subtasks
+complete, instead of rescanning the plan for every pick. A scheduler that
+follows a PlanStore applies status changes as the plan is updated, and only
+rebuilds the graph when subtasks or dependencies change.
+
+Ready subtasks are handed out by:
+1. Critical path length - the longest chain of subtasks waiting on this one
+2. priority - optional subtask field, higher first
+3. Plan order
+
+Phases that aren't parallel_safe still run one subtask at a time, in plan
+order.
+
+Usage:
+    from core.subtask_scheduler import SubtaskScheduler
+
+    scheduler = SubtaskScheduler.from_spec_dir(spec_dir)
+    stop_following = scheduler.follow(get_plan_store(spec_dir))
+    for subtask in scheduler.claim(3):
+        ...
+        scheduler.mark_completed(subtask["id"])
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.plan_store import PlanStore
+
+# Import debug utilities
+try:
+    from debug import debug_warning
+except ImportError:
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "core.subtask_scheduler"
+
+
+@dataclass
+class _Node:
+    """A subtask in the dependency graph."""
+
+    subtask: dict  # Same shape as get_next_subtask() results
+    phase_key: str | int
+    index: int  # Position in the plan
+    priority: int = 0
+    dependencies: set[str] = field(default_factory=set)
+    dependents: set[str] = field(default_factory=set)
+    unmet: int = 0
+    # Depends on a phase that isn't in the plan
+    unsatisfiable: bool = False
+    critical_path: int = 1
+
+    @property
+    def id(self) -> str:
+        return self.subtask["id"]
+
+    @property
+    def sort_key(self) -> tuple:
+        return (-self.critical_path, -self.priority, self.index)
+
+
+class SubtaskScheduler:
+    """Hands out ready subtasks of an implementation plan."""
+
+    def __init__(self, plan: dict):
+        """
+        Build the dependency graph of a plan.
+
+        Args:
+            plan: Parsed implementation_plan.json
+        """
+        self._nodes: dict[str, _Node] = {}
+        self._status: dict[str, str] = {}
+        self._claimed: set[str] = set()
+        self._ready: list[tuple] = []
+        # Phase key -> subtask ids in plan order, for phases run serially
+        self._serial_phases: dict[str | int, list[str]] = {}
+        # What the graph was built from (see _graph_signature)
+        self._signature = _graph_signature(plan)
+        # Plan store notifications may come from other threads
+        self._lock = threading.RLock()
+        self._build(plan)
+
+    @classmethod
+    def from_spec_dir(cls, spec_dir: Path) -> SubtaskScheduler:
+        """Build a scheduler from a spec's implementation_plan.json."""
+        from core.plan_store import get_plan_store
+
+        return cls(get_plan_store(spec_dir).get() or {})
+
+    def follow(self, store: PlanStore) -> Callable[[], None]:
+        """
+        Keep up with a plan store: every plan change is passed to refresh().
+
+        Args:
+            store: The store of the plan this scheduler was built from
+
+        Returns:
+            Function that stops following the store
+        """
+        unsubscribe = store.subscribe(self.refresh)
+        plan = store.get()
+        if plan is not None:
+            # Changes read before subscribing
+            self.refresh(plan)
+        return unsubscribe
+
+    # ------------------------------------------------------------------
+    # Graph construction
+    # ------------------------------------------------------------------
+
+    def _build(self, plan: dict) -> None:
+        phases = plan.get("phases") or []
+        phase_members: dict[str | int, list[str]] = {}
+        # depends_on may name a phase by id or by number
+        phase_aliases: dict[str | int, str | int] = {}
+
+        for phase in phases:
+            phase_key = phase.get("id") or phase.get("phase")
+            phase_aliases[phase_key] = phase_key
+            if phase.get("phase") is not None:
+                phase_aliases.setdefault(phase.get("phase"), phase_key)
+            members = phase_members.setdefault(phase_key, [])
+            for subtask in phase.get("subtasks") or []:
+                subtask_id = subtask.get("id")
+                if not subtask_id or subtask_id in self._nodes:
+                    continue
+                self._nodes[subtask_id] = _Node(
+                    subtask={
+                        "phase_id": phase_key,
+                        "phase_name": phase.get("name"),
+                        "phase_num": phase.get("phase"),
+                        **subtask,
+                    },
+                    phase_key=phase_key,
+                    index=len(self._nodes),
+                    priority=_as_int(subtask.get("priority")),
+                )
+                self._status[subtask_id] = subtask.get("status", "pending")
+                members.append(subtask_id)
+            if not phase.get("parallel_safe"):
+                self._serial_phases[phase_key] = members
+
+        for phase in phases:
+            phase_key = phase.get("id") or phase.get("phase")
+            phase_dependencies: set[str] = set()
+            unknown = False
+            for dep in phase.get("depends_on") or []:
+                if dep in phase_aliases:
+                    phase_dependencies.update(phase_members[phase_aliases[dep]])
+                else:
+                    unknown = True
+            if unknown:
+                # Can never be satisfied (same as an unmet phase dependency)
+                debug_warning(MODULE, "Unknown phase dependency", phase=phase_key)
+            for subtask_id in phase_members[phase_key]:
+                node = self._nodes[subtask_id]
+                own = {
+                    dep
+                    for dep in node.subtask.get("depends_on") or []
+                    if dep in self._nodes and dep != subtask_id
+                }
+                node.dependencies = (phase_dependencies | own) - {subtask_id}
+                for dep in node.dependencies:
+                    self._nodes[dep].dependents.add(subtask_id)
+                node.unmet = sum(
+                    1 for dep in node.dependencies if self._status[dep] != "completed"
+                )
+                if unknown:
+                    node.unsatisfiable = True
+                    node.unmet += 1
+
+        self._compute_critical_paths()
+        for node in self._nodes.values():
+            self._push_if_ready(node)
+
+    def _compute_critical_paths(self) -> None:
+        """Longest chain of waiting subtasks, counting serial phase order."""
+        successors = {
+            subtask_id: set(node.dependents) for subtask_id, node in self._nodes.items()
+        }
+        for members in self._serial_phases.values():
+            for before, after in zip(members, members[1:]):
+                successors[before].add(after)
+
+        # Kahn's algorithm; subtasks in a cycle keep a critical path of 1
+        indegree = dict.fromkeys(self._nodes, 0)
+        for targets in successors.values():
+            for target in targets:
+                indegree[target] += 1
+        queue = [subtask_id for subtask_id, count in indegree.items() if count == 0]
+        order = []
+        while queue:
+            subtask_id = queue.pop()
+            order.append(subtask_id)
+            for target in successors[subtask_id]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    queue.append(target)
+        if len(order) < len(self._nodes):
+            debug_warning(MODULE, "Dependency cycle in implementation plan")
+
+        for subtask_id in reversed(order):
+            node = self._nodes[subtask_id]
+            node.critical_path = 1 + max(
+                (self._nodes[s].critical_path for s in successors[subtask_id]),
+                default=0,
+            )
+
+    # ------------------------------------------------------------------
+    # Ready queue
+    # ------------------------------------------------------------------
+
+    def _push_if_ready(self, node: _Node) -> None:
+        if self._is_ready(node.id):
+            heapq.heappush(self._ready, (*node.sort_key, node.id))
+
+    def _is_ready(self, subtask_id: str) -> bool:
+        return (
+            self._nodes[subtask_id].unmet == 0
+            and self._status[subtask_id] == "pending"
+            and subtask_id not in self._claimed
+        )
+
+    def _serial_head(self, phase_key: str | int) -> str | None:
+        """First pending subtask of a serial phase, None while one is claimed."""
+        members = self._serial_phases[phase_key]
+        if any(subtask_id in self._claimed for subtask_id in members):
+            return None
+        for subtask_id in members:
+            if self._status[subtask_id] == "pending":
+                return subtask_id
+        return None
+
+    def next_ready(self, k: int = 1) -> list[dict]:
+        """
+        Get the next ready subtasks without claiming them.
+
+        Args:
+            k: Maximum number of subtasks
+
+        Returns:
+            Up to k subtask dicts (with phase_id, phase_name and phase_num),
+            best first
+        """
+        with self._lock:
+            # Drop entries for subtasks that were claimed or finished, and
+            # repeats from subtasks that became ready more than once
+            self._ready = list(
+                {e[-1]: e for e in self._ready if self._is_ready(e[-1])}.values()
+            )
+            heapq.heapify(self._ready)
+
+            picked = []
+            serial_phases_used = set()
+            for entry in sorted(self._ready):
+                if len(picked) >= k:
+                    break
+                node = self._nodes[entry[-1]]
+                if node.phase_key in self._serial_phases:
+                    if node.phase_key in serial_phases_used:
+                        continue
+                    if self._serial_head(node.phase_key) != node.id:
+                        continue
+                    serial_phases_used.add(node.phase_key)
+                picked.append(dict(node.subtask, status=self._status[node.id]))
+            return picked
+
+    def next_ready_after(self, subtask_id: str, k: int = 1) -> list[dict]:
+        """
+        Get what next_ready() would return once a subtask completes.
+
+        Nothing is changed: the completion is applied and then undone.
+
+        Args:
+            subtask_id: Subtask assumed to complete
+            k: Maximum number of subtasks
+
+        Returns:
+            Up to k subtask dicts, best first
+        """
+        with self._lock:
+            status = self._status.get(subtask_id)
+            if status is None or status == "completed":
+                return self.next_ready(k)
+            claimed = subtask_id in self._claimed
+            self.mark_completed(subtask_id)
+            try:
+                return self.next_ready(k)
+            finally:
+                self._set_status(subtask_id, status)
+                if claimed:
+                    self._claimed.add(subtask_id)
+
+    def claim(self, k: int = 1) -> list[dict]:
+        """
+        Hand out the next ready subtasks to workers.
+
+        Claimed subtasks aren't handed out again until they are completed,
+        failed or released.
+
+        Args:
+            k: Maximum number of subtasks
+
+        Returns:
+            The claimed subtask dicts
+        """
+        with self._lock:
+            picked = self.next_ready(k)
+            self._claimed.update(subtask["id"] for subtask in picked)
+            return picked
+
+    # ------------------------------------------------------------------
+    # Status updates
+    # ------------------------------------------------------------------
+
+    def mark_completed(self, subtask_id: str) -> list[str]:
+        """
+        Record that a subtask completed.
+
+        Returns:
+            Ids of subtasks that became ready because of it
+        """
+        with self._lock:
+            node = self._nodes.get(subtask_id)
+            if node is None or self._status[subtask_id] == "completed":
+                self._claimed.discard(subtask_id)
+                return []
+            self._claimed.discard(subtask_id)
+            self._status[subtask_id] = "completed"
+
+            unblocked = []
+            for dependent_id in sorted(node.dependents):
+                dependent = self._nodes[dependent_id]
+                dependent.unmet -= 1
+                if self._is_ready(dependent_id):
+                    self._push_if_ready(dependent)
+                    unblocked.append(dependent_id)
+            return unblocked
+
+    def mark_failed(self, subtask_id: str) -> None:
+        """Record that a subtask failed (its dependents stay blocked)."""
+        with self._lock:
+            if subtask_id in self._nodes:
+                self._claimed.discard(subtask_id)
+                self._set_status(subtask_id, "failed")
+
+    def release(self, subtask_id: str) -> None:
+        """
+        Drop the claim on a subtask that didn't complete.
+
+        Its status is left as the plan has it, so a subtask that's pending
+        again goes back to the ready queue (e.g. to retry it).
+        """
+        with self._lock:
+            if subtask_id in self._nodes:
+                self._claimed.discard(subtask_id)
+                self._push_if_ready(self._nodes[subtask_id])
+
+    def _set_status(self, subtask_id: str, status: str) -> None:
+        node = self._nodes[subtask_id]
+        if self._status[subtask_id] == "completed":
+            # Un-completing blocks the dependents again
+            for dependent_id in node.dependents:
+                self._nodes[dependent_id].unmet += 1
+        self._status[subtask_id] = status
+        self._push_if_ready(node)
+
+    def refresh(self, plan: dict) -> None:
+        """
+        Catch up with a newer version of the plan.
+
+        Status changes are applied incrementally; the graph is only rebuilt
+        if subtasks, dependencies, priorities or parallel_safe flags changed.
+        Claims are kept while a subtask's status is unchanged.
+
+        Args:
+            plan: Parsed implementation_plan.json
+        """
+        with self._lock:
+            if _graph_signature(plan) != self._signature:
+                updated = SubtaskScheduler(plan)
+                claimed = self._claimed & updated._nodes.keys()
+                # Keep this scheduler's lock, which the caller holds
+                updated.__dict__.pop("_lock")
+                self.__dict__.update(updated.__dict__)
+                self._claimed = claimed
+                return
+
+            for phase in plan.get("phases") or []:
+                phase_key = phase.get("id") or phase.get("phase")
+                for subtask in phase.get("subtasks") or []:
+                    node = self._nodes.get(subtask.get("id"))
+                    if node is None or node.phase_key != phase_key:
+                        # A duplicate id (only the first one is scheduled)
+                        continue
+                    node.subtask = {
+                        "phase_id": phase_key,
+                        "phase_name": phase.get("name"),
+                        "phase_num": phase.get("phase"),
+                        **subtask,
+                    }
+                    status = subtask.get("status", "pending")
+                    if status == self._status[node.id]:
+                        continue
+                    if status == "completed":
+                        self.mark_completed(node.id)
+                    else:
+                        self._claimed.discard(node.id)
+                        self._set_status(node.id, status)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def status(self, subtask_id: str) -> str | None:
+        """Current status of a subtask (None if it isn't in the plan)."""
+        return self._status.get(subtask_id)
+
+    def critical_path(self, subtask_id: str) -> int:
+        """Length of the longest chain of subtasks starting at this one."""
+        return self._nodes[subtask_id].critical_path
+
+    @property
+    def claimed(self) -> set[str]:
+        return set(self._claimed)
+
+    def is_complete(self) -> bool:
+        """Whether every subtask is completed."""
+        return all(status == "completed" for status in self._status.values())
+
+
+def _graph_signature(plan: dict) -> list:
+    """The parts of a plan the dependency graph and ordering are built from."""
+    return [
+        (
+            phase.get("id"),
+            phase.get("phase"),
+            bool(phase.get("parallel_safe")),
+            phase.get("depends_on") or [],
+            [
+                (
+                    subtask.get("id"),
+                    subtask.get("depends_on") or [],
+                    subtask.get("priority"),
+                )
+                for subtask in phase.get("subtasks") or []
+            ],
+        )
+        for phase in plan.get("phases") or []
+    ]
+
+
+def _as_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
@@ -17,6 +17,7 @@ This module has been refactored for better maintainability:
 Public API is exported via workspace/__init__.py for backward compatibility.
 """
 
+import asyncio
 import subprocess
 from pathlib import Path
 
@@ -70,6 +71,7 @@ except ImportError:
 
 
 # Import merge system
+from core.git_runner import run_git
 from core.workspace.display import (
     print_conflict_info as _print_conflict_info,
 )
@@ -81,7 +83,6 @@ from core.workspace.display import (
 )
 from core.workspace.git_utils import (
     MAX_PARALLEL_AI_MERGES,
-    _is_auto_claude_file,
     get_existing_build_worktree,
 )
 from core.workspace.git_utils import (
@@ -93,6 +94,7 @@ from core.workspace.git_utils import (
 from core.workspace.git_utils import (
     is_lock_file as _is_lock_file,
 )
+from core.workspace.merge_preflight import preflight_merge
 
 # Import from refactored modules in core/workspace/
 from core.workspace.models import (
@@ -108,6 +110,9 @@ from merge import (
 
 MODULE = "workspace"
 
+# Paths per "git add" when staging resolved files
+GIT_ADD_BATCH_SIZE = 500
+
 # The following functions are now imported from refactored modules above.
 # They are kept here only to avoid breaking the existing code that still needs
 # the complex merge operations below.
@@ -499,13 +504,12 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
     Check for git-level conflicts WITHOUT modifying the working directory.
 
     Uses git merge-tree to check conflicts in-memory, avoiding HMR triggers
-    from file system changes.
+    from file system changes. Results are cached per (base, branch) commit
+    pair by the merge preflight.
 
     Returns:
         Dict with has_conflicts, conflicting_files, etc.
     """
-    import re
-
     spec_branch = f"auto-claude/{spec_name}"
     result = {
         "has_conflicts": False,
@@ -515,120 +519,14 @@ def _check_git_conflicts(project_dir: Path, spec_name: str) -> dict:
     }
 
     try:
-        # Get current branch
-        base_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if base_result.returncode == 0:
-            result["base_branch"] = base_result.stdout.strip()
-
-        # Get merge base
-        merge_base_result = subprocess.run(
-            ["git", "merge-base", result["base_branch"], spec_branch],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if merge_base_result.returncode != 0:
-            debug_warning(MODULE, "Could not find merge base")
-            return result
-
-        merge_base = merge_base_result.stdout.strip()
-
-        # Get commit hashes
-        main_commit_result = subprocess.run(
-            ["git", "rev-parse", result["base_branch"]],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        spec_commit_result = subprocess.run(
-            ["git", "rev-parse", spec_branch],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        if main_commit_result.returncode != 0 or spec_commit_result.returncode != 0:
-            debug_warning(MODULE, "Could not resolve branch commits")
+        preflight = preflight_merge(project_dir, spec_name)
+        result["base_branch"] = preflight.base_branch
+        if preflight.error:
+            debug_warning(MODULE, preflight.error)
             return result
 
-        main_commit = main_commit_result.stdout.strip()
-        spec_commit = spec_commit_result.stdout.strip()
-
-        # Use git merge-tree to check for conflicts WITHOUT touching working directory
-        # Note: --write-tree mode only accepts 2 branches (it auto-finds the merge base)
-        merge_tree_result = subprocess.run(
-            [
-                "git",
-                "merge-tree",
-                "--write-tree",
-                "--no-messages",
-                result["base_branch"],  # Use branch names, not commit hashes
-                spec_branch,
-            ],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        # merge-tree returns exit code 1 if there are conflicts
-        if merge_tree_result.returncode != 0:
-            result["has_conflicts"] = True
-
-            # Parse the output for conflicting files
-            output = merge_tree_result.stdout + merge_tree_result.stderr
-            for line in output.split("\n"):
-                if "CONFLICT" in line:
-                    match = re.search(
-                        r"(?:Merge conflict in|CONFLICT.*?:)\s*(.+?)(?:\s*$|\s+\()",
-                        line,
-                    )
-                    if match:
-                        file_path = match.group(1).strip()
-                        # Skip .auto-claude files - they should never be merged
-                        if (
-                            file_path
-                            and file_path not in result["conflicting_files"]
-                            and not _is_auto_claude_file(file_path)
-                        ):
-                            result["conflicting_files"].append(file_path)
-
-            # Fallback: if we didn't parse conflicts, use diff to find files changed in both branches
-            if not result["conflicting_files"]:
-                main_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, main_commit],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                main_files = (
-                    set(main_files_result.stdout.strip().split("\n"))
-                    if main_files_result.stdout.strip()
-                    else set()
-                )
-
-                spec_files_result = subprocess.run(
-                    ["git", "diff", "--name-only", merge_base, spec_commit],
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                spec_files = (
-                    set(spec_files_result.stdout.strip().split("\n"))
-                    if spec_files_result.stdout.strip()
-                    else set()
-                )
-
-                # Files modified in both = potential conflicts
-                # Filter out .auto-claude files - they should never be merged
-                conflicting = main_files & spec_files
-                result["conflicting_files"] = [
-                    f for f in conflicting if not _is_auto_claude_file(f)
-                ]
+        result["has_conflicts"] = preflight.has_conflicts
+        result["conflicting_files"] = preflight.conflicting_files
 
     except Exception as e:
         print(muted(f"  Error checking git conflicts: {e}"))
@@ -658,6 +556,32 @@ def _resolve_git_conflicts_with_ai(
     Returns:
         Dict with success, resolved_files, remaining_conflicts
     """
+    return asyncio.run(
+        _resolve_git_conflicts_with_ai_async(
+            project_dir,
+            spec_name,
+            worktree_path,
+            git_conflicts,
+            orchestrator,
+            no_commit=no_commit,
+        )
+    )
+
+
+async def _resolve_git_conflicts_with_ai_async(
+    project_dir: Path,
+    spec_name: str,
+    worktree_path: Path,
+    git_conflicts: dict,
+    orchestrator: MergeOrchestrator,
+    no_commit: bool = False,
+) -> dict:
+    """
+    Async implementation of _resolve_git_conflicts_with_ai.
+
+    Git runs through the async git runner so it doesn't stall the parallel
+    AI merges, and resolved files are staged together at the end.
+    """
 
     debug(
         MODULE,
@@ -688,27 +612,25 @@ def _resolve_git_conflicts_with_ai(
         f"Resolving {len(conflicting_files)} conflicting file(s) with AI...", "progress"
     )
 
-    # Get merge-base commit
-    merge_base_result = subprocess.run(
-        ["git", "merge-base", base_branch, spec_branch],
-        cwd=project_dir,
-        capture_output=True,
-        text=True,
-    )
-    merge_base = (
-        merge_base_result.stdout.strip() if merge_base_result.returncode == 0 else None
+    # Get merge-base commit and the branch's changed files
+    merge_base_result, changed_files = await asyncio.gather(
+        run_git(["merge-base", base_branch, spec_branch], cwd=project_dir),
+        asyncio.to_thread(
+            _get_changed_files_from_branch, project_dir, base_branch, spec_branch
+        ),
     )
+    merge_base = merge_base_result.stdout.strip() if merge_base_result.ok else None
     debug(
         MODULE,
         "Found merge-base commit",
         merge_base=merge_base[:12] if merge_base else None,
     )
 
+    # Files to stage, all at once, when resolution is done
+    files_to_stage: list[str] = []
+
     # FIX: Copy NEW files FIRST before resolving conflicts
     # This ensures dependencies exist before files that import them are written
-    changed_files = _get_changed_files_from_branch(
-        project_dir, base_branch, spec_branch
-    )
     new_files = [
         (f, s) for f, s in changed_files if s == "A" and f not in conflicting_files
     ]
@@ -724,9 +646,7 @@ def _resolve_git_conflicts_with_ai(
                     target_path = project_dir / file_path
                     target_path.parent.mkdir(parents=True, exist_ok=True)
                     target_path.write_text(content, encoding="utf-8")
-                    subprocess.run(
-                        ["git", "add", file_path], cwd=project_dir, capture_output=True
-                    )
+                    files_to_stage.append(file_path)
                     resolved_files.append(file_path)
                     debug(MODULE, f"Copied new file: {file_path}")
             except Exception as e:
@@ -820,9 +740,7 @@ def _resolve_git_conflicts_with_ai(
                     target_path = project_dir / file_path
                     target_path.parent.mkdir(parents=True, exist_ok=True)
                     target_path.write_text(merged_content, encoding="utf-8")
-                    subprocess.run(
-                        ["git", "add", file_path], cwd=project_dir, capture_output=True
-                    )
+                    files_to_stage.append(file_path)
                     resolved_files.append(file_path)
                     print(success(f"    ✓ {file_path} (new file)"))
                 else:
@@ -830,11 +748,7 @@ def _resolve_git_conflicts_with_ai(
                     target_path = project_dir / file_path
                     if target_path.exists():
                         target_path.unlink()
-                        subprocess.run(
-                            ["git", "add", file_path],
-                            cwd=project_dir,
-                            capture_output=True,
-                        )
+                        files_to_stage.append(file_path)
                     resolved_files.append(file_path)
                     print(success(f"    ✓ {file_path} (deleted)"))
             except Exception as e:
@@ -860,12 +774,10 @@ def _resolve_git_conflicts_with_ai(
         start_time = time.time()
 
         # Run parallel merges
-        parallel_results = asyncio.run(
-            _run_parallel_merges(
-                tasks=files_needing_ai_merge,
-                project_dir=project_dir,
-                max_concurrent=MAX_PARALLEL_AI_MERGES,
-            )
+        parallel_results = await _run_parallel_merges(
+            tasks=files_needing_ai_merge,
+            project_dir=project_dir,
+            max_concurrent=MAX_PARALLEL_AI_MERGES,
         )
 
         elapsed = time.time() - start_time
@@ -876,11 +788,7 @@ def _resolve_git_conflicts_with_ai(
                 target_path = project_dir / result.file_path
                 target_path.parent.mkdir(parents=True, exist_ok=True)
                 target_path.write_text(result.merged_content, encoding="utf-8")
-                subprocess.run(
-                    ["git", "add", result.file_path],
-                    cwd=project_dir,
-                    capture_output=True,
-                )
+                files_to_stage.append(result.file_path)
                 resolved_files.append(result.file_path)
 
                 if result.was_auto_merged:
@@ -926,9 +834,7 @@ def _resolve_git_conflicts_with_ai(
                 target_path = project_dir / file_path
                 if target_path.exists():
                     target_path.unlink()
-                    subprocess.run(
-                        ["git", "add", file_path], cwd=project_dir, capture_output=True
-                    )
+                    files_to_stage.append(file_path)
             else:
                 # Added or modified - copy from worktree
                 content = _get_file_content_from_ref(
@@ -938,13 +844,13 @@ def _resolve_git_conflicts_with_ai(
                     target_path = project_dir / file_path
                     target_path.parent.mkdir(parents=True, exist_ok=True)
                     target_path.write_text(content, encoding="utf-8")
-                    subprocess.run(
-                        ["git", "add", file_path], cwd=project_dir, capture_output=True
-                    )
+                    files_to_stage.append(file_path)
                     resolved_files.append(file_path)
         except Exception as e:
             print(muted(f"    Warning: Could not process {file_path}: {e}"))
 
+    await _stage_files(project_dir, files_to_stage)
+
     # V2: Record merge completion in Evolution Tracker for future context
     # TODO: _record_merge_completion not yet implemented - see line 141
     # if resolved_files:
@@ -992,6 +898,20 @@ def _resolve_git_conflicts_with_ai(
     return result
 
 
+async def _stage_files(project_dir: Path, file_paths: list[str]) -> None:
+    """Stage files (including deletions) with as few git processes as possible."""
+    for start in range(0, len(file_paths), GIT_ADD_BATCH_SIZE):
+        batch = file_paths[start : start + GIT_ADD_BATCH_SIZE]
+        result = await run_git(["add", "--", *batch], cwd=project_dir)
+        if result.ok:
+            continue
+        # A path git can't match aborts the whole add - retry one by one so
+        # the other files are still staged
+        debug_warning(MODULE, "Batched git add failed", stderr=result.stderr[:500])
+        for file_path in batch:
+            await run_git(["add", "--", file_path], cwd=project_dir)
+
+
 # Note: All constants, classes and helper functions are imported from the refactored modules above
 # - Constants from git_utils (MAX_FILE_LINES_FOR_AI, BINARY_EXTENSIONS, etc.)
 # - Models from workspace/models.py (MergeLock, MergeLockError, etc.)
@@ -1004,7 +924,6 @@ def _resolve_git_conflicts_with_ai(
 # Parallel AI Merge Implementation
 # =============================================================================
 
-import asyncio
 import logging
 import os
 
@@ -1223,21 +1142,27 @@ async def _merge_file_with_ai_async(
                 )
 
             # Respect model overrides from environment
+            from core.rate_limiter import Priority, rate_limited
             from phase_config import resolve_model_id
+
             model = resolve_model_id(
                 os.environ.get("ANTHROPIC_SMALL_FAST_MODEL")
                 or os.environ.get("ANTHROPIC_MODEL")
                 or "haiku"
             )
 
-            client = ClaudeSDKClient(
-                options=ClaudeAgentOptions(
-                    model=model,
-                    system_prompt=AI_MERGE_SYSTEM_PROMPT,
-                    allowed_tools=[],
-                    max_turns=1,
-                    max_thinking_tokens=1024,  # Low thinking for speed
-                )
+            client = rate_limited(
+                ClaudeSDKClient(
+                    options=ClaudeAgentOptions(
+                        model=model,
+                        system_prompt=AI_MERGE_SYSTEM_PROMPT,
+                        allowed_tools=[],
+                        max_turns=1,
+                        max_thinking_tokens=1024,  # Low thinking for speed
+                    )
+                ),
+                model,
+                Priority.CODING,
             )
 
             response_text = ""
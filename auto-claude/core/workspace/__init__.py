@@ -29,7 +29,12 @@ _spec.loader.exec_module(_workspace_module)
 merge_existing_build = _workspace_module.merge_existing_build
 _run_parallel_merges = _workspace_module._run_parallel_merges
 
-# Models and Enums
+# Dependency Cache
+from .dependency_cache import (
+    DependencyShareResult,
+    share_dependencies,
+)
+
 # Display Functions
 from .display import (
     _print_conflict_info,
@@ -78,8 +83,19 @@ from .git_utils import (
     is_binary_file,
     is_lock_file,
     is_process_running,
+    validate_merged_files,
     validate_merged_syntax,
 )
+
+# Merge Preflight
+from .merge_preflight import (
+    MergePreflightResult,
+    clear_preflight_cache,
+    preflight_merge,
+    preflight_merges,
+)
+
+# Models and Enums
 from .models import (
     MergeLock,
     MergeLockError,
@@ -101,6 +117,15 @@ from .setup import (
     setup_workspace,
 )
 
+# Sparse Checkout
+from .sparse_checkout import compute_sparse_cone
+
+# Syntax Validation
+from .syntax_validator import (
+    SyntaxValidator,
+    get_syntax_validator,
+)
+
 __all__ = [
     # Merge Operations (from workspace.py)
     "merge_existing_build",
@@ -121,13 +146,27 @@ __all__ = [
     "is_process_running",
     "is_binary_file",
     "validate_merged_syntax",
+    "validate_merged_files",
     "create_conflict_file_with_git",
+    # Merge Preflight
+    "MergePreflightResult",
+    "preflight_merge",
+    "preflight_merges",
+    "clear_preflight_cache",
+    # Syntax Validation
+    "SyntaxValidator",
+    "get_syntax_validator",
     # Setup
     "choose_workspace",
     "copy_spec_to_worktree",
     "setup_workspace",
     "ensure_timeline_hook_installed",
     "initialize_timeline_tracking",
+    # Sparse Checkout
+    "compute_sparse_cone",
+    # Dependency Cache
+    "DependencyShareResult",
+    "share_dependencies",
     # Display
     "show_build_summary",
     "show_changed_files",
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Dependency Cache
+================
+
+Shares installed dependencies between spec worktrees.
+
+A new worktree has no node_modules or virtualenv, so QA and test commands
+reinstall everything per spec. With WORKTREE_SHARE_DEPENDENCIES=true,
+installed dependencies are kept in a per-project cache keyed by a hash of
+the lockfiles they were installed from, and copied into each worktree whose
+lockfiles match.
+
+Every copy is private: a worktree that installs, patches or rebuilds a
+package only changes its own tree, never the cache, another worktree or the
+main project. Files are cloned copy-on-write where the filesystem supports
+it (btrfs and XFS on Linux), so copies share disk blocks until written;
+elsewhere they are plain copies. Absolute symlinks into the copied tree are
+re-pointed at the copy. A copied virtualenv is relocated: its scripts, and
+editable installs (.pth files, __editable__ finders, egg-links) that point
+into the main project, are rewritten to point into the worktree.
+
+The cache is seeded from the main project's installed dependencies when its
+lockfiles hash the same. Cache entries are built in a temporary directory
+and renamed into place, so concurrent specs never see a partial entry.
+
+Usage:
+    from core.workspace.dependency_cache import share_dependencies
+
+    for result in share_dependencies(project_dir, worktree_path):
+        print(result.dependency_path, result.status)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+# Import debug utilities
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.dependency_cache"
+
+# Cache location, inside the worktrees directory of the main project
+DEPENDENCY_CACHE_DIR = Path(".worktrees") / ".deps"
+
+# Set to "true" to copy cached dependencies into new worktrees
+SHARE_DEPENDENCIES_ENV_VAR = "WORKTREE_SHARE_DEPENDENCIES"
+
+# ecosystem -> (lockfiles, installed dependency directory)
+ECOSYSTEMS = {
+    "node": (
+        ["package-lock.json", "pnpm-lock.yaml", "yarn.lock"],
+        "node_modules",
+    ),
+    "python": (
+        ["poetry.lock", "uv.lock", "Pipfile.lock", "requirements.txt"],
+        ".venv",
+    ),
+}
+
+# ioctl request that clones a file's extents (Linux FICLONE)
+_FICLONE = 0x40049409
+
+# Virtualenv files that hold absolute paths to the environment or to
+# editable installs' source (relative to the environment)
+_VENV_PATH_FILES = (
+    "bin/*",
+    "Scripts/*",
+    "lib/python*/site-packages/*.pth",
+    "lib/python*/site-packages/__editable__*.py",
+    "lib/python*/site-packages/*.egg-link",
+    "lib/python*/site-packages/*.dist-info/direct_url.json",
+    "Lib/site-packages/*.pth",
+    "Lib/site-packages/__editable__*.py",
+    "Lib/site-packages/*.egg-link",
+    "Lib/site-packages/*.dist-info/direct_url.json",
+)
+
+
+@dataclass
+class DependencySet:
+    """Dependencies of one directory, installed from its lockfiles."""
+
+    ecosystem: str
+    directory: str  # Repo-relative, "" for the root
+    lockfiles: list[str] = field(default_factory=list)
+    key: str = ""
+
+    @property
+    def dependency_path(self) -> str:
+        dependency_dir = ECOSYSTEMS[self.ecosystem][1]
+        return (
+            f"{self.directory}/{dependency_dir}" if self.directory else dependency_dir
+        )
+
+
+@dataclass
+class DependencyShareResult:
+    """What happened to one dependency set of a worktree."""
+
+    ecosystem: str
+    dependency_path: str
+    key: str
+    # "copied", "exists", "not_ignored" or "unavailable"
+    status: str
+    cache_created: bool = False
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def is_dependency_sharing_enabled() -> bool:
+    """Check whether worktrees should share cached dependencies."""
+    return os.getenv(SHARE_DEPENDENCIES_ENV_VAR, "false").lower() == "true"
+
+
+def _hash_lockfiles(directory: Path, lockfiles: list[str]) -> str | None:
+    """Hash lockfile contents (None if one of them is missing)."""
+    digest = hashlib.sha256()
+    for name in lockfiles:
+        try:
+            content = (directory / name).read_bytes()
+        except OSError:
+            return None
+        digest.update(name.encode() + b"\0" + content + b"\0")
+    return digest.hexdigest()[:16]
+
+
+def find_dependency_sets(worktree_path: Path) -> list[DependencySet]:
+    """
+    Find the directories of a worktree that have lockfiles.
+
+    Lockfiles must be tracked by git and checked out (so directories outside
+    a sparse checkout are skipped).
+
+    Args:
+        worktree_path: Path to the worktree
+
+    Returns:
+        One DependencySet per (ecosystem, directory), with its cache key
+    """
+    names = {name for lockfiles, _ in ECOSYSTEMS.values() for name in lockfiles}
+    result = subprocess.run(
+        ["git", "ls-files", "-z", "--", *names, *(f"**/{name}" for name in names)],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    if result.returncode != 0:
+        return []
+
+    found: dict[tuple[str, str], list[str]] = {}
+    for path in sorted(filter(None, result.stdout.split("\0"))):
+        if "node_modules/" in path or not (worktree_path / path).is_file():
+            continue
+        directory, _, name = path.rpartition("/")
+        for ecosystem, (lockfiles, _) in ECOSYSTEMS.items():
+            if name in lockfiles:
+                found.setdefault((ecosystem, directory), []).append(name)
+
+    dependency_sets = []
+    for (ecosystem, directory), lockfiles in found.items():
+        key = _hash_lockfiles(worktree_path / directory, lockfiles)
+        if key:
+            dependency_sets.append(
+                DependencySet(ecosystem, directory, sorted(lockfiles), key)
+            )
+    return dependency_sets
+
+
+def _clone_file(source: str, destination: str) -> str:
+    """Copy a file, sharing its blocks copy-on-write where the filesystem can."""
+    if sys.platform == "linux":
+        import fcntl
+
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(source, destination)
+            return destination
+        except OSError:
+            pass  # Not supported here (or across filesystems): plain copy
+    return shutil.copy2(source, destination)
+
+
+def _copy_tree(source: Path, destination: Path, final: Path) -> None:
+    """
+    Make a private copy of a directory tree.
+
+    Relative symlinks are copied as they are; absolute ones that point into
+    the source tree are re-pointed at the same place in the copy, so nothing
+    in the copy resolves back into the source.
+
+    Args:
+        source: Tree to copy
+        destination: Where to copy it (a staging path)
+        final: Where the copy will be once it's moved into place
+    """
+    source_root = str(source.resolve())
+
+    def copy_link(link: str, target_path: Path) -> None:
+        target = os.readlink(link)
+        if os.path.isabs(target) and (
+            target == source_root or target.startswith(source_root + os.sep)
+        ):
+            target = str(final / os.path.relpath(target, source_root))
+        os.symlink(target, target_path)
+
+    destination.mkdir(parents=True)
+    for root, dirs, files in os.walk(source):
+        target_root = destination / os.path.relpath(root, source)
+        for name in list(dirs):
+            source_path = os.path.join(root, name)
+            if os.path.islink(source_path):
+                # os.walk doesn't follow directory symlinks - copy the link
+                copy_link(source_path, target_root / name)
+                dirs.remove(name)
+            else:
+                (target_root / name).mkdir()
+        for name in files:
+            source_path = os.path.join(root, name)
+            if os.path.islink(source_path):
+                copy_link(source_path, target_root / name)
+            else:
+                _clone_file(source_path, str(target_root / name))
+
+
+def _relocate_venv(venv: Path, old_root: Path, new_root: Path) -> None:
+    """
+    Point a copied virtualenv at its new location.
+
+    Rewrites paths under old_root (the directory the environment was
+    installed in) to new_root in its scripts (shebangs, activate) and in
+    editable installs, whose source is in that directory too. The files are
+    replaced rather than edited in place, so a clone's shared blocks aren't
+    written through.
+    """
+    old_path = re.escape(str(old_root.resolve()).encode())
+    old = re.compile(old_path + rb"(?=[/\\\s'\"]|$)")
+    new = str(new_root.resolve()).encode()
+    for pattern in _VENV_PATH_FILES:
+        for path in venv.glob(pattern):
+            if path.is_symlink() or not path.is_file():
+                continue
+            content = path.read_bytes()
+            if b"\0" in content[:1024]:
+                continue
+            relocated = old.sub(lambda _: new, content)
+            if relocated == content:
+                continue
+            replacement = path.with_name(f".{path.name}.relocated")
+            replacement.write_bytes(relocated)
+            shutil.copymode(path, replacement)
+            os.replace(replacement, path)
+
+
+def _publish(build: Path, final: Path) -> bool:
+    """
+    Atomically move a finished build into place.
+
+    Returns:
+        False if another process published it first (the build is discarded)
+    """
+    try:
+        os.rename(build, final)
+        return True
+    except OSError:
+        if final.exists() or final.is_symlink():
+            shutil.rmtree(build, ignore_errors=True)
+            if build.is_symlink():
+                build.unlink()
+            return False
+        raise
+
+
+def _ensure_cache_entry(
+    project_dir: Path, cache_dir: Path, dependency_set: DependencySet
+) -> tuple[Path | None, bool]:
+    """
+    Get the cache entry for a dependency set, seeding it from the main project.
+
+    Returns:
+        Tuple of (installed dependencies in the cache or None, whether the
+        entry was created by this call)
+    """
+    dependency_dir = ECOSYSTEMS[dependency_set.ecosystem][1]
+    entry = cache_dir / f"{dependency_set.ecosystem}-{dependency_set.key}"
+    installed = entry / dependency_dir
+    if installed.is_dir():
+        return installed, False
+
+    source_dir = project_dir / dependency_set.directory
+    source = source_dir / dependency_dir
+    if not source.is_dir() or source.is_symlink():
+        return None, False
+    if _hash_lockfiles(source_dir, dependency_set.lockfiles) != dependency_set.key:
+        # The main project has different dependencies installed
+        return None, False
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    build = cache_dir / f".build-{uuid.uuid4().hex[:8]}"
+    try:
+        # A copy, not links: nothing may write through to the main project
+        _copy_tree(source, build / dependency_dir, installed)
+        # Keep where it was installed from, to relocate worktree copies
+        (build / "source").write_text(str(source_dir.resolve()))
+    except OSError as e:
+        debug_warning(MODULE, "Could not seed dependency cache", error=str(e))
+        shutil.rmtree(build, ignore_errors=True)
+        return None, False
+
+    created = _publish(build, entry)
+    debug(MODULE, "Seeded dependency cache", entry=entry.name, created=created)
+    return installed, created
+
+
+def _is_ignored(worktree_path: Path, dependency_set: DependencySet) -> bool:
+    """Check that git ignores the dependencies once they are materialized."""
+    # A directory - also matched by directory-only patterns ("node_modules/")
+    path = dependency_set.dependency_path + "/"
+    result = subprocess.run(
+        ["git", "check-ignore", "-q", "--no-index", path],
+        cwd=worktree_path,
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
+def _materialize(
+    worktree_path: Path, dependency_set: DependencySet, installed: Path
+) -> str:
+    """Copy cached dependencies into a worktree; returns the status."""
+    target = worktree_path / dependency_set.dependency_path
+    staging = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}")
+
+    try:
+        _copy_tree(installed, staging, target)
+        if dependency_set.ecosystem == "python":
+            source_file = installed.parent / "source"
+            if source_file.is_file():
+                _relocate_venv(
+                    staging,
+                    Path(source_file.read_text()),
+                    worktree_path / dependency_set.directory,
+                )
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    if not _publish(staging, target):
+        return "exists"
+    return "copied"
+
+
+def share_dependencies(
+    project_dir: Path, worktree_path: Path
+) -> list[DependencyShareResult]:
+    """
+    Copy cached dependencies into a worktree.
+
+    Safe to run concurrently for different specs, and again on an existing
+    worktree (directories that already have dependencies are left alone).
+
+    Args:
+        project_dir: Main project directory (owner of the cache)
+        worktree_path: The spec's worktree
+
+    Returns:
+        One result per dependency set found in the worktree
+    """
+    cache_dir = project_dir / DEPENDENCY_CACHE_DIR
+    results = []
+
+    for dependency_set in find_dependency_sets(worktree_path):
+        result = DependencyShareResult(
+            ecosystem=dependency_set.ecosystem,
+            dependency_path=dependency_set.dependency_path,
+            key=dependency_set.key,
+            status="unavailable",
+        )
+        results.append(result)
+
+        target = worktree_path / dependency_set.dependency_path
+        if target.exists() or target.is_symlink():
+            result.status = "exists"
+            continue
+        # Never create something git would pick up and commit
+        if not _is_ignored(worktree_path, dependency_set):
+            result.status = "not_ignored"
+            continue
+
+        installed, result.cache_created = _ensure_cache_entry(
+            project_dir, cache_dir, dependency_set
+        )
+        if installed is None:
+            continue
+        try:
+            result.status = _materialize(worktree_path, dependency_set, installed)
+        except OSError as e:
+            debug_warning(
+                MODULE,
+                "Could not share dependencies",
+                path=dependency_set.dependency_path,
+                error=str(e),
+            )
+
+    debug(MODULE, "Shared dependencies", results=[r.to_dict() for r in results])
+    return results
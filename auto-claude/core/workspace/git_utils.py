@@ -6,10 +6,13 @@ Git Utilities
 Utility functions for git operations used in workspace management.
 """
 
-import json
 import subprocess
 from pathlib import Path
 
+from merge.git_object_reader import get_object_reader
+
+from .syntax_validator import get_syntax_validator
+
 # Constants for merge limits
 MAX_FILE_LINES_FOR_AI = 5000  # Skip AI for files larger than this
 MAX_PARALLEL_AI_MERGES = 5  # Limit concurrent AI merge operations
@@ -127,15 +130,7 @@ def get_file_content_from_ref(
     project_dir: Path, ref: str, file_path: str
 ) -> str | None:
     """Get file content from a git ref (branch, commit, etc.)."""
-    result = subprocess.run(
-        ["git", "show", f"{ref}:{file_path}"],
-        cwd=project_dir,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode == 0:
-        return result.stdout
-    return None
+    return get_object_reader(project_dir).read_file(ref, file_path)
 
 
 def get_changed_files_from_branch(
@@ -228,111 +223,29 @@ def validate_merged_syntax(
     - Is much faster than tsc (no npm setup overhead)
     - Has accurate JSX/TSX parsing (matches Vite's behavior)
     - Works in isolation without tsconfig.json
+
+    Python and JSON are checked in-process. Results are cached by content
+    hash; use validate_merged_files() to check many files in one esbuild run.
     """
-    import tempfile
-    from pathlib import Path as P
+    return get_syntax_validator(project_dir).validate(file_path, content)
 
-    ext = P(file_path).suffix.lower()
 
-    # TypeScript/JavaScript validation using esbuild
-    if ext in {".ts", ".tsx", ".js", ".jsx"}:
-        try:
-            # Write to temp file in system temp dir (NOT project dir to avoid HMR triggers)
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=ext,
-                delete=False,
-                # Don't set dir= to avoid writing to project directory which triggers HMR
-            ) as tmp:
-                tmp.write(content)
-                tmp_path = tmp.name
-
-            try:
-                # Find esbuild binary - try multiple locations
-                esbuild_cmd = None
-
-                # Try to find esbuild in node_modules (works with pnpm, npm, yarn)
-                for search_dir in [project_dir, project_dir.parent]:
-                    # pnpm stores it differently
-                    pnpm_esbuild = search_dir / "node_modules" / ".pnpm"
-                    if pnpm_esbuild.exists():
-                        for esbuild_dir in pnpm_esbuild.glob(
-                            "esbuild@*/node_modules/esbuild/bin/esbuild"
-                        ):
-                            if esbuild_dir.exists():
-                                esbuild_cmd = str(esbuild_dir)
-                                break
-                    # Standard npm/yarn location
-                    npm_esbuild = search_dir / "node_modules" / ".bin" / "esbuild"
-                    if npm_esbuild.exists():
-                        esbuild_cmd = str(npm_esbuild)
-                        break
-                    if esbuild_cmd:
-                        break
-
-                # Fall back to npx if not found
-                if not esbuild_cmd:
-                    esbuild_cmd = "npx"
-                    args = ["npx", "esbuild", tmp_path, "--log-level=error"]
-                else:
-                    args = [esbuild_cmd, tmp_path, "--log-level=error"]
-
-                # Use esbuild for fast, accurate syntax validation
-                # esbuild infers loader from extension (.tsx, .ts, etc.)
-                # --log-level=error only shows errors
-                result = subprocess.run(
-                    args,
-                    cwd=project_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=15,  # esbuild is fast, 15s is plenty
-                )
-
-                if result.returncode != 0:
-                    # Filter out npm warnings and extract actual errors
-                    error_output = result.stderr.strip()
-                    error_lines = [
-                        line
-                        for line in error_output.split("\n")
-                        if line
-                        and not line.startswith("npm warn")
-                        and not line.startswith("npm WARN")
-                    ]
-                    if error_lines:
-                        # Extract just the error message, not full path
-                        error_msg = "\n".join(error_lines[:3])
-                        return False, f"Syntax error: {error_msg}"
-
-                return True, ""
-
-            finally:
-                P(tmp_path).unlink(missing_ok=True)
-
-        except subprocess.TimeoutExpired:
-            return True, ""  # Timeout = assume ok
-        except FileNotFoundError:
-            return True, ""  # No esbuild = skip validation
-        except Exception as e:
-            return True, ""  # Other errors = skip validation
-
-    # Python validation
-    elif ext == ".py":
-        try:
-            compile(content, file_path, "exec")
-            return True, ""
-        except SyntaxError as e:
-            return False, f"Python syntax error: {e.msg} at line {e.lineno}"
+def validate_merged_files(
+    files: dict[str, str], project_dir: Path
+) -> dict[str, tuple[bool, str]]:
+    """
+    Validate the syntax of many merged files at once.
 
-    # JSON validation
-    elif ext == ".json":
-        try:
-            json.loads(content)
-            return True, ""
-        except json.JSONDecodeError as e:
-            return False, f"JSON error: {e.msg} at line {e.lineno}"
+    All TypeScript/JavaScript files are checked by a single esbuild run.
+
+    Args:
+        files: Dict mapping file path to merged content
+        project_dir: Project root directory
 
-    # Other file types - skip validation
-    return True, ""
+    Returns:
+        Dict mapping each file path to (is_valid, error_message)
+    """
+    return get_syntax_validator(project_dir).validate_many(files)
 
 
 def create_conflict_file_with_git(
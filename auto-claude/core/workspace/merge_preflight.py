@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Merge Preflight
+===============
+
+Batched, non-destructive check of which spec branches would conflict when
+merged into the base branch.
+
+Checking one spec at a time costs 5-7 git subprocesses (current branch,
+merge base, rev-parse of both sides, merge-tree, and a diff fallback). The
+UI shows conflict badges for every spec, so that cost is paid once per
+spec on every refresh. This module instead:
+
+- Resolves the current branch, the base and every spec branch with a
+  single ``git for-each-ref``
+- Runs one ``git merge-tree --write-tree --name-only`` and one
+  ``git rev-list --left-right --count`` per branch, concurrently
+- Caches results by (base SHA, branch SHA), so branches that haven't moved
+  since the last check cost no subprocesses at all
+
+Usage:
+    from core.workspace.merge_preflight import preflight_merges
+
+    results = preflight_merges(project_dir)
+    for spec_name, result in results.items():
+        print(spec_name, result.has_conflicts, result.conflicting_files)
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .git_utils import _is_auto_claude_file
+
+# Import debug utilities
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.merge_preflight"
+
+# Prefix of the branches WorktreeManager creates for specs
+SPEC_BRANCH_PREFIX = "auto-claude/"
+
+# Upper bound on concurrent merge-tree processes
+MAX_PREFLIGHT_WORKERS = min(8, os.cpu_count() or 4)
+
+# Number of (base SHA, branch SHA) results kept in memory
+PREFLIGHT_CACHE_SIZE = 512
+
+
+@dataclass
+class MergePreflightResult:
+    """Outcome of merging one spec branch into the base branch in memory."""
+
+    spec_name: str
+    spec_branch: str
+    base_branch: str
+    base_sha: str | None = None
+    branch_sha: str | None = None
+    has_conflicts: bool = False
+    conflicting_files: list[str] = field(default_factory=list)
+    commits_behind: int = 0  # Base commits the spec branch doesn't have
+    commits_ahead: int = 0  # Spec commits not yet in the base
+    cached: bool = False
+    error: str | None = None
+
+    @property
+    def needs_rebase(self) -> bool:
+        return self.commits_behind > 0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["needs_rebase"] = self.needs_rebase
+        return data
+
+
+# (base_sha, branch_sha) -> (has_conflicts, conflicting_files, behind, ahead)
+_cache: OrderedDict[tuple[str, str], tuple[bool, tuple[str, ...], int, int]] = (
+    OrderedDict()
+)
+_cache_lock = threading.Lock()
+
+
+def clear_preflight_cache() -> None:
+    """Drop all cached preflight results."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _cache_get(key: tuple[str, str]):
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+        return entry
+
+
+def _cache_put(key: tuple[str, str], entry) -> None:
+    with _cache_lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > PREFLIGHT_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def _run_git(project_dir: Path, args: list[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _resolve_refs(
+    project_dir: Path, base_branch: str | None
+) -> tuple[str, str | None, dict[str, str]]:
+    """
+    Resolve the base branch and every spec branch with one for-each-ref.
+
+    Returns:
+        Tuple of (base branch name, base SHA or None, {spec_name: branch SHA})
+    """
+    result = _run_git(
+        project_dir,
+        ["for-each-ref", "--format=%(HEAD) %(objectname) %(refname)", "refs/heads/"],
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or "git for-each-ref failed")
+
+    current_branch = None
+    heads: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        # "<* or space> <sha> <refname>"
+        marker = line[:1]
+        sha, _, refname = line[2:].partition(" ")
+        name = refname.removeprefix("refs/heads/")
+        heads[name] = sha
+        if marker == "*":
+            current_branch = name
+
+    base_branch = base_branch or current_branch or "HEAD"
+    base_sha = heads.get(base_branch)
+    if base_sha is None:
+        # Detached HEAD, a remote-tracking ref, or a tag
+        rev = _run_git(project_dir, ["rev-parse", "--verify", "--quiet", base_branch])
+        base_sha = rev.stdout.strip() if rev.returncode == 0 else None
+
+    spec_shas = {
+        name.removeprefix(SPEC_BRANCH_PREFIX): sha
+        for name, sha in heads.items()
+        if name.startswith(SPEC_BRANCH_PREFIX)
+    }
+    return base_branch, base_sha, spec_shas
+
+
+def _merge_tree(project_dir: Path, base_sha: str, branch_sha: str):
+    """
+    Merge two commits in memory and count how far apart they are.
+
+    Returns:
+        Tuple of (has_conflicts, conflicting_files, commits_behind, commits_ahead)
+    """
+    merge = _run_git(
+        project_dir,
+        [
+            "merge-tree",
+            "--write-tree",
+            "--name-only",
+            "--no-messages",
+            "-z",
+            base_sha,
+            branch_sha,
+        ],
+    )
+    # Exit code 1 means conflicts; anything else non-zero is a failure
+    if merge.returncode not in (0, 1):
+        raise RuntimeError(merge.stderr.strip() or "git merge-tree failed")
+
+    has_conflicts = merge.returncode == 1
+    files: list[str] = []
+    if has_conflicts:
+        # Output: <tree OID>\0<path>\0<path>\0...
+        for path in merge.stdout.split("\0")[1:]:
+            if path and path not in files and not _is_auto_claude_file(path):
+                files.append(path)
+
+    counts = _run_git(
+        project_dir,
+        ["rev-list", "--left-right", "--count", f"{base_sha}...{branch_sha}"],
+    )
+    behind = ahead = 0
+    if counts.returncode == 0:
+        left, _, right = counts.stdout.strip().partition("\t")
+        behind, ahead = int(left or 0), int(right or 0)
+
+    return has_conflicts, tuple(files), behind, ahead
+
+
+def _check_branch(
+    project_dir: Path, result: MergePreflightResult
+) -> MergePreflightResult:
+    key = (result.base_sha, result.branch_sha)
+    entry = _cache_get(key)
+    if entry is not None:
+        result.cached = True
+    else:
+        try:
+            entry = _merge_tree(project_dir, result.base_sha, result.branch_sha)
+        except Exception as e:
+            debug_warning(
+                MODULE, "Preflight failed", spec=result.spec_name, error=str(e)
+            )
+            result.error = str(e)
+            return result
+        _cache_put(key, entry)
+
+    has_conflicts, files, behind, ahead = entry
+    result.has_conflicts = has_conflicts
+    result.conflicting_files = list(files)
+    result.commits_behind = behind
+    result.commits_ahead = ahead
+    return result
+
+
+def preflight_merges(
+    project_dir: Path,
+    spec_names: list[str] | None = None,
+    base_branch: str | None = None,
+    max_workers: int = MAX_PREFLIGHT_WORKERS,
+) -> dict[str, MergePreflightResult]:
+    """
+    Check many spec branches for merge conflicts without touching the working tree.
+
+    Args:
+        project_dir: Project root directory
+        spec_names: Specs to check (default: every auto-claude/* branch)
+        base_branch: Branch to merge into (default: the current branch)
+        max_workers: Maximum concurrent git merge-tree processes
+
+    Returns:
+        Dict mapping spec name to its MergePreflightResult, in input order.
+        Specs whose branch is missing get a result with ``error`` set.
+    """
+    project_dir = Path(project_dir)
+    base_branch, base_sha, spec_shas = _resolve_refs(project_dir, base_branch)
+    if spec_names is None:
+        spec_names = sorted(spec_shas)
+
+    results: dict[str, MergePreflightResult] = {}
+    pending: list[MergePreflightResult] = []
+    for spec_name in spec_names:
+        result = MergePreflightResult(
+            spec_name=spec_name,
+            spec_branch=f"{SPEC_BRANCH_PREFIX}{spec_name}",
+            base_branch=base_branch,
+            base_sha=base_sha,
+            branch_sha=spec_shas.get(spec_name),
+        )
+        results[spec_name] = result
+        if base_sha is None:
+            result.error = f"Base branch '{base_branch}' not found"
+        elif result.branch_sha is None:
+            result.error = f"Branch '{result.spec_branch}' not found"
+        else:
+            pending.append(result)
+
+    if len(pending) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            list(pool.map(lambda r: _check_branch(project_dir, r), pending))
+    else:
+        for result in pending:
+            _check_branch(project_dir, result)
+
+    debug(
+        MODULE,
+        f"Preflight checked {len(results)} spec(s)",
+        cached=sum(1 for r in pending if r.cached),
+        conflicting=sum(1 for r in results.values() if r.has_conflicts),
+    )
+    return results
+
+
+def preflight_merge(
+    project_dir: Path, spec_name: str, base_branch: str | None = None
+) -> MergePreflightResult:
+    """
+    Check a single spec branch for merge conflicts.
+
+    Args:
+        project_dir: Project root directory
+        spec_name: Name of the spec
+        base_branch: Branch to merge into (default: the current branch)
+
+    Returns:
+        MergePreflightResult for the spec
+    """
+    return preflight_merges(project_dir, [spec_name], base_branch=base_branch)[
+        spec_name
+    ]
@@ -23,10 +23,12 @@ from ui import (
     select_menu,
     success,
 )
-from worktree import WorktreeManager
+from worktree import WorktreeInfo, WorktreeManager
 
+from .dependency_cache import is_dependency_sharing_enabled, share_dependencies
 from .git_utils import has_uncommitted_changes
 from .models import WorkspaceMode
+from .sparse_checkout import compute_sparse_cone
 
 # Import debug utilities
 try:
@@ -220,8 +222,19 @@ def setup_workspace(
     manager = WorktreeManager(project_dir, base_branch=base_branch)
     manager.setup()
 
+    # In sparse mode, only check out the directories this spec works in
+    sparse_cone = None
+    if manager.sparse and source_spec_dir and source_spec_dir.exists():
+        sparse_cone = compute_sparse_cone(project_dir, source_spec_dir)
+        if sparse_cone is None:
+            print_status(
+                "Could not scope a sparse checkout, using the full tree", "info"
+            )
+
     # Get or create worktree for THIS SPECIFIC SPEC
-    worktree_info = manager.get_or_create_worktree(spec_name)
+    worktree_info = manager.get_or_create_worktree(spec_name, sparse_cone=sparse_cone)
+    if manager.sparse and worktree_info.creation_seconds is not None:
+        report_worktree_size(manager, worktree_info)
 
     # Copy spec files to worktree if provided
     localized_spec_dir = None
@@ -231,6 +244,16 @@ def setup_workspace(
         )
         print_status("Spec files copied to workspace", "success")
 
+    # Reuse installed dependencies instead of reinstalling them per spec
+    if is_dependency_sharing_enabled():
+        shared = [
+            result.dependency_path
+            for result in share_dependencies(project_dir, worktree_info.path)
+            if result.status == "copied"
+        ]
+        if shared:
+            print_status(f"Copied cached dependencies: {', '.join(shared)}", "success")
+
     print_status(f"Workspace ready: {worktree_info.path.name}", "success")
     print()
 
@@ -245,6 +268,27 @@ def setup_workspace(
     return worktree_info.path, manager, localized_spec_dir
 
 
+def report_worktree_size(manager: WorktreeManager, worktree_info: WorktreeInfo) -> None:
+    """Print the disk use and creation time of a newly created worktree."""
+    size_mb = manager.get_disk_usage(worktree_info.spec_name) / (1024 * 1024)
+    if worktree_info.sparse_cone is not None:
+        scope = f"{len(worktree_info.sparse_cone)} directories"
+    else:
+        scope = "full tree"
+    print_status(
+        f"Checked out {scope}: {size_mb:.1f} MB in {worktree_info.creation_seconds:.1f}s",
+        "info",
+    )
+    debug(
+        MODULE,
+        "Worktree created",
+        spec=worktree_info.spec_name,
+        sparse_cone=worktree_info.sparse_cone,
+        disk_mb=round(size_mb, 2),
+        creation_seconds=round(worktree_info.creation_seconds, 3),
+    )
+
+
 def ensure_timeline_hook_installed(project_dir: Path) -> None:
     """
     Ensure the FileTimelineTracker git post-commit hook is installed.
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Sparse Checkout Scoping
+=======================
+
+Works out which directories a spec's sparse worktree should check out.
+
+In a monorepo a spec usually touches one or two services, so instead of a
+full checkout the worktree gets a cone-mode sparse-checkout seeded from:
+
+- The spec's services (requirements.json, context.json and the
+  implementation plan), mapped to directories through project_index.json
+- The directories of the plan's files_to_modify / files_to_create and the
+  context's files_to_modify
+
+Anything the agent later touches outside the cone is added on demand by the
+sparse checkout hook (see core.worktree.create_sparse_checkout_hook).
+
+Usage:
+    from core.workspace.sparse_checkout import compute_sparse_cone
+
+    cone = compute_sparse_cone(project_dir, spec_dir)
+    manager.get_or_create_worktree(spec_name, sparse_cone=cone)
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+# Import debug utilities
+try:
+    from debug import debug
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.sparse_checkout"
+
+
+def _load_json(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_project_index(project_dir: Path, spec_dir: Path) -> dict:
+    """Load project_index.json from the spec, falling back to the project."""
+    for candidate in (
+        spec_dir / "project_index.json",
+        project_dir / ".auto-claude" / "project_index.json",
+    ):
+        index = _load_json(candidate)
+        if index:
+            return index
+    return {}
+
+
+def _service_directory(project_dir: Path, name: str, info: dict) -> str | None:
+    """
+    Map a project index service to a repo-relative directory.
+
+    Returns:
+        The directory ("" for the project root), or None if it can't be mapped
+    """
+    path = Path(info.get("path") or name)
+    if path.is_absolute():
+        try:
+            path = path.resolve().relative_to(project_dir.resolve())
+        except ValueError:
+            # Index generated in another checkout - fall back to the name
+            path = Path(name)
+    relative = path.as_posix()
+    if relative == ".":
+        return ""
+    if (project_dir / relative).is_dir():
+        return relative
+    return None
+
+
+def _file_paths(entries: list) -> list[str]:
+    """Paths from a files_to_modify list (strings or {"path": ...} dicts)."""
+    paths = []
+    for entry in entries or []:
+        if isinstance(entry, dict):
+            entry = entry.get("path", "")
+        if isinstance(entry, str) and entry:
+            paths.append(entry)
+    return paths
+
+
+def compute_sparse_cone(project_dir: Path, spec_dir: Path) -> list[str] | None:
+    """
+    Work out the sparse-checkout cone for a spec.
+
+    Args:
+        project_dir: Main project directory
+        spec_dir: The spec's directory (with requirements.json,
+            context.json and implementation_plan.json, where they exist)
+
+    Returns:
+        Sorted repo-relative directories, or None if the spec needs the whole
+        tree (a service at the project root, all services, or nothing to seed
+        the cone from)
+    """
+    project_dir = Path(project_dir)
+    spec_dir = Path(spec_dir)
+    index = _load_project_index(project_dir, spec_dir)
+    requirements = _load_json(spec_dir / "requirements.json")
+    context = _load_json(spec_dir / "context.json")
+    plan = _load_json(spec_dir / "implementation_plan.json")
+
+    services: set[str] = set(requirements.get("services_involved") or [])
+    services.update(context.get("scoped_services") or [])
+    services.update(plan.get("services_involved") or [])
+    files = _file_paths(context.get("files_to_modify"))
+
+    for phase in plan.get("phases") or []:
+        for subtask in phase.get("subtasks") or []:
+            if subtask.get("all_services"):
+                debug(MODULE, "Subtask spans all services, using full checkout")
+                return None
+            if subtask.get("service"):
+                services.add(subtask["service"])
+            files.extend(_file_paths(subtask.get("files_to_modify")))
+            files.extend(_file_paths(subtask.get("files_to_create")))
+
+    directories: set[str] = set()
+    index_services = index.get("services") or {}
+    for name in services:
+        info = index_services.get(name)
+        if not isinstance(info, dict):
+            continue
+        directory = _service_directory(project_dir, name, info)
+        if directory == "":
+            debug(MODULE, "Service at project root, using full checkout", service=name)
+            return None
+        if directory:
+            directories.add(directory)
+
+    for file_path in files:
+        path = Path(file_path)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(project_dir)
+            except ValueError:
+                continue
+        parent = path.parent.as_posix()
+        if parent != "." and not parent.startswith(".."):
+            directories.add(parent)
+
+    if not directories:
+        return None
+
+    # Drop directories already inside another one
+    cone = [
+        d
+        for d in sorted(directories)
+        if not any(d.startswith(other + "/") for other in directories)
+    ]
+    debug(MODULE, "Computed sparse cone", services=sorted(services), cone=cone)
+    return cone
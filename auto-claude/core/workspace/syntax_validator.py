@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Syntax Validator
+================
+
+Batched syntax checking for merged files.
+
+Checking merged files one at a time meant, per file: a temp file, a glob
+through ``node_modules/.pnpm`` to find esbuild, and a fresh esbuild (or
+npx) process. SyntaxValidator instead:
+
+- Locates esbuild once per project and remembers it
+- Checks every TypeScript/JavaScript file of a batch in one esbuild run
+- Checks Python and JSON in-process
+- Caches results by content hash, so re-validating an unchanged merge
+  result (e.g. after a retry of a different file) is free
+
+Usage:
+    from core.workspace.syntax_validator import get_syntax_validator
+
+    validator = get_syntax_validator(project_dir)
+    results = validator.validate_many({"src/App.tsx": merged, "api.py": merged_py})
+    for path, (is_valid, error) in results.items():
+        ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Import debug utilities
+try:
+    from debug import debug, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+MODULE = "workspace.syntax_validator"
+
+# Extensions checked with esbuild (loader is inferred from the extension)
+ESBUILD_EXTENSIONS = {".ts", ".tsx", ".js", ".jsx"}
+
+# Timeout for one esbuild run over a whole batch
+ESBUILD_TIMEOUT = 30
+
+# Number of content hashes whose results are kept
+VALIDATION_CACHE_SIZE = 2048
+
+# "✘ [ERROR] message" (or "X [ERROR]" on terminals without Unicode)
+_ERROR_HEADER = re.compile(r"^\S+ \[ERROR\] (.+)$")
+# "    3.tsx:12:4:" - location line following an error header
+_ERROR_LOCATION = re.compile(r"^\s+(\S+?):(\d+):(\d+):$")
+
+ValidationResult = tuple[bool, str]
+
+
+@dataclass
+class SyntaxValidatorStats:
+    """Counters for how much work validation actually did."""
+
+    files_checked: int = 0
+    cache_hits: int = 0
+    esbuild_runs: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def find_esbuild(project_dir: Path) -> str | None:
+    """
+    Locate an esbuild binary for a project.
+
+    Looks in node_modules/.bin and the pnpm store of the project and its
+    parent, then on PATH.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Path to esbuild, or None if it isn't installed
+    """
+    for search_dir in [project_dir, project_dir.parent]:
+        # Standard npm/yarn location
+        npm_esbuild = search_dir / "node_modules" / ".bin" / "esbuild"
+        if npm_esbuild.exists():
+            return str(npm_esbuild)
+        # pnpm stores it differently
+        pnpm_store = search_dir / "node_modules" / ".pnpm"
+        if pnpm_store.exists():
+            for candidate in pnpm_store.glob(
+                "esbuild@*/node_modules/esbuild/bin/esbuild"
+            ):
+                if candidate.exists():
+                    return str(candidate)
+    return shutil.which("esbuild")
+
+
+def _content_key(file_path: str, content: str) -> str:
+    suffix = Path(file_path).suffix.lower()
+    return hashlib.sha256(f"{suffix}\0{content}".encode()).hexdigest()
+
+
+def _validate_python(file_path: str, content: str) -> ValidationResult:
+    try:
+        compile(content, file_path, "exec")
+        return True, ""
+    except SyntaxError as e:
+        return False, f"Python syntax error: {e.msg} at line {e.lineno}"
+
+
+def _validate_json(content: str) -> ValidationResult:
+    try:
+        json.loads(content)
+        return True, ""
+    except json.JSONDecodeError as e:
+        return False, f"JSON error: {e.msg} at line {e.lineno}"
+
+
+def parse_esbuild_errors(output: str) -> dict[str, list[str]]:
+    """
+    Group esbuild's error log by file.
+
+    Args:
+        output: esbuild stderr (run with --log-level=error --color=false)
+
+    Returns:
+        Dict mapping the file name esbuild reported to "message at line N" strings
+    """
+    errors: dict[str, list[str]] = {}
+    message = None
+    for line in output.splitlines():
+        header = _ERROR_HEADER.match(line)
+        if header:
+            message = header.group(1).strip()
+            continue
+        location = _ERROR_LOCATION.match(line)
+        if location and message is not None:
+            errors.setdefault(location.group(1), []).append(
+                f"{message} at line {location.group(2)}"
+            )
+            message = None
+    return errors
+
+
+class SyntaxValidator:
+    """
+    Validates merged file contents for one project.
+
+    Thread-safe: parallel merges can share one instance.
+    """
+
+    def __init__(self, project_dir: Path, esbuild_path: str | None = None):
+        """
+        Initialize the validator.
+
+        Args:
+            project_dir: Project root directory (used to find esbuild)
+            esbuild_path: esbuild binary to use (default: located on first use)
+        """
+        self.project_dir = Path(project_dir)
+        self.stats = SyntaxValidatorStats()
+        self._esbuild_path = esbuild_path
+        self._esbuild_resolved = esbuild_path is not None
+        self._cache: OrderedDict[str, ValidationResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def esbuild_path(self) -> str | None:
+        """The esbuild binary, located once and then reused."""
+        with self._lock:
+            if not self._esbuild_resolved:
+                self._esbuild_path = find_esbuild(self.project_dir)
+                self._esbuild_resolved = True
+                debug(MODULE, "Resolved esbuild", path=self._esbuild_path)
+            return self._esbuild_path
+
+    def validate(self, file_path: str, content: str) -> ValidationResult:
+        """
+        Validate one file.
+
+        Args:
+            file_path: Path of the file (its extension selects the checker)
+            content: Merged file content
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        return self.validate_many({file_path: content})[file_path]
+
+    def validate_many(self, files: dict[str, str]) -> dict[str, ValidationResult]:
+        """
+        Validate a batch of files, running esbuild at most once.
+
+        Args:
+            files: Dict mapping file path to merged content
+
+        Returns:
+            Dict mapping each file path to (is_valid, error_message).
+            Files of unsupported types, and TS/JS files when esbuild is
+            unavailable or fails to run, are reported as valid.
+        """
+        results: dict[str, ValidationResult] = {}
+        pending_js: dict[str, tuple[str, str]] = {}
+
+        for file_path, content in files.items():
+            key = _content_key(file_path, content)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[file_path] = cached
+                continue
+
+            ext = Path(file_path).suffix.lower()
+            if ext in ESBUILD_EXTENSIONS:
+                pending_js[file_path] = (key, content)
+                continue
+            if ext == ".py":
+                result = _validate_python(file_path, content)
+            elif ext == ".json":
+                result = _validate_json(content)
+            else:
+                # Other file types - skip validation
+                results[file_path] = (True, "")
+                continue
+            self._cache_put(key, result)
+            results[file_path] = result
+
+        if pending_js:
+            js_results = self._validate_with_esbuild(
+                {path: content for path, (_, content) in pending_js.items()}
+            )
+            for file_path, (key, _) in pending_js.items():
+                result = js_results.get(file_path)
+                if result is None:
+                    # esbuild didn't run - skip validation, don't cache
+                    results[file_path] = (True, "")
+                    continue
+                self._cache_put(key, result)
+                results[file_path] = result
+
+        with self._lock:
+            self.stats.files_checked += len(files)
+        return {file_path: results[file_path] for file_path in files}
+
+    def clear_cache(self) -> None:
+        """Forget all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    def _cache_get(self, key: str) -> ValidationResult | None:
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.stats.cache_hits += 1
+            return result
+
+    def _cache_put(self, key: str, result: ValidationResult) -> None:
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > VALIDATION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _validate_with_esbuild(
+        self, files: dict[str, str]
+    ) -> dict[str, ValidationResult]:
+        """
+        Check TS/JS files with a single esbuild run.
+
+        Returns:
+            Results per file, or an empty dict if esbuild couldn't be run
+        """
+        esbuild = self.esbuild_path
+        if not esbuild:
+            return {}
+
+        # Temp dir in system temp (NOT project dir, to avoid HMR triggers).
+        # Files are numbered so paths with the same name don't collide.
+        with tempfile.TemporaryDirectory(prefix="auto-claude-syntax-") as tmp:
+            tmp_dir = Path(tmp)
+            names: dict[str, str] = {}
+            for i, (file_path, content) in enumerate(files.items()):
+                name = f"{i}{Path(file_path).suffix.lower()}"
+                (tmp_dir / name).write_text(content, encoding="utf-8")
+                names[name] = file_path
+
+            try:
+                # esbuild infers the loader from the extension (.tsx, .ts, etc.)
+                result = subprocess.run(
+                    [
+                        esbuild,
+                        *names,
+                        f"--outdir={tmp_dir / 'out'}",
+                        "--log-level=error",
+                        "--log-limit=0",
+                        "--color=false",
+                    ],
+                    cwd=tmp_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=ESBUILD_TIMEOUT,
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                debug_warning(MODULE, "esbuild failed to run", error=str(e))
+                return {}
+
+        with self._lock:
+            self.stats.esbuild_runs += 1
+
+        results = dict.fromkeys(files, (True, ""))
+        if result.returncode == 0:
+            return results
+
+        errors = parse_esbuild_errors(result.stderr)
+        if not errors:
+            # Not a syntax error (bad install, unsupported flag) - skip validation
+            debug_warning(
+                MODULE, "esbuild failed without file errors", stderr=result.stderr[:500]
+            )
+            return {}
+        for name, messages in errors.items():
+            file_path = names.get(Path(name).name)
+            if file_path is not None:
+                results[file_path] = (
+                    False,
+                    "Syntax error: " + "\n".join(messages[:3]),
+                )
+        return results
+
+
+_validators: dict[Path, SyntaxValidator] = {}
+_validators_lock = threading.Lock()
+
+
+def get_syntax_validator(project_dir: Path) -> SyntaxValidator:
+    """
+    Get the shared validator for a project.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        SyntaxValidator reused across calls for the same project
+    """
+    key = Path(project_dir).resolve()
+    with _validators_lock:
+        validator = _validators.get(key)
+        if validator is None:
+            validator = SyntaxValidator(key)
+            _validators[key] = validator
+        return validator
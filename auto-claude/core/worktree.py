@@ -19,8 +19,216 @@ import os
 import re
 import shutil
 import subprocess
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+# Warm pool of detached worktrees at the base branch tip, kept in
+# .worktrees/.pool/ so a spec can claim one instead of checking out the
+# whole tree. Disabled unless a pool size is configured.
+POOL_DIR_NAME = ".pool"
+POOL_SIZE_ENV_VAR = "WORKTREE_POOL_SIZE"
+
+# Pool worktrees still being created after this long were abandoned
+# (e.g. the process exited mid-checkout) and are cleaned up
+STALE_POOL_FILL_SECONDS = 600
+
+# Upper bound on concurrent git processes when listing worktree stats
+MAX_STATUS_WORKERS = min(8, os.cpu_count() or 4)
+
+# Diff stats depend only on the base and branch commits, so they are
+# cached per (base SHA, branch SHA) until either side moves
+STATS_CACHE_SIZE = 256
+_stats_cache: OrderedDict[tuple[str, str], dict] = OrderedDict()
+_stats_cache_lock = threading.Lock()
+
+# Sparse mode: spec worktrees only check out a cone-mode sparse-checkout of
+# the directories the spec works in (see create_worktree). Opt-in.
+SPARSE_ENV_VAR = "WORKTREE_SPARSE"
+
+# Tool input fields naming a file, and a directory, that the agent touches.
+# A sparse worktree's cone is expanded to cover them before the tool runs.
+SPARSE_FILE_TOOL_INPUTS = {
+    "Read": "file_path",
+    "Write": "file_path",
+    "Edit": "file_path",
+    "MultiEdit": "file_path",
+    "NotebookEdit": "notebook_path",
+}
+SPARSE_DIR_TOOL_INPUTS = {"Glob": "path", "Grep": "path"}
+
+# Untracked directories that never need to be in a cone
+_SPARSE_IGNORED_DIRS = {".git", ".auto-claude"}
+
+
+def clear_worktree_stats_cache() -> None:
+    """Forget all cached worktree diff stats."""
+    with _stats_cache_lock:
+        _stats_cache.clear()
+
+
+def read_sparse_cone(worktree_path: Path) -> list[str] | None:
+    """
+    Get the directories in a worktree's cone-mode sparse-checkout.
+
+    Args:
+        worktree_path: Path to the worktree
+
+    Returns:
+        Repo-relative directories (empty = top-level files only),
+        or None if the worktree is a full checkout
+    """
+    result = subprocess.run(
+        ["git", "sparse-checkout", "list"],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    if result.returncode != 0:
+        return None
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+def sparse_cone_covers(cone: list[str], path: str, is_dir: bool = False) -> bool:
+    """
+    Check whether a repo-relative path is checked out by a cone.
+
+    Cone mode always includes top-level files, and the files directly inside
+    every parent of a cone directory.
+
+    Args:
+        cone: Directories in the cone
+        path: Repo-relative file or directory path
+        is_dir: Whether path is a directory (all of it must be covered)
+    """
+    path = path.strip("/")
+    if is_dir:
+        directory = path
+        if not directory:
+            return False
+    else:
+        directory = path.rpartition("/")[0]
+        if not directory:
+            return True
+
+    for entry in cone:
+        if directory == entry or directory.startswith(entry + "/"):
+            return True
+        if not is_dir and entry.startswith(directory + "/"):
+            return True
+    return False
+
+
+def expand_sparse_checkout(
+    worktree_path: Path, directories: list[str], cone: list[str] | None = None
+) -> list[str]:
+    """
+    Add directories to a sparse worktree's cone.
+
+    Args:
+        worktree_path: Path to the worktree
+        directories: Repo-relative directories to check out
+        cone: Current cone, if already known (updated in place)
+
+    Returns:
+        The directories that were added (empty if all were already covered
+        or the worktree is a full checkout)
+    """
+    if cone is None:
+        cone = read_sparse_cone(worktree_path)
+        if cone is None:
+            return []
+
+    missing = []
+    for directory in directories:
+        directory = directory.strip("/")
+        if directory and not sparse_cone_covers(cone + missing, directory, True):
+            missing.append(directory)
+    if not missing:
+        return []
+
+    result = subprocess.run(
+        ["git", "sparse-checkout", "add", *missing],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    if result.returncode != 0:
+        raise WorktreeError(f"Failed to expand sparse checkout: {result.stderr}")
+
+    cone.extend(missing)
+    return missing
+
+
+def create_sparse_checkout_hook(worktree_path: Path):
+    """
+    Create a PreToolUse hook that keeps a sparse worktree's cone in step
+    with the files the agent works on.
+
+    Before a file tool (Read, Write, Edit, ...) touches a path outside the
+    cone, its directory is added to the cone, so existing files appear and
+    new files can be committed. Glob/Grep add the directory they search.
+
+    Args:
+        worktree_path: Path to the sparse worktree (the agent's working directory)
+
+    Returns:
+        Async hook function for ClaudeAgentOptions hooks
+    """
+    root = Path(worktree_path).resolve()
+    cone = read_sparse_cone(root) or []
+    lock = threading.Lock()
+
+    async def sparse_checkout_hook(
+        input_data: dict[str, Any],
+        tool_use_id: str | None = None,
+        context: Any | None = None,
+    ) -> dict[str, Any]:
+        tool_name = input_data.get("tool_name", "")
+        tool_input = input_data.get("tool_input", {}) or {}
+
+        if tool_name in SPARSE_FILE_TOOL_INPUTS:
+            raw_path, is_dir = tool_input.get(SPARSE_FILE_TOOL_INPUTS[tool_name]), False
+        elif tool_name in SPARSE_DIR_TOOL_INPUTS:
+            raw_path, is_dir = tool_input.get(SPARSE_DIR_TOOL_INPUTS[tool_name]), True
+        else:
+            return {}
+        if not raw_path:
+            return {}
+
+        target = Path(raw_path)
+        if not target.is_absolute():
+            target = root / target
+        try:
+            relative = target.resolve().relative_to(root).as_posix()
+        except ValueError:
+            return {}  # Outside the worktree
+        if relative == "." or relative.split("/")[0] in _SPARSE_IGNORED_DIRS:
+            return {}
+
+        with lock:
+            if sparse_cone_covers(cone, relative, is_dir):
+                return {}
+            directory = relative if is_dir else relative.rpartition("/")[0]
+            try:
+                added = expand_sparse_checkout(root, [directory], cone)
+            except WorktreeError as e:
+                print(f"Warning: {e}")
+                return {}
+        if added:
+            print(f"Expanded sparse checkout: {', '.join(added)}")
+        return {}
+
+    return sparse_checkout_hook
 
 
 class WorktreeError(Exception):
@@ -42,6 +250,8 @@ class WorktreeInfo:
     files_changed: int = 0
     additions: int = 0
     deletions: int = 0
+    sparse_cone: list[str] | None = None
+    creation_seconds: float | None = None
 
 
 class WorktreeManager:
@@ -50,13 +260,49 @@ class WorktreeManager:
 
     Each spec gets its own worktree in .worktrees/{spec-name}/ with
     a corresponding branch auto-claude/{spec-name}.
+
+    With a pool size set (argument or WORKTREE_POOL_SIZE), up to that many
+    detached worktrees are kept ready in .worktrees/.pool/. create_worktree
+    claims one and switches it to the spec branch, remove_worktree cleans
+    the worktree and returns it to the pool, and the pool is topped up in a
+    background thread.
+
+    With sparse mode on (argument or WORKTREE_SPARSE=true), callers can pass
+    create_worktree a cone of directories; only those are checked out.
+    Sparse worktrees bypass the pool.
     """
 
-    def __init__(self, project_dir: Path, base_branch: str | None = None):
+    def __init__(
+        self,
+        project_dir: Path,
+        base_branch: str | None = None,
+        pool_size: int | None = None,
+        sparse: bool | None = None,
+    ):
         self.project_dir = project_dir
         self.base_branch = base_branch or self._detect_base_branch()
         self.worktrees_dir = project_dir / ".worktrees"
+        self.pool_dir = self.worktrees_dir / POOL_DIR_NAME
+        self.pool_size = (
+            pool_size if pool_size is not None else self._pool_size_from_env()
+        )
+        self.sparse = (
+            sparse
+            if sparse is not None
+            else os.getenv(SPARSE_ENV_VAR, "").lower() == "true"
+        )
         self._merge_lock = asyncio.Lock()
+        self._pool_lock = threading.Lock()
+        self._refill_thread: threading.Thread | None = None
+
+    @staticmethod
+    def _pool_size_from_env() -> int:
+        """Read the worktree pool size from the environment (0 = disabled)."""
+        try:
+            return max(0, int(os.getenv(POOL_SIZE_ENV_VAR, "0")))
+        except ValueError:
+            print(f"Warning: {POOL_SIZE_ENV_VAR} must be an integer, pool disabled")
+            return 0
 
     def _detect_base_branch(self) -> str:
         """
@@ -256,26 +502,52 @@ class WorktreeManager:
         """Get diff statistics for a worktree."""
         worktree_path = self.get_worktree_path(spec_name)
 
-        stats = {
+        if not worktree_path.exists():
+            return self._empty_stats()
+
+        result = self._run_git(
+            ["rev-parse", self.base_branch, "HEAD"], cwd=worktree_path
+        )
+        commits = result.stdout.split()
+        if result.returncode != 0 or len(commits) != 2:
+            return self._empty_stats()
+
+        return self._get_commit_stats(commits[0], commits[1])
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {
             "commit_count": 0,
             "files_changed": 0,
             "additions": 0,
             "deletions": 0,
         }
 
-        if not worktree_path.exists():
-            return stats
+    def _get_commit_stats(self, base_commit: str, branch_commit: str) -> dict:
+        """
+        Get diff statistics of a branch commit against the base commit.
+
+        Results are cached by the commit pair.
+        """
+        key = (base_commit, branch_commit)
+        with _stats_cache_lock:
+            cached = _stats_cache.get(key)
+            if cached is not None:
+                _stats_cache.move_to_end(key)
+                return dict(cached)
+
+        stats = self._empty_stats()
 
         # Commit count
         result = self._run_git(
-            ["rev-list", "--count", f"{self.base_branch}..HEAD"], cwd=worktree_path
+            ["rev-list", "--count", f"{base_commit}..{branch_commit}"]
         )
         if result.returncode == 0:
             stats["commit_count"] = int(result.stdout.strip() or "0")
 
         # Diff stats
         result = self._run_git(
-            ["diff", "--shortstat", f"{self.base_branch}...HEAD"], cwd=worktree_path
+            ["diff", "--shortstat", f"{base_commit}...{branch_commit}"]
         )
         if result.returncode == 0 and result.stdout.strip():
             # Parse: "3 files changed, 50 insertions(+), 10 deletions(-)"
@@ -289,14 +561,23 @@ class WorktreeManager:
             if match:
                 stats["deletions"] = int(match.group(1))
 
-        return stats
+        with _stats_cache_lock:
+            _stats_cache[key] = stats
+            while len(_stats_cache) > STATS_CACHE_SIZE:
+                _stats_cache.popitem(last=False)
+        return dict(stats)
 
-    def create_worktree(self, spec_name: str) -> WorktreeInfo:
+    def create_worktree(
+        self, spec_name: str, sparse_cone: list[str] | None = None
+    ) -> WorktreeInfo:
         """
         Create a worktree for a spec.
 
         Args:
             spec_name: The spec folder name (e.g., "002-implement-memory")
+            sparse_cone: Repo-relative directories for a cone-mode sparse
+                checkout (top-level files are always included). None creates
+                a full checkout.
 
         Returns:
             WorktreeInfo for the created worktree
@@ -304,6 +585,7 @@ class WorktreeManager:
         Raises:
             WorktreeError: If a branch namespace conflict exists or worktree creation fails
         """
+        started = time.monotonic()
         worktree_path = self.get_worktree_path(spec_name)
         branch_name = self.get_branch_name(spec_name)
 
@@ -327,6 +609,39 @@ class WorktreeManager:
         # Delete branch if it exists (from previous attempt)
         self._run_git(["branch", "-D", branch_name])
 
+        if sparse_cone is not None:
+            sparse_cone = sorted({d.strip("/") for d in sparse_cone if d.strip("/")})
+            self._create_sparse_worktree(worktree_path, branch_name, sparse_cone)
+            print(
+                f"Created worktree: {worktree_path.name} on branch {branch_name} "
+                f"(sparse, {len(sparse_cone)} directories)"
+            )
+            return WorktreeInfo(
+                path=worktree_path,
+                branch=branch_name,
+                spec_name=spec_name,
+                base_branch=self.base_branch,
+                is_active=True,
+                sparse_cone=sparse_cone,
+                creation_seconds=time.monotonic() - started,
+            )
+
+        if self.pool_size > 0 and self._claim_pooled_worktree(
+            worktree_path, branch_name
+        ):
+            print(
+                f"Created worktree: {worktree_path.name} on branch {branch_name} (from pool)"
+            )
+            self.refill_pool_async()
+            return WorktreeInfo(
+                path=worktree_path,
+                branch=branch_name,
+                spec_name=spec_name,
+                base_branch=self.base_branch,
+                is_active=True,
+                creation_seconds=time.monotonic() - started,
+            )
+
         # Create worktree with new branch from base
         result = self._run_git(
             ["worktree", "add", "-b", branch_name, str(worktree_path), self.base_branch]
@@ -338,6 +653,10 @@ class WorktreeManager:
             )
 
         print(f"Created worktree: {worktree_path.name} on branch {branch_name}")
+        creation_seconds = time.monotonic() - started
+
+        if self.pool_size > 0:
+            self.refill_pool_async()
 
         return WorktreeInfo(
             path=worktree_path,
@@ -345,14 +664,97 @@ class WorktreeManager:
             spec_name=spec_name,
             base_branch=self.base_branch,
             is_active=True,
+            creation_seconds=creation_seconds,
         )
 
-    def get_or_create_worktree(self, spec_name: str) -> WorktreeInfo:
+    def _create_sparse_worktree(
+        self, worktree_path: Path, branch_name: str, cone: list[str]
+    ) -> None:
+        """
+        Create a worktree that only checks out the given cone.
+
+        The worktree is added without a checkout, the cone is set, and only
+        then are the files in it read into the index and working tree.
+        """
+        result = self._run_git(
+            [
+                "worktree",
+                "add",
+                "--no-checkout",
+                "-b",
+                branch_name,
+                str(worktree_path),
+                self.base_branch,
+            ]
+        )
+        if result.returncode != 0:
+            raise WorktreeError(
+                f"Failed to create worktree for {worktree_path.name}: {result.stderr}"
+            )
+
+        for args in (
+            ["sparse-checkout", "set", "--cone", *cone],
+            ["read-tree", "-mu", "HEAD"],
+        ):
+            result = self._run_git(args, cwd=worktree_path)
+            if result.returncode != 0:
+                self._run_git(["worktree", "remove", "--force", str(worktree_path)])
+                self._run_git(["branch", "-D", branch_name])
+                raise WorktreeError(
+                    f"Failed to set up sparse checkout for {worktree_path.name}: "
+                    f"{result.stderr}"
+                )
+
+    def get_sparse_cone(self, spec_name: str) -> list[str] | None:
+        """
+        Get the sparse-checkout cone of a spec's worktree.
+
+        Returns:
+            Checked-out directories, or None for a full checkout (or no worktree)
+        """
+        worktree_path = self.get_worktree_path(spec_name)
+        if not worktree_path.exists():
+            return None
+        return read_sparse_cone(worktree_path)
+
+    def expand_sparse_cone(self, spec_name: str, directories: list[str]) -> list[str]:
+        """
+        Add directories to a sparse worktree's cone.
+
+        Args:
+            spec_name: The spec folder name
+            directories: Repo-relative directories to check out
+
+        Returns:
+            The directories that were added
+        """
+        return expand_sparse_checkout(self.get_worktree_path(spec_name), directories)
+
+    def get_disk_usage(self, spec_name: str) -> int:
+        """
+        Get the size in bytes of the files checked out in a spec's worktree.
+
+        Git metadata (shared with the main repository) is not counted.
+        """
+        total = 0
+        for root, dirs, files in os.walk(self.get_worktree_path(spec_name)):
+            dirs[:] = [d for d in dirs if d != ".git"]
+            for name in files:
+                path = os.path.join(root, name)
+                if name != ".git" and not os.path.islink(path):
+                    total += os.path.getsize(path)
+        return total
+
+    def get_or_create_worktree(
+        self, spec_name: str, sparse_cone: list[str] | None = None
+    ) -> WorktreeInfo:
         """
         Get existing worktree or create a new one for a spec.
 
         Args:
             spec_name: The spec folder name
+            sparse_cone: Directories to check out if a sparse worktree is
+                created (see create_worktree)
 
         Returns:
             WorktreeInfo for the worktree
@@ -362,7 +764,7 @@ class WorktreeManager:
             print(f"Using existing worktree: {existing.path}")
             return existing
 
-        return self.create_worktree(spec_name)
+        return self.create_worktree(spec_name, sparse_cone=sparse_cone)
 
     def remove_worktree(self, spec_name: str, delete_branch: bool = False) -> None:
         """
@@ -372,18 +774,25 @@ class WorktreeManager:
             spec_name: The spec folder name
             delete_branch: Whether to also delete the branch
         """
+        from merge.git_object_reader import close_reader
+
         worktree_path = self.get_worktree_path(spec_name)
         branch_name = self.get_branch_name(spec_name)
 
         if worktree_path.exists():
-            result = self._run_git(
-                ["worktree", "remove", "--force", str(worktree_path)]
-            )
-            if result.returncode == 0:
-                print(f"Removed worktree: {worktree_path.name}")
+            # Its cat-file processes would outlive the directory
+            close_reader(worktree_path)
+            if self.pool_size > 0 and self._recycle_worktree(worktree_path):
+                print(f"Recycled worktree: {worktree_path.name}")
             else:
-                print(f"Warning: Could not remove worktree: {result.stderr}")
-                shutil.rmtree(worktree_path, ignore_errors=True)
+                result = self._run_git(
+                    ["worktree", "remove", "--force", str(worktree_path)]
+                )
+                if result.returncode == 0:
+                    print(f"Removed worktree: {worktree_path.name}")
+                else:
+                    print(f"Warning: Could not remove worktree: {result.stderr}")
+                    shutil.rmtree(worktree_path, ignore_errors=True)
 
         if delete_branch:
             self._run_git(["branch", "-D", branch_name])
@@ -391,6 +800,162 @@ class WorktreeManager:
 
         self._run_git(["worktree", "prune"])
 
+    # ==================== Warm Worktree Pool ====================
+
+    def _pooled_worktrees(self) -> list[Path]:
+        """Pool worktrees that are ready to be claimed."""
+        if not self.pool_dir.exists():
+            return []
+        return sorted(
+            item
+            for item in self.pool_dir.iterdir()
+            if item.is_dir() and item.name.startswith("slot-")
+        )
+
+    def _resolve_base_commit(self) -> str | None:
+        result = self._run_git(["rev-parse", "--verify", self.base_branch])
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def _claim_pooled_worktree(self, worktree_path: Path, branch_name: str) -> bool:
+        """
+        Move a pooled worktree to worktree_path and put it on a new branch.
+
+        Moving is atomic, so processes sharing the pool can't claim the same
+        worktree. A worktree left at an older base tip is hard-reset first,
+        which only rewrites the files that changed since.
+
+        Returns:
+            True if a pooled worktree was claimed
+        """
+        base_commit = self._resolve_base_commit()
+        if base_commit is None:
+            return False
+
+        for slot in self._pooled_worktrees():
+            result = self._run_git(["worktree", "move", str(slot), str(worktree_path)])
+            if result.returncode != 0:
+                continue  # Claimed by someone else, or broken
+
+            head = self._run_git(["rev-parse", "HEAD"], cwd=worktree_path)
+            if head.stdout.strip() != base_commit:
+                self._run_git(["reset", "--hard", "-q", base_commit], cwd=worktree_path)
+            result = self._run_git(
+                ["switch", "-q", "-c", branch_name], cwd=worktree_path
+            )
+            if result.returncode == 0:
+                return True
+
+            print(f"Warning: Could not use pooled worktree: {result.stderr}")
+            self._run_git(["worktree", "remove", "--force", str(worktree_path)])
+            return False
+
+        return False
+
+    def _recycle_worktree(self, worktree_path: Path) -> bool:
+        """
+        Clean a spec worktree and return it to the pool.
+
+        Returns:
+            False if the pool is full or the worktree couldn't be reset,
+            in which case the caller removes it as usual
+        """
+        if len(self._pooled_worktrees()) >= self.pool_size:
+            return False
+        if read_sparse_cone(worktree_path) is not None:
+            # Pooled worktrees are full checkouts
+            return False
+        base_commit = self._resolve_base_commit()
+        if base_commit is None:
+            return False
+
+        for args in (
+            ["checkout", "-q", "-f", "--detach", base_commit],
+            ["clean", "-ffdxq"],
+        ):
+            if self._run_git(args, cwd=worktree_path).returncode != 0:
+                return False
+
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        slot = self.pool_dir / f"slot-{uuid.uuid4().hex[:12]}"
+        result = self._run_git(["worktree", "move", str(worktree_path), str(slot)])
+        return result.returncode == 0
+
+    def _add_pooled_worktree(self, base_commit: str) -> bool:
+        """Check out one detached worktree at base_commit into the pool."""
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        slot_id = uuid.uuid4().hex[:12]
+        # Checked out under a hidden name, then moved, so it can't be
+        # claimed half-populated
+        filling = self.pool_dir / f".filling-{slot_id}"
+        result = self._run_git(
+            ["worktree", "add", "-q", "--detach", str(filling), base_commit]
+        )
+        if result.returncode != 0:
+            print(f"Warning: Could not add pooled worktree: {result.stderr}")
+            return False
+        result = self._run_git(
+            ["worktree", "move", str(filling), str(self.pool_dir / f"slot-{slot_id}")]
+        )
+        return result.returncode == 0
+
+    def fill_pool(self) -> int:
+        """
+        Add detached worktrees at the base branch tip until the pool is full.
+
+        Returns:
+            Number of worktrees added
+        """
+        if self.pool_size <= 0:
+            return 0
+        with self._pool_lock:
+            self._remove_stale_pool_fills()
+            base_commit = self._resolve_base_commit()
+            if base_commit is None:
+                return 0
+            added = 0
+            while len(self._pooled_worktrees()) < self.pool_size:
+                if not self._add_pooled_worktree(base_commit):
+                    break
+                added += 1
+            return added
+
+    def refill_pool_async(self) -> None:
+        """Top up the pool in a background thread (no-op if one is running)."""
+        if self.pool_size <= 0:
+            return
+        if self._refill_thread is not None and self._refill_thread.is_alive():
+            return
+        self._refill_thread = threading.Thread(
+            target=self.fill_pool, name="worktree-pool-refill", daemon=True
+        )
+        self._refill_thread.start()
+
+    def wait_for_pool(self, timeout: float | None = None) -> None:
+        """Wait for a background refill to finish."""
+        if self._refill_thread is not None:
+            self._refill_thread.join(timeout)
+
+    def drain_pool(self) -> None:
+        """Remove every pooled worktree."""
+        self.wait_for_pool()
+        if not self.pool_dir.exists():
+            return
+        for item in self.pool_dir.iterdir():
+            if item.is_dir():
+                self._run_git(["worktree", "remove", "--force", str(item)])
+        shutil.rmtree(self.pool_dir, ignore_errors=True)
+        self._run_git(["worktree", "prune"])
+
+    def _remove_stale_pool_fills(self) -> None:
+        """Remove pool worktrees whose creation was abandoned."""
+        if not self.pool_dir.exists():
+            return
+        cutoff = time.time() - STALE_POOL_FILL_SECONDS
+        for item in self.pool_dir.iterdir():
+            if item.name.startswith(".filling-") and item.stat().st_mtime < cutoff:
+                self._run_git(["worktree", "remove", "--force", str(item)])
+                shutil.rmtree(item, ignore_errors=True)
+
     def merge_worktree(
         self, spec_name: str, delete_after: bool = False, no_commit: bool = False
     ) -> bool:
@@ -475,20 +1040,96 @@ class WorktreeManager:
     # ==================== Listing & Discovery ====================
 
     def list_all_worktrees(self) -> list[WorktreeInfo]:
-        """List all spec worktrees."""
+        """
+        List all spec worktrees.
+
+        Branch tips and the worktree each branch is checked out in come from
+        a single for-each-ref. Stats for the worktrees are then computed
+        concurrently (cached per base/branch commit pair).
+        """
         worktrees = []
 
         if not self.worktrees_dir.exists():
             return worktrees
 
-        for item in self.worktrees_dir.iterdir():
-            if item.is_dir():
+        # Skip the worktree pool and other hidden directories
+        spec_dirs = [
+            item
+            for item in self.worktrees_dir.iterdir()
+            if item.is_dir() and not item.name.startswith(".")
+        ]
+        if not spec_dirs:
+            return worktrees
+
+        base_commit, checked_out = self._get_branch_tips()
+
+        pending: list[tuple[Path, str, str]] = []
+        for item in spec_dirs:
+            tip = checked_out.get(item.resolve()) if base_commit else None
+            if tip is None:
+                # Detached HEAD or unregistered directory - check it directly
                 info = self.get_worktree_info(item.name)
                 if info:
                     worktrees.append(info)
+                continue
+            branch, commit = tip
+            pending.append((item, branch, commit))
+
+        def build_info(entry: tuple[Path, str, str]) -> WorktreeInfo:
+            path, branch, commit = entry
+            return WorktreeInfo(
+                path=path,
+                branch=branch,
+                spec_name=path.name,
+                base_branch=self.base_branch,
+                is_active=True,
+                **self._get_commit_stats(base_commit, commit),
+            )
+
+        if len(pending) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_STATUS_WORKERS, len(pending))
+            ) as pool:
+                worktrees.extend(pool.map(build_info, pending))
+        else:
+            worktrees.extend(build_info(entry) for entry in pending)
 
         return worktrees
 
+    def _get_branch_tips(self) -> tuple[str | None, dict[Path, tuple[str, str]]]:
+        """
+        Resolve the base commit and every checked-out branch with one for-each-ref.
+
+        Returns:
+            Tuple of (base commit or None, {worktree path: (branch, commit)})
+        """
+        result = self._run_git(
+            [
+                "for-each-ref",
+                "--format=%(objectname)%00%(refname:short)%00%(worktreepath)",
+                "refs/heads/",
+            ]
+        )
+        if result.returncode != 0:
+            return None, {}
+
+        base_commit = None
+        checked_out: dict[Path, tuple[str, str]] = {}
+        for line in result.stdout.splitlines():
+            parts = line.split("\0")
+            if len(parts) != 3:
+                continue
+            commit, branch, worktree_path = parts
+            if branch == self.base_branch:
+                base_commit = commit
+            if worktree_path:
+                checked_out[Path(worktree_path).resolve()] = (branch, commit)
+
+        if base_commit is None:
+            # Base is not a local branch (e.g. a remote-tracking ref)
+            base_commit = self._resolve_base_commit()
+        return base_commit, checked_out
+
     def list_all_spec_branches(self) -> list[str]:
         """List all auto-claude branches (even if worktree removed)."""
         result = self._run_git(["branch", "--list", "auto-claude/*"])
@@ -538,9 +1179,14 @@ class WorktreeManager:
         }
 
     def cleanup_all(self) -> None:
-        """Remove all worktrees and their branches."""
-        for worktree in self.list_all_worktrees():
-            self.remove_worktree(worktree.spec_name, delete_branch=True)
+        """Remove all worktrees, their branches, and the worktree pool."""
+        pool_size, self.pool_size = self.pool_size, 0  # Don't recycle
+        try:
+            for worktree in self.list_all_worktrees():
+                self.remove_worktree(worktree.spec_name, delete_branch=True)
+        finally:
+            self.pool_size = pool_size
+        self.drain_pool()
 
     def cleanup_stale_worktrees(self) -> None:
         """Remove worktrees that aren't registered with git."""
@@ -554,8 +1200,11 @@ class WorktreeManager:
             if line.startswith("worktree "):
                 registered_paths.add(Path(line.split(" ", 1)[1]))
 
-        # Remove unregistered directories
+        # Remove unregistered directories (the pool and other hidden
+        # directories, like the dependency cache, are handled separately)
         for item in self.worktrees_dir.iterdir():
+            if item.name.startswith("."):
+                continue
             if item.is_dir() and item not in registered_paths:
                 print(f"Removing stale worktree directory: {item.name}")
                 shutil.rmtree(item, ignore_errors=True)
@@ -17,6 +17,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from client import create_client
+from core.rate_limiter import Priority
 from phase_config import get_thinking_budget
 from ui import print_status
 
@@ -96,6 +97,7 @@ class IdeationGenerator:
             self.output_dir,
             self.model,
             max_thinking_tokens=self.thinking_budget,
+            priority=Priority.IDEATION,
         )
 
         try:
@@ -189,6 +191,7 @@ Write the fixed JSON to the file now.
             self.output_dir,
             self.model,
             max_thinking_tokens=self.thinking_budget,
+            priority=Priority.IDEATION,
         )
 
         try:
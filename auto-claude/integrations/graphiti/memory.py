@@ -37,6 +37,7 @@ from graphiti import (
     MAX_CONTEXT_RESULTS,
     GraphitiMemory,
     GroupIdMode,
+    shared_client,
 )
 
 # Import config utilities
@@ -174,6 +175,7 @@ __all__ = [
     "GraphitiMemory",
     "GroupIdMode",
     "get_graphiti_memory",
+    "shared_client",
     "is_graphiti_enabled",
     "test_graphiti_connection",
     "test_provider_configuration",
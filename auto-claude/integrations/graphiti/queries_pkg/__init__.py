@@ -12,6 +12,7 @@ Public API exports maintain backward compatibility with the original
 graphiti_memory.py module.
 """
 
+from .client import shared_client
 from .graphiti import GraphitiMemory
 from .schema import (
     EPISODE_TYPE_CODEBASE_DISCOVERY,
@@ -29,6 +30,7 @@ from .schema import (
 __all__ = [
     "GraphitiMemory",
     "GroupIdMode",
+    "shared_client",
     "MAX_CONTEXT_RESULTS",
     "EPISODE_TYPE_SESSION_INSIGHT",
     "EPISODE_TYPE_CODEBASE_DISCOVERY",
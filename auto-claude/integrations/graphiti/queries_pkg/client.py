@@ -5,12 +5,17 @@ Handles database connection, initialization, and lifecycle management.
 """
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 from graphiti_config import GraphitiConfig, GraphitiState
 
 logger = logging.getLogger(__name__)
 
+# Client every GraphitiMemory uses while set (see shared_client)
+_shared_client: "GraphitiClient | None" = None
+
 
 class GraphitiClient:
     """
@@ -156,3 +161,33 @@ class GraphitiClient:
                 self._llm_client = None
                 self._embedder = None
                 self._initialized = False
+
+
+def get_shared_client() -> GraphitiClient | None:
+    """The client set by shared_client(), if any."""
+    return _shared_client
+
+
+@asynccontextmanager
+async def shared_client(
+    config: GraphitiConfig | None = None,
+) -> AsyncIterator[GraphitiClient]:
+    """
+    Use one client for every GraphitiMemory inside the block.
+
+    Concurrent builds (run.py --specs) otherwise open a database connection
+    and provider clients for every query and memory save. The client is
+    initialized by the first GraphitiMemory that needs it and closed when
+    the block ends.
+
+    Args:
+        config: Graphiti configuration (default: from the environment)
+    """
+    global _shared_client
+    client = GraphitiClient(config or GraphitiConfig.from_env())
+    previous, _shared_client = _shared_client, client
+    try:
+        yield client
+    finally:
+        _shared_client = previous
+        await client.close()
@@ -15,7 +15,7 @@ from pathlib import Path
 
 from graphiti_config import GraphitiConfig, GraphitiState
 
-from .client import GraphitiClient
+from .client import GraphitiClient, get_shared_client
 from .queries import GraphitiQueries
 from .schema import MAX_CONTEXT_RESULTS, GroupIdMode
 from .search import GraphitiSearch
@@ -64,6 +64,8 @@ class GraphitiMemory:
 
         # Component modules
         self._client: GraphitiClient | None = None
+        # False when the client is shared (see client.shared_client)
+        self._owns_client = True
         self._queries: GraphitiQueries | None = None
         self._search: GraphitiSearch | None = None
 
@@ -134,8 +136,10 @@ class GraphitiMemory:
             return False
 
         try:
-            # Create client
-            self._client = GraphitiClient(self.config)
+            # Create client, unless one is shared
+            shared = get_shared_client()
+            self._owns_client = shared is None
+            self._client = shared or GraphitiClient(self.config)
 
             # Initialize client with state tracking
             if not await self._client.initialize(self.state):
@@ -182,9 +186,12 @@ class GraphitiMemory:
     async def close(self) -> None:
         """
         Close the Graphiti client and clean up connections.
+
+        A shared client is left open for the other users.
         """
         if self._client:
-            await self._client.close()
+            if self._owns_client:
+                await self._client.close()
             self._client = None
             self._queries = None
             self._search = None
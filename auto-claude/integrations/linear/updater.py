@@ -28,6 +28,7 @@ from pathlib import Path
 from typing import Optional
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+from core.rate_limiter import Priority, RateLimitedClient, rate_limited
 
 # Linear status constants (matching Valma AI team setup)
 STATUS_TODO = "Todo"
@@ -108,7 +109,7 @@ def get_linear_api_key() -> str:
     return os.environ.get("LINEAR_API_KEY", "")
 
 
-def _create_linear_client() -> ClaudeSDKClient:
+def _create_linear_client() -> RateLimitedClient:
     """
     Create a minimal Claude client with only Linear MCP tools.
     Used for focused mini-agent calls.
@@ -135,21 +136,25 @@ def _create_linear_client() -> ClaudeSDKClient:
         or "haiku"
     )
 
-    return ClaudeSDKClient(
-        options=ClaudeAgentOptions(
-            model=model,
-            system_prompt="You are a Linear API assistant. Execute the requested Linear operation precisely.",
-            allowed_tools=LINEAR_TOOLS,
-            mcp_servers={
-                "linear": {
-                    "type": "http",
-                    "url": "https://mcp.linear.app/mcp",
-                    "headers": {"Authorization": f"Bearer {linear_api_key}"},
-                }
-            },
-            max_turns=10,  # Should complete in 1-3 turns
-            env=sdk_env,  # Pass ANTHROPIC_BASE_URL etc. to subprocess
-        )
+    return rate_limited(
+        ClaudeSDKClient(
+            options=ClaudeAgentOptions(
+                model=model,
+                system_prompt="You are a Linear API assistant. Execute the requested Linear operation precisely.",
+                allowed_tools=LINEAR_TOOLS,
+                mcp_servers={
+                    "linear": {
+                        "type": "http",
+                        "url": "https://mcp.linear.app/mcp",
+                        "headers": {"Authorization": f"Bearer {linear_api_key}"},
+                    }
+                },
+                max_turns=10,  # Should complete in 1-3 turns
+                env=sdk_env,  # Pass ANTHROPIC_BASE_URL etc. to subprocess
+            )
+        ),
+        model,
+        Priority.INSIGHTS,
     )
 
 
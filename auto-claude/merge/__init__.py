@@ -23,7 +23,12 @@ Usage:
     result = orchestrator.merge_task("task-001-feature")
 """
 
-from .ai_resolver import AIResolver, create_claude_resolver
+from .ai_resolver import (
+    AIResolver,
+    FakeAIFunction,
+    ResolutionCache,
+    create_claude_resolver,
+)
 from .auto_merger import AutoMerger
 from .compatibility_rules import CompatibilityRule
 from .conflict_detector import ConflictDetector
@@ -46,6 +51,7 @@ from .file_timeline import (
     TaskIntent,
     WorktreeState,
 )
+from .git_object_reader import GitObjectReader, get_object_reader
 from .git_utils import find_worktree, get_file_from_branch
 from .merge_pipeline import MergePipeline
 from .models import MergeReport, MergeStats, TaskMergeRequest
@@ -92,6 +98,8 @@ __all__ = [
     "AutoMerger",
     "FileEvolutionTracker",
     "AIResolver",
+    "FakeAIFunction",
+    "ResolutionCache",
     "create_claude_resolver",
     "ConflictResolver",
     "MergePipeline",
@@ -99,6 +107,8 @@ __all__ = [
     # Utilities
     "find_worktree",
     "get_file_from_branch",
+    "GitObjectReader",
+    "get_object_reader",
     "apply_single_task_changes",
     "combine_non_conflicting_changes",
     "find_import_end",
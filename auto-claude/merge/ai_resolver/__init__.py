@@ -10,6 +10,8 @@ minimal context to reduce token usage and cost.
 Components:
 - AIResolver: Main resolver class
 - ConflictContext: Minimal context for AI prompts
+- ResolutionCache: Content-keyed cache of AI resolutions
+- FakeAIFunction: Offline AI stand-in for tests and benchmarks
 - create_claude_resolver: Factory for Claude-based resolver
 
 Usage:
@@ -25,12 +27,18 @@ Usage:
     result = resolver.resolve_conflict(conflict, baseline_code, task_snapshots)
 """
 
+from .cache import ResolutionCache, compute_resolution_key
 from .claude_client import create_claude_resolver
 from .context import ConflictContext
-from .resolver import AIResolver
+from .fake import FakeAIFunction
+from .resolver import AIResolver, PrefetchResult
 
 __all__ = [
     "AIResolver",
     "ConflictContext",
+    "FakeAIFunction",
+    "PrefetchResult",
+    "ResolutionCache",
+    "compute_resolution_key",
     "create_claude_resolver",
 ]
@@ -0,0 +1,245 @@
+"""
+Resolution Cache
+================
+
+Caches AI conflict resolutions so identical conflicts are only sent once.
+
+A conflict is identified by a hash of everything the AI sees that affects
+the merged code: the baseline region, each task's changed regions and
+intent, the language, and the prompt version. File paths and task IDs are
+left out so the same conflict shape in two files (or in a merge preview
+followed by the real merge) shares one entry.
+
+When given a directory, entries are also written to disk so they survive
+across processes. The directory is pruned to max_disk_entries files, oldest
+(least recently read or written) first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .context import ConflictContext
+from .prompts import PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Default number of resolutions kept in memory
+DEFAULT_MAX_ENTRIES = 1024
+
+# Default number of resolutions kept on disk
+DEFAULT_MAX_DISK_ENTRIES = 4096
+
+
+@dataclass
+class ResolutionCacheStats:
+    """Counters for cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def compute_resolution_key(context: ConflictContext) -> str:
+    """
+    Compute the cache key for a conflict context.
+
+    Args:
+        context: The context that would be sent to the AI
+
+    Returns:
+        Hex digest identifying the conflict's content
+    """
+    payload = {
+        "prompt_version": PROMPT_VERSION,
+        "language": context.language,
+        "baseline": context.baseline_code,
+        "tasks": [
+            {
+                "intent": intent,
+                "changes": [
+                    [
+                        change.change_type.value,
+                        change.target,
+                        change.content_before,
+                        change.content_after,
+                    ]
+                    for change in changes
+                ],
+            }
+            for _task_id, intent, changes in context.task_changes
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResolutionCache:
+    """
+    Thread-safe LRU of merged code keyed by compute_resolution_key().
+
+    Usage:
+        cache = ResolutionCache(project_dir / ".auto-claude" / "ai_resolution_cache")
+        key = compute_resolution_key(context)
+        merged = cache.get(key)
+        if merged is None:
+            merged = call_ai(...)
+            cache.put(key, merged)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory to persist entries in (None for memory only)
+            max_entries: Maximum number of entries kept in memory
+            max_disk_entries: Maximum number of entry files kept in cache_dir
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.stats = ResolutionCacheStats()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached resolution.
+
+        Args:
+            key: Key from compute_resolution_key()
+
+        Returns:
+            The merged code, or None if not cached
+        """
+        with self._lock:
+            merged = self._entries.get(key)
+            if merged is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return merged
+
+        merged = self._read_entry(key)
+
+        with self._lock:
+            if merged is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self._remember(key, merged)
+            return merged
+
+    def put(self, key: str, merged_code: str) -> None:
+        """
+        Store a resolution.
+
+        Args:
+            key: Key from compute_resolution_key()
+            merged_code: The merged code the AI returned for that conflict
+        """
+        with self._lock:
+            self._remember(key, merged_code)
+            self.stats.stores += 1
+        self._write_entry(key, merged_code)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (persisted entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remember(self, key: str, merged_code: str) -> None:
+        """Insert into the LRU. Caller must hold the lock."""
+        self._entries[key] = merged_code
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read_entry(self, key: str) -> str | None:
+        if self.cache_dir is None:
+            return None
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("prompt_version") != PROMPT_VERSION:
+            return None
+        # Mark as recently used, so pruning keeps it
+        with suppress(OSError):
+            os.utime(path)
+        return data.get("merged_code")
+
+    def _write_entry(self, key: str, merged_code: str) -> None:
+        if self.cache_dir is None:
+            return
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"prompt_version": PROMPT_VERSION, "merged_code": merged_code}, f
+                )
+            os.replace(tmp_path, self._entry_path(key))
+            tmp_path = None
+        except OSError as e:
+            logger.debug(f"Could not persist AI resolution {key[:12]}: {e}")
+        finally:
+            if tmp_path is not None:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+        self.prune_disk()
+
+    def prune_disk(self) -> int:
+        """
+        Delete the oldest entry files beyond max_disk_entries.
+
+        Returns:
+            Number of files deleted
+        """
+        if self.cache_dir is None:
+            return 0
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        with suppress(OSError):
+                            entries.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            return 0
+        excess = len(entries) - self.max_disk_entries
+        if excess <= 0:
+            return 0
+        entries.sort()
+        removed = 0
+        for _mtime, path in entries[:excess]:
+            with suppress(OSError):
+                os.unlink(path)
+                removed += 1
+        return removed
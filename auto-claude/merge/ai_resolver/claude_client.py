@@ -16,17 +16,21 @@ import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .cache import ResolutionCache
     from .resolver import AIResolver
 
 logger = logging.getLogger(__name__)
 
 
-def create_claude_resolver() -> AIResolver:
+def create_claude_resolver(cache: ResolutionCache | None = None) -> AIResolver:
     """
     Create an AIResolver configured to use Claude via the Agent SDK.
 
     Uses the same OAuth token pattern as the rest of the auto-claude framework.
 
+    Args:
+        cache: Resolution cache to use (default: a new in-memory cache)
+
     Returns:
         Configured AIResolver instance
     """
@@ -37,7 +41,7 @@ def create_claude_resolver() -> AIResolver:
 
     if not get_auth_token():
         logger.warning("No authentication token found, AI resolution unavailable")
-        return AIResolver()
+        return AIResolver(cache=cache)
 
     # Ensure SDK can find the token
     ensure_claude_code_oauth_token()
@@ -46,7 +50,9 @@ def create_claude_resolver() -> AIResolver:
         from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
     except ImportError:
         logger.warning("claude_agent_sdk not installed, AI resolution unavailable")
-        return AIResolver()
+        return AIResolver(cache=cache)
+
+    from core.rate_limiter import Priority, rate_limited
 
     def call_claude(system: str, user: str) -> str:
         """Call Claude using the Agent SDK for merge resolution."""
@@ -57,13 +63,17 @@ def create_claude_resolver() -> AIResolver:
             model = resolve_model_id("sonnet")
             
             # Create a minimal client for merge resolution
-            client = ClaudeSDKClient(
-                options=ClaudeAgentOptions(
-                    model=model,
-                    system_prompt=system,
-                    allowed_tools=[],  # No tools needed for merge
-                    max_turns=1,
-                )
+            client = rate_limited(
+                ClaudeSDKClient(
+                    options=ClaudeAgentOptions(
+                        model=model,
+                        system_prompt=system,
+                        allowed_tools=[],  # No tools needed for merge
+                        max_turns=1,
+                    )
+                ),
+                model,
+                Priority.CODING,
             )
 
             try:
@@ -96,4 +106,4 @@ def create_claude_resolver() -> AIResolver:
             return ""
 
     logger.info("Using Claude Agent SDK for merge resolution")
-    return AIResolver(ai_call_fn=call_claude)
+    return AIResolver(ai_call_fn=call_claude, cache=cache)
@@ -0,0 +1,116 @@
+"""
+Fake AI Function
+================
+
+Offline stand-in for the Claude call used by AIResolver.
+
+It understands both the single-conflict and the batch prompts, answers
+each conflict region with a deterministic "merge" (the baseline code plus
+every task's new code), and can simulate latency. It records each call and
+the peak number of calls in flight, so tests and benchmarks can check
+batching, caching, and concurrency without network access.
+
+Usage:
+    from merge.ai_resolver import AIResolver, FakeAIFunction
+
+    fake = FakeAIFunction(latency=0.05)
+    resolver = AIResolver(ai_call_fn=fake)
+    ...
+    assert fake.call_count == 1
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Callable
+
+_CONFLICT_HEADER = re.compile(r"^## Conflict: (\S+)$", re.MULTILINE)
+_BASELINE = re.compile(
+    r"--- BASELINE CODE \(before any changes\) ---\n(.*?)\n?--- END BASELINE ---",
+    re.DOTALL,
+)
+_LANGUAGE = re.compile(r"^Language: (\S+)$", re.MULTILINE)
+_TASK_CODE = re.compile(r"^    Code: (.*)$", re.MULTILINE)
+
+
+def default_merge(context: str) -> str:
+    """
+    Produce a deterministic merge for one conflict region's prompt context.
+
+    Args:
+        context: Text produced by ConflictContext.to_prompt_context()
+
+    Returns:
+        The baseline code followed by each task's new code
+    """
+    baseline = _BASELINE.search(context)
+    parts = [baseline.group(1)] if baseline else []
+    parts.extend(_TASK_CODE.findall(context))
+    return "\n".join(part for part in parts if part)
+
+
+class FakeAIFunction:
+    """
+    Callable matching AICallFunction: (system_prompt, user_prompt) -> response.
+
+    Thread-safe, so it can be shared by concurrent resolutions.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        merge_fn: Callable[[str], str] = default_merge,
+    ):
+        """
+        Initialize the fake.
+
+        Args:
+            latency: Seconds to sleep per call, to simulate a model round trip
+            merge_fn: Maps one region's prompt context to the merged code
+        """
+        self.latency = latency
+        self.merge_fn = merge_fn
+        self.prompts: list[str] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def call_count(self) -> int:
+        """Number of calls made so far."""
+        with self._lock:
+            return len(self.prompts)
+
+    def __call__(self, system: str, user: str) -> str:
+        with self._lock:
+            self.prompts.append(user)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            return self._respond(user)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _respond(self, prompt: str) -> str:
+        headers = [h for h in _CONFLICT_HEADER.finditer(prompt) if h.group(1) != "<id>"]
+        if not headers:
+            return self._code_block(prompt)
+
+        sections = []
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(prompt)
+            section = prompt[header.end() : end]
+            sections.append(
+                f"## Conflict: {header.group(1)}\n{self._code_block(section)}"
+            )
+        return "\n\n".join(sections)
+
+    def _code_block(self, context: str) -> str:
+        language = _LANGUAGE.search(context)
+        lang = language.group(1) if language else ""
+        return f"```{lang}\n{self.merge_fn(context)}\n```"
@@ -100,3 +100,20 @@ def extract_batch_code_blocks(
         return match.group(1).strip()
 
     return None
+
+
+def extract_labeled_code_blocks(response: str) -> dict[str, str]:
+    """
+    Extract every "## Conflict: <id>" code block from a cross-file batch response.
+
+    Args:
+        response: The batch AI response
+
+    Returns:
+        Mapping of conflict id to extracted code
+    """
+    pattern = r"## Conflict:\s*(\S+)[^\n]*\n\s*```[^\n]*\n(.*?)```"
+    return {
+        match.group(1): match.group(2).strip()
+        for match in re.finditer(pattern, response, re.DOTALL)
+    }
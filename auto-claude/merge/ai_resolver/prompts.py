@@ -10,6 +10,9 @@ in merging conflicting code changes.
 
 from __future__ import annotations
 
+# Bump whenever a template changes so cached resolutions are not reused
+PROMPT_VERSION = "1"
+
 # System prompt for the AI
 SYSTEM_PROMPT = "You are an expert code merge assistant. Be concise and precise."
 
@@ -56,6 +59,22 @@ merged code
 
 Resolve all conflicts now:"""
 
+# Batch merge prompt template for conflicts from several files
+CROSS_FILE_BATCH_PROMPT_TEMPLATE = """You are a code merge assistant. Your task is to merge changes from multiple development tasks.
+
+There are {num_conflicts} independent conflict regions below, possibly from different files. Resolve each one on its own.
+
+{combined_context}
+
+For each conflict region, output the merged code in a separate code block labeled with its conflict id:
+
+## Conflict: <id>
+```<language>
+merged code
+```
+
+Resolve all conflicts now:"""
+
 
 def format_merge_prompt(context: str, language: str) -> str:
     """
@@ -95,3 +114,23 @@ def format_batch_merge_prompt(
         combined_context=combined_context,
         language=language,
     )
+
+
+def format_cross_file_batch_prompt(
+    num_conflicts: int,
+    combined_context: str,
+) -> str:
+    """
+    Format the batch merge prompt for conflicts spanning several files.
+
+    Args:
+        num_conflicts: Number of conflicts to resolve
+        combined_context: Combined context, each section headed by "## Conflict: <id>"
+
+    Returns:
+        Formatted batch prompt string
+    """
+    return CROSS_FILE_BATCH_PROMPT_TEMPLATE.format(
+        num_conflicts=num_conflicts,
+        combined_context=combined_context,
+    )
@@ -10,8 +10,12 @@ resolution of conflicts using AI with minimal context.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from ..types import (
     ConflictRegion,
@@ -21,12 +25,18 @@ from ..types import (
     MergeStrategy,
     TaskSnapshot,
 )
+from .cache import ResolutionCache, compute_resolution_key
 from .context import ConflictContext
 from .language_utils import infer_language, locations_overlap
-from .parsers import extract_batch_code_blocks, extract_code_block
+from .parsers import (
+    extract_batch_code_blocks,
+    extract_code_block,
+    extract_labeled_code_blocks,
+)
 from .prompts import (
     SYSTEM_PROMPT,
     format_batch_merge_prompt,
+    format_cross_file_batch_prompt,
     format_merge_prompt,
 )
 
@@ -35,6 +45,20 @@ logger = logging.getLogger(__name__)
 # Type for the AI call function
 AICallFunction = Callable[[str, str], str]
 
+# Default cap on AI calls in flight during prefetch_resolutions()
+MAX_CONCURRENT_CALLS = 4
+
+
+@dataclass
+class PrefetchResult:
+    """Outcome of AIResolver.prefetch_resolutions()."""
+
+    conflicts_requested: int = 0
+    already_cached: int = 0
+    resolved: int = 0
+    ai_calls_made: int = 0
+    tokens_used: int = 0
+
 
 class AIResolver:
     """
@@ -46,6 +70,10 @@ class AIResolver:
     3. Calls AI and parses response
     4. Returns MergeResult with merged code
 
+    Resolutions are cached by conflict content, and prefetch_resolutions()
+    can resolve many conflicts at once by packing them into cross-file
+    batches that are sent concurrently.
+
     Usage:
         resolver = AIResolver(ai_call_fn)
         result = resolver.resolve_conflict(conflict, context)
@@ -58,6 +86,9 @@ class AIResolver:
         self,
         ai_call_fn: AICallFunction | None = None,
         max_context_tokens: int = MAX_CONTEXT_TOKENS,
+        cache: ResolutionCache | None = None,
+        batch_token_budget: int | None = None,
+        max_concurrent_calls: int = MAX_CONCURRENT_CALLS,
     ):
         """
         Initialize the AI resolver.
@@ -66,11 +97,21 @@ class AIResolver:
             ai_call_fn: Function that calls AI. Signature: (system_prompt, user_prompt) -> response
                         If None, uses a stub that requires explicit calls.
             max_context_tokens: Maximum tokens to include in context
+            cache: Resolution cache (default: a new in-memory cache)
+            batch_token_budget: Maximum context tokens per cross-file batch
+                                (default: max_context_tokens)
+            max_concurrent_calls: Default cap on AI calls in flight when prefetching
         """
         self.ai_call_fn = ai_call_fn
         self.max_context_tokens = max_context_tokens
+        self.cache = cache if cache is not None else ResolutionCache()
+        self.batch_token_budget = batch_token_budget or max_context_tokens
+        self.max_concurrent_calls = max_concurrent_calls
+        self._stats_lock = threading.Lock()
         self._call_count = 0
         self._total_tokens = 0
+        self._cache_hits = 0
+        self._batched_calls = 0
 
     def set_ai_function(self, ai_call_fn: AICallFunction) -> None:
         """Set the AI call function after initialization."""
@@ -79,15 +120,29 @@ class AIResolver:
     @property
     def stats(self) -> dict[str, int]:
         """Get usage statistics."""
-        return {
-            "calls_made": self._call_count,
-            "estimated_tokens_used": self._total_tokens,
-        }
+        with self._stats_lock:
+            return {
+                "calls_made": self._call_count,
+                "estimated_tokens_used": self._total_tokens,
+                "cache_hits": self._cache_hits,
+                "batched_calls": self._batched_calls,
+            }
 
     def reset_stats(self) -> None:
         """Reset usage statistics."""
-        self._call_count = 0
-        self._total_tokens = 0
+        with self._stats_lock:
+            self._call_count = 0
+            self._total_tokens = 0
+            self._cache_hits = 0
+            self._batched_calls = 0
+
+    def _record_call(self, tokens: int, batched: bool = False) -> None:
+        """Count one AI call. Safe to call from concurrent resolutions."""
+        with self._stats_lock:
+            self._call_count += 1
+            self._total_tokens += tokens
+            if batched:
+                self._batched_calls += 1
 
     def build_context(
         self,
@@ -191,6 +246,20 @@ class AIResolver:
                 conflicts_remaining=[conflict],
             )
 
+        # Reuse an earlier resolution of the same conflict
+        cache_key = compute_resolution_key(context)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            with self._stats_lock:
+                self._cache_hits += 1
+            return MergeResult(
+                decision=MergeDecision.AI_MERGED,
+                file_path=conflict.file_path,
+                merged_content=cached,
+                conflicts_resolved=[conflict],
+                explanation=f"AI resolved conflict at {conflict.location} (cached)",
+            )
+
         # Build prompt
         prompt_context = context.to_prompt_context()
         prompt = format_merge_prompt(prompt_context, context.language)
@@ -199,13 +268,13 @@ class AIResolver:
         try:
             logger.info(f"Calling AI to resolve conflict in {conflict.file_path}")
             response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
-            self._call_count += 1
-            self._total_tokens += context.estimated_tokens + len(response) // 4
+            self._record_call(context.estimated_tokens + len(response) // 4)
 
             # Parse response
             merged_code = extract_code_block(response, context.language)
 
             if merged_code:
+                self.cache.put(cache_key, merged_code)
                 return MergeResult(
                     decision=MergeDecision.AI_MERGED,
                     file_path=conflict.file_path,
@@ -352,21 +421,21 @@ class AIResolver:
 
         try:
             response = self.ai_call_fn(SYSTEM_PROMPT, batch_prompt)
-            self._call_count += 1
-            self._total_tokens += total_tokens + len(response) // 4
+            self._record_call(total_tokens + len(response) // 4, batched=True)
 
             # Parse batch response
             # This is a simplified parser - production would be more robust
             resolved = []
             remaining = []
 
-            for conflict in conflicts:
+            for conflict, ctx in zip(conflicts, all_contexts):
                 # Try to find the resolution for this location
                 code_block = extract_batch_code_blocks(
                     response, conflict.location, language
                 )
 
                 if code_block:
+                    self.cache.put(compute_resolution_key(ctx), code_block)
                     resolved.append(conflict)
                 else:
                     remaining.append(conflict)
@@ -404,6 +473,139 @@ class AIResolver:
                 conflicts_remaining=conflicts,
             )
 
+    def prefetch_resolutions(
+        self,
+        conflicts: list[tuple[ConflictRegion, str, list[TaskSnapshot]]],
+        max_concurrent: int | None = None,
+    ) -> PrefetchResult:
+        """
+        Resolve many conflicts up front, batching across files.
+
+        Conflicts that are already cached, or identical to an earlier one in
+        the list, are not sent again. The rest are packed in order into
+        batches of at most batch_token_budget estimated tokens, and the
+        batches are sent concurrently. Every parsed resolution goes into the
+        cache, so the resolve_conflict() calls that follow return at once.
+        Anything that fails or can't be parsed is simply left uncached and
+        gets resolved individually later.
+
+        Args:
+            conflicts: (conflict, baseline code at its location, task snapshots) triples
+            max_concurrent: Cap on AI calls in flight (default: max_concurrent_calls)
+
+        Returns:
+            PrefetchResult describing the calls made
+        """
+        result = PrefetchResult(conflicts_requested=len(conflicts))
+        if not self.ai_call_fn:
+            return result
+
+        pending: dict[str, ConflictContext] = {}
+        for conflict, baseline_code, task_snapshots in conflicts:
+            context = self.build_context(conflict, baseline_code, task_snapshots)
+            if context.estimated_tokens > self.max_context_tokens:
+                continue
+            key = compute_resolution_key(context)
+            if key in pending:
+                continue
+            if self.cache.get(key) is not None:
+                result.already_cached += 1
+                continue
+            pending[key] = context
+
+        batches = self._plan_batches(list(pending.items()))
+        if not batches:
+            return result
+
+        limit = max(1, max_concurrent or self.max_concurrent_calls)
+        logger.info(
+            f"Prefetching {len(pending)} AI resolution(s) in {len(batches)} call(s)"
+        )
+
+        async def _dispatch_all() -> list[tuple[int, int]]:
+            semaphore = asyncio.Semaphore(limit)
+
+            async def _dispatch(batch) -> tuple[int, int]:
+                async with semaphore:
+                    return await asyncio.to_thread(self._call_batch, batch)
+
+            return await asyncio.gather(*(_dispatch(batch) for batch in batches))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            outcomes = asyncio.run(_dispatch_all())
+        else:
+            # Called from inside an event loop: run ours on a separate thread
+            with ThreadPoolExecutor(max_workers=1) as runner:
+                outcomes = runner.submit(asyncio.run, _dispatch_all()).result()
+
+        for resolved, tokens in outcomes:
+            result.resolved += resolved
+            result.tokens_used += tokens
+            result.ai_calls_made += 1
+        return result
+
+    def _plan_batches(
+        self,
+        items: list[tuple[str, ConflictContext]],
+    ) -> list[list[tuple[str, ConflictContext]]]:
+        """Greedily pack contexts, in order, into batches within the token budget."""
+        batches: list[list[tuple[str, ConflictContext]]] = []
+        current: list[tuple[str, ConflictContext]] = []
+        current_tokens = 0
+        for key, context in items:
+            tokens = context.estimated_tokens
+            if current and current_tokens + tokens > self.batch_token_budget:
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append((key, context))
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _call_batch(self, batch: list[tuple[str, ConflictContext]]) -> tuple[int, int]:
+        """
+        Send one batch and cache what comes back.
+
+        Returns:
+            (resolutions cached, estimated tokens sent)
+        """
+        tokens = sum(context.estimated_tokens for _, context in batch)
+        if len(batch) == 1:
+            key, context = batch[0]
+            prompt = format_merge_prompt(context.to_prompt_context(), context.language)
+        else:
+            prompt = format_cross_file_batch_prompt(
+                num_conflicts=len(batch),
+                combined_context="\n\n---\n\n".join(
+                    f"## Conflict: c{i}\n{context.to_prompt_context()}"
+                    for i, (_, context) in enumerate(batch)
+                ),
+            )
+
+        try:
+            response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
+        except Exception as e:
+            logger.error(f"Batch AI call failed: {e}")
+            return 0, tokens
+        self._record_call(tokens + len(response) // 4, batched=len(batch) > 1)
+
+        if len(batch) == 1:
+            merged = extract_code_block(response, batch[0][1].language)
+            blocks = {"c0": merged} if merged else {}
+        else:
+            blocks = extract_labeled_code_blocks(response)
+
+        resolved = 0
+        for i, (key, _context) in enumerate(batch):
+            merged = blocks.get(f"c{i}")
+            if merged:
+                self.cache.put(key, merged)
+                resolved += 1
+        return resolved, tokens
+
     def can_resolve(self, conflict: ConflictRegion) -> bool:
         """
         Check if this resolver should handle a conflict.
@@ -0,0 +1,616 @@
+"""
+Merge Pipeline Benchmark
+========================
+
+Measures the merge subsystem against synthetic git repositories.
+
+A repository is generated with a configurable number of Python modules,
+each task gets its own worktree and branch (like a spec build), and a
+share of the modules is edited by every task so the run includes real
+conflicts. The benchmark then drives, in order:
+
+    timeline_events   FileTimelineTracker task start, worktree changes and
+                      a burst of main branch commits
+    capture_baselines FileEvolutionTracker.capture_baselines for every task
+    refresh_from_git  FileEvolutionTracker.refresh_from_git for every task
+    semantic_analysis SemanticAnalyzer.analyze_diff on every changed file
+                      (cold cache)
+    merge_tasks       MergeOrchestrator.merge_tasks over all tasks, with
+                      FakeAIFunction standing in for the model
+
+For each stage it records wall time, the number of subprocesses started
+through subprocess.Popen (i.e. git calls; deterministic-stage worker
+processes are not included), peak RSS and bytes written. The report is
+JSON so runs from two commits can be compared with --compare.
+
+Usage:
+    cd auto-claude
+    python -m merge.benchmark --files 60 --tasks 10 --overlap 0.2
+    python -m merge.benchmark --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .ai_resolver import AIResolver, FakeAIFunction
+from .models import TaskMergeRequest
+from .orchestrator import MergeOrchestrator
+from .semantic_analyzer import SemanticAnalyzer
+from .timeline_tracker import FileTimelineTracker
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Order stages appear in the report
+STAGES = (
+    "timeline_events",
+    "capture_baselines",
+    "refresh_from_git",
+    "semantic_analysis",
+    "merge_tasks",
+)
+
+# Relative change below which --compare doesn't flag a metric
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+@dataclass
+class BenchmarkConfig:
+    """Shape of the synthetic repository and how the merge is run."""
+
+    file_count: int = 20
+    file_lines: int = 200  # Approximate lines per module
+    task_count: int = 4
+    overlap_ratio: float = 0.25  # Share of modules edited by every task
+    main_commits: int = 3  # Commits landing on main while tasks run
+    ai_latency: float = 0.0  # Seconds per fake AI call
+    max_workers: int = 1  # Deterministic-stage worker processes
+    max_concurrent_ai: int = 5
+
+    def __post_init__(self) -> None:
+        if self.file_count < 1 or self.task_count < 1:
+            raise ValueError("file_count and task_count must be at least 1")
+        if not 0.0 <= self.overlap_ratio <= 1.0:
+            raise ValueError("overlap_ratio must be between 0 and 1")
+
+    @property
+    def shared_file_count(self) -> int:
+        return round(self.file_count * self.overlap_ratio)
+
+
+@dataclass
+class StageMetrics:
+    """Resource usage of one benchmark stage."""
+
+    wall_seconds: float = 0.0
+    subprocesses: int = 0
+    peak_rss_kb: int | None = None
+    peak_child_rss_kb: int | None = None
+    bytes_written: int | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class SyntheticRepo:
+    """A generated repository and the worktree of each task."""
+
+    path: Path
+    base_commit: str
+    main_commits: list[str]
+    task_worktrees: dict[str, Path]
+    task_files: dict[str, list[str]]  # task_id -> modules it edits
+    shared_files: list[str]
+
+
+# =============================================================================
+# SYNTHETIC REPOSITORY
+# =============================================================================
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _module_path(index: int) -> str:
+    return f"src/module_{index:04d}.py"
+
+
+def _function(name: str, body_lines: int, offset: int, marker: str = "") -> str:
+    lines = [f"def {name}(value):", f'    """Compute {name}."""', "    result = value"]
+    for k in range(body_lines):
+        lines.append(f"    result = result * {k + 2} + {offset + k}{marker}")
+    lines.append("    return result")
+    return "\n".join(lines)
+
+
+# Body lines of each generated function
+_BODY_LINES = 4
+
+
+def _function_count(config: BenchmarkConfig) -> int:
+    return max(2, config.file_lines // (_BODY_LINES + 5))
+
+
+def module_content(index: int, config: BenchmarkConfig) -> str:
+    """Baseline content of one synthetic module."""
+    parts = [f'"""Synthetic module {index}."""', "", "import os", ""]
+    for j in range(_function_count(config)):
+        parts.append("")
+        parts.append(_function(f"func_{index}_{j}", _BODY_LINES, j))
+        parts.append("")
+    return "\n".join(parts) + "\n"
+
+
+def task_content(index: int, task_number: int, config: BenchmarkConfig) -> str:
+    """
+    A task's version of a module.
+
+    Every task rewrites one function and appends a helper of its own.
+    Tasks rewrite different functions, so those auto-merge unless there
+    are more tasks than functions. In addition, the first task removes
+    the module's last function and the second rewrites it, a conflict
+    that goes to the AI resolver when both edit a shared module.
+
+    Args:
+        index: Module number
+        task_number: Zero-based task number
+        config: Repository shape
+    """
+    functions = _function_count(config)
+    last = functions - 1
+    content = module_content(index, config)
+
+    def rewrite(j: int) -> str:
+        marker = f"  # task {task_number}"
+        return _function(f"func_{index}_{j}", _BODY_LINES, j, marker=marker)
+
+    target = task_number % last
+    content = content.replace(
+        _function(f"func_{index}_{target}", _BODY_LINES, target), rewrite(target), 1
+    )
+    last_function = _function(f"func_{index}_{last}", _BODY_LINES, last)
+    if task_number == 0:
+        content = content.replace(last_function + "\n", "", 1)
+    elif task_number == 1:
+        content = content.replace(last_function, rewrite(last), 1)
+
+    helper = _function(f"task_{task_number}_helper_{index}", 2, index)
+    return content + "\n\n" + helper + "\n"
+
+
+def create_synthetic_repo(root: Path, config: BenchmarkConfig) -> SyntheticRepo:
+    """
+    Generate a repository with one worktree per task.
+
+    Args:
+        root: Empty directory to create the repository in
+        config: Repository shape
+
+    Returns:
+        SyntheticRepo describing what was generated
+    """
+    repo = root / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "docs").mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "Benchmark")
+    (repo / ".gitignore").write_text(".auto-claude/\n.worktrees/\n")
+    for i in range(config.file_count):
+        (repo / _module_path(i)).write_text(module_content(i, config))
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "Initial modules")
+    _git(repo, "branch", "-M", "main")
+    base_commit = _git(repo, "rev-parse", "HEAD")
+
+    shared = [_module_path(i) for i in range(config.shared_file_count)]
+    own = [_module_path(i) for i in range(config.shared_file_count, config.file_count)]
+
+    task_worktrees: dict[str, Path] = {}
+    task_files: dict[str, list[str]] = {}
+    for t in range(config.task_count):
+        task_id = f"task-{t + 1:03d}"
+        files = shared + own[t :: config.task_count]
+        worktree = repo / ".worktrees" / task_id
+        _git(
+            repo, "worktree", "add", "-q", "-b", f"auto-claude/{task_id}", str(worktree)
+        )
+        for file_path in files:
+            index = int(Path(file_path).stem.split("_")[1])
+            (worktree / file_path).write_text(task_content(index, t, config))
+        if files:
+            _git(worktree, "add", "-A")
+            _git(worktree, "commit", "-q", "-m", f"{task_id} changes")
+        task_worktrees[task_id] = worktree
+        task_files[task_id] = files
+
+    # Unrelated work landing on main while the tasks run
+    main_commits = []
+    for k in range(config.main_commits):
+        (repo / "docs" / f"notes_{k}.md").write_text(f"# Notes {k}\n")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", f"Notes {k}")
+        main_commits.append(_git(repo, "rev-parse", "HEAD"))
+
+    return SyntheticRepo(
+        path=repo,
+        base_commit=base_commit,
+        main_commits=main_commits,
+        task_worktrees=task_worktrees,
+        task_files=task_files,
+        shared_files=shared,
+    )
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+
+def _read_proc_value(path: str, key: str) -> int | None:
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(key):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_kb() -> int | None:
+    peak = _read_proc_value("/proc/self/status", "VmHWM:")
+    if peak is None and resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak //= 1024  # bytes on macOS
+    return peak
+
+
+def _peak_child_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+@contextmanager
+def measure_stage(metrics: StageMetrics) -> Iterator[StageMetrics]:
+    """
+    Record wall time, subprocesses, peak RSS and bytes written for a block.
+
+    Subprocesses are counted by temporarily replacing subprocess.Popen,
+    which subprocess.run and the git object reader both go through.
+
+    Args:
+        metrics: Metrics object to fill in
+    """
+    original_popen = subprocess.Popen
+    counter = {"count": 0}
+
+    class CountingPopen(original_popen):
+        def __init__(self, *args, **kwargs):
+            counter["count"] += 1
+            super().__init__(*args, **kwargs)
+
+    _reset_peak_rss()
+    written_before = _read_proc_value("/proc/self/io", "wchar:")
+    subprocess.Popen = CountingPopen
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_seconds = time.perf_counter() - start
+        subprocess.Popen = original_popen
+        metrics.subprocesses = counter["count"]
+        metrics.peak_rss_kb = _peak_rss_kb()
+        metrics.peak_child_rss_kb = _peak_child_rss_kb()
+        written_after = _read_proc_value("/proc/self/io", "wchar:")
+        if written_before is not None and written_after is not None:
+            metrics.bytes_written = written_after - written_before
+
+
+# =============================================================================
+# STAGES
+# =============================================================================
+
+
+def _run_timeline_events(synthetic: SyntheticRepo, metrics: StageMetrics) -> None:
+    tracker = FileTimelineTracker(synthetic.path)
+    for task_id, files in synthetic.task_files.items():
+        tracker.on_task_start(
+            task_id,
+            files,
+            branch_point_commit=synthetic.base_commit,
+            task_title=f"Benchmark {task_id}",
+        )
+        worktree = synthetic.task_worktrees[task_id]
+        for file_path in files:
+            tracker.on_task_worktree_change(
+                task_id, file_path, (worktree / file_path).read_text()
+            )
+    tracker.on_main_branch_commits(synthetic.main_commits)
+    metrics.details["events"] = (
+        len(synthetic.task_files)
+        + sum(len(files) for files in synthetic.task_files.values())
+        + len(synthetic.main_commits)
+    )
+
+
+def _run_capture_baselines(
+    synthetic: SyntheticRepo, orchestrator: MergeOrchestrator, metrics: StageMetrics
+) -> None:
+    for task_id, files in synthetic.task_files.items():
+        orchestrator.evolution_tracker.capture_baselines(task_id, files)
+    metrics.details["files_captured"] = sum(
+        len(files) for files in synthetic.task_files.values()
+    )
+
+
+def _run_refresh(
+    synthetic: SyntheticRepo, orchestrator: MergeOrchestrator, metrics: StageMetrics
+) -> None:
+    for task_id, worktree in synthetic.task_worktrees.items():
+        orchestrator.evolution_tracker.refresh_from_git(task_id, worktree)
+    metrics.details["files_refreshed"] = sum(
+        len(files) for files in synthetic.task_files.values()
+    )
+
+
+def _run_semantic_analysis(
+    synthetic: SyntheticRepo, config: BenchmarkConfig, metrics: StageMetrics
+) -> None:
+    analyzer = SemanticAnalyzer()
+    changes = 0
+    for task_id, files in synthetic.task_files.items():
+        worktree = synthetic.task_worktrees[task_id]
+        for file_path in files:
+            index = int(Path(file_path).stem.split("_")[1])
+            analysis = analyzer.analyze_diff(
+                file_path,
+                module_content(index, config),
+                (worktree / file_path).read_text(),
+                task_id=task_id,
+            )
+            changes += len(analysis.changes)
+    metrics.details["changes_found"] = changes
+
+
+def _run_merge(
+    synthetic: SyntheticRepo,
+    orchestrator: MergeOrchestrator,
+    fake_ai: FakeAIFunction,
+    metrics: StageMetrics,
+) -> None:
+    report = orchestrator.merge_tasks(
+        [
+            TaskMergeRequest(task_id=task_id, worktree_path=worktree)
+            for task_id, worktree in synthetic.task_worktrees.items()
+        ]
+    )
+    metrics.details.update(
+        success=report.success,
+        error=report.error,
+        stats=report.stats.to_dict(),
+        stage_timings=dict(report.stage_timings),
+        fake_ai_calls=fake_ai.call_count,
+        fake_ai_max_in_flight=fake_ai.max_in_flight,
+    )
+
+
+def run_benchmark(
+    config: BenchmarkConfig, work_dir: Path | None = None
+) -> dict[str, Any]:
+    """
+    Generate a repository and measure every merge stage against it.
+
+    Args:
+        config: Repository shape and merge settings
+        work_dir: Directory to generate the repository in (default: a
+            temporary directory that is removed afterwards)
+
+    Returns:
+        JSON-serializable report
+    """
+    if work_dir is None:
+        with tempfile.TemporaryDirectory(prefix="merge-bench-") as tmp:
+            return run_benchmark(config, Path(tmp))
+
+    stages: dict[str, StageMetrics] = {}
+
+    setup = StageMetrics()
+    with measure_stage(setup):
+        synthetic = create_synthetic_repo(Path(work_dir), config)
+
+    fake_ai = FakeAIFunction(latency=config.ai_latency)
+    orchestrator = MergeOrchestrator(
+        synthetic.path,
+        ai_resolver=AIResolver(
+            ai_call_fn=fake_ai, max_concurrent_calls=config.max_concurrent_ai
+        ),
+        dry_run=True,
+        max_workers=config.max_workers,
+        max_concurrent_ai=config.max_concurrent_ai,
+    )
+
+    runners = {
+        "timeline_events": lambda m: _run_timeline_events(synthetic, m),
+        "capture_baselines": lambda m: _run_capture_baselines(
+            synthetic, orchestrator, m
+        ),
+        "refresh_from_git": lambda m: _run_refresh(synthetic, orchestrator, m),
+        "semantic_analysis": lambda m: _run_semantic_analysis(synthetic, config, m),
+        "merge_tasks": lambda m: _run_merge(synthetic, orchestrator, fake_ai, m),
+    }
+    for name in STAGES:
+        stages[name] = StageMetrics()
+        with measure_stage(stages[name]):
+            runners[name](stages[name])
+
+    return {
+        "config": asdict(config),
+        "environment": _environment(),
+        "setup": setup.to_dict(),
+        "stages": {name: metrics.to_dict() for name, metrics in stages.items()},
+        "totals": {
+            "wall_seconds": sum(m.wall_seconds for m in stages.values()),
+            "subprocesses": sum(m.subprocesses for m in stages.values()),
+        },
+    }
+
+
+def _environment() -> dict[str, Any]:
+    source_dir = Path(__file__).resolve().parent
+    try:
+        source_commit = _git(source_dir, "rev-parse", "HEAD")
+    except (OSError, subprocess.CalledProcessError):
+        source_commit = None
+    try:
+        git_version = _git(source_dir, "--version")
+    except (OSError, subprocess.CalledProcessError):
+        git_version = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": git_version,
+        "source_commit": source_commit,
+        "peak_rss_per_stage": _reset_peak_rss(),
+    }
+
+
+# =============================================================================
+# COMPARISON
+# =============================================================================
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """
+    Compare per-stage metrics of two reports.
+
+    Args:
+        baseline: Report from the reference commit
+        current: Report from the commit under test
+        threshold: Relative increase that counts as a regression
+
+    Returns:
+        One entry per stage and metric with both values, the relative
+        change, and whether it regressed
+    """
+    rows = []
+    for stage in STAGES:
+        old = baseline.get("stages", {}).get(stage, {})
+        new = current.get("stages", {}).get(stage, {})
+        for metric in ("wall_seconds", "subprocesses", "peak_rss_kb", "bytes_written"):
+            before, after = old.get(metric), new.get(metric)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before if before else 0.0
+            rows.append(
+                {
+                    "stage": stage,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change": change,
+                    "regressed": change > threshold,
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the merge pipeline on a synthetic repository"
+    )
+    parser.add_argument("--files", type=int, default=20, help="Modules to generate")
+    parser.add_argument(
+        "--file-lines", type=int, default=200, help="Approximate lines per module"
+    )
+    parser.add_argument("--tasks", type=int, default=4, help="Parallel tasks")
+    parser.add_argument(
+        "--overlap",
+        type=float,
+        default=0.25,
+        help="Share of modules edited by every task (0-1)",
+    )
+    parser.add_argument(
+        "--main-commits", type=int, default=3, help="Commits landing on main"
+    )
+    parser.add_argument(
+        "--ai-latency", type=float, default=0.0, help="Seconds per fake AI call"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Deterministic-stage worker processes"
+    )
+    parser.add_argument("--work-dir", type=Path, help="Keep the repository here")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="Baseline report to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Relative increase reported as a regression",
+    )
+    args = parser.parse_args()
+
+    config = BenchmarkConfig(
+        file_count=args.files,
+        file_lines=args.file_lines,
+        task_count=args.tasks,
+        overlap_ratio=args.overlap,
+        main_commits=args.main_commits,
+        ai_latency=args.ai_latency,
+        max_workers=args.workers,
+    )
+    if args.work_dir:
+        args.work_dir.mkdir(parents=True, exist_ok=True)
+    report = run_benchmark(config, args.work_dir)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        report["comparison"] = compare_reports(baseline, report, args.threshold)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+
+    if any(row["regressed"] for row in report.get("comparison", [])):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ This module contains:
 - Conflict detection algorithms
 - Severity assessment logic
 - Implicit conflict detection
-- Range overlap checking
+- Range overlap checking (including a sweep-line pass across locations)
 """
 
 from __future__ import annotations
@@ -17,6 +17,7 @@ import logging
 from collections import defaultdict
 
 from .compatibility_rules import CompatibilityRule
+from .overlap_index import OverlapIndex
 from .types import (
     ChangeType,
     ConflictRegion,
@@ -112,6 +113,12 @@ def detect_conflicts(
             )
             conflicts.append(conflict)
 
+    # Changes that share lines under different location names
+    overlap_conflicts = detect_overlap_conflicts(task_analyses, rule_index, conflicts)
+    if overlap_conflicts:
+        debug_detailed(MODULE, f"Found {len(overlap_conflicts)} line-overlap conflicts")
+    conflicts.extend(overlap_conflicts)
+
     # Also check for implicit conflicts (e.g., changes to related code)
     implicit_conflicts = detect_implicit_conflicts(task_analyses)
     if implicit_conflicts:
@@ -126,6 +133,7 @@ def analyze_location_conflict(
     location: str,
     task_changes: list[tuple[str, SemanticChange]],
     rule_index: dict[tuple[ChangeType, ChangeType], CompatibilityRule],
+    require_same_target: bool = True,
 ) -> ConflictRegion | None:
     """
     Analyze changes at a specific location for conflicts.
@@ -135,6 +143,8 @@ def analyze_location_conflict(
         location: Location identifier (e.g., "function:main")
         task_changes: List of (task_id, change) tuples for this location
         rule_index: Indexed compatibility rules
+        require_same_target: Treat changes to different targets as compatible.
+            Pass False when the changes are known to share lines.
 
     Returns:
         ConflictRegion if conflicts exist, None otherwise
@@ -145,7 +155,7 @@ def analyze_location_conflict(
 
     # Check if all changes target the same thing
     targets = {c.target for c in changes}
-    if len(targets) > 1:
+    if require_same_target and len(targets) > 1:
         # Different targets at same location - likely compatible
         # (e.g., adding two different functions)
         return None
@@ -251,6 +261,138 @@ def ranges_overlap(ranges: list[tuple[int, int]]) -> bool:
     return False
 
 
+def base_line_range(change: SemanticChange) -> tuple[int, int]:
+    """
+    Line range a change covers in the file every task started from.
+
+    A modification's line_start/line_end are in the task's edited file;
+    the semantic analyzer records where the element was before the edits
+    in metadata. Changes without that metadata are taken at their lines.
+
+    Args:
+        change: A change to existing code
+
+    Returns:
+        (start_line, end_line), inclusive
+    """
+    return (
+        change.metadata.get("base_line_start", change.line_start),
+        change.metadata.get("base_line_end", change.line_end),
+    )
+
+
+def _widest_key(change: SemanticChange) -> tuple[int, int]:
+    start, end = base_line_range(change)
+    return end - start, -start
+
+
+def detect_overlap_conflicts(
+    task_analyses: dict[str, FileAnalysis],
+    rule_index: dict[tuple[ChangeType, ChangeType], CompatibilityRule],
+    location_conflicts: list[ConflictRegion] | None = None,
+) -> list[ConflictRegion]:
+    """
+    Detect conflicts between changes that share lines but not a location.
+
+    Only changes to existing code (not purely additive ones) are indexed,
+    by their line range in the file every task started from (see
+    base_line_range), so a task that shifted lines by inserting code
+    doesn't appear to overlap another task's edits further down. Pairs
+    from different tasks at different locations are linked into groups,
+    and each group is analyzed as one region at the location of its
+    widest change. A pair is skipped if a location conflict already
+    covers both tasks at one of its locations.
+
+    Args:
+        task_analyses: Map of task_id -> FileAnalysis
+        rule_index: Indexed compatibility rules
+        location_conflicts: Conflicts already found by location grouping
+
+    Returns:
+        List of conflict regions, one per overlapping group
+    """
+    covered: set[tuple[str, str, str]] = set()
+    for conflict in location_conflicts or []:
+        for task_id in conflict.tasks_involved:
+            covered.add((conflict.file_path, conflict.location, task_id))
+
+    by_file: dict[str, list[tuple[str, SemanticChange]]] = defaultdict(list)
+    for task_id, analysis in task_analyses.items():
+        for change in analysis.changes:
+            if not change.is_additive:
+                by_file[analysis.file_path].append((task_id, change))
+
+    conflicts: list[ConflictRegion] = []
+    for file_path, entries in by_file.items():
+        for members in _group_overlapping_changes(file_path, entries, covered):
+            task_changes = [entries[p] for p in members]
+            widest = max(task_changes, key=lambda tc: _widest_key(tc[1]))
+            conflict = analyze_location_conflict(
+                file_path,
+                widest[1].location,
+                task_changes,
+                rule_index,
+                require_same_target=False,
+            )
+            if conflict:
+                debug_detailed(
+                    MODULE,
+                    f"Line-overlap conflict at {conflict.location}",
+                    severity=conflict.severity.value,
+                    tasks=conflict.tasks_involved,
+                )
+                conflicts.append(conflict)
+
+    return conflicts
+
+
+def _group_overlapping_changes(
+    file_path: str,
+    entries: list[tuple[str, SemanticChange]],
+    covered: set[tuple[str, str, str]],
+) -> list[list[int]]:
+    """
+    Link uncovered cross-task, cross-location overlaps into groups.
+
+    Args:
+        file_path: File the entries belong to
+        entries: (task_id, change) pairs for one file
+        covered: (file_path, location, task_id) triples with a location conflict
+
+    Returns:
+        Sorted entry positions for each group of two or more linked changes
+    """
+    index: OverlapIndex[int] = OverlapIndex()
+    for position, (_, change) in enumerate(entries):
+        index.add(*base_line_range(change), position)
+
+    # Union-find over entry positions
+    parent = list(range(len(entries)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in index.overlapping_pairs():
+        task_a, change_a = entries[a]
+        task_b, change_b = entries[b]
+        if task_a == task_b or change_a.location == change_b.location:
+            continue
+        if any(
+            (file_path, loc, task_a) in covered and (file_path, loc, task_b) in covered
+            for loc in (change_a.location, change_b.location)
+        ):
+            continue
+        parent[find(a)] = find(b)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for position in range(len(entries)):
+        groups[find(position)].append(position)
+    return [members for members in groups.values() if len(members) > 1]
+
+
 def detect_implicit_conflicts(
     task_analyses: dict[str, FileAnalysis],
 ) -> list[ConflictRegion]:
@@ -78,6 +78,7 @@ class ConflictResolver:
         remaining: list[ConflictRegion] = []
         ai_calls = 0
         tokens_used = 0
+        ai_resolved = 0
 
         for conflict in conflicts:
             # Try auto-merge first
@@ -128,6 +129,7 @@ class ConflictResolver:
                         ai_result.merged_content or "",
                     )
                     resolved.append(conflict)
+                    ai_resolved += 1
                     continue
 
             # Could not resolve
@@ -136,7 +138,9 @@ class ConflictResolver:
         # Determine final decision
         if not remaining:
             decision = (
-                MergeDecision.AUTO_MERGED if ai_calls == 0 else MergeDecision.AI_MERGED
+                MergeDecision.AUTO_MERGED
+                if ai_resolved == 0
+                else MergeDecision.AI_MERGED
             )
         elif remaining and resolved:
             decision = MergeDecision.NEEDS_HUMAN_REVIEW
@@ -15,6 +15,7 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from ..git_object_reader import get_object_reader
 from ..types import FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
 
@@ -123,17 +124,8 @@ class BaselineCapture:
         Returns:
             Git commit SHA, or "unknown" if not available
         """
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.storage.project_dir,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            return "unknown"
+        commit = get_object_reader(self.storage.project_dir).resolve("HEAD")
+        return commit or "unknown"
 
     def capture_baselines(
         self,
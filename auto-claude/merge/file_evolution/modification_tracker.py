@@ -15,6 +15,7 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from ..git_object_reader import get_object_reader
 from ..semantic_analyzer import SemanticAnalyzer
 from ..types import FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
@@ -129,6 +130,7 @@ class ModificationTracker:
         task_id: str,
         worktree_path: Path,
         evolutions: dict[str, FileEvolution],
+        base_ref: str = "main",
     ) -> None:
         """
         Refresh task snapshots by analyzing git diff from worktree.
@@ -140,24 +142,27 @@ class ModificationTracker:
             task_id: The task identifier
             worktree_path: Path to the task's worktree
             evolutions: Current evolution data (will be updated)
+            base_ref: Branch or commit the task branched from
         """
         debug(
             MODULE,
             f"refresh_from_git() for task {task_id}",
             task_id=task_id,
             worktree_path=str(worktree_path),
+            base_ref=base_ref,
         )
 
         try:
             # Get list of files changed in the worktree
             result = subprocess.run(
-                ["git", "diff", "--name-only", "main...HEAD"],
+                ["git", "diff", "--name-only", f"{base_ref}...HEAD"],
                 cwd=worktree_path,
                 capture_output=True,
                 text=True,
                 check=True,
             )
             changed_files = [f for f in result.stdout.strip().split("\n") if f]
+            reader = get_object_reader(worktree_path)
 
             debug(
                 MODULE,
@@ -170,26 +175,16 @@ class ModificationTracker:
             for file_path in changed_files:
                 # Get the diff for this file
                 diff_result = subprocess.run(
-                    ["git", "diff", "main...HEAD", "--", file_path],
+                    ["git", "diff", f"{base_ref}...HEAD", "--", file_path],
                     cwd=worktree_path,
                     capture_output=True,
                     text=True,
                     check=True,
                 )
 
-                # Get content before (from main) and after (current)
-                try:
-                    show_result = subprocess.run(
-                        ["git", "show", f"main:{file_path}"],
-                        cwd=worktree_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    old_content = show_result.stdout
-                except subprocess.CalledProcessError:
-                    # File is new
-                    old_content = ""
+                # Get content before (from the base) and after (current).
+                # A missing blob means the file is new.
+                old_content = reader.read_file(base_ref, file_path) or ""
 
                 current_file = worktree_path / file_path
                 if current_file.exists():
@@ -326,6 +326,7 @@ class FileEvolutionTracker:
         self,
         task_id: str,
         worktree_path: Path,
+        base_ref: str = "main",
     ) -> None:
         """
         Refresh task snapshots by analyzing git diff from worktree.
@@ -336,10 +337,12 @@ class FileEvolutionTracker:
         Args:
             task_id: The task identifier
             worktree_path: Path to the task's worktree
+            base_ref: Branch or commit the task branched from
         """
         self.modification_tracker.refresh_from_git(
             task_id=task_id,
             worktree_path=worktree_path,
             evolutions=self._evolutions,
+            base_ref=base_ref,
         )
         self._save_evolutions()
@@ -0,0 +1,337 @@
+"""
+Git Object Reader
+=================
+
+Long-lived ``git cat-file --batch`` reader shared by the merge and workspace code.
+
+Reading a file at a ref used to mean forking ``git show <ref>:<path>`` for every
+file. On large merges that is hundreds of short-lived processes. This module keeps
+one ``git cat-file --batch-check`` and one ``git cat-file --batch`` process per
+repository, and caches blob contents by SHA so the same object is only transferred
+once.
+
+Usage:
+    from merge.git_object_reader import get_object_reader
+
+    reader = get_object_reader(project_dir)
+    content = reader.read_file("main", "src/App.tsx")
+    head_sha = reader.resolve("HEAD")
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Default number of blobs kept in each reader's LRU cache
+DEFAULT_CACHE_SIZE = 512
+
+# Blobs larger than this are returned but never cached
+MAX_CACHED_BLOB_BYTES = 2 * 1024 * 1024
+
+# Readers kept open at once; the least recently used one is closed beyond this
+MAX_OPEN_READERS = 16
+
+
+@dataclass
+class ObjectReaderStats:
+    """Counters for verifying how many git forks a reader saved."""
+
+    lookups: int = 0
+    cache_hits: int = 0
+    processes_spawned: int = 0
+    fallback_forks: int = 0
+
+    @property
+    def forks_avoided(self) -> int:
+        """Lookups that would have forked ``git show`` but did not."""
+        return max(0, self.lookups - self.processes_spawned - self.fallback_forks)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["forks_avoided"] = self.forks_avoided
+        return data
+
+
+def _normalize_newlines(text: str) -> str:
+    """Match the universal-newline decoding of ``subprocess.run(text=True)``."""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _BatchProcess:
+    """One ``git cat-file`` process in either --batch or --batch-check mode."""
+
+    def __init__(self, repo_path: Path, mode: str, stats: ObjectReaderStats):
+        self.repo_path = repo_path
+        self.mode = mode
+        self.stats = stats
+        self._proc: subprocess.Popen | None = None
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", self.mode],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self.stats.processes_spawned += 1
+        return self._proc
+
+    def query(self, spec: str) -> tuple[str, str, int, bytes | None] | None:
+        """
+        Send one object spec and read the response.
+
+        Returns:
+            (sha, type, size, content) where content is None in --batch-check
+            mode, or None if the object does not exist.
+        """
+        proc = self._ensure_started()
+        proc.stdin.write(spec.encode("utf-8") + b"\n")
+        proc.stdin.flush()
+
+        header = proc.stdout.readline()
+        if not header:
+            raise OSError("git cat-file exited unexpectedly")
+
+        parts = header.decode("utf-8", errors="replace").rstrip("\n").split(" ")
+        if len(parts) != 3 or parts[-1] in ("missing", "ambiguous"):
+            return None
+
+        sha, obj_type, size_str = parts
+        size = int(size_str)
+        content = None
+        if self.mode == "--batch":
+            content = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing newline
+        return sha, obj_type, size, content
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            if self._proc.stdin:
+                self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except Exception:
+            self._proc.kill()
+        self._proc = None
+
+
+class GitObjectReader:
+    """
+    Thread-safe reader for git objects backed by persistent cat-file processes.
+
+    One instance exists per repository path (see get_object_reader). Blob
+    contents are cached by SHA, so reading the same file at two refs that
+    point to the same blob only transfers it once.
+    """
+
+    def __init__(self, repo_path: Path, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            repo_path: Repository (or worktree) directory to run git in
+            cache_size: Maximum number of blobs kept in the LRU cache
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.cache_size = cache_size
+        self.stats = ObjectReaderStats()
+        self._lock = threading.Lock()
+        self._check = _BatchProcess(self.repo_path, "--batch-check", self.stats)
+        self._batch = _BatchProcess(self.repo_path, "--batch", self.stats)
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+
+    def resolve(self, rev: str) -> str | None:
+        """
+        Resolve a revision (ref, commit, or ``ref:path``) to an object SHA.
+
+        Args:
+            rev: Anything ``git rev-parse`` accepts
+
+        Returns:
+            The object SHA, or None if it does not exist
+        """
+        with self._lock:
+            self.stats.lookups += 1
+            info = self._query_check(rev)
+        return info[0] if info else None
+
+    def read_blob(self, rev: str) -> bytes | None:
+        """
+        Read raw blob bytes for a revision such as ``main:src/app.py``.
+
+        Args:
+            rev: Object spec naming a blob
+
+        Returns:
+            Blob content, or None if the object does not exist or is not a blob
+        """
+        with self._lock:
+            self.stats.lookups += 1
+            info = self._query_check(rev)
+            if info is None:
+                return None
+            sha, obj_type, _size = info
+            if obj_type != "blob":
+                return None
+
+            cached = self._cache.get(sha)
+            if cached is not None:
+                self._cache.move_to_end(sha)
+                self.stats.cache_hits += 1
+                return cached
+
+            try:
+                result = self._batch.query(sha)
+            except OSError as e:
+                logger.debug(f"git cat-file --batch failed for {rev}: {e}")
+                self._batch.close()
+                return self._fallback_show(rev)
+            if result is None:
+                return None
+
+            content = result[3]
+            if len(content) <= MAX_CACHED_BLOB_BYTES:
+                self._cache[sha] = content
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return content
+
+    def read_file(self, ref: str, file_path: str) -> str | None:
+        """
+        Read a file's text at a ref, equivalent to ``git show <ref>:<path>``.
+
+        Args:
+            ref: Branch, tag, or commit
+            file_path: Path relative to the repository root
+
+        Returns:
+            Decoded file content, or None if the file doesn't exist at that ref
+        """
+        if "\n" in file_path or "\n" in ref:
+            # cat-file reads one spec per line; use a one-off fork instead
+            with self._lock:
+                self.stats.lookups += 1
+                content = self._fallback_show(f"{ref}:{file_path}")
+        else:
+            content = self.read_blob(f"{ref}:{file_path}")
+        if content is None:
+            return None
+        return _normalize_newlines(content.decode("utf-8", errors="replace"))
+
+    def clear_cache(self) -> None:
+        """Drop all cached blob contents."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Terminate the cat-file processes (they restart on next use)."""
+        with self._lock:
+            self._check.close()
+            self._batch.close()
+
+    def _query_check(self, rev: str) -> tuple[str, str, int] | None:
+        """Run a --batch-check lookup. Caller must hold the lock."""
+        if "\n" in rev:
+            return None
+        try:
+            result = self._check.query(rev)
+        except OSError as e:
+            logger.debug(f"git cat-file --batch-check failed for {rev}: {e}")
+            self._check.close()
+            return None
+        if result is None:
+            return None
+        return result[0], result[1], result[2]
+
+    def _fallback_show(self, rev: str) -> bytes | None:
+        """Read an object with a one-off ``git show``. Caller must hold the lock."""
+        self.stats.fallback_forks += 1
+        try:
+            result = subprocess.run(
+                ["git", "show", rev],
+                cwd=self.repo_path,
+                capture_output=True,
+            )
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout
+
+
+_readers: OrderedDict[Path, GitObjectReader] = OrderedDict()
+_readers_lock = threading.Lock()
+
+
+def get_object_reader(repo_path: Path | str) -> GitObjectReader:
+    """
+    Get the shared GitObjectReader for a repository, creating it if needed.
+
+    At most MAX_OPEN_READERS are kept; creating another closes the least
+    recently used one.
+
+    Args:
+        repo_path: Repository or worktree directory
+
+    Returns:
+        The reader for that directory
+    """
+    key = Path(repo_path).resolve()
+    evicted = []
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = GitObjectReader(key)
+            _readers[key] = reader
+            while len(_readers) > MAX_OPEN_READERS:
+                evicted.append(_readers.popitem(last=False)[1])
+        else:
+            _readers.move_to_end(key)
+    for old in evicted:
+        old.close()
+    return reader
+
+
+def close_reader(repo_path: Path | str) -> None:
+    """
+    Close and forget the reader for a repository, if there is one.
+
+    Call this before deleting a worktree, so its cat-file processes don't
+    outlive the directory.
+
+    Args:
+        repo_path: Repository or worktree directory
+    """
+    with _readers_lock:
+        reader = _readers.pop(Path(repo_path).resolve(), None)
+    if reader is not None:
+        reader.close()
+
+
+def get_reader_stats() -> dict[str, dict]:
+    """Get stats for every active reader, keyed by repository path."""
+    with _readers_lock:
+        return {str(path): reader.stats.to_dict() for path, reader in _readers.items()}
+
+
+def close_all_readers() -> None:
+    """Close every reader's processes and forget them."""
+    with _readers_lock:
+        readers = list(_readers.values())
+        _readers.clear()
+    for reader in readers:
+        reader.close()
+
+
+atexit.register(close_all_readers)
@@ -15,6 +15,8 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+from .git_object_reader import get_object_reader
+
 
 def find_worktree(project_dir: Path, task_id: str) -> Path | None:
     """
@@ -65,14 +67,4 @@ def get_file_from_branch(project_dir: Path, file_path: str, branch: str) -> str
     Returns:
         File content as string, or None if file doesn't exist on branch
     """
-    try:
-        result = subprocess.run(
-            ["git", "show", f"{branch}:{file_path}"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
-        return None
+    return get_object_reader(project_dir).read_file(branch, file_path)
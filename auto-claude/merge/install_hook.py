@@ -42,7 +42,21 @@ if [[ "$BRANCH" == "main" ]] || [[ "$BRANCH" == "master" ]]; then
             exit 0
         fi
 
-        # Try to notify the tracker
+        # If the tracker daemon is running, just hand it the commit hash.
+        # It batches bursts (rebases, cherry-picks) into one update.
+        SOCKET=".auto-claude/tracker.sock"
+        if [[ -S "$SOCKET" ]] && $PYTHON -c '
+import socket, sys
+s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+s.settimeout(1)
+s.connect(sys.argv[1])
+s.sendall(("commit " + sys.argv[2] + "\\n").encode())
+s.close()
+' "$SOCKET" "$COMMIT_HASH" 2>/dev/null; then
+            exit 0
+        fi
+
+        # Otherwise notify the tracker directly
         # Run in background to avoid slowing down commits
         ($PYTHON -m auto_claude.merge.tracker_cli notify-commit "$COMMIT_HASH" 2>/dev/null &) &
 
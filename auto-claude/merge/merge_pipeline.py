@@ -9,17 +9,20 @@ This module handles the pipeline for merging a single file:
 - Detecting conflicts
 - Determining merge strategy (single task vs. multi-task)
 - Coordinating conflict resolution
+- Deterministic (AI-free) merges for worker processes
 """
 
 from __future__ import annotations
 
 import logging
 
+from .auto_merger import AutoMerger
 from .conflict_detector import ConflictDetector
 from .conflict_resolver import ConflictResolver
 from .file_merger import apply_single_task_changes, combine_non_conflicting_changes
 from .types import (
     ChangeType,
+    ConflictSeverity,
     FileAnalysis,
     MergeDecision,
     MergeResult,
@@ -28,6 +31,12 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Conflict severities the ConflictResolver hands to the AI resolver
+AI_RESOLVABLE_SEVERITIES = {ConflictSeverity.MEDIUM, ConflictSeverity.HIGH}
+
+# Per-process pipeline used by merge_file_deterministic
+_deterministic_pipeline: MergePipeline | None = None
+
 
 class MergePipeline:
     """
@@ -146,3 +155,83 @@ class MergePipeline:
             analyses[snapshot.task_id] = analysis
 
         return analyses
+
+
+def needs_ai_resolution(result: MergeResult) -> bool:
+    """
+    Check whether a deterministic merge result left work for the AI resolver.
+
+    Args:
+        result: Result from a pipeline with AI disabled
+
+    Returns:
+        True if an AI-enabled pipeline would try to resolve a remaining conflict
+    """
+    return any(
+        conflict.severity in AI_RESOLVABLE_SEVERITIES
+        for conflict in result.conflicts_remaining
+    )
+
+
+def build_deterministic_pipeline(
+    conflict_detector: ConflictDetector | None = None,
+    auto_merger: AutoMerger | None = None,
+) -> MergePipeline:
+    """
+    Build a pipeline that never calls the AI resolver.
+
+    Args:
+        conflict_detector: Detector to use (default: a new ConflictDetector)
+        auto_merger: Merger to use (default: a new AutoMerger)
+
+    Returns:
+        MergePipeline with AI resolution disabled
+    """
+    return MergePipeline(
+        conflict_detector=conflict_detector or ConflictDetector(),
+        conflict_resolver=ConflictResolver(
+            auto_merger=auto_merger or AutoMerger(),
+            ai_resolver=None,
+            enable_ai=False,
+        ),
+    )
+
+
+def init_deterministic_worker(
+    conflict_detector: ConflictDetector | None = None,
+    auto_merger: AutoMerger | None = None,
+) -> None:
+    """Process pool initializer: set up this worker's deterministic pipeline."""
+    global _deterministic_pipeline
+    _deterministic_pipeline = build_deterministic_pipeline(
+        conflict_detector, auto_merger
+    )
+
+
+def merge_file_deterministic(
+    file_path: str,
+    baseline_content: str,
+    task_snapshots: list[TaskSnapshot],
+) -> MergeResult:
+    """
+    Merge a file using only conflict detection and AutoMerger.
+
+    Module-level so it can run in a worker process. Each process builds its
+    pipeline once (see init_deterministic_worker) and reuses it for every
+    file it is given.
+
+    Args:
+        file_path: Path to the file
+        baseline_content: Original baseline content
+        task_snapshots: Snapshots from tasks that modified this file
+
+    Returns:
+        MergeResult; check needs_ai_resolution() before treating it as final
+    """
+    if _deterministic_pipeline is None:
+        init_deterministic_worker()
+    return _deterministic_pipeline.merge_file(
+        file_path=file_path,
+        baseline_content=baseline_content,
+        task_snapshots=task_snapshots,
+    )
@@ -89,6 +89,7 @@ class MergeReport:
     stats: MergeStats = field(default_factory=MergeStats)
     success: bool = True
     error: str | None = None
+    stage_timings: dict[str, float] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -104,6 +105,7 @@ class MergeReport:
             "stats": self.stats.to_dict(),
             "success": self.success,
             "error": self.error,
+            "stage_timings": self.stage_timings,
         }
 
     def save(self, path: Path) -> None:
@@ -18,18 +18,30 @@ with maximum automation and minimum AI token usage.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from .ai_resolver import AIResolver, create_claude_resolver
+from .ai_resolver import AIResolver, ResolutionCache, create_claude_resolver
 from .auto_merger import AutoMerger
 from .conflict_detector import ConflictDetector
 from .conflict_resolver import ConflictResolver
 from .file_evolution import FileEvolutionTracker
+from .file_merger import extract_location_content
 from .git_utils import find_worktree, get_file_from_branch
-from .merge_pipeline import MergePipeline
+from .merge_pipeline import (
+    AI_RESOLVABLE_SEVERITIES,
+    MergePipeline,
+    build_deterministic_pipeline,
+    init_deterministic_worker,
+    merge_file_deterministic,
+    needs_ai_resolution,
+)
 
 # Re-export models for backwards compatibility
 from .models import MergeReport, MergeStats, TaskMergeRequest
@@ -38,6 +50,8 @@ from .types import (
     ConflictRegion,
     FileAnalysis,
     MergeDecision,
+    MergeResult,
+    TaskSnapshot,
 )
 
 # Import debug utilities
@@ -82,6 +96,12 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.orchestrator"
 
+# Default cap on concurrent AI conflict resolutions
+MAX_PARALLEL_AI_RESOLUTIONS = 5
+
+# Below this many files a process pool costs more than it saves
+MIN_FILES_FOR_PROCESS_POOL = 4
+
 # Export all public classes for backwards compatibility
 __all__ = [
     "MergeOrchestrator",
@@ -119,6 +139,8 @@ class MergeOrchestrator:
         enable_ai: bool = True,
         ai_resolver: AIResolver | None = None,
         dry_run: bool = False,
+        max_workers: int = 1,
+        max_concurrent_ai: int = MAX_PARALLEL_AI_RESOLUTIONS,
     ):
         """
         Initialize the merge orchestrator.
@@ -129,6 +151,9 @@ class MergeOrchestrator:
             enable_ai: Whether to use AI for ambiguous conflicts
             ai_resolver: Optional pre-configured AI resolver
             dry_run: If True, don't write any files
+            max_workers: Worker processes for the deterministic merge stage
+                (conflict detection and auto-merge). 1 runs it in-process.
+            max_concurrent_ai: Maximum AI resolutions in flight at once
         """
         debug_section(MODULE, "Initializing MergeOrchestrator")
         debug(
@@ -143,6 +168,8 @@ class MergeOrchestrator:
         self.storage_dir = storage_dir or (self.project_dir / ".auto-claude")
         self.enable_ai = enable_ai
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers)
+        self.max_concurrent_ai = max(1, max_concurrent_ai)
 
         # Initialize components
         debug_detailed(MODULE, "Initializing sub-components...")
@@ -176,7 +203,9 @@ class MergeOrchestrator:
         """Get the AI resolver, initializing if needed."""
         if not self._ai_resolver_initialized:
             if self.enable_ai:
-                self._ai_resolver = create_claude_resolver()
+                self._ai_resolver = create_claude_resolver(
+                    cache=ResolutionCache(self.storage_dir / "ai_resolution_cache")
+                )
             else:
                 self._ai_resolver = AIResolver()  # No AI function
             self._ai_resolver_initialized = True
@@ -246,7 +275,9 @@ class MergeOrchestrator:
 
             # Ensure evolution data is up to date
             debug(MODULE, "Refreshing evolution data from git...")
+            stage_start = time.perf_counter()
             self.evolution_tracker.refresh_from_git(task_id, worktree_path)
+            report.stage_timings["refresh"] = time.perf_counter() - stage_start
 
             # Get files modified by this task
             modifications = self.evolution_tracker.get_task_modifications(task_id)
@@ -262,24 +293,11 @@ class MergeOrchestrator:
                 return report
 
             # Process each modified file
-            for file_path, snapshot in modifications:
-                debug_detailed(
-                    MODULE,
-                    f"Processing file: {file_path}",
-                    changes=len(snapshot.semantic_changes),
-                )
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=[snapshot],
-                    target_branch=target_branch,
-                )
-                report.file_results[file_path] = result
-                self._update_stats(report.stats, result)
-                debug_verbose(
-                    MODULE,
-                    f"File merge result: {result.decision.value}",
-                    file=file_path,
-                )
+            self._merge_files(
+                [(file_path, [snapshot]) for file_path, snapshot in modifications],
+                target_branch,
+                report,
+            )
 
             report.success = report.stats.files_failed == 0
 
@@ -314,6 +332,7 @@ class MergeOrchestrator:
         self,
         requests: list[TaskMergeRequest],
         target_branch: str = "main",
+        base_ref: str = "main",
     ) -> MergeReport:
         """
         Merge multiple tasks' changes.
@@ -324,6 +343,7 @@ class MergeOrchestrator:
         Args:
             requests: List of merge requests (one per task)
             target_branch: Branch to merge into
+            base_ref: Branch or commit the tasks branched from
 
         Returns:
             MergeReport with combined results
@@ -339,17 +359,19 @@ class MergeOrchestrator:
             requests = sorted(requests, key=lambda r: -r.priority)
 
             # Refresh evolution data for all tasks
+            stage_start = time.perf_counter()
             for request in requests:
                 if request.worktree_path and request.worktree_path.exists():
                     self.evolution_tracker.refresh_from_git(
-                        request.task_id, request.worktree_path
+                        request.task_id, request.worktree_path, base_ref
                     )
+            report.stage_timings["refresh"] = time.perf_counter() - stage_start
 
             # Find all files modified by any task
             task_ids = [r.task_id for r in requests]
             file_tasks = self.evolution_tracker.get_files_modified_by_tasks(task_ids)
 
-            # Process each file
+            jobs: list[tuple[str, list[TaskSnapshot]]] = []
             for file_path, modifying_tasks in file_tasks.items():
                 # Get snapshots from all tasks that modified this file
                 evolution = self.evolution_tracker.get_file_evolution(file_path)
@@ -362,16 +384,11 @@ class MergeOrchestrator:
                     if evolution.get_task_snapshot(tid)
                 ]
 
-                if not snapshots:
-                    continue
+                if snapshots:
+                    jobs.append((file_path, snapshots))
 
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=snapshots,
-                    target_branch=target_branch,
-                )
-                report.file_results[file_path] = result
-                self._update_stats(report.stats, result)
+            # Process each file
+            self._merge_files(jobs, target_branch, report)
 
             report.success = report.stats.files_failed == 0
 
@@ -392,32 +409,181 @@ class MergeOrchestrator:
 
         return report
 
-    def _merge_file(
+    def _merge_files(
         self,
-        file_path: str,
-        task_snapshots: list,
+        jobs: list[tuple[str, list[TaskSnapshot]]],
         target_branch: str,
-    ):
+        report: MergeReport,
+    ) -> None:
         """
-        Merge changes from multiple tasks for a single file.
+        Merge a set of files and record the results on the report.
+
+        Runs in three stages:
+        1. Load baselines (in-process, uses the shared git object reader)
+        2. Deterministic merge of every file, in a process pool when
+           max_workers > 1
+        3. AI resolution for files the deterministic stage left conflicts in,
+           run concurrently up to max_concurrent_ai
+
+        Results are recorded in job order regardless of completion order.
 
         Args:
-            file_path: Path to the file
-            task_snapshots: Snapshots from tasks that modified this file
+            jobs: (file_path, task_snapshots) pairs in the order to report them
             target_branch: Branch to merge into
+            report: Report to populate
+        """
+        stage_start = time.perf_counter()
+        baselines = [
+            self._load_baseline(file_path, target_branch) for file_path, _ in jobs
+        ]
+        report.stage_timings["baseline"] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        results = self._run_deterministic_stage(jobs, baselines)
+        report.stage_timings["deterministic"] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        ai_indices = []
+        if self.enable_ai:
+            ai_indices = [i for i, r in enumerate(results) if needs_ai_resolution(r)]
+        if ai_indices:
+            self._prefetch_ai_resolutions(
+                [(baselines[i], jobs[i][1], results[i]) for i in ai_indices],
+                report,
+            )
+            ai_results = self._run_ai_stage(
+                [(jobs[i][0], baselines[i], jobs[i][1]) for i in ai_indices]
+            )
+            for i, result in zip(ai_indices, ai_results):
+                results[i] = result
+        report.stage_timings["ai"] = time.perf_counter() - stage_start
+
+        for (file_path, _), result in zip(jobs, results):
+            report.file_results[file_path] = result
+            self._update_stats(report.stats, result)
+            debug_verbose(
+                MODULE,
+                f"File merge result: {result.decision.value}",
+                file=file_path,
+            )
 
-        Returns:
-            MergeResult with merged content or conflict info
+    def _run_deterministic_stage(
+        self,
+        jobs: list[tuple[str, list[TaskSnapshot]]],
+        baselines: list[str],
+    ) -> list[MergeResult]:
+        """Run conflict detection and auto-merge for every job."""
+        if self.max_workers > 1 and len(jobs) >= MIN_FILES_FOR_PROCESS_POOL:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, len(jobs)),
+                    initializer=init_deterministic_worker,
+                    initargs=(self.conflict_detector, self.auto_merger),
+                ) as pool:
+                    return list(
+                        pool.map(
+                            merge_file_deterministic,
+                            [file_path for file_path, _ in jobs],
+                            baselines,
+                            [snapshots for _, snapshots in jobs],
+                        )
+                    )
+            except BrokenProcessPool as e:
+                debug_warning(
+                    MODULE, "Process pool failed, merging in-process", error=str(e)
+                )
+
+        pipeline = build_deterministic_pipeline(
+            self.conflict_detector, self.auto_merger
+        )
+        return [
+            pipeline.merge_file(
+                file_path=file_path,
+                baseline_content=baseline,
+                task_snapshots=snapshots,
+            )
+            for (file_path, snapshots), baseline in zip(jobs, baselines)
+        ]
+
+    def _prefetch_ai_resolutions(
+        self,
+        items: list[tuple[str, list[TaskSnapshot], MergeResult]],
+        report: MergeReport,
+    ) -> None:
+        """
+        Resolve every AI-bound conflict up front in cross-file batches.
+
+        The resolutions land in the AI resolver's cache, so the per-file
+        pipeline runs that follow pick them up without calling the AI again.
+
+        Args:
+            items: (baseline, task snapshots, deterministic result) per file
+            report: Report whose stats get the prefetch calls and tokens
         """
-        task_ids = [s.task_id for s in task_snapshots]
+        conflicts = [
+            (
+                conflict,
+                extract_location_content(baseline, conflict.location),
+                snapshots,
+            )
+            for baseline, snapshots, result in items
+            for conflict in result.conflicts_remaining
+            if conflict.severity in AI_RESOLVABLE_SEVERITIES
+        ]
+        prefetch = self.ai_resolver.prefetch_resolutions(
+            conflicts, max_concurrent=self.max_concurrent_ai
+        )
+        report.stats.ai_calls_made += prefetch.ai_calls_made
+        report.stats.estimated_tokens_used += prefetch.tokens_used
         debug(
             MODULE,
-            f"_merge_file: {file_path}",
-            tasks=task_ids,
-            target_branch=target_branch,
+            "Prefetched AI resolutions",
+            conflicts=prefetch.conflicts_requested,
+            cached=prefetch.already_cached,
+            resolved=prefetch.resolved,
+            ai_calls=prefetch.ai_calls_made,
         )
 
-        # Get baseline content
+    def _run_ai_stage(
+        self,
+        jobs: list[tuple[str, str, list[TaskSnapshot]]],
+    ) -> list[MergeResult]:
+        """
+        Re-run the full (AI-enabled) pipeline for files that need AI.
+
+        The AI call function is synchronous (it drives its own event loop),
+        so each file runs in a worker thread while a semaphore caps how many
+        are in flight.
+        """
+        debug(MODULE, f"Resolving {len(jobs)} file(s) with AI", files=len(jobs))
+        pipeline = self.merge_pipeline
+        semaphore_limit = self.max_concurrent_ai
+
+        async def _resolve_all() -> list[MergeResult]:
+            semaphore = asyncio.Semaphore(semaphore_limit)
+
+            async def _resolve(file_path, baseline, snapshots) -> MergeResult:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        pipeline.merge_file,
+                        file_path=file_path,
+                        baseline_content=baseline,
+                        task_snapshots=snapshots,
+                    )
+
+            return await asyncio.gather(*(_resolve(*job) for job in jobs))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return list(asyncio.run(_resolve_all()))
+
+        # Called from inside an event loop: run ours on a separate thread
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return list(runner.submit(asyncio.run, _resolve_all()).result())
+
+    def _load_baseline(self, file_path: str, target_branch: str) -> str:
+        """Get the baseline content a file's task changes apply to."""
         baseline_content = self.evolution_tracker.get_baseline_content(file_path)
         if baseline_content is None:
             # Try to get from target branch
@@ -428,13 +594,7 @@ class MergeOrchestrator:
         if baseline_content is None:
             # File is new - created by task(s)
             baseline_content = ""
-
-        # Delegate to merge pipeline
-        return self.merge_pipeline.merge_file(
-            file_path=file_path,
-            baseline_content=baseline_content,
-            task_snapshots=task_snapshots,
-        )
+        return baseline_content
 
     def get_pending_conflicts(self) -> list[tuple[str, list[ConflictRegion]]]:
         """
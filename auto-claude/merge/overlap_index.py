@@ -0,0 +1,81 @@
+"""
+Overlap Index
+=============
+
+Sweep-line index for finding overlapping line ranges.
+
+Conflict detection groups changes by their location string, which misses
+changes from different tasks that touch the same lines under different
+names (a class and one of its methods, a function that was converted to
+a variable). Comparing every pair of ranges to catch those is quadratic
+in the number of changes. This index sorts the ranges once and sweeps
+them with a heap of "open" ranges, reporting all k overlapping pairs in
+O((n + k) log n).
+
+Usage:
+    index = OverlapIndex()
+    for task_id, change in changes:
+        index.add(change.line_start, change.line_end, (task_id, change))
+    for (task_a, a), (task_b, b) in index.overlapping_pairs():
+        ...
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class OverlapIndex(Generic[T]):
+    """
+    Collection of inclusive line ranges with attached items.
+
+    Two ranges overlap when they share at least one line, matching
+    SemanticChange.overlaps_with().
+    """
+
+    def __init__(self) -> None:
+        self._intervals: list[tuple[int, int, T]] = []
+
+    def add(self, start: int, end: int, item: T) -> None:
+        """
+        Add a range.
+
+        Args:
+            start: First line (inclusive)
+            end: Last line (inclusive); values below start are treated as start
+            item: Payload returned in overlapping pairs
+        """
+        self._intervals.append((start, max(start, end), item))
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def overlapping_pairs(self) -> Iterator[tuple[T, T]]:
+        """
+        Yield every pair of items whose ranges overlap.
+
+        Within a pair, the item whose range starts first (or was added
+        first, on ties) comes first. Pairs are yielded in sweep order,
+        which is deterministic for a given set of ranges.
+
+        Yields:
+            (item_a, item_b) tuples
+        """
+        order = sorted(
+            range(len(self._intervals)),
+            key=lambda i: (self._intervals[i][0], self._intervals[i][1], i),
+        )
+        # Min-heap of (end, index) for ranges that may still overlap later ones
+        active: list[tuple[int, int]] = []
+
+        for i in order:
+            start, end, item = self._intervals[i]
+            while active and active[0][0] < start:
+                heapq.heappop(active)
+            for _, j in sorted(active, key=lambda entry: entry[1]):
+                yield self._intervals[j][2], item
+            heapq.heappush(active, (end, i))
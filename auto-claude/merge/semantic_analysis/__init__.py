@@ -3,12 +3,14 @@ Semantic analyzer package for AST-based code analysis.
 
 This package provides modular semantic analysis capabilities:
 - models.py: Data structures for extracted elements
+- line_index.py: Byte offset to line number lookup
 - python_analyzer.py: Python-specific AST extraction
 - js_analyzer.py: JavaScript/TypeScript-specific AST extraction
 - comparison.py: Element comparison and change classification
 - regex_analyzer.py: Fallback regex-based analysis
 """
 
+from .line_index import LineIndex
 from .models import ExtractedElement
 
-__all__ = ["ExtractedElement"]
+__all__ = ["ExtractedElement", "LineIndex"]
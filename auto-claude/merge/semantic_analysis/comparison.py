@@ -46,6 +46,7 @@ def compare_elements(
                     line_end=elem_before.end_line,
                     content_before=elem_before.content,
                     content_after=None,
+                    metadata=base_lines(elem_before),
                 )
             )
 
@@ -77,12 +78,33 @@ def compare_elements(
                         line_end=elem_after.end_line,
                         content_before=elem_before.content,
                         content_after=elem_after.content,
+                        metadata=base_lines(elem_before),
                     )
                 )
 
     return changes
 
 
+def base_lines(elem_before: ExtractedElement) -> dict[str, int]:
+    """
+    Metadata recording where a changed element was before the change.
+
+    line_start/line_end of a modification are in the task's edited file;
+    these lines are in the file every task started from, so changes from
+    different tasks can be compared by position.
+
+    Args:
+        elem_before: The element in the before version
+
+    Returns:
+        Metadata dict with base_line_start and base_line_end
+    """
+    return {
+        "base_line_start": elem_before.start_line,
+        "base_line_end": elem_before.end_line,
+    }
+
+
 def get_add_change_type(element_type: str) -> ChangeType:
     """
     Map element type to add change type.
@@ -0,0 +1,197 @@
+"""
+Incremental reparsing support for before/after diffs.
+
+Most task diffs touch a few hunks of a large file. Instead of parsing the
+``after`` content from scratch, the cached ``before`` tree is edited with
+the diff's hunks and reparsed incrementally. Only the top-level nodes that
+differ between the two trees are then handed to the element extractors.
+"""
+
+from __future__ import annotations
+
+import difflib
+from dataclasses import dataclass
+from itertools import accumulate
+
+from .line_index import LineIndex
+from .models import ExtractedElement
+
+try:
+    from tree_sitter import Node, Tree
+except ImportError:
+    Node = None
+    Tree = None
+
+
+@dataclass
+class ParsedSource:
+    """A parsed file with its elements grouped by top-level node."""
+
+    source_bytes: bytes
+    tree: Tree
+    line_index: LineIndex
+    child_elements: list[dict[str, ExtractedElement]]
+    key_owners: dict[str, list[int]]
+
+    def merged_elements(self) -> dict[str, ExtractedElement]:
+        """Combine per-node elements the way a single full extraction would."""
+        merged: dict[str, ExtractedElement] = {}
+        for elements in self.child_elements:
+            merged.update(elements)
+        return merged
+
+
+@dataclass
+class TextEdit:
+    """One diff hunk expressed in the coordinates tree-sitter expects."""
+
+    start_byte: int
+    old_end_byte: int
+    new_end_byte: int
+    start_point: tuple[int, int]
+    old_end_point: tuple[int, int]
+    new_end_point: tuple[int, int]
+
+
+class NodeSubset:
+    """Stand-in for a node that only exposes some of a node's children."""
+
+    def __init__(self, children: list[Node]):
+        self.children = children
+
+
+def compute_line_edits(
+    before_bytes: bytes,
+    after_bytes: bytes,
+    before_index: LineIndex,
+) -> list[TextEdit]:
+    """
+    Derive tree-sitter edits from a line diff of the two versions.
+
+    Edits are returned last-to-first so each one can be applied with the
+    original ``before`` offsets: applying a later hunk first never moves
+    the bytes an earlier hunk refers to.
+    """
+    before_lines = before_bytes.splitlines(keepends=True)
+    after_lines = after_bytes.splitlines(keepends=True)
+    before_starts = [0, *accumulate(len(line) for line in before_lines)]
+    after_starts = [0, *accumulate(len(line) for line in after_lines)]
+
+    # Trim the common prefix and suffix so the matcher only sees the window
+    # that actually differs
+    prefix = 0
+    limit = min(len(before_lines), len(after_lines))
+    while prefix < limit and before_lines[prefix] == after_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and before_lines[-1 - suffix] == after_lines[-1 - suffix]:
+        suffix += 1
+
+    matcher = difflib.SequenceMatcher(
+        None,
+        before_lines[prefix : len(before_lines) - suffix],
+        after_lines[prefix : len(after_lines) - suffix],
+    )
+    edits = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        i1, i2, j1, j2 = i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix
+        start = before_starts[i1]
+        old_end = before_starts[i2]
+        inserted = after_bytes[after_starts[j1] : after_starts[j2]]
+        start_point = before_index.point_for_byte(start)
+
+        rows = inserted.count(b"\n")
+        if rows:
+            new_end_col = len(inserted) - inserted.rfind(b"\n") - 1
+        else:
+            new_end_col = start_point[1] + len(inserted)
+
+        edits.append(
+            TextEdit(
+                start_byte=start,
+                old_end_byte=old_end,
+                new_end_byte=start + len(inserted),
+                start_point=start_point,
+                old_end_point=before_index.point_for_byte(old_end),
+                new_end_point=(start_point[0] + rows, new_end_col),
+            )
+        )
+
+    edits.reverse()
+    return edits
+
+
+def reparse_incrementally(
+    parser,
+    before: ParsedSource,
+    after_bytes: bytes,
+) -> tuple[Tree, Tree]:
+    """
+    Apply the diff to a copy of the before tree and reparse the after text.
+
+    Returns:
+        (edited_before_tree, after_tree). The edited tree's top-level node
+        positions are shifted into ``after`` coordinates.
+    """
+    edited = before.tree.copy()
+    for edit in compute_line_edits(before.source_bytes, after_bytes, before.line_index):
+        edited.edit(
+            start_byte=edit.start_byte,
+            old_end_byte=edit.old_end_byte,
+            new_end_byte=edit.new_end_byte,
+            start_point=edit.start_point,
+            old_end_point=edit.old_end_point,
+            new_end_point=edit.new_end_point,
+        )
+    return edited, parser.parse(after_bytes, old_tree=edited)
+
+
+def partition_top_level(
+    before: ParsedSource,
+    edited_tree: Tree,
+    after_tree: Tree,
+    after_bytes: bytes,
+) -> tuple[list[int], list[Node]]:
+    """
+    Split top-level nodes into unchanged pairs and changed nodes.
+
+    A before node is unchanged when, after shifting through the edits, an
+    after node of the same type sits at the same position with identical
+    text.
+
+    Returns:
+        (changed_before_indices, changed_after_nodes), both in source order
+    """
+    after_children = after_tree.root_node.children
+    after_by_span = {
+        (node.start_byte, node.end_byte, node.type): idx
+        for idx, node in enumerate(after_children)
+    }
+    before_children = before.tree.root_node.children
+    shifted_children = edited_tree.root_node.children
+
+    changed_before = []
+    unchanged_after = set()
+    last_match = -1
+    for idx, (orig, shifted) in enumerate(zip(before_children, shifted_children)):
+        match = after_by_span.get((shifted.start_byte, shifted.end_byte, shifted.type))
+        # Pairs must stay in source order so "last definition wins" agrees
+        # between the two sides
+        if (
+            match is not None
+            and match > last_match
+            and before.source_bytes[orig.start_byte : orig.end_byte]
+            == after_bytes[shifted.start_byte : shifted.end_byte]
+        ):
+            unchanged_after.add(match)
+            last_match = match
+        else:
+            changed_before.append(idx)
+
+    changed_after = [
+        node for idx, node in enumerate(after_children) if idx not in unchanged_after
+    ]
+    return changed_before, changed_after
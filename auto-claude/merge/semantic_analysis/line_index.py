@@ -0,0 +1,42 @@
+"""
+Byte offset to line number lookup for extracted elements.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+
+class LineIndex:
+    """
+    Precomputed newline offsets for a source buffer.
+
+    Tree-sitter reports positions as byte offsets. Counting newlines in
+    the prefix for every element is O(file size) per lookup, so large files
+    become quadratic. This builds the offset table once and answers each
+    lookup with a binary search.
+    """
+
+    def __init__(self, source_bytes: bytes):
+        """
+        Build the newline table.
+
+        Args:
+            source_bytes: UTF-8 encoded source the byte offsets refer to
+        """
+        offsets = []
+        pos = source_bytes.find(b"\n")
+        while pos != -1:
+            offsets.append(pos)
+            pos = source_bytes.find(b"\n", pos + 1)
+        self._newline_offsets = offsets
+
+    def line_for_byte(self, byte_pos: int) -> int:
+        """Convert a byte position to a 1-indexed line number."""
+        return bisect_left(self._newline_offsets, byte_pos) + 1
+
+    def point_for_byte(self, byte_pos: int) -> tuple[int, int]:
+        """Convert a byte position to a 0-indexed (row, column) point."""
+        row = bisect_left(self._newline_offsets, byte_pos)
+        line_start = self._newline_offsets[row - 1] + 1 if row > 0 else 0
+        return row, byte_pos - line_start
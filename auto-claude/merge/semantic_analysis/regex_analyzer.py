@@ -41,22 +41,27 @@ def analyze_with_regex(
 
     # Analyze the diff for patterns
     added_lines: list[tuple[int, str]] = []
-    removed_lines: list[tuple[int, str]] = []
+    # (line in the after version, line in the before version, text)
+    removed_lines: list[tuple[int, int, str]] = []
     current_line = 0
+    before_line = 0
 
     for line in diff:
         if line.startswith("@@"):
             # Parse the line numbers
-            match = re.match(r"@@ -\d+(?:,\d+)? \+(\d+)", line)
+            match = re.match(r"@@ -(\d+)(?:,\d+)? \+(\d+)", line)
             if match:
-                current_line = int(match.group(1))
+                before_line = int(match.group(1))
+                current_line = int(match.group(2))
         elif line.startswith("+") and not line.startswith("+++"):
             added_lines.append((current_line, line[1:]))
             current_line += 1
         elif line.startswith("-") and not line.startswith("---"):
-            removed_lines.append((current_line, line[1:]))
+            removed_lines.append((current_line, before_line, line[1:]))
+            before_line += 1
         elif not line.startswith("-"):
             current_line += 1
+            before_line += 1
 
     # Detect imports
     import_pattern = get_import_pattern(ext)
@@ -73,7 +78,7 @@ def analyze_with_regex(
                 )
             )
 
-    for line_num, line in removed_lines:
+    for line_num, before_num, line in removed_lines:
         if import_pattern and import_pattern.match(line.strip()):
             changes.append(
                 SemanticChange(
@@ -83,6 +88,10 @@ def analyze_with_regex(
                     line_start=line_num,
                     line_end=line_num,
                     content_before=line,
+                    metadata={
+                        "base_line_start": before_num,
+                        "base_line_end": before_num,
+                    },
                 )
             )
 
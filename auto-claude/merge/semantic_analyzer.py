@@ -14,10 +14,12 @@ When tree-sitter is not available, falls back to regex-based heuristics.
 from __future__ import annotations
 
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
-from .types import ChangeType, FileAnalysis
+from .types import ChangeType, FileAnalysis, compute_content_hash
 
 # Import debug utilities
 try:
@@ -94,6 +96,13 @@ if TREE_SITTER_AVAILABLE:
 
 # Import our modular components
 from .semantic_analysis.comparison import compare_elements
+from .semantic_analysis.incremental import (
+    NodeSubset,
+    ParsedSource,
+    partition_top_level,
+    reparse_incrementally,
+)
+from .semantic_analysis.line_index import LineIndex
 from .semantic_analysis.models import ExtractedElement
 from .semantic_analysis.regex_analyzer import analyze_with_regex
 
@@ -101,6 +110,12 @@ if TREE_SITTER_AVAILABLE:
     from .semantic_analysis.js_analyzer import extract_js_elements
     from .semantic_analysis.python_analyzer import extract_python_elements
 
+# Number of parsed element maps kept per analyzer, keyed by content hash
+DEFAULT_ELEMENT_CACHE_SIZE = 256
+
+# Number of baseline syntax trees kept for incremental reparsing
+DEFAULT_TREE_CACHE_SIZE = 32
+
 
 class SemanticAnalyzer:
     """
@@ -116,9 +131,36 @@ class SemanticAnalyzer:
             print(f"{change.change_type.value}: {change.target}")
     """
 
-    def __init__(self):
-        """Initialize the analyzer with available parsers."""
+    def __init__(
+        self,
+        cache_size: int = DEFAULT_ELEMENT_CACHE_SIZE,
+        incremental: bool = False,
+    ):
+        """
+        Initialize the analyzer with available parsers.
+
+        Args:
+            cache_size: Maximum number of parsed element maps to keep. The
+                same baseline content is usually analyzed once per task that
+                touched the file, so sharing one analyzer across a merge
+                avoids re-parsing it.
+            incremental: If True, reparse ``after`` incrementally from the
+                cached ``before`` tree and only compare the top-level nodes
+                that changed. Falls back to a full parse whenever the result
+                could differ from one.
+        """
         self._parsers: dict[str, Parser] = {}
+        self.incremental = incremental
+        self._cache_size = cache_size
+        self._element_cache: OrderedDict[
+            tuple[str, str], dict[str, ExtractedElement]
+        ] = OrderedDict()
+        self._parsed_cache: OrderedDict[tuple[str, str], ParsedSource] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._incremental_runs = 0
+        self._incremental_fallbacks = 0
 
         debug(
             MODULE,
@@ -209,17 +251,17 @@ class SemanticAnalyzer:
         ext: str,
     ) -> FileAnalysis:
         """Analyze using tree-sitter AST parsing."""
-        parser = self._parsers[ext]
-
-        tree_before = parser.parse(bytes(before, "utf-8"))
-        tree_after = parser.parse(bytes(after, "utf-8"))
+        changes = None
+        if self.incremental and before:
+            changes = self._compare_incrementally(before, after, ext)
 
-        # Extract structural elements from both versions
-        elements_before = self._extract_elements(tree_before, before, ext)
-        elements_after = self._extract_elements(tree_after, after, ext)
+        if changes is None:
+            # Extract structural elements from both versions
+            elements_before = self._get_elements(before, ext)
+            elements_after = self._get_elements(after, ext)
 
-        # Compare and generate semantic changes
-        changes = compare_elements(elements_before, elements_after, ext)
+            # Compare and generate semantic changes
+            changes = compare_elements(elements_before, elements_after, ext)
 
         # Build the analysis
         analysis = FileAnalysis(file_path=file_path, changes=changes)
@@ -247,28 +289,138 @@ class SemanticAnalyzer:
 
         return analysis
 
+    def _get_elements(self, source: str, ext: str) -> dict[str, ExtractedElement]:
+        """
+        Parse source and extract its elements, reusing cached results.
+
+        The returned map may be shared with other callers and must not be
+        mutated.
+        """
+        key = (ext, compute_content_hash(source))
+        with self._cache_lock:
+            cached = self._element_cache.get(key)
+            if cached is not None:
+                self._element_cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached
+            self._cache_misses += 1
+
+        source_bytes = bytes(source, "utf-8")
+        tree = self._parsers[ext].parse(source_bytes)
+        elements = self._extract_elements(tree.root_node, source_bytes, ext)
+
+        with self._cache_lock:
+            self._element_cache[key] = elements
+            while len(self._element_cache) > self._cache_size:
+                self._element_cache.popitem(last=False)
+        return elements
+
+    def _get_parsed_source(self, source: str, ext: str) -> ParsedSource:
+        """Parse source and extract elements per top-level node, with caching."""
+        key = (ext, compute_content_hash(source))
+        with self._cache_lock:
+            cached = self._parsed_cache.get(key)
+            if cached is not None:
+                self._parsed_cache.move_to_end(key)
+                return cached
+
+        source_bytes = bytes(source, "utf-8")
+        tree = self._parsers[ext].parse(source_bytes)
+        line_index = LineIndex(source_bytes)
+        child_elements = []
+        key_owners: dict[str, list[int]] = {}
+        for idx, child in enumerate(tree.root_node.children):
+            elements = self._extract_elements(
+                NodeSubset([child]), source_bytes, ext, line_index
+            )
+            child_elements.append(elements)
+            for element_key in elements:
+                key_owners.setdefault(element_key, []).append(idx)
+
+        parsed = ParsedSource(
+            source_bytes=source_bytes,
+            tree=tree,
+            line_index=line_index,
+            child_elements=child_elements,
+            key_owners=key_owners,
+        )
+        with self._cache_lock:
+            self._parsed_cache[key] = parsed
+            while len(self._parsed_cache) > DEFAULT_TREE_CACHE_SIZE:
+                self._parsed_cache.popitem(last=False)
+        return parsed
+
+    def _compare_incrementally(self, before: str, after: str, ext: str):
+        """
+        Compare versions by reparsing only what the diff touched.
+
+        Returns:
+            List of semantic changes, or None if the caller should fall back
+            to a full parse
+        """
+        parsed_before = self._get_parsed_source(before, ext)
+        after_bytes = bytes(after, "utf-8")
+
+        try:
+            edited_tree, after_tree = reparse_incrementally(
+                self._parsers[ext], parsed_before, after_bytes
+            )
+        except (ValueError, TypeError) as e:
+            debug_error(MODULE, "Incremental reparse failed", error=str(e))
+            self._incremental_fallbacks += 1
+            return None
+
+        changed_before, changed_after = partition_top_level(
+            parsed_before, edited_tree, after_tree, after_bytes
+        )
+
+        elements_before: dict[str, ExtractedElement] = {}
+        for idx in changed_before:
+            elements_before.update(parsed_before.child_elements[idx])
+        elements_after = self._extract_elements(
+            NodeSubset(changed_after), after_bytes, ext
+        )
+
+        # If a changed element's key is also defined by an unchanged node,
+        # which definition "wins" depends on the whole file; use a full parse.
+        changed = set(changed_before)
+        for element_key in elements_before.keys() | elements_after.keys():
+            owners = parsed_before.key_owners.get(element_key, ())
+            if any(owner not in changed for owner in owners):
+                self._incremental_fallbacks += 1
+                return None
+
+        self._incremental_runs += 1
+        debug_detailed(
+            MODULE,
+            "Incremental comparison",
+            changed_before=len(changed_before),
+            changed_after=len(changed_after),
+            total_nodes=len(parsed_before.child_elements),
+        )
+        return compare_elements(elements_before, elements_after, ext)
+
     def _extract_elements(
         self,
-        tree: Tree,
-        source: str,
+        root: Node | NodeSubset,
+        source_bytes: bytes,
         ext: str,
+        line_index: LineIndex | None = None,
     ) -> dict[str, ExtractedElement]:
-        """Extract structural elements from a syntax tree."""
+        """Extract structural elements below a syntax tree node."""
         elements: dict[str, ExtractedElement] = {}
-        source_bytes = bytes(source, "utf-8")
+        line_index = line_index or LineIndex(source_bytes)
 
         def get_text(node: Node) -> str:
             return source_bytes[node.start_byte : node.end_byte].decode("utf-8")
 
-        def get_line(byte_pos: int) -> int:
-            # Convert byte position to line number (1-indexed)
-            return source[:byte_pos].count("\n") + 1
+        get_line = line_index.line_for_byte
 
         # Language-specific extraction
         if ext == ".py":
-            extract_python_elements(tree.root_node, elements, get_text, get_line)
+            extract_python_elements(root, elements, get_text, get_line)
         elif ext in {".js", ".jsx", ".ts", ".tsx"}:
-            extract_js_elements(tree.root_node, elements, get_text, get_line, ext)
+            extract_js_elements(root, elements, get_text, get_line, ext)
 
         return elements
 
@@ -288,6 +440,24 @@ class SemanticAnalyzer:
         # Analyze against empty string to get all elements as "additions"
         return self.analyze_diff(file_path, "", content)
 
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Get parse cache and incremental reparse statistics."""
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "entries": len(self._element_cache),
+                "incremental_runs": self._incremental_runs,
+                "incremental_fallbacks": self._incremental_fallbacks,
+            }
+
+    def clear_cache(self) -> None:
+        """Drop all cached element maps and syntax trees."""
+        with self._cache_lock:
+            self._element_cache.clear()
+            self._parsed_cache.clear()
+
     @property
     def supported_extensions(self) -> set[str]:
         """Get the set of supported file extensions."""
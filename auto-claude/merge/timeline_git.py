@@ -17,6 +17,8 @@ import logging
 import subprocess
 from pathlib import Path
 
+from .git_object_reader import get_object_reader
+
 logger = logging.getLogger(__name__)
 
 # Import debug utilities
@@ -81,15 +83,9 @@ class TimelineGitHelper:
             File content as string, or None if file doesn't exist at that commit
         """
         try:
-            result = subprocess.run(
-                ["git", "show", f"{commit_hash}:{file_path}"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
+            return get_object_reader(self.project_path).read_file(
+                commit_hash, file_path
             )
-            if result.returncode == 0:
-                return result.stdout
-            return None
         except Exception:
             return None
 
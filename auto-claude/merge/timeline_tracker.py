@@ -173,45 +173,72 @@ class FileTimelineTracker:
         Args:
             commit_hash: Git commit hash
         """
-        debug(MODULE, f"on_main_branch_commit: {commit_hash}")
+        self.on_main_branch_commits([commit_hash])
 
-        # Get list of files changed in this commit
-        changed_files = self.git.get_files_changed_in_commit(commit_hash)
+    def on_main_branch_commits(self, commit_hashes: list[str]) -> None:
+        """
+        Record several main branch commits in one batch, oldest first.
 
-        for file_path in changed_files:
-            # Only update existing timelines (we don't create new ones for random files)
-            if file_path not in self._timelines:
-                continue
+        Used by the tracker daemon to fold bursts (rebases, cherry-pick
+        series) into one update. Commit metadata is fetched once per commit
+        rather than once per changed file, and each touched timeline is
+        written to disk once at the end.
 
-            timeline = self._timelines[file_path]
+        Args:
+            commit_hashes: Git commit hashes in the order they were made
+        """
+        debug(MODULE, f"on_main_branch_commits: {len(commit_hashes)} commit(s)")
+        updated: set[str] = set()
 
-            # Get file content at this commit
-            content = self.git.get_file_content_at_commit(file_path, commit_hash)
-            if content is None:
-                continue
+        for commit_hash in commit_hashes:
+            # Get list of files changed in this commit
+            changed_files = self.git.get_files_changed_in_commit(commit_hash)
+            commit_info: dict | None = None
 
-            # Get commit metadata
-            commit_info = self.git.get_commit_info(commit_hash)
-
-            # Create main branch event
-            event = MainBranchEvent(
-                commit_hash=commit_hash,
-                timestamp=datetime.now(),
-                content=content,
-                source="human",
-                commit_message=commit_info.get("message", ""),
-                author=commit_info.get("author"),
-                diff_summary=commit_info.get("diff_summary"),
+            for file_path in changed_files:
+                # Only update existing timelines (we don't create new ones for random files)
+                if file_path not in self._timelines:
+                    continue
+
+                timeline = self._timelines[file_path]
+
+                # Get file content at this commit
+                content = self.git.get_file_content_at_commit(file_path, commit_hash)
+                if content is None:
+                    continue
+
+                # Get commit metadata (same for every file in the commit)
+                if commit_info is None:
+                    commit_info = self.git.get_commit_info(commit_hash)
+
+                # Create main branch event
+                event = MainBranchEvent(
+                    commit_hash=commit_hash,
+                    timestamp=datetime.now(),
+                    content=content,
+                    source="human",
+                    commit_message=commit_info.get("message", ""),
+                    author=commit_info.get("author"),
+                    diff_summary=commit_info.get("diff_summary"),
+                )
+
+                timeline.add_main_event(event)
+                updated.add(file_path)
+
+            debug_success(
+                MODULE,
+                f"Processed main commit {commit_hash[:8]}",
+                files_updated=len(changed_files),
             )
 
-            timeline.add_main_event(event)
-            self._persist_timeline(file_path)
+        for file_path in sorted(updated):
+            self.persistence.save_timeline(file_path, self._timelines[file_path])
+        if updated:
+            self.persistence.update_index(list(self._timelines.keys()))
 
-        debug_success(
-            MODULE,
-            f"Processed main commit {commit_hash[:8]}",
-            files_updated=len(changed_files),
-        )
+    def reload(self) -> None:
+        """Re-read all timelines from disk, dropping in-memory state."""
+        self._timelines = self.persistence.load_all_timelines()
 
     def on_task_worktree_change(
         self,
@@ -9,6 +9,8 @@ Usage:
     python -m auto_claude.merge.tracker_cli notify-commit <hash>
     python -m auto_claude.merge.tracker_cli show-timeline <file_path>
     python -m auto_claude.merge.tracker_cli show-drift <task_id>
+    python -m auto_claude.merge.tracker_cli daemon [--coalesce-window S]
+    python -m auto_claude.merge.tracker_cli stop-daemon
 """
 
 import argparse
@@ -16,6 +18,14 @@ import sys
 from pathlib import Path
 
 from .file_timeline import FileTimelineTracker
+from .tracker_daemon import (
+    DEFAULT_COALESCE_WINDOW,
+    TrackerDaemon,
+    get_socket_path,
+    is_daemon_running,
+    notify_daemon,
+    send_command,
+)
 
 
 def find_project_root() -> Path:
@@ -40,9 +50,16 @@ def get_tracker() -> FileTimelineTracker:
 
 def cmd_notify_commit(args):
     """Handle the notify-commit command from git post-commit hook."""
-    tracker = get_tracker()
     commit_hash = args.commit_hash
 
+    # Hand off to a running daemon if there is one (hooks installed before
+    # the daemon existed call this command directly)
+    if notify_daemon(get_socket_path(find_project_root()), commit_hash):
+        print(f"[FileTimelineTracker] Queued commit {commit_hash[:8]} with daemon")
+        return
+
+    tracker = get_tracker()
+
     print(f"[FileTimelineTracker] Processing commit: {commit_hash[:8]}")
     tracker.on_main_branch_commit(commit_hash)
     print("[FileTimelineTracker] Commit processed successfully")
@@ -167,6 +184,44 @@ def cmd_init_from_worktree(args):
     print("Done.")
 
 
+def cmd_daemon(args):
+    """Run the tracker daemon in the foreground."""
+    daemon = TrackerDaemon(
+        find_project_root(),
+        coalesce_window=args.coalesce_window,
+        idle_timeout=args.idle_timeout,
+    )
+    try:
+        daemon.start()
+    except (OSError, RuntimeError) as e:
+        print(f"[FileTimelineTracker] Could not start daemon: {e}")
+        sys.exit(1)
+
+    print(f"[FileTimelineTracker] Daemon listening on {daemon.socket_path}")
+    daemon.serve_forever()
+
+
+def cmd_stop_daemon(args):
+    """Stop a running tracker daemon."""
+    socket_path = get_socket_path(find_project_root())
+    if not is_daemon_running(socket_path):
+        print("[FileTimelineTracker] Daemon is not running")
+        return
+
+    send_command(socket_path, "shutdown", expect_reply=True)
+    print("[FileTimelineTracker] Daemon stopped")
+
+
+def cmd_daemon_status(args):
+    """Report whether the tracker daemon is running."""
+    socket_path = get_socket_path(find_project_root())
+    if is_daemon_running(socket_path):
+        print(f"[FileTimelineTracker] Daemon running on {socket_path}")
+    else:
+        print("[FileTimelineTracker] Daemon is not running")
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="FileTimelineTracker CLI",
@@ -220,6 +275,34 @@ def main():
     init_parser.add_argument("--title", help="Task title")
     init_parser.set_defaults(func=cmd_init_from_worktree)
 
+    # daemon
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Run the tracker daemon that batches hook notifications"
+    )
+    daemon_parser.add_argument(
+        "--coalesce-window",
+        type=float,
+        default=DEFAULT_COALESCE_WINDOW,
+        help="Seconds without new commits before a burst is processed",
+    )
+    daemon_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Exit after this many seconds without commits",
+    )
+    daemon_parser.set_defaults(func=cmd_daemon)
+
+    # stop-daemon
+    stop_parser = subparsers.add_parser("stop-daemon", help="Stop the tracker daemon")
+    stop_parser.set_defaults(func=cmd_stop_daemon)
+
+    # daemon-status
+    status_parser = subparsers.add_parser(
+        "daemon-status", help="Check whether the tracker daemon is running"
+    )
+    status_parser.set_defaults(func=cmd_daemon_status)
+
     args = parser.parse_args()
 
     if not args.command:
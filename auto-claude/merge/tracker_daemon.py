@@ -0,0 +1,417 @@
+"""
+FileTimelineTracker Daemon
+==========================
+
+Optional long-lived process that receives main branch commits from the git
+post-commit hook over a Unix socket.
+
+Without it, every commit forks a Python process that imports the merge
+package and reloads every timeline before recording one commit. A rebase
+or cherry-pick series does that once per commit. The daemon instead keeps
+the package loaded, collects commit hashes as they arrive, and records a
+burst of them in a single batched timeline update once commits stop
+arriving for a short window.
+
+The hook only writes "commit <hash>" to ``.auto-claude/tracker.sock``.
+If nothing is listening it falls back to ``tracker_cli notify-commit``.
+
+Protocol (one command per line):
+    commit <hash>   Queue a commit (no reply)
+    flush           Process queued commits now, reply "ok"
+    ping            Reply "pong"
+    shutdown        Process queued commits and stop
+
+Usage:
+    python -m auto_claude.merge.tracker_cli daemon
+    python -m auto_claude.merge.tracker_cli stop-daemon
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .timeline_tracker import FileTimelineTracker
+
+# Import debug utilities
+try:
+    from debug import debug, debug_success, debug_warning
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+    def debug_success(*args, **kwargs):
+        pass
+
+    def debug_warning(*args, **kwargs):
+        pass
+
+
+logger = logging.getLogger(__name__)
+MODULE = "merge.tracker_daemon"
+
+# Socket file name inside the storage directory (.auto-claude/)
+SOCKET_NAME = "tracker.sock"
+
+# Seconds without a new commit before a burst is processed
+DEFAULT_COALESCE_WINDOW = 0.5
+
+# Upper bound on how long a commit waits while a burst keeps going
+DEFAULT_MAX_BATCH_DELAY = 5.0
+
+# Timeout for client connections
+CLIENT_TIMEOUT = 2.0
+
+
+@dataclass
+class DaemonStats:
+    """Counters for how much work the daemon coalesced."""
+
+    commits_received: int = 0
+    commits_processed: int = 0
+    batches_processed: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def get_socket_path(project_path: Path, storage_path: Path | None = None) -> Path:
+    """
+    Get the daemon socket path for a project.
+
+    Args:
+        project_path: Root directory of the project
+        storage_path: Storage directory (default: <project>/.auto-claude)
+
+    Returns:
+        Path of the Unix socket
+    """
+    return (storage_path or Path(project_path) / ".auto-claude") / SOCKET_NAME
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """Reads newline-separated commands from one client connection."""
+
+    server: _TrackerServer
+    timeout = CLIENT_TIMEOUT
+
+    def handle(self) -> None:
+        daemon = self.server.daemon
+        try:
+            self._handle_commands(daemon)
+        except OSError as e:
+            debug_warning(MODULE, "Client connection dropped", error=str(e))
+
+    def _handle_commands(self, daemon: TrackerDaemon) -> None:
+        for raw in self.rfile:
+            command, _, argument = (
+                raw.decode("utf-8", errors="replace").strip().partition(" ")
+            )
+            if command == "commit" and argument:
+                daemon.submit(argument.strip())
+            elif command == "flush":
+                daemon.flush()
+                self.wfile.write(b"ok\n")
+            elif command == "ping":
+                self.wfile.write(b"pong\n")
+            elif command == "shutdown":
+                self.wfile.write(b"ok\n")
+                threading.Thread(target=daemon.stop, daemon=True).start()
+                return
+
+
+class _TrackerServer(socketserver.UnixStreamServer):
+    """
+    Handles one connection at a time.
+
+    Each hook run is its own connection, so serving them in accept order
+    keeps commits in the order they were made.
+    """
+
+    def __init__(self, socket_path: str, daemon: TrackerDaemon):
+        self.daemon = daemon
+        super().__init__(socket_path, _CommandHandler)
+
+
+class TrackerDaemon:
+    """
+    Unix socket server that batches main branch commits into the tracker.
+
+    Commits are processed in arrival order. A batch is processed when no
+    new commit has arrived for coalesce_window seconds, or when the oldest
+    queued commit has waited max_batch_delay seconds. Timelines are
+    reloaded from disk before each batch so updates made by other
+    processes (task start, merges) are not overwritten.
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        storage_path: Path | None = None,
+        socket_path: Path | None = None,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        max_batch_delay: float = DEFAULT_MAX_BATCH_DELAY,
+        idle_timeout: float | None = None,
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            project_path: Root directory of the project
+            storage_path: Timeline storage directory (default: .auto-claude/)
+            socket_path: Socket to listen on (default: <storage>/tracker.sock)
+            coalesce_window: Quiet period that ends a burst of commits
+            max_batch_delay: Longest a queued commit waits during a burst
+            idle_timeout: Stop after this many seconds without commits (None = never)
+        """
+        self.project_path = Path(project_path).resolve()
+        self.storage_path = storage_path or (self.project_path / ".auto-claude")
+        self.socket_path = socket_path or get_socket_path(
+            self.project_path, self.storage_path
+        )
+        self.coalesce_window = coalesce_window
+        self.max_batch_delay = max_batch_delay
+        self.idle_timeout = idle_timeout
+        self.stats = DaemonStats()
+
+        self._tracker: FileTimelineTracker | None = None
+        self._server: _TrackerServer | None = None
+        self._pending: list[str] = []
+        self._first_queued = 0.0
+        self._last_queued = 0.0
+        self._last_activity = time.monotonic()
+        self._flush_requested = False
+        self._stopping = False
+        self._condition = threading.Condition()
+        self._process_lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._stopped = threading.Event()
+
+    @property
+    def tracker(self) -> FileTimelineTracker:
+        """The tracker batches are applied to, created on first use."""
+        if self._tracker is None:
+            self._tracker = FileTimelineTracker(self.project_path, self.storage_path)
+        return self._tracker
+
+    def start(self) -> None:
+        """
+        Bind the socket and start serving in background threads.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        if is_daemon_running(self.socket_path):
+            raise RuntimeError(f"Tracker daemon already running at {self.socket_path}")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists() or self.socket_path.is_symlink():
+            # Left over from a daemon that didn't shut down cleanly
+            self.socket_path.unlink()
+
+        self._server = _TrackerServer(str(self.socket_path), self)
+        os.chmod(self.socket_path, 0o600)
+
+        self._threads = [
+            threading.Thread(
+                target=self._server.serve_forever,
+                kwargs={"poll_interval": 0.1},
+                name="tracker-daemon-server",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._batch_loop, name="tracker-daemon-batcher", daemon=True
+            ),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        debug_success(MODULE, "Tracker daemon listening", socket=str(self.socket_path))
+
+    def serve_forever(self) -> None:
+        """Start the daemon and block until it is stopped."""
+        self.start()
+        try:
+            self._stopped.wait()
+        except KeyboardInterrupt:
+            self.stop()
+
+    def stop(self) -> None:
+        """Process anything still queued, then stop serving and remove the socket."""
+        with self._condition:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._condition.notify_all()
+
+        for thread in self._threads:
+            if (
+                thread.name == "tracker-daemon-batcher"
+                and thread is not threading.current_thread()
+            ):
+                thread.join()
+        self._process_pending()
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+        self._stopped.set()
+        debug(MODULE, "Tracker daemon stopped", **self.stats.to_dict())
+
+    def submit(self, commit_hash: str) -> None:
+        """
+        Queue a commit for the next batch.
+
+        Args:
+            commit_hash: Git commit hash from the post-commit hook
+        """
+        now = time.monotonic()
+        with self._condition:
+            if not self._pending:
+                self._first_queued = now
+            self._pending.append(commit_hash)
+            self._last_queued = now
+            self._last_activity = now
+            self.stats.commits_received += 1
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Process queued commits now and wait until they are recorded."""
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+        self._process_pending()
+
+    def _batch_loop(self) -> None:
+        """Wait for bursts to settle, then hand them to _process_pending."""
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    now = time.monotonic()
+                    if self._pending and (
+                        self._flush_requested
+                        or now - self._last_queued >= self.coalesce_window
+                        or now - self._first_queued >= self.max_batch_delay
+                    ):
+                        break
+                    if (
+                        self.idle_timeout is not None
+                        and not self._pending
+                        and now - self._last_activity >= self.idle_timeout
+                    ):
+                        debug(MODULE, "Tracker daemon idle, shutting down")
+                        threading.Thread(target=self.stop, daemon=True).start()
+                        return
+                    self._condition.wait(timeout=self._wait_timeout(now))
+                if self._stopping:
+                    return
+            self._process_pending()
+
+    def _wait_timeout(self, now: float) -> float:
+        """How long the batcher can sleep before something may be due. Caller holds the lock."""
+        if self._pending:
+            return max(
+                0.0,
+                min(
+                    self._last_queued + self.coalesce_window,
+                    self._first_queued + self.max_batch_delay,
+                )
+                - now,
+            )
+        if self.idle_timeout is not None:
+            return max(0.0, self._last_activity + self.idle_timeout - now)
+        return 1.0
+
+    def _process_pending(self) -> None:
+        """Record every queued commit in one tracker update."""
+        with self._process_lock:
+            with self._condition:
+                batch = self._pending
+                self._pending = []
+                self._flush_requested = False
+            if not batch:
+                return
+
+            # Duplicate notifications (e.g. hook re-runs) only count once
+            commits = list(dict.fromkeys(batch))
+            debug(MODULE, f"Processing {len(commits)} commit(s) in one batch")
+            try:
+                self.tracker.reload()
+                self.tracker.on_main_branch_commits(commits)
+            except Exception as e:
+                logger.error(f"Tracker daemon failed to process commits: {e}")
+                debug_warning(MODULE, "Batch failed", error=str(e))
+                return
+
+            self.stats.batches_processed += 1
+            self.stats.commits_processed += len(commits)
+
+
+def send_command(
+    socket_path: Path,
+    command: str,
+    expect_reply: bool = False,
+    timeout: float = CLIENT_TIMEOUT,
+) -> str | None:
+    """
+    Send one command to a running daemon.
+
+    Args:
+        socket_path: Daemon socket
+        command: Command line without the trailing newline
+        expect_reply: Wait for and return the daemon's one-line reply
+        timeout: Socket timeout in seconds
+
+    Returns:
+        The reply (or "" when no reply was expected)
+
+    Raises:
+        OSError: If the daemon is not reachable
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(command.encode("utf-8") + b"\n")
+        if not expect_reply:
+            return ""
+        sock.shutdown(socket.SHUT_WR)
+        return sock.makefile("rb").readline().decode("utf-8").strip()
+
+
+def notify_daemon(socket_path: Path, commit_hash: str) -> bool:
+    """
+    Hand a commit to the daemon if one is running.
+
+    Args:
+        socket_path: Daemon socket
+        commit_hash: Commit to record
+
+    Returns:
+        True if the daemon accepted it, False if the caller should fall back
+    """
+    try:
+        send_command(socket_path, f"commit {commit_hash}")
+        return True
+    except OSError:
+        return False
+
+
+def is_daemon_running(socket_path: Path) -> bool:
+    """Check whether a daemon answers on the socket."""
+    try:
+        return send_command(socket_path, "ping", expect_reply=True) == "pong"
+    except OSError:
+        return False
@@ -5,6 +5,13 @@ Prompts Module
 Prompt generation and templates for AI interactions.
 """
 
+# Import the prompt context budget
+from .context_budget import (
+    ContextBudget,
+    estimate_tokens,
+    get_agent_budget,
+)
+
 # Import all functions from prompt_generator
 # Import project context utilities
 from .project_context import (
@@ -52,4 +59,8 @@ __all__ = [
     "detect_project_capabilities",
     "get_mcp_tools_for_project",
     "should_refresh_project_index",
+    # context_budget
+    "ContextBudget",
+    "estimate_tokens",
+    "get_agent_budget",
 ]
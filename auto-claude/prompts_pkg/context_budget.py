@@ -0,0 +1,577 @@
+"""
+Prompt Context Budget
+=====================
+
+Keeps subtask prompts within a token budget per agent.
+
+A coder prompt is assembled from sections: the subtask instructions, hints
+from previous attempts, Graphiti memory context and the contents of the
+referenced files (patterns_from and files_to_modify). Without a limit, large
+subtasks produced huge prompts. The budgeter:
+- Estimates each section's tokens with a fast approximation, cached per text
+- Never trims the instructions; caps recovery hints and Graphiti context
+- Splits referenced files into symbol ranges (the imports header, then each
+  top-level function or class, long ones split at nested definitions),
+  ranks them by how much they mention the subtask and includes the most
+  relevant ones until the budget is spent, instead of the first 200 lines
+
+The budget comes from AGENT_CONTEXT_BUDGET_<AGENT> (e.g.
+AGENT_CONTEXT_BUDGET_CODER), then AGENT_CONTEXT_BUDGET, then the agent's
+default; 0 disables it.
+
+Usage:
+    budget = ContextBudget.for_agent("coder")
+    hints = budget.fit_items("recovery_hints", hints, RECOVERY_HINTS_MAX_TOKENS)
+    budget.record("instructions", estimate_tokens(prompt))
+    context = load_subtask_context(spec_dir, project_dir, subtask,
+                                   max_tokens=budget.remaining)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+# Import debug utilities
+try:
+    from debug import debug
+except ImportError:
+
+    def debug(*args, **kwargs):
+        pass
+
+
+MODULE = "prompts_pkg.context_budget"
+
+# Prompt tokens per agent when no AGENT_CONTEXT_BUDGET* variable is set
+DEFAULT_AGENT_BUDGETS = {
+    "coder": 24_000,
+}
+DEFAULT_BUDGET_TOKENS = 24_000
+
+# Caps for the optional sections, within what the budget has left
+RECOVERY_HINTS_MAX_TOKENS = 800
+GRAPHITI_MAX_SHARE = 0.25
+
+# Symbol ranges longer than this are split at nested definitions
+MAX_BLOCK_LINES = 80
+
+# Words that say nothing about which code is relevant
+_STOPWORDS = frozenset(
+    "the and for with from that this into when then than add use using "
+    "new update make should must all any each are not but its".split()
+)
+
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+_WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+_DEFINITION_RE = re.compile(
+    r"^(?P<indent>[ \t]*)(?:export\s+(?:default\s+)?)?(?:pub(?:\(\w+\))?\s+)?"
+    r"(?:async\s+)?(?:def|class|function\*?|func|fn|interface|struct|enum|trait|impl)"
+    r"\s+(?:\([^)]*\)\s*)?(?P<name>[A-Za-z_$][\w$]*)"
+    r"|^(?P<arrow_indent>[ \t]*)(?:export\s+)?(?:const|let)\s+"
+    r"(?P<arrow_name>[A-Za-z_$][\w$]*)\s*=\s*(?:async\s+)?(?:\(|function)"
+)
+
+
+@lru_cache(maxsize=2048)
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Counts words and punctuation marks, which tracks tokenizer output well
+    for code, with a floor of 4 characters per token for long words.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Approximate token count
+    """
+    if not text:
+        return 0
+    return max(len(_PIECE_RE.findall(text)), len(text) // 4)
+
+
+def get_agent_budget(agent: str) -> int | None:
+    """
+    Prompt token budget for an agent type.
+
+    Args:
+        agent: Agent type (e.g. "coder")
+
+    Returns:
+        Token budget, or None if the budget is disabled (0)
+    """
+    default = DEFAULT_AGENT_BUDGETS.get(agent, DEFAULT_BUDGET_TOKENS)
+    value = os.environ.get(f"AGENT_CONTEXT_BUDGET_{agent.upper()}") or os.environ.get(
+        "AGENT_CONTEXT_BUDGET"
+    )
+    try:
+        budget = int(value) if value else default
+    except ValueError:
+        budget = default
+    return budget if budget > 0 else None
+
+
+def _omitted_note(count: int, what: str) -> str:
+    return f"... ({count} more {what} omitted to fit the context budget)"
+
+
+@dataclass
+class ContextBudget:
+    """Tokens each prompt section used and had trimmed, against a limit."""
+
+    agent: str
+    # None when the budget is disabled
+    limit: int | None
+    used: dict[str, int] = field(default_factory=dict)
+    omitted: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def for_agent(cls, agent: str) -> ContextBudget:
+        return cls(agent, get_agent_budget(agent))
+
+    @property
+    def total(self) -> int:
+        return sum(self.used.values())
+
+    @property
+    def remaining(self) -> int | None:
+        """Tokens left for further sections (None if unlimited)."""
+        if self.limit is None:
+            return None
+        return max(0, self.limit - self.total)
+
+    def record(self, section: str, used: int, omitted: int = 0) -> None:
+        """Set the tokens a section used and had trimmed."""
+        self.used[section] = used
+        if omitted:
+            self.omitted[section] = omitted
+        else:
+            self.omitted.pop(section, None)
+
+    def discard(self, section: str) -> None:
+        """Forget a section (e.g. before fitting it again)."""
+        self.used.pop(section, None)
+        self.omitted.pop(section, None)
+
+    def _allowance(self, max_tokens: int | None) -> int | None:
+        remaining = self.remaining
+        if remaining is None:
+            return max_tokens
+        return remaining if max_tokens is None else min(remaining, max_tokens)
+
+    def fit_items(
+        self, section: str, items: list[str] | None, max_tokens: int | None = None
+    ) -> list[str] | None:
+        """
+        Keep the leading items of a list that fit the budget.
+
+        Args:
+            section: Section name to record the items under
+            items: Items in order of importance (e.g. recovery hints)
+            max_tokens: Cap for this section, within the remaining budget
+
+        Returns:
+            The items that fit, with a note if any were dropped
+        """
+        if not items:
+            return items
+        allowance = self._allowance(max_tokens)
+        kept, used = [], 0
+        for i, item in enumerate(items):
+            tokens = estimate_tokens(item)
+            if allowance is not None and used + tokens > allowance and kept:
+                dropped = items[i:]
+                kept.append(_omitted_note(len(dropped), section.replace("_", " ")))
+                self.record(section, used, sum(estimate_tokens(d) for d in dropped))
+                return kept
+            kept.append(item)
+            used += tokens
+        self.record(section, used)
+        return kept
+
+    def fit_text(
+        self, section: str, text: str | None, max_share: float | None = None
+    ) -> str | None:
+        """
+        Trim a text section to the budget, dropping whole lines from the end.
+
+        Args:
+            section: Section name to record the text under
+            text: Section text (e.g. Graphiti context)
+            max_share: Largest share of the remaining budget it may take
+
+        Returns:
+            The text, trimmed if it didn't fit
+        """
+        if not text:
+            return text
+        remaining = self.remaining
+        allowance = (
+            None
+            if remaining is None or max_share is None
+            else int(remaining * max_share)
+        )
+        allowance = self._allowance(allowance)
+        tokens = estimate_tokens(text)
+        if allowance is None or tokens <= allowance:
+            self.record(section, tokens)
+            return text
+
+        lines = text.split("\n")
+        kept, used = [], 0
+        for line in lines:
+            line_tokens = estimate_tokens(line) + 1
+            if used + line_tokens > allowance:
+                break
+            kept.append(line)
+            used += line_tokens
+        kept.append(_omitted_note(len(lines) - len(kept), "lines"))
+        self.record(section, used, tokens - used)
+        return "\n".join(kept)
+
+    def to_dict(self) -> dict:
+        return {
+            "agent": self.agent,
+            "limit": self.limit,
+            "total": self.total,
+            "sections": dict(self.used),
+            "omitted": dict(self.omitted),
+        }
+
+    def summary(self) -> str:
+        """One line breakdown, e.g. '9.8k/24.0k tokens (instructions 1.2k, ...)'."""
+        limit = _format_tokens(self.limit) if self.limit else "unlimited"
+        parts = [
+            f"{section} {_format_tokens(tokens)}"
+            for section, tokens in self.used.items()
+            if tokens
+        ]
+        line = f"{_format_tokens(self.total)}/{limit} tokens"
+        if parts:
+            line += f" ({', '.join(parts)})"
+        omitted = sum(self.omitted.values())
+        if omitted:
+            line += f", trimmed {_format_tokens(omitted)}"
+        return line
+
+
+def _format_tokens(tokens: int) -> str:
+    return f"{tokens / 1000:.1f}k" if tokens >= 1000 else str(tokens)
+
+
+# =============================================================================
+# Symbol ranges
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class SymbolBlock:
+    """A range of lines in a file: the header, or one definition."""
+
+    # Definition name, "" for the header and plain chunks
+    name: str
+    # 0-based, end exclusive
+    start: int
+    end: int
+    text: str
+    tokens: int
+    words: frozenset[str]
+
+
+# Resolved path -> ((mtime_ns, size), lines, blocks)
+_block_cache: dict[Path, tuple[tuple[int, int], list[str], list[SymbolBlock]]] = {}
+
+
+def _split_words(text: str) -> set[str]:
+    """Lowercase identifier parts: 'loadSubtask_context' -> load, subtask, context."""
+    words = set()
+    for word in _WORD_RE.findall(text):
+        lower = word.lower()
+        words.add(lower)
+        for part in lower.split("_"):
+            words.add(part)
+        for part in _CAMEL_RE.findall(word):
+            words.add(part.lower())
+    return {w for w in words if len(w) > 2 and w not in _STOPWORDS}
+
+
+def _definitions(lines: list[str], start: int, end: int) -> list[tuple[int, int, str]]:
+    """(line, indent width, name) of each definition between start and end."""
+    found = []
+    for i in range(start, end):
+        match = _DEFINITION_RE.match(lines[i])
+        if match:
+            indent = match.group("indent")
+            if indent is None:
+                indent = match.group("arrow_indent")
+            name = match.group("name") or match.group("arrow_name")
+            found.append((i, len(indent.expandtabs(4)), name))
+    return found
+
+
+def _with_decorators(lines: list[str], i: int, floor: int) -> int:
+    """Move a definition's start up over its decorators and doc comments."""
+    while i > floor and lines[i - 1].strip().startswith(("@", "#[", "///", "/**", "*")):
+        i -= 1
+    return i
+
+
+def _make_block(lines: list[str], name: str, start: int, end: int) -> SymbolBlock:
+    text = "\n".join(lines[start:end])
+    return SymbolBlock(
+        name, start, end, text, estimate_tokens(text) + 1, frozenset(_split_words(text))
+    )
+
+
+def _split_block(
+    lines: list[str], name: str, start: int, end: int
+) -> list[SymbolBlock]:
+    """Split a long range at its nested definitions, then into fixed chunks."""
+    if end - start <= MAX_BLOCK_LINES:
+        return [_make_block(lines, name, start, end)]
+
+    nested = [d for d in _definitions(lines, start + 1, end) if d[1] > 0]
+    if nested:
+        shallowest = min(indent for _, indent, _ in nested)
+        cuts = [
+            (_with_decorators(lines, i, start + 1), nested_name)
+            for i, indent, nested_name in nested
+            if indent == shallowest
+        ]
+        blocks = []
+        if cuts[0][0] > start:
+            blocks.append(_make_block(lines, name, start, cuts[0][0]))
+        for (cut, nested_name), (next_cut, _) in zip(cuts, [*cuts[1:], (end, "")]):
+            # Nested ranges are short enough once split, or get chunked
+            blocks.extend(_chunk(lines, f"{name}.{nested_name}", cut, next_cut))
+        return blocks
+    return _chunk(lines, name, start, end)
+
+
+def _chunk(lines: list[str], name: str, start: int, end: int) -> list[SymbolBlock]:
+    return [
+        _make_block(lines, name, i, min(i + MAX_BLOCK_LINES, end))
+        for i in range(start, end, MAX_BLOCK_LINES)
+    ]
+
+
+def _parse_blocks(lines: list[str]) -> list[SymbolBlock]:
+    """Split a file into its header and top-level definitions."""
+    starts = [
+        (_with_decorators(lines, i, 0), name)
+        for i, indent, name in _definitions(lines, 0, len(lines))
+        if indent == 0
+    ]
+    blocks = []
+    header_end = starts[0][0] if starts else len(lines)
+    if header_end > 0:
+        blocks.extend(_split_block(lines, "", 0, header_end))
+    for (start, name), (end, _) in zip(starts, [*starts[1:], (len(lines), "")]):
+        blocks.extend(_split_block(lines, name, start, end))
+    return blocks
+
+
+def read_symbol_blocks(path: Path) -> tuple[list[str], list[SymbolBlock]]:
+    """
+    Read a file as symbol ranges, cached until the file changes.
+
+    Args:
+        path: File to read
+
+    Returns:
+        (lines, blocks) of the file
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    resolved = path.resolve()
+    stat = os.stat(resolved)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _block_cache.get(resolved)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    lines = resolved.read_text().split("\n")
+    blocks = _parse_blocks(lines)
+    _block_cache[resolved] = (key, lines, blocks)
+    return lines, blocks
+
+
+def warm_symbol_cache(project_dir: Path, paths: list[str]) -> None:
+    """Read and split files ahead of selecting from them."""
+    for path in paths:
+        try:
+            read_symbol_blocks(project_dir / path)
+        except (OSError, UnicodeDecodeError):
+            pass
+
+
+def clear_symbol_cache() -> None:
+    """Forget all cached symbol ranges."""
+    _block_cache.clear()
+
+
+# =============================================================================
+# Relevance and selection
+# =============================================================================
+
+
+def subtask_keywords(subtask: dict) -> frozenset[str]:
+    """Words from a subtask's id, description and file names."""
+    parts = [subtask.get("id", ""), subtask.get("description", "")]
+    for key in ("files_to_modify", "files_to_create", "patterns_from"):
+        parts.extend(Path(p).stem for p in subtask.get(key, []))
+    return frozenset(_split_words(" ".join(str(p) for p in parts)))
+
+
+def score_block(block: SymbolBlock, keywords: frozenset[str]) -> int:
+    """Relevance of a block: keywords in its name weigh more than in its body."""
+    score = len(block.words & keywords)
+    if block.name:
+        score += 3 * len(_split_words(block.name) & keywords)
+    else:
+        # The header shows imports and conventions; it ranks with blocks
+        # that match the subtask by name
+        score += 5
+    return score
+
+
+@dataclass
+class FileSelection:
+    """The blocks of one file chosen for a prompt."""
+
+    path: str
+    lines: list[str]
+    blocks: list[SymbolBlock]
+    chosen: list[SymbolBlock] = field(default_factory=list)
+
+    @property
+    def omitted_tokens(self) -> int:
+        return sum(b.tokens for b in self.blocks) - sum(b.tokens for b in self.chosen)
+
+    def render(self) -> str:
+        """The chosen blocks in file order, marking the lines left out."""
+        if len(self.chosen) == len(self.blocks):
+            return "\n".join(self.lines)
+
+        out, position = [], 0
+        for block in sorted(self.chosen, key=lambda b: b.start):
+            if block.start > position:
+                out.append(f"... (lines {position + 1}-{block.start} omitted)")
+            out.append(block.text)
+            position = block.end
+        if position < len(self.lines):
+            out.append(f"... (lines {position + 1}-{len(self.lines)} omitted)")
+        return "\n".join(out)
+
+
+def select_blocks(
+    files: list[FileSelection],
+    keywords: frozenset[str],
+    max_tokens: int | None = None,
+    max_file_lines: int | None = None,
+) -> int:
+    """
+    Choose the most relevant blocks across files, within the limits.
+
+    Blocks are taken by relevance (earlier files first on ties, so files to
+    modify come before patterns), then in file order. A block that doesn't
+    fit is skipped, so smaller relevant ones can still be taken.
+
+    Args:
+        files: Files to choose from; their chosen lists are filled in
+        keywords: Subtask keywords (from subtask_keywords)
+        max_tokens: Token limit across all files (None for no limit)
+        max_file_lines: Line limit per file (None for no limit)
+
+    Returns:
+        Tokens of the chosen blocks
+    """
+    candidates = sorted(
+        (
+            (-score_block(block, keywords), file_index, block.start, block)
+            for file_index, selection in enumerate(files)
+            for block in selection.blocks
+        ),
+        key=lambda c: c[:3],
+    )
+    used = 0
+    lines_used = [0] * len(files)
+    for _, file_index, _, block in candidates:
+        if max_tokens is not None and used + block.tokens > max_tokens:
+            continue
+        length = block.end - block.start
+        if (
+            max_file_lines is not None
+            and lines_used[file_index] + length > max_file_lines
+        ):
+            continue
+        files[file_index].chosen.append(block)
+        used += block.tokens
+        lines_used[file_index] += length
+    return used
+
+
+def trim_file_contents(
+    project_dir: Path,
+    subtask: dict,
+    groups: dict[str, list[str]],
+    max_tokens: int | None = None,
+    max_file_lines: int | None = None,
+) -> tuple[dict[str, dict[str, str]], int]:
+    """
+    Read groups of files, keeping their most relevant symbol ranges.
+
+    Args:
+        project_dir: Project root the paths are relative to
+        subtask: The subtask the files are for
+        groups: Group name -> paths, in priority order
+        max_tokens: Token limit across all files (None for no limit)
+        max_file_lines: Line limit per file (None for no limit)
+
+    Returns:
+        (group name -> path -> content, tokens omitted)
+    """
+    contents: dict[str, dict[str, str]] = {group: {} for group in groups}
+    selections: list[tuple[str, FileSelection]] = []
+    for group, paths in groups.items():
+        for path in paths:
+            full_path = project_dir / path
+            if not full_path.exists():
+                continue
+            try:
+                lines, blocks = read_symbol_blocks(full_path)
+            except (OSError, UnicodeDecodeError):
+                contents[group][path] = "(Could not read file)"
+                continue
+            selections.append((group, FileSelection(path, lines, blocks)))
+
+    select_blocks(
+        [selection for _, selection in selections],
+        subtask_keywords(subtask),
+        max_tokens,
+        max_file_lines,
+    )
+    omitted = 0
+    for group, selection in selections:
+        omitted += selection.omitted_tokens
+        contents[group][selection.path] = (
+            selection.render()
+            if selection.chosen
+            else "(Omitted to fit the context budget)"
+        )
+    if omitted:
+        debug(
+            MODULE,
+            "Trimmed file context",
+            subtask_id=subtask.get("id"),
+            omitted_tokens=omitted,
+            max_tokens=max_tokens,
+        )
+    return contents, omitted
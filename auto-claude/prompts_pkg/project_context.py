@@ -13,6 +13,44 @@ saving context window and keeping agents focused.
 import json
 from pathlib import Path
 
+# Worktree -> project whose project_index.json it uses (see share_project_index)
+_index_sources: dict[Path, Path] = {}
+
+
+def project_index_file(project_dir: Path) -> Path:
+    """
+    Path of the project_index.json that applies to a directory.
+
+    Args:
+        project_dir: Root directory of the project (or a worktree of it)
+
+    Returns:
+        The project's own index, or the shared one for a worktree
+    """
+    source = _index_sources.get(Path(project_dir).resolve(), project_dir)
+    return source / ".auto-claude" / "project_index.json"
+
+
+def share_project_index(project_dir: Path, worktree_dirs: list[Path]) -> dict:
+    """
+    Use a project's index for worktrees of it too.
+
+    Worktrees are checked out from the project, so they have the same
+    services; concurrent builds (run.py --specs) use the project's index
+    instead of each needing their own.
+
+    Args:
+        project_dir: Root directory of the project
+        worktree_dirs: Worktrees of the project
+
+    Returns:
+        The project's index (empty dict if it has none)
+    """
+    project_dir = Path(project_dir).resolve()
+    for worktree_dir in worktree_dirs:
+        _index_sources[Path(worktree_dir).resolve()] = project_dir
+    return load_project_index(project_dir)
+
 
 def load_project_index(project_dir: Path) -> dict:
     """
@@ -24,7 +62,7 @@ def load_project_index(project_dir: Path) -> dict:
     Returns:
         Parsed project index dict, or empty dict if not found
     """
-    index_file = project_dir / ".auto-claude" / "project_index.json"
+    index_file = project_index_file(project_dir)
     if not index_file.exists():
         return {}
 
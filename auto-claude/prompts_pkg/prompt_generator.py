@@ -15,6 +15,8 @@ This approach:
 import json
 from pathlib import Path
 
+from .context_budget import trim_file_contents
+
 
 def get_relative_spec_path(spec_dir: Path, project_dir: Path) -> str:
     """
@@ -296,62 +298,43 @@ def load_subtask_context(
     spec_dir: Path,
     project_dir: Path,
     subtask: dict,
-    max_file_lines: int = 200,
+    max_file_lines: int | None = 200,
+    max_tokens: int | None = None,
 ) -> dict:
     """
     Load minimal context needed for a subtask.
 
+    Files are included by symbol range (imports header, functions, classes),
+    most relevant to the subtask first, rather than from the top.
+
     Args:
         spec_dir: Spec directory
         project_dir: Project root
         subtask: The subtask being implemented
-        max_file_lines: Maximum lines to include per file
+        max_file_lines: Maximum lines to include per file (None for no limit)
+        max_tokens: Maximum tokens across all files (None for no limit)
 
     Returns:
-        Dict with file contents and relevant context
+        Dict with file contents, relevant context and the tokens left out
     """
-    context = {
-        "patterns": {},
-        "files_to_modify": {},
+    contents, omitted = trim_file_contents(
+        project_dir,
+        subtask,
+        {
+            # Files to modify win ties for the budget
+            "files_to_modify": subtask.get("files_to_modify", []),
+            "patterns": subtask.get("patterns_from", []),
+        },
+        max_tokens=max_tokens,
+        max_file_lines=max_file_lines,
+    )
+    return {
+        "patterns": contents["patterns"],
+        "files_to_modify": contents["files_to_modify"],
         "spec_excerpt": None,
+        "omitted_tokens": omitted,
     }
 
-    # Load pattern files (truncated)
-    for pattern_path in subtask.get("patterns_from", []):
-        full_path = project_dir / pattern_path
-        if full_path.exists():
-            try:
-                lines = full_path.read_text().split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["patterns"][pattern_path] = content
-            except Exception:
-                context["patterns"][pattern_path] = "(Could not read file)"
-
-    # Load files to modify (truncated)
-    for file_path in subtask.get("files_to_modify", []):
-        full_path = project_dir / file_path
-        if full_path.exists():
-            try:
-                lines = full_path.read_text().split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["files_to_modify"][file_path] = content
-            except Exception:
-                context["files_to_modify"][file_path] = "(Could not read file)"
-
-    return context
-
 
 def format_context_for_prompt(context: dict) -> str:
     """
@@ -5,9 +5,9 @@ QA Acceptance Criteria Handling
 Manages acceptance criteria validation and status tracking.
 """
 
-import json
 from pathlib import Path
 
+from core.plan_store import get_plan_store
 from progress import is_build_complete
 
 # =============================================================================
@@ -16,23 +16,14 @@ from progress import is_build_complete
 
 
 def load_implementation_plan(spec_dir: Path) -> dict | None:
-    """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return None
-    try:
-        with open(plan_file) as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return None
+    """Load a private copy of the implementation plan JSON."""
+    return get_plan_store(spec_dir).load()
 
 
 def save_implementation_plan(spec_dir: Path, plan: dict) -> bool:
     """Save the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
     try:
-        with open(plan_file, "w") as f:
-            json.dump(plan, f, indent=2)
+        get_plan_store(spec_dir).write(plan)
         return True
     except OSError:
         return False
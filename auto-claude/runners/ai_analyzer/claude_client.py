@@ -6,6 +6,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from core.rate_limiter import Priority, rate_limited
+
 try:
     from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
@@ -106,7 +108,7 @@ class ClaudeAnalysisClient:
             settings_file: Path to security settings file
 
         Returns:
-            ClaudeSDKClient instance
+            Rate-limited ClaudeSDKClient
         """
         system_prompt = (
             f"You are a senior software architect analyzing this codebase. "
@@ -115,15 +117,20 @@ class ClaudeAnalysisClient:
             f"Output your analysis as valid JSON only."
         )
 
-        return ClaudeSDKClient(
-            options=ClaudeAgentOptions(
-                model=self._get_model(),
-                system_prompt=system_prompt,
-                allowed_tools=self.ALLOWED_TOOLS,
-                max_turns=self.MAX_TURNS,
-                cwd=str(self.project_dir.resolve()),
-                settings=str(settings_file.resolve()),
-            )
+        model = self._get_model()
+        return rate_limited(
+            ClaudeSDKClient(
+                options=ClaudeAgentOptions(
+                    model=model,
+                    system_prompt=system_prompt,
+                    allowed_tools=self.ALLOWED_TOOLS,
+                    max_turns=self.MAX_TURNS,
+                    cwd=str(self.project_dir.resolve()),
+                    settings=str(settings_file.resolve()),
+                )
+            ),
+            model,
+            Priority.IDEATION,
         )
 
     async def _collect_response(self, client: Any) -> str:
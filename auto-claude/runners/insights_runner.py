@@ -32,6 +32,7 @@ except ImportError:
     ClaudeSDKClient = None
 
 from core.auth import ensure_claude_code_oauth_token, get_auth_token
+from core.rate_limiter import Priority, rate_limited
 from debug import (
     debug,
     debug_detailed,
@@ -183,18 +184,22 @@ Current question: {message}"""
 
     try:
         # Create Claude SDK client with appropriate settings for insights
-        client = ClaudeSDKClient(
-            options=ClaudeAgentOptions(
-                model=model,  # Use configured model
-                system_prompt=system_prompt,
-                allowed_tools=[
-                    "Read",
-                    "Glob",
-                    "Grep",
-                ],
-                max_turns=30,  # Allow sufficient turns for codebase exploration
-                cwd=str(project_path),
-            )
+        client = rate_limited(
+            ClaudeSDKClient(
+                options=ClaudeAgentOptions(
+                    model=model,  # Use configured model
+                    system_prompt=system_prompt,
+                    allowed_tools=[
+                        "Read",
+                        "Glob",
+                        "Grep",
+                    ],
+                    max_turns=30,  # Allow sufficient turns for codebase exploration
+                    cwd=str(project_path),
+                )
+            ),
+            model,
+            Priority.IDEATION,
         )
 
         # Use async context manager pattern
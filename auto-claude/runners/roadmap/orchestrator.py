@@ -6,9 +6,11 @@ Coordinates all phases of the roadmap generation process.
 
 import asyncio
 import json
+from functools import partial
 from pathlib import Path
 
 from client import create_client
+from core.rate_limiter import Priority
 from debug import debug, debug_error, debug_section, debug_success
 from init import init_auto_claude_dir
 from phase_config import get_thinking_budget
@@ -61,7 +63,7 @@ class RoadmapOrchestrator:
             self.project_dir,
             self.output_dir,
             resolved_model,
-            create_client,
+            partial(create_client, priority=Priority.IDEATION),
             self.thinking_budget,
         )
 
@@ -16,6 +16,7 @@ Main functions:
 - bash_security_hook: Pre-tool-use hook for command validation
 - validate_command: Standalone validation function for testing
 - get_security_profile: Get or create security profile for a project
+- share_security_profile: Use a project's profile for its worktrees too
 - reset_profile_cache: Reset cached security profile
 
 Command parsing:
@@ -48,6 +49,7 @@ from .parser import (
 from .profile import (
     get_security_profile,
     reset_profile_cache,
+    share_security_profile,
 )
 
 # Validators (for advanced usage)
@@ -74,6 +76,7 @@ __all__ = [
     "bash_security_hook",
     "validate_command",
     "get_security_profile",
+    "share_security_profile",
     "reset_profile_cache",
     # Parsing utilities
     "extract_commands",
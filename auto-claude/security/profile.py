@@ -18,9 +18,10 @@ from project_analyzer import (
 # GLOBAL STATE
 # =============================================================================
 
-# Cache the security profile to avoid re-analyzing on every command
-_cached_profile: Optional[SecurityProfile] = None
-_cached_project_dir: Optional[Path] = None
+# Cache the security profiles to avoid re-analyzing on every command. Keyed
+# by project directory: concurrent builds (run.py --specs) each run in their
+# own worktree, and would otherwise keep evicting each other's profile.
+_cached_profiles: dict[Path, SecurityProfile] = {}
 
 
 def get_security_profile(
@@ -36,23 +37,42 @@ def get_security_profile(
     Returns:
         SecurityProfile for the project
     """
-    global _cached_profile, _cached_project_dir
-
     project_dir = Path(project_dir).resolve()
 
     # Return cached profile if same project
-    if _cached_profile is not None and _cached_project_dir == project_dir:
-        return _cached_profile
+    profile = _cached_profiles.get(project_dir)
+    if profile is not None:
+        return profile
 
     # Analyze and cache
-    _cached_profile = get_or_create_profile(project_dir, spec_dir)
-    _cached_project_dir = project_dir
+    profile = _cached_profiles[project_dir] = get_or_create_profile(
+        project_dir, spec_dir
+    )
+    return profile
+
+
+def share_security_profile(
+    project_dir: Path, worktree_dirs: list[Path]
+) -> SecurityProfile:
+    """
+    Analyze a project once and use its profile for worktrees of it too.
+
+    Worktrees are checked out from the project, so they have the same stack;
+    concurrent builds (run.py --specs) would otherwise analyze each one.
 
-    return _cached_profile
+    Args:
+        project_dir: Project root directory
+        worktree_dirs: Worktrees of the project
+
+    Returns:
+        SecurityProfile for the project
+    """
+    profile = get_security_profile(project_dir)
+    for worktree_dir in worktree_dirs:
+        _cached_profiles[Path(worktree_dir).resolve()] = profile
+    return profile
 
 
 def reset_profile_cache() -> None:
-    """Reset the cached profile (useful for testing or re-analysis)."""
-    global _cached_profile, _cached_project_dir
-    _cached_profile = None
-    _cached_project_dir = None
+    """Reset the cached profiles (useful for testing or re-analysis)."""
+    _cached_profiles.clear()
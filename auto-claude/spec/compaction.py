@@ -11,6 +11,7 @@ from pathlib import Path
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from core.auth import get_sdk_env_vars, require_auth_token
+from core.rate_limiter import Priority, rate_limited
 
 
 async def summarize_phase_output(
@@ -67,18 +68,22 @@ Be concise and use bullet points. Skip boilerplate and meta-commentary.
 ## Summary:
 """
 
-    client = ClaudeSDKClient(
-        options=ClaudeAgentOptions(
-            model=model,
-            system_prompt=(
-                "You are a concise technical summarizer. Extract only the most "
-                "critical information from phase outputs. Use bullet points. "
-                "Focus on decisions, discoveries, and actionable insights."
-            ),
-            allowed_tools=[],  # No tools needed for summarization
-            max_turns=1,
-            env=get_sdk_env_vars(),
-        )
+    client = rate_limited(
+        ClaudeSDKClient(
+            options=ClaudeAgentOptions(
+                model=model,
+                system_prompt=(
+                    "You are a concise technical summarizer. Extract only the most "
+                    "critical information from phase outputs. Use bullet points. "
+                    "Focus on decisions, discoveries, and actionable insights."
+                ),
+                allowed_tools=[],  # No tools needed for summarization
+                max_turns=1,
+                env=get_sdk_env_vars(),
+            )
+        ),
+        model,
+        Priority.CODING,
     )
 
     try:
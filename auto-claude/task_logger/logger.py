@@ -2,6 +2,7 @@
 Main TaskLogger class for logging task execution.
 """
 
+from contextlib import AbstractContextManager
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -64,6 +65,15 @@ class TaskLogger:
         """Add an entry to the current phase."""
         self.storage.add_entry(entry)
 
+    def batched_writes(self) -> AbstractContextManager[None]:
+        """
+        Batch log file writes for the duration of a with block.
+
+        Streaming markers are still emitted for every entry; only the
+        task_logs.json rewrites are batched (see LogStorage.batched).
+        """
+        return self.storage.batched()
+
     def _debug_log(
         self,
         content: str,
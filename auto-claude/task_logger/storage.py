@@ -6,11 +6,19 @@ import json
 import os
 import sys
 import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .models import LogEntry, LogPhase
 
+# While batching, entries are saved once this many are pending...
+BATCH_MAX_ENTRIES = 50
+# ...or once this long has passed since the last save
+BATCH_MAX_SECONDS = 1.0
+
 
 class LogStorage:
     """Handles persistent storage of task logs."""
@@ -27,6 +35,9 @@ class LogStorage:
         self.spec_dir = Path(spec_dir)
         self.log_file = self.spec_dir / self.LOG_FILE
         self._data: dict = self._load_or_create()
+        self._batch_depth = 0
+        self._unsaved_entries = 0
+        self._last_save = time.monotonic()
 
     def _load_or_create(self) -> dict:
         """Load existing logs or create new structure."""
@@ -68,6 +79,8 @@ class LogStorage:
 
     def save(self) -> None:
         """Save logs to file atomically to prevent corruption from concurrent reads."""
+        self._unsaved_entries = 0
+        self._last_save = time.monotonic()
         self._data["updated_at"] = self._timestamp()
         try:
             self.spec_dir.mkdir(parents=True, exist_ok=True)
@@ -112,7 +125,31 @@ class LogStorage:
             }
 
         self._data["phases"][phase_key]["entries"].append(entry.to_dict())
-        self.save()
+        self._unsaved_entries += 1
+        if (
+            not self._batch_depth
+            or self._unsaved_entries >= BATCH_MAX_ENTRIES
+            or time.monotonic() - self._last_save >= BATCH_MAX_SECONDS
+        ):
+            self.save()
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """
+        Save added entries in batches instead of after every entry.
+
+        Every save rewrites the whole log file, so streaming thousands of
+        entries one save at a time gets slow. Inside this block entries are
+        saved every BATCH_MAX_ENTRIES entries or BATCH_MAX_SECONDS, and
+        anything left is saved on exit. Blocks can be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._unsaved_entries:
+                self.save()
 
     def update_phase_status(
         self, phase: str, status: str, completed_at: str | None = None
@@ -9,6 +9,10 @@ from .logger import TaskLogger
 # Global logger instance for easy access
 _current_logger: TaskLogger | None = None
 
+# One logger per spec directory, so specs building concurrently in one
+# process (run.py --specs) don't replace each other's logger
+_loggers: dict[Path, TaskLogger] = {}
+
 
 def get_task_logger(
     spec_dir: Path | None = None, emit_markers: bool = True
@@ -29,7 +33,10 @@ def get_task_logger(
         return _current_logger
 
     if _current_logger is None or _current_logger.spec_dir != spec_dir:
-        _current_logger = TaskLogger(spec_dir, emit_markers)
+        logger = _loggers.get(Path(spec_dir))
+        if logger is None:
+            logger = _loggers[Path(spec_dir)] = TaskLogger(spec_dir, emit_markers)
+        _current_logger = logger
 
     return _current_logger
 
@@ -38,6 +45,7 @@ def clear_task_logger() -> None:
     """Clear the global task logger."""
     global _current_logger
     _current_logger = None
+    _loggers.clear()
 
 
 def update_task_logger_path(new_spec_dir: Path) -> None:
@@ -55,9 +63,12 @@ def update_task_logger_path(new_spec_dir: Path) -> None:
     if _current_logger is None:
         return
 
+    _loggers.pop(Path(_current_logger.spec_dir), None)
+
     # Update the logger's internal paths
     _current_logger.spec_dir = Path(new_spec_dir)
     _current_logger.log_file = _current_logger.spec_dir / TaskLogger.LOG_FILE
+    _loggers[_current_logger.spec_dir] = _current_logger
 
     # Update spec_id in the storage
     _current_logger.storage.update_spec_id(new_spec_dir.name)
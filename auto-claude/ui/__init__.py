@@ -48,7 +48,7 @@ from .icons import Icons, icon
 from .menu import MenuOption, select_menu
 from .progress import progress_bar
 from .spinner import Spinner
-from .status import BuildState, BuildStatus, StatusManager
+from .status import BuildState, BuildStatus, SpecStatusManager, StatusManager
 
 # For backward compatibility
 _FANCY_UI = FANCY_UI
@@ -94,6 +94,7 @@ __all__ = [
     # Status
     "BuildState",
     "BuildStatus",
+    "SpecStatusManager",
     "StatusManager",
     # Formatters
     "print_header",
@@ -62,7 +62,7 @@ from ui.progress import progress_bar
 from ui.spinner import Spinner
 
 # Status management
-from ui.status import BuildState, BuildStatus, StatusManager
+from ui.status import BuildState, BuildStatus, SpecStatusManager, StatusManager
 
 # For backward compatibility, expose private capability variables
 _FANCY_UI = FANCY_UI
@@ -107,6 +107,7 @@ __all__ = [
     # Status
     "BuildState",
     "BuildStatus",
+    "SpecStatusManager",
     "StatusManager",
     # Formatters
     "print_header",
@@ -6,7 +6,7 @@ Build status tracking and status file management for ccstatusline integration.
 """
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -44,6 +44,11 @@ class BuildStatus:
     workers_max: int = 1
     session_number: int = 0
     session_started: str = ""
+    rate_limit_waiting: int = 0
+    rate_limit_last_wait: float = 0.0
+    rate_limit_average_wait: float = 0.0
+    # Per-spec progress when several specs build at once (--specs)
+    specs: dict[str, dict] = field(default_factory=dict)
     last_update: str = ""
 
     def to_dict(self) -> dict:
@@ -71,6 +76,12 @@ class BuildStatus:
                 "number": self.session_number,
                 "started_at": self.session_started,
             },
+            "rate_limit": {
+                "waiting": self.rate_limit_waiting,
+                "last_wait_seconds": self.rate_limit_last_wait,
+                "average_wait_seconds": self.rate_limit_average_wait,
+            },
+            "specs": self.specs,
             "last_update": self.last_update or datetime.now().isoformat(),
         }
 
@@ -81,6 +92,7 @@ class BuildStatus:
         phase = data.get("phase", {})
         workers = data.get("workers", {})
         session = data.get("session", {})
+        rate_limit = data.get("rate_limit", {})
 
         return cls(
             active=data.get("active", False),
@@ -97,10 +109,22 @@ class BuildStatus:
             workers_max=workers.get("max", 1),
             session_number=session.get("number", 0),
             session_started=session.get("started_at", ""),
+            rate_limit_waiting=rate_limit.get("waiting", 0),
+            rate_limit_last_wait=rate_limit.get("last_wait_seconds", 0.0),
+            rate_limit_average_wait=rate_limit.get("average_wait_seconds", 0.0),
+            specs=data.get("specs", {}),
             last_update=data.get("last_update", ""),
         )
 
 
+# States in which a spec of a multi-spec build counts as an active worker
+_ACTIVE_STATES = {
+    BuildState.PLANNING.value,
+    BuildState.BUILDING.value,
+    BuildState.QA.value,
+}
+
+
 class StatusManager:
     """Manages the .auto-claude-status file for ccstatusline integration."""
 
@@ -192,6 +216,43 @@ class StatusManager:
         self._status.session_number = number
         self.write()
 
+    def update_rate_limit(
+        self, waiting: int, last_wait: float, average_wait: float
+    ) -> None:
+        """Update API request queue wait times."""
+        self._status.rate_limit_waiting = waiting
+        self._status.rate_limit_last_wait = last_wait
+        self._status.rate_limit_average_wait = average_wait
+        self.write()
+
+    def update_spec(self, spec: str, status: BuildStatus) -> None:
+        """
+        Record one spec's progress in a multi-spec build.
+
+        Subtask counts are summed over all specs, and the specs that are
+        planning, building or in QA count as active workers.
+        """
+        self._status.specs[spec] = {
+            "state": status.state.value,
+            "subtasks": {
+                "completed": status.subtasks_completed,
+                "total": status.subtasks_total,
+                "in_progress": status.subtasks_in_progress,
+                "failed": status.subtasks_failed,
+            },
+            "phase": status.phase_current,
+            "session": status.session_number,
+        }
+        specs = self._status.specs.values()
+        self._status.subtasks_completed = sum(s["subtasks"]["completed"] for s in specs)
+        self._status.subtasks_total = sum(s["subtasks"]["total"] for s in specs)
+        self._status.subtasks_in_progress = sum(
+            s["subtasks"]["in_progress"] for s in specs
+        )
+        self._status.subtasks_failed = sum(s["subtasks"]["failed"] for s in specs)
+        self._status.workers_active = sum(s["state"] in _ACTIVE_STATES for s in specs)
+        self.write()
+
     def clear(self) -> None:
         """Remove status file."""
         if self.status_file.exists():
@@ -199,3 +260,38 @@ class StatusManager:
                 self.status_file.unlink()
             except OSError:
                 pass
+
+
+class SpecStatusManager(StatusManager):
+    """
+    Status of one spec in a multi-spec build.
+
+    Has the StatusManager interface, but instead of writing its own status
+    file it reports to the aggregate status of the whole build.
+    """
+
+    def __init__(self, parent: StatusManager, spec: str):
+        super().__init__(parent.project_dir)
+        self.parent = parent
+        self.spec = spec
+        self._status.spec = spec
+
+    def read(self) -> BuildStatus:
+        """The spec's current status."""
+        return self._status
+
+    def write(self, status: BuildStatus = None) -> None:
+        """Report the spec's status to the aggregate status."""
+        if status:
+            self._status = status
+        self._status.last_update = datetime.now().isoformat()
+        self.parent.update_spec(self.spec, self._status)
+
+    def update_rate_limit(
+        self, waiting: int, last_wait: float, average_wait: float
+    ) -> None:
+        """The rate limiter is shared, so its wait times go to the aggregate."""
+        self.parent.update_rate_limit(waiting, last_wait, average_wait)
+
+    def clear(self) -> None:
+        """Nothing to remove; the aggregate status file is the parent's."""
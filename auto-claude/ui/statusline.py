@@ -155,6 +155,14 @@ def format_full(status: BuildStatus) -> str:
     if status.session_number > 0:
         lines.append(f"Session: {status.session_number}")
 
+    # Multi-spec builds (--specs) list each spec's progress
+    for spec, progress in status.specs.items():
+        subtasks = progress.get("subtasks", {})
+        lines.append(
+            f"  {spec}: {progress.get('state', '')} "
+            f"{subtasks.get('completed', 0)}/{subtasks.get('total', 0)}"
+        )
+
     return "\n".join(lines)
 
 
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for the Client Config Factory
+===================================
+
+Tests reusing the per-run client configuration across sessions.
+
+Covers:
+- Reusing project capabilities, skills and tool allowlists
+- Revalidating them when project_index.json or .claude/skills/ change
+- Rewriting the security settings file only when it changes
+- Per-session model, thinking budget and agent type
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from core import client as client_module
+from core.client import ClientConfigFactory, get_client_factory
+
+
+@pytest.fixture
+def calls(monkeypatch) -> dict[str, int]:
+    """Count project index loads and skill discovery."""
+    calls = {"discover_skills": 0, "load_project_index": 0}
+
+    def counted(name):
+        original = getattr(client_module, name)
+
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return original(*args, **kwargs)
+
+        return wrapper
+
+    for name in calls:
+        monkeypatch.setattr(client_module, name, counted(name))
+    return calls
+
+
+@pytest.fixture
+def project(temp_dir: Path, monkeypatch) -> Path:
+    """A project without skills, outside any sparse worktree."""
+    monkeypatch.setattr(client_module, "require_auth_token", lambda: "token")
+    monkeypatch.setattr(client_module, "read_sparse_cone", lambda path: None)
+    monkeypatch.delenv("LINEAR_API_KEY", raising=False)
+    monkeypatch.delenv("GRAPHITI_MCP_URL", raising=False)
+    project_dir = temp_dir / "project"
+    (project_dir / ".auto-claude").mkdir(parents=True)
+    return project_dir
+
+
+def _write_index(project_dir: Path, index: dict) -> None:
+    (project_dir / ".auto-claude" / "project_index.json").write_text(json.dumps(index))
+
+
+def _add_skill(project_dir: Path, name: str) -> None:
+    skill_dir = project_dir / ".claude" / "skills" / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: The {name} skill\n---\n\nDo {name}.\n"
+    )
+
+
+class TestProjectConfig:
+    """Tests for caching the project-dependent configuration."""
+
+    def test_reused_across_sessions(self, project: Path, calls: dict):
+        factory = ClientConfigFactory(project, project / "spec")
+
+        first = factory.create_client("model-a")
+        second = factory.create_client("model-b", max_thinking_tokens=5000)
+
+        assert calls == {"discover_skills": 1, "load_project_index": 1}
+        assert first.options.model == "model-a"
+        assert second.options.model == "model-b"
+        assert second.options.max_thinking_tokens == 5000
+        assert first.options.allowed_tools == second.options.allowed_tools
+        # Each session gets its own allowlist to modify
+        assert first.options.allowed_tools is not second.options.allowed_tools
+
+    def test_project_index_change_revalidates(self, project: Path, calls: dict):
+        factory = ClientConfigFactory(project, project / "spec")
+        factory.create_client("model", agent_type="qa_reviewer")
+
+        _write_index(
+            project,
+            {"services": {"web": {"framework": "react", "type": "frontend"}}},
+        )
+        config, reused = factory.get_project_config()
+
+        assert not reused
+        assert calls["load_project_index"] == 2
+        assert config.project_capabilities["is_web_frontend"]
+
+    def test_new_skill_revalidates(self, project: Path, calls: dict):
+        factory = ClientConfigFactory(project, project / "spec")
+        factory.create_client("model")
+
+        _add_skill(project, "deploy")
+        client = factory.create_client("model")
+
+        assert calls["discover_skills"] == 2
+        assert client_module.TOOL_GET_SKILL_DETAILS in client.options.allowed_tools
+        assert "deploy" in client.options.system_prompt
+
+    def test_one_factory_per_project_and_spec(self, project: Path):
+        factory = get_client_factory(project, project / "spec")
+
+        assert get_client_factory(project / ".", project / "spec") is factory
+        assert get_client_factory(project, project / "other") is not factory
+
+
+class TestSettingsFile:
+    """Tests for writing the security settings file."""
+
+    def test_written_once_while_unchanged(self, project: Path):
+        factory = ClientConfigFactory(project, project / "spec")
+
+        factory.create_client("model")
+        inode = factory.settings_file.stat().st_ino
+        factory.create_client("model")
+
+        assert factory.settings_file.stat().st_ino == inode
+        settings = json.loads(factory.settings_file.read_text())
+        assert settings["sandbox"]["enabled"]
+
+    def test_rewritten_when_deleted(self, project: Path):
+        factory = ClientConfigFactory(project, project / "spec")
+        factory.create_client("model")
+
+        factory.settings_file.unlink()
+        factory.create_client("model")
+
+        assert factory.settings_file.exists()
+
+    def test_rewritten_when_permissions_change(self, project: Path, monkeypatch):
+        factory = ClientConfigFactory(project, project / "spec")
+        factory.create_client("model")
+
+        monkeypatch.setenv("GRAPHITI_MCP_URL", "http://localhost:8000/mcp/")
+        client = factory.create_client("model")
+
+        allow = json.loads(factory.settings_file.read_text())["permissions"]["allow"]
+        assert set(client_module.GRAPHITI_MCP_TOOLS) <= set(allow)
+        assert set(client_module.GRAPHITI_MCP_TOOLS) <= set(
+            client.options.allowed_tools
+        )
+
+
+class TestSetupTime:
+    """Tests for reporting client setup time."""
+
+    def test_reported(self, project: Path, capsys):
+        factory = ClientConfigFactory(project, project / "spec")
+
+        factory.create_client("model")
+        factory.create_client("model")
+
+        output = capsys.readouterr().out
+        assert "Client setup:" in output
+        assert "(fresh project config)" in output
+        assert "(cached project config)" in output
+        assert factory.last_setup_seconds > 0
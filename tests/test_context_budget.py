@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Tests for the Prompt Context Budget
+===================================
+
+Tests keeping subtask prompts within a per-agent token budget.
+
+Covers:
+- Token estimates and per-agent budgets
+- Splitting files into symbol ranges, cached until they change
+- Choosing the ranges most relevant to the subtask
+- Trimming recovery hints and Graphiti context
+- The budget breakdown of prompt bundles
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from agents import prefetch
+from agents.prefetch import build_prompt_bundle
+from prompts_pkg.context_budget import (
+    ContextBudget,
+    clear_symbol_cache,
+    estimate_tokens,
+    get_agent_budget,
+    read_symbol_blocks,
+    subtask_keywords,
+    trim_file_contents,
+)
+from prompts_pkg.prompt_generator import load_subtask_context
+
+
+def _module(functions: int, body_lines: int = 20) -> str:
+    """A Python module with an import header and numbered functions."""
+    lines = ["import os", "import sys", ""]
+    for i in range(functions):
+        lines.append(f"def handler_{i}(request):")
+        lines.extend(f"    value_{j} = request.get({j})" for j in range(body_lines))
+        lines.append("")
+    return "\n".join(lines)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_symbol_cache()
+    yield
+    clear_symbol_cache()
+
+
+class TestEstimates:
+    """Tests for token estimates and budgets."""
+
+    def test_estimate(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("def f(x): return x") == 8
+        # Long words count at least a token per 4 characters
+        assert estimate_tokens("a" * 400) == 100
+
+    def test_agent_budget_from_env(self, monkeypatch):
+        monkeypatch.delenv("AGENT_CONTEXT_BUDGET", raising=False)
+        monkeypatch.delenv("AGENT_CONTEXT_BUDGET_CODER", raising=False)
+        assert get_agent_budget("coder") == 24_000
+
+        monkeypatch.setenv("AGENT_CONTEXT_BUDGET", "8000")
+        assert get_agent_budget("coder") == 8000
+
+        monkeypatch.setenv("AGENT_CONTEXT_BUDGET_CODER", "0")
+        assert get_agent_budget("coder") is None
+        assert get_agent_budget("qa_fixer") == 8000
+
+
+class TestSymbolBlocks:
+    """Tests for splitting files into symbol ranges."""
+
+    def test_header_and_definitions(self, temp_dir: Path):
+        path = temp_dir / "app.py"
+        path.write_text(
+            "import os\n\n@route('/')\ndef index():\n    pass\n\nclass View:\n    pass\n"
+        )
+
+        _, blocks = read_symbol_blocks(path)
+
+        assert [(b.name, b.start, b.end) for b in blocks] == [
+            ("", 0, 2),
+            ("index", 2, 6),
+            ("View", 6, 9),
+        ]
+
+    def test_long_class_split_at_methods(self, temp_dir: Path):
+        methods = "\n".join(
+            f"    def method_{i}(self):\n" + "        pass\n" * 20 for i in range(5)
+        )
+        path = temp_dir / "big.py"
+        path.write_text(f"class Big:\n    '''Doc.'''\n{methods}")
+
+        _, blocks = read_symbol_blocks(path)
+
+        assert [b.name for b in blocks] == ["Big"] + [
+            f"Big.method_{i}" for i in range(5)
+        ]
+
+    def test_cached_until_file_changes(self, temp_dir: Path):
+        path = temp_dir / "app.py"
+        path.write_text("def first(): pass\n")
+
+        _, blocks = read_symbol_blocks(path)
+        assert read_symbol_blocks(path)[1] is blocks
+
+        path.write_text("def second(): pass\n# longer\n")
+        assert read_symbol_blocks(path)[1][0].name == "second"
+
+
+class TestSelection:
+    """Tests for choosing the relevant symbol ranges."""
+
+    def test_relevant_function_instead_of_top(self, temp_dir: Path):
+        (temp_dir / "handlers.py").write_text(_module(30))
+        subtask = {
+            "id": "fix-handler",
+            "description": "Fix handler_25 ignoring the request",
+            "files_to_modify": ["handlers.py"],
+        }
+
+        context = load_subtask_context(temp_dir, temp_dir, subtask)
+        content = context["files_to_modify"]["handlers.py"]
+
+        assert "def handler_25(request):" in content
+        assert "import os" in content
+        assert "omitted)" in content
+        assert context["omitted_tokens"] > 0
+
+    def test_token_budget_across_files(self, temp_dir: Path):
+        (temp_dir / "a.py").write_text(_module(10))
+        (temp_dir / "b.py").write_text(_module(10))
+        subtask = {"files_to_modify": ["a.py"], "patterns_from": ["b.py"]}
+
+        contents, omitted = trim_file_contents(
+            temp_dir,
+            subtask,
+            {"files_to_modify": ["a.py"], "patterns": ["b.py"]},
+            max_tokens=1000,
+        )
+
+        used = sum(
+            estimate_tokens(c) for group in contents.values() for c in group.values()
+        )
+        assert used <= 1100
+        assert omitted > 0
+        # Files to modify win ties
+        assert contents["files_to_modify"]["a.py"].count("def ") > contents["patterns"][
+            "b.py"
+        ].count("def ")
+
+    def test_small_files_whole(self, temp_dir: Path):
+        (temp_dir / "views.py").write_text("def index(): ...\n")
+        subtask = {"patterns_from": ["views.py"], "files_to_modify": ["missing.py"]}
+
+        context = load_subtask_context(temp_dir, temp_dir, subtask)
+
+        assert context["patterns"] == {"views.py": "def index(): ...\n"}
+        assert context["files_to_modify"] == {}
+        assert context["omitted_tokens"] == 0
+
+    def test_keywords(self):
+        keywords = subtask_keywords(
+            {
+                "id": "add-rateLimit",
+                "description": "Add the limiter to api_client",
+                "files_to_modify": ["core/http_client.py"],
+            }
+        )
+
+        assert {"rate", "limit", "limiter", "api", "client", "http"} <= keywords
+        assert "the" not in keywords
+
+
+class TestBudget:
+    """Tests for trimming the optional sections."""
+
+    def test_hints_keep_leading_items(self):
+        budget = ContextBudget("coder", 1000)
+
+        hints = budget.fit_items("recovery_hints", ["word " * 20] * 5, max_tokens=70)
+
+        assert len(hints) == 3
+        assert hints[-1].startswith("... (3 more recovery hints omitted")
+        assert budget.omitted["recovery_hints"] == 75
+
+    def test_text_limited_by_share(self):
+        budget = ContextBudget("coder", 1000)
+        budget.record("instructions", 600)
+        text = "\n".join(f"- insight {i}" for i in range(100))
+
+        trimmed = budget.fit_text("graphiti", text, max_share=0.25)
+
+        assert budget.used["graphiti"] <= 100
+        assert trimmed.endswith("omitted to fit the context budget)")
+        assert budget.remaining == 400 - budget.used["graphiti"]
+
+    def test_unlimited_keeps_everything(self):
+        budget = ContextBudget("coder", None)
+
+        assert budget.fit_text("graphiti", "a\nb") == "a\nb"
+        assert budget.remaining is None
+        assert budget.summary().startswith("2/unlimited tokens")
+
+
+class TestPromptBundle:
+    """Tests for the budget breakdown of prompt bundles."""
+
+    def test_bundle_within_budget(self, temp_dir: Path, monkeypatch):
+        monkeypatch.setenv("AGENT_CONTEXT_BUDGET_CODER", "3000")
+
+        async def fake_graphiti_context(spec_dir, project_dir, subtask):
+            return "\n".join(f"- past insight {i}" for i in range(500))
+
+        monkeypatch.setattr(prefetch, "get_graphiti_context", fake_graphiti_context)
+        (temp_dir / "handlers.py").write_text(_module(40))
+        subtask = {
+            "id": "handler-7",
+            "description": "Validate input in handler_7",
+            "files_to_modify": ["handlers.py"],
+        }
+
+        bundle = asyncio.run(
+            build_prompt_bundle(temp_dir, temp_dir, subtask, {"name": "Backend"})
+        )
+
+        budget = bundle.budget
+        assert set(budget.used) == {"instructions", "graphiti", "files"}
+        assert budget.total <= 3000
+        assert estimate_tokens(bundle.prompt) <= 3000 * 1.05
+        assert "def handler_7(request):" in bundle.prompt
+        assert budget.omitted["graphiti"] > 0
+        assert budget.omitted["files"] > 0
+        assert "trimmed" in budget.summary()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for the Async Git Runner
+==============================
+
+Tests running git from async code without blocking the event loop.
+
+Covers:
+- Successful and failing commands, and check=True
+- Killing commands that time out
+- The per-repository concurrency limit
+- Async commit helpers used by the agent loop
+- Batched staging of resolved merge files
+"""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import core.git_runner as git_runner
+import pytest
+from agents.utils import (
+    get_commit_count,
+    get_commit_count_async,
+    get_latest_commit,
+    get_latest_commit_async,
+)
+from core.git_runner import GitCommandError, run_git
+
+
+class TestRunGit:
+    """Tests for run_git."""
+
+    def test_success(self, temp_git_repo: Path):
+        result = asyncio.run(
+            run_git(["rev-parse", "--abbrev-ref", "HEAD"], temp_git_repo)
+        )
+
+        assert result.ok
+        assert result.stdout.strip() == "main"
+        assert result.cwd == str(temp_git_repo.resolve())
+        assert result.duration >= 0
+
+    def test_failure_returns_result(self, temp_git_repo: Path):
+        result = asyncio.run(run_git(["rev-parse", "no-such-ref"], temp_git_repo))
+
+        assert not result.ok
+        assert result.returncode != 0
+        assert result.stderr
+
+    def test_check_raises(self, temp_git_repo: Path):
+        with pytest.raises(GitCommandError) as exc_info:
+            asyncio.run(
+                run_git(["rev-parse", "no-such-ref"], temp_git_repo, check=True)
+            )
+
+        assert exc_info.value.result.args == ["rev-parse", "no-such-ref"]
+
+    def test_input_is_passed_to_stdin(self, temp_git_repo: Path):
+        result = asyncio.run(
+            run_git(["hash-object", "--stdin"], temp_git_repo, input="hello\n")
+        )
+        expected = subprocess.run(
+            ["git", "hash-object", "--stdin"],
+            cwd=temp_git_repo,
+            input="hello\n",
+            capture_output=True,
+            text=True,
+        ).stdout
+
+        assert result.stdout == expected
+
+    def test_timeout_kills_process(self, temp_git_repo: Path):
+        # A shell alias that outlives the timeout
+        async def run():
+            return await run_git(
+                ["-c", "alias.hang=!sleep 10", "hang"], temp_git_repo, timeout=0.2
+            )
+
+        result = asyncio.run(run())
+
+        assert result.timed_out
+        assert not result.ok
+        assert result.duration < 5
+
+    def test_missing_directory(self, tmp_path: Path):
+        result = asyncio.run(run_git(["status"], tmp_path / "missing"))
+
+        assert result.returncode == -1
+        assert not result.ok
+
+    def test_limits_concurrency_per_repo(self, temp_git_repo: Path, monkeypatch):
+        monkeypatch.setattr(git_runner, "MAX_GIT_PROCESSES_PER_REPO", 2)
+        running = 0
+        peak = 0
+        real_exec = asyncio.create_subprocess_exec
+
+        async def tracking_exec(*args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            process = await real_exec(*args, **kwargs)
+            real_communicate = process.communicate
+
+            async def communicate(*a, **kw):
+                nonlocal running
+                try:
+                    await asyncio.sleep(0.05)
+                    return await real_communicate(*a, **kw)
+                finally:
+                    running -= 1
+
+            process.communicate = communicate
+            return process
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", tracking_exec)
+
+        async def run_many():
+            return await asyncio.gather(
+                *(run_git(["rev-parse", "HEAD"], temp_git_repo) for _ in range(6))
+            )
+
+        results = asyncio.run(run_many())
+
+        assert all(r.ok for r in results)
+        assert peak == 2
+
+
+class TestAsyncCommitHelpers:
+    """The async helpers agree with the sync ones."""
+
+    def test_latest_commit_and_count(self, temp_git_repo: Path):
+        async def gather():
+            return await asyncio.gather(
+                get_latest_commit_async(temp_git_repo),
+                get_commit_count_async(temp_git_repo),
+            )
+
+        commit, count = asyncio.run(gather())
+
+        assert commit == get_latest_commit(temp_git_repo)
+        assert count == get_commit_count(temp_git_repo) == 1
+
+    def test_not_a_repository(self, tmp_path: Path):
+        assert asyncio.run(get_latest_commit_async(tmp_path)) is None
+        assert asyncio.run(get_commit_count_async(tmp_path)) == 0
+
+
+class TestStageFiles:
+    """Batched staging of resolved merge files."""
+
+    def _staged(self, repo: Path) -> set[str]:
+        output = subprocess.run(
+            ["git", "diff", "--cached", "--name-status"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return set(output.strip().splitlines())
+
+    def test_stages_changes_and_deletions_in_batches(
+        self, temp_git_repo: Path, monkeypatch
+    ):
+        from core.workspace import _workspace_module as workspace_module
+
+        monkeypatch.setattr(workspace_module, "GIT_ADD_BATCH_SIZE", 2)
+        (temp_git_repo / "README.md").unlink()
+        for name in ("a.py", "b.py", "c.py"):
+            (temp_git_repo / name).write_text(f"# {name}\n")
+
+        asyncio.run(
+            workspace_module._stage_files(
+                temp_git_repo, ["a.py", "b.py", "c.py", "README.md"]
+            )
+        )
+
+        assert self._staged(temp_git_repo) == {
+            "A\ta.py",
+            "A\tb.py",
+            "A\tc.py",
+            "D\tREADME.md",
+        }
+
+    def test_unmatched_path_does_not_block_others(self, temp_git_repo: Path):
+        from core.workspace import _workspace_module as workspace_module
+
+        (temp_git_repo / "a.py").write_text("# a\n")
+
+        asyncio.run(workspace_module._stage_files(temp_git_repo, ["gone.py", "a.py"]))
+
+        assert self._staged(temp_git_repo) == {"A\ta.py"}
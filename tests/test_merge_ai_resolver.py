@@ -11,13 +11,18 @@ Covers:
 - Conflict resolution attempts
 - Statistics tracking (AI calls, token estimates)
 - can_resolve filtering logic
+- Resolution caching and cross-file batched prefetch
 """
 
+import os
 from datetime import datetime
 
 import pytest
 
 from merge import (
+    AIResolver,
+    FakeAIFunction,
+    ResolutionCache,
     ChangeType,
     SemanticChange,
     TaskSnapshot,
@@ -207,3 +212,201 @@ class TestStatsTracking:
 
         stats = mock_ai_resolver.stats
         assert stats["calls_made"] == 3
+
+
+def _python_conflict(file_path: str, name: str, intent: str = "Change it"):
+    """Build a conflict on a Python function plus the task snapshots behind it."""
+    snapshots = [
+        TaskSnapshot(
+            task_id=task_id,
+            task_intent=f"{intent} ({task_id})",
+            started_at=datetime.now(),
+            semantic_changes=[
+                SemanticChange(
+                    change_type=ChangeType.MODIFY_FUNCTION,
+                    target=name,
+                    location=f"function:{name}",
+                    line_start=1,
+                    line_end=2,
+                    content_after=f"def {name}():\n    return {value}",
+                ),
+            ],
+        )
+        for task_id, value in (("task-001", 1), ("task-002", 2))
+    ]
+    conflict = ConflictRegion(
+        file_path=file_path,
+        location=f"function:{name}",
+        tasks_involved=["task-001", "task-002"],
+        change_types=[ChangeType.MODIFY_FUNCTION, ChangeType.MODIFY_FUNCTION],
+        severity=ConflictSeverity.HIGH,
+        can_auto_merge=False,
+        merge_strategy=MergeStrategy.AI_REQUIRED,
+    )
+    return conflict, f"def {name}():\n    return 0", snapshots
+
+
+class TestResolutionCache:
+    """Tests for caching AI resolutions."""
+
+    def test_repeat_resolution_hits_cache(self):
+        """Resolving the same conflict twice calls the AI once."""
+        fake = FakeAIFunction()
+        resolver = AIResolver(ai_call_fn=fake)
+        conflict, baseline, snapshots = _python_conflict("a.py", "f")
+
+        first = resolver.resolve_conflict(conflict, baseline, snapshots)
+        second = resolver.resolve_conflict(conflict, baseline, snapshots)
+
+        assert fake.call_count == 1
+        assert second.decision == MergeDecision.AI_MERGED
+        assert second.merged_content == first.merged_content
+        assert second.ai_calls_made == 0
+        assert resolver.stats["cache_hits"] == 1
+
+    def test_same_shape_in_other_file_hits_cache(self):
+        """File path is not part of the key."""
+        fake = FakeAIFunction()
+        resolver = AIResolver(ai_call_fn=fake)
+
+        resolver.resolve_conflict(*_python_conflict("a.py", "f"))
+        resolver.resolve_conflict(*_python_conflict("b.py", "f"))
+
+        assert fake.call_count == 1
+
+    def test_different_intent_misses_cache(self):
+        """Task intents are part of the key."""
+        fake = FakeAIFunction()
+        resolver = AIResolver(ai_call_fn=fake)
+
+        resolver.resolve_conflict(*_python_conflict("a.py", "f", intent="Fix bug"))
+        resolver.resolve_conflict(*_python_conflict("a.py", "f", intent="Add feature"))
+
+        assert fake.call_count == 2
+
+    def test_persisted_cache_survives_new_resolver(self, tmp_path):
+        """A merge preview's resolutions are reused by the real merge."""
+        fake = FakeAIFunction()
+        conflict, baseline, snapshots = _python_conflict("a.py", "f")
+
+        preview = AIResolver(ai_call_fn=fake, cache=ResolutionCache(tmp_path))
+        preview.resolve_conflict(conflict, baseline, snapshots)
+        real = AIResolver(ai_call_fn=fake, cache=ResolutionCache(tmp_path))
+        result = real.resolve_conflict(conflict, baseline, snapshots)
+
+        assert fake.call_count == 1
+        assert result.decision == MergeDecision.AI_MERGED
+
+    def test_cache_is_bounded(self):
+        """The in-memory LRU keeps at most max_entries resolutions."""
+        cache = ResolutionCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
+
+    def test_disk_cache_is_bounded(self, tmp_path):
+        """Entry files beyond max_disk_entries are pruned, oldest first."""
+        for mtime, key in enumerate(("a", "b", "c")):
+            ResolutionCache(tmp_path).put(key, key)
+            os.utime(tmp_path / f"{key}.json", (1000 + mtime, 1000 + mtime))
+        cache = ResolutionCache(tmp_path, max_disk_entries=2)
+        # Reading an entry marks it as recently used
+        assert cache.get("a") == "a"
+
+        cache.put("d", "d")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "d.json"]
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """A temp file is removed even when writing it fails."""
+        from merge.ai_resolver import cache as cache_module
+
+        def broken_dump(*args, **kwargs):
+            raise ValueError("not serializable")
+
+        monkeypatch.setattr(cache_module.json, "dump", broken_dump)
+
+        with pytest.raises(ValueError):
+            ResolutionCache(tmp_path).put("a", "a")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestPrefetchResolutions:
+    """Tests for cross-file batched, concurrent prefetching."""
+
+    def test_batches_conflicts_across_files(self):
+        """Conflicts from different files share one call within the budget."""
+        fake = FakeAIFunction()
+        resolver = AIResolver(ai_call_fn=fake)
+        items = [_python_conflict(f"m{i}.py", f"f{i}") for i in range(3)]
+
+        prefetch = resolver.prefetch_resolutions(items)
+
+        assert prefetch.ai_calls_made == 1
+        assert prefetch.resolved == 3
+        for item in items:
+            result = resolver.resolve_conflict(*item)
+            assert result.decision == MergeDecision.AI_MERGED
+            assert result.merged_content.startswith(item[1])
+        assert fake.call_count == 1
+
+    def test_token_budget_splits_batches(self):
+        """Batches never exceed batch_token_budget."""
+        items = [_python_conflict(f"m{i}.py", f"f{i}") for i in range(4)]
+        per_conflict = AIResolver().build_context(*items[0]).estimated_tokens
+        fake = FakeAIFunction()
+        resolver = AIResolver(
+            ai_call_fn=fake, batch_token_budget=per_conflict * 2 + 1
+        )
+
+        prefetch = resolver.prefetch_resolutions(items)
+
+        assert prefetch.ai_calls_made == 2
+        assert prefetch.resolved == 4
+
+    def test_skips_cached_and_duplicate_conflicts(self):
+        """Identical conflicts are sent once; cached ones not at all."""
+        fake = FakeAIFunction()
+        resolver = AIResolver(ai_call_fn=fake)
+        items = [_python_conflict("a.py", "f"), _python_conflict("b.py", "f")]
+
+        first = resolver.prefetch_resolutions(items)
+        second = resolver.prefetch_resolutions(items)
+
+        assert first.ai_calls_made == 1
+        assert second.ai_calls_made == 0
+        assert second.already_cached == 2
+        assert fake.call_count == 1
+
+    def test_concurrency_cap(self):
+        """No more than max_concurrent batches are in flight."""
+        fake = FakeAIFunction(latency=0.05)
+        resolver = AIResolver(ai_call_fn=fake, batch_token_budget=1)
+        items = [_python_conflict(f"m{i}.py", f"f{i}") for i in range(6)]
+
+        prefetch = resolver.prefetch_resolutions(items, max_concurrent=3)
+
+        assert prefetch.ai_calls_made == 6
+        assert fake.max_in_flight == 3
+        assert resolver.stats["calls_made"] == 6
+
+    def test_unparsed_batch_leaves_conflicts_uncached(self):
+        """A response without labeled blocks caches nothing."""
+        resolver = AIResolver(ai_call_fn=lambda system, user: "I can't help with that.")
+        items = [_python_conflict(f"m{i}.py", f"f{i}") for i in range(2)]
+
+        prefetch = resolver.prefetch_resolutions(items)
+
+        assert prefetch.ai_calls_made == 1
+        assert prefetch.resolved == 0
+        assert len(resolver.cache) == 0
+
+    def test_without_ai_function(self, ai_resolver):
+        """Without AI function, prefetch does nothing."""
+        prefetch = ai_resolver.prefetch_resolutions([_python_conflict("a.py", "f")])
+
+        assert prefetch.ai_calls_made == 0
+        assert prefetch.conflicts_requested == 1
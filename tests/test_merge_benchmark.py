@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the Merge Benchmark
+=============================
+
+Tests the synthetic repository generator, per-stage measurement, and
+report comparison used to track merge pipeline performance.
+
+Covers:
+- Generated repositories have one branch/worktree per task
+- Every stage is measured and the merge resolves conflicts with the fake AI
+- Subprocess counting
+- Regression comparison between two reports
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge.benchmark import (
+    STAGES,
+    BenchmarkConfig,
+    StageMetrics,
+    compare_reports,
+    create_synthetic_repo,
+    measure_stage,
+    run_benchmark,
+)
+
+SMALL = BenchmarkConfig(file_count=6, file_lines=60, task_count=3, overlap_ratio=0.34)
+
+
+class TestSyntheticRepo:
+    """Tests for repository generation."""
+
+    def test_worktree_per_task(self, tmp_path):
+        synthetic = create_synthetic_repo(tmp_path, SMALL)
+
+        branches = subprocess.run(
+            ["git", "branch", "--list", "auto-claude/*", "--format=%(refname:short)"],
+            cwd=synthetic.path,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert branches == ["auto-claude/task-001", "auto-claude/task-002", "auto-claude/task-003"]
+        assert len(synthetic.main_commits) == SMALL.main_commits
+        assert all(path.exists() for path in synthetic.task_worktrees.values())
+
+    def test_shared_files_edited_by_every_task(self, tmp_path):
+        synthetic = create_synthetic_repo(tmp_path, SMALL)
+
+        assert len(synthetic.shared_files) == 2
+        for files in synthetic.task_files.values():
+            assert set(synthetic.shared_files) <= set(files)
+        own = [
+            set(files) - set(synthetic.shared_files)
+            for files in synthetic.task_files.values()
+        ]
+        assert set.union(*own) == {f"src/module_{i:04d}.py" for i in range(2, 6)}
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            BenchmarkConfig(overlap_ratio=1.5)
+
+
+class TestRunBenchmark:
+    """Tests for a full benchmark run."""
+
+    def test_report(self, tmp_path):
+        report = run_benchmark(SMALL, tmp_path)
+
+        assert list(report["stages"]) == list(STAGES)
+        json.dumps(report)
+        for metrics in report["stages"].values():
+            assert metrics["wall_seconds"] > 0
+        assert report["stages"]["refresh_from_git"]["subprocesses"] > 0
+        assert report["stages"]["semantic_analysis"]["subprocesses"] == 0
+
+        merge = report["stages"]["merge_tasks"]["details"]
+        assert merge["success"]
+        assert merge["stats"]["files_processed"] == SMALL.file_count
+        assert merge["stats"]["files_ai_merged"] == 2
+        assert merge["fake_ai_calls"] >= 1
+
+    def test_no_overlap_needs_no_ai(self, tmp_path):
+        config = BenchmarkConfig(file_count=4, file_lines=60, task_count=2, overlap_ratio=0)
+
+        merge = run_benchmark(config, tmp_path)["stages"]["merge_tasks"]["details"]
+
+        assert merge["stats"]["files_auto_merged"] == 4
+        assert merge["fake_ai_calls"] == 0
+
+
+class TestMeasurement:
+    """Tests for measure_stage and compare_reports."""
+
+    def test_counts_subprocesses(self):
+        metrics = StageMetrics()
+        with measure_stage(metrics):
+            subprocess.run(["git", "--version"], capture_output=True)
+            subprocess.run(["git", "--version"], capture_output=True)
+
+        assert metrics.subprocesses == 2
+        assert subprocess.Popen.__name__ == "Popen"
+
+    def test_compare_flags_regressions(self):
+        baseline = {"stages": {"merge_tasks": {"wall_seconds": 1.0, "subprocesses": 10}}}
+        current = {"stages": {"merge_tasks": {"wall_seconds": 1.05, "subprocesses": 20}}}
+
+        rows = {row["metric"]: row for row in compare_reports(baseline, current)}
+
+        assert not rows["wall_seconds"]["regressed"]
+        assert rows["subprocesses"]["regressed"]
+        assert rows["subprocesses"]["change"] == pytest.approx(1.0)
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Tests for GitObjectReader
+=========================
+
+Tests the persistent git cat-file reader used by merge and workspace code.
+
+Covers:
+- Reading files at refs and resolving revisions
+- Missing files and refs
+- Blob cache hits and fork accounting
+- Shared per-repository instances, closed on removal and capped in number
+- Thread safety
+- Migrated call sites
+"""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge import git_object_reader
+from merge.git_object_reader import GitObjectReader, close_reader, get_object_reader
+from merge.git_utils import get_file_from_branch
+from merge.timeline_git import TimelineGitHelper
+
+
+def _commit_file(repo: Path, name: str, content: str, message: str) -> str:
+    path = repo / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    subprocess.run(["git", "add", name], cwd=repo, capture_output=True, check=True)
+    subprocess.run(["git", "commit", "-m", message], cwd=repo, capture_output=True, check=True)
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def reader(temp_git_repo: Path):
+    """Create a standalone reader for the temp repo."""
+    reader = GitObjectReader(temp_git_repo)
+    yield reader
+    reader.close()
+
+
+class TestReadFile:
+    """Tests for reading file contents at refs."""
+
+    def test_read_file_matches_git_show(self, reader, temp_git_repo):
+        """Content matches what git show returns."""
+        _commit_file(temp_git_repo, "src/app.py", "def main():\n    return 1\n", "Add app")
+
+        expected = subprocess.run(
+            ["git", "show", "main:src/app.py"],
+            cwd=temp_git_repo, capture_output=True, text=True,
+        ).stdout
+
+        assert reader.read_file("main", "src/app.py") == expected
+
+    def test_read_file_at_older_commit(self, reader, temp_git_repo):
+        """Reads historical content by commit hash."""
+        first = _commit_file(temp_git_repo, "a.txt", "one\n", "v1")
+        _commit_file(temp_git_repo, "a.txt", "two\n", "v2")
+
+        assert reader.read_file(first, "a.txt") == "one\n"
+        assert reader.read_file("HEAD", "a.txt") == "two\n"
+
+    def test_missing_file_returns_none(self, reader):
+        """A path that doesn't exist at the ref returns None."""
+        assert reader.read_file("main", "does/not/exist.py") is None
+
+    def test_missing_ref_returns_none(self, reader):
+        """An unknown ref returns None."""
+        assert reader.read_file("no-such-branch", "README.md") is None
+
+    def test_directory_is_not_a_blob(self, reader, temp_git_repo):
+        """Reading a tree path returns None like a missing file."""
+        _commit_file(temp_git_repo, "pkg/mod.py", "x = 1\n", "Add pkg")
+        assert reader.read_file("main", "pkg") is None
+
+    def test_crlf_normalized_like_text_mode(self, reader, temp_git_repo):
+        """CRLF content is decoded the same way subprocess text mode does."""
+        path = temp_git_repo / "win.txt"
+        path.write_bytes(b"a\r\nb\r\n")
+        subprocess.run(["git", "add", "win.txt"], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "crlf"], cwd=temp_git_repo, capture_output=True)
+
+        assert reader.read_file("main", "win.txt") == "a\nb\n"
+
+
+class TestResolve:
+    """Tests for revision resolution."""
+
+    def test_resolve_head(self, reader, temp_git_repo):
+        """HEAD resolves to the current commit."""
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=temp_git_repo, capture_output=True, text=True,
+        ).stdout.strip()
+
+        assert reader.resolve("HEAD") == expected
+
+    def test_resolve_sees_new_commits(self, reader, temp_git_repo):
+        """The long-lived process picks up commits made after it started."""
+        reader.resolve("HEAD")
+        new_head = _commit_file(temp_git_repo, "b.txt", "b\n", "Add b")
+
+        assert reader.resolve("HEAD") == new_head
+
+    def test_resolve_unknown(self, reader):
+        """Unknown revisions resolve to None."""
+        assert reader.resolve("definitely-not-a-ref") is None
+
+    def test_not_a_repository(self, tmp_path):
+        """A non-git directory resolves to None instead of raising."""
+        reader = GitObjectReader(tmp_path)
+        try:
+            assert reader.resolve("HEAD") is None
+            assert reader.read_file("HEAD", "x.py") is None
+        finally:
+            reader.close()
+
+
+class TestCachingAndStats:
+    """Tests for the blob cache and fork accounting."""
+
+    def test_identical_blobs_hit_cache(self, reader, temp_git_repo):
+        """Same blob reached through two refs is only transferred once."""
+        _commit_file(temp_git_repo, "c.txt", "shared\n", "Add c")
+        subprocess.run(["git", "branch", "other"], cwd=temp_git_repo, capture_output=True)
+
+        reader.read_file("main", "c.txt")
+        reader.read_file("other", "c.txt")
+
+        assert reader.stats.cache_hits == 1
+
+    def test_processes_reused_across_reads(self, reader, temp_git_repo):
+        """Many reads spawn at most the two cat-file processes."""
+        for i in range(5):
+            _commit_file(temp_git_repo, f"f{i}.txt", f"{i}\n", f"Add f{i}")
+        for i in range(5):
+            assert reader.read_file("main", f"f{i}.txt") == f"{i}\n"
+
+        assert reader.stats.processes_spawned == 2
+        assert reader.stats.forks_avoided == 3
+        assert reader.stats.to_dict()["lookups"] == 5
+
+    def test_cache_is_bounded(self, temp_git_repo):
+        """The LRU evicts the oldest blobs beyond cache_size."""
+        reader = GitObjectReader(temp_git_repo, cache_size=2)
+        try:
+            for i in range(3):
+                _commit_file(temp_git_repo, f"g{i}.txt", f"g{i}\n", f"Add g{i}")
+            for i in range(3):
+                reader.read_file("main", f"g{i}.txt")
+
+            assert len(reader._cache) == 2
+        finally:
+            reader.close()
+
+    def test_recovers_after_close(self, reader):
+        """Closing the processes just restarts them on next use."""
+        assert reader.read_file("main", "README.md") == "# Test Project\n"
+        reader.close()
+        assert reader.read_file("main", "README.md") == "# Test Project\n"
+
+
+class TestSharedReader:
+    """Tests for the per-repository registry."""
+
+    def test_same_repo_same_reader(self, temp_git_repo):
+        """get_object_reader returns one instance per repository."""
+        assert get_object_reader(temp_git_repo) is get_object_reader(str(temp_git_repo))
+
+    def test_close_reader(self, temp_git_repo):
+        """close_reader stops the processes and forgets the reader."""
+        reader = get_object_reader(temp_git_repo)
+        assert reader.resolve("HEAD")
+
+        close_reader(temp_git_repo)
+
+        assert reader._check._proc is None
+        assert get_object_reader(temp_git_repo) is not reader
+        close_reader(temp_git_repo / "missing")
+
+    def test_registry_closes_least_recently_used(self, tmp_path, monkeypatch):
+        """Beyond MAX_OPEN_READERS the least recently used reader is closed."""
+        monkeypatch.setattr(git_object_reader, "MAX_OPEN_READERS", 2)
+        monkeypatch.setattr(git_object_reader, "_readers", type(git_object_reader._readers)())
+        repos = []
+        for name in ("a", "b", "c"):
+            repo = tmp_path / name
+            subprocess.run(["git", "init", "-q", str(repo)], check=True)
+            repos.append(repo)
+        first, second = get_object_reader(repos[0]), get_object_reader(repos[1])
+        first.resolve("HEAD")
+        second.resolve("HEAD")
+
+        # Using the first makes the second the least recently used
+        get_object_reader(repos[0])
+        get_object_reader(repos[2])
+
+        assert second._check._proc is None
+        assert first._check._proc is not None
+        assert list(git_object_reader._readers) == [repos[0].resolve(), repos[2].resolve()]
+        git_object_reader.close_all_readers()
+
+    def test_concurrent_reads(self, temp_git_repo):
+        """Concurrent threads get consistent results from one reader."""
+        for i in range(4):
+            _commit_file(temp_git_repo, f"t{i}.txt", f"thread {i}\n" * 50, f"Add t{i}")
+        reader = get_object_reader(temp_git_repo)
+        errors = []
+
+        def worker(i: int):
+            for _ in range(20):
+                if reader.read_file("main", f"t{i}.txt") != f"thread {i}\n" * 50:
+                    errors.append(i)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+
+
+class TestMigratedCallSites:
+    """Tests that existing helpers go through the reader."""
+
+    def test_get_file_from_branch(self, temp_git_repo):
+        """merge.git_utils.get_file_from_branch reads via the reader."""
+        assert get_file_from_branch(temp_git_repo, "README.md", "main") == "# Test Project\n"
+        assert get_file_from_branch(temp_git_repo, "missing.md", "main") is None
+
+    def test_timeline_helper(self, temp_git_repo):
+        """TimelineGitHelper.get_file_content_at_commit reads via the reader."""
+        helper = TimelineGitHelper(temp_git_repo)
+        head = helper.get_current_main_commit()
+        before = get_object_reader(temp_git_repo).stats.lookups
+
+        assert helper.get_file_content_at_commit("README.md", head) == "# Test Project\n"
+        assert get_object_reader(temp_git_repo).stats.lookups == before + 1
@@ -14,9 +14,11 @@ Covers:
 - Merge statistics and reports
 - AI enabled/disabled modes
 - Report serialization
+- Parallel per-file merge and concurrent AI resolution
 """
 
 import json
+import subprocess
 import sys
 from pathlib import Path
 
@@ -27,7 +29,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
 # Add tests directory to path for test_fixtures
 sys.path.insert(0, str(Path(__file__).parent))
 
-from merge import MergeOrchestrator
+from merge import AIResolver, FakeAIFunction, MergeOrchestrator
 from merge.orchestrator import TaskMergeRequest
 
 from test_fixtures import (
@@ -248,3 +250,126 @@ class TestErrorHandling:
 
         assert report is not None
         assert len(report.tasks_merged) == 0
+
+
+PARALLEL_BASE = "def f(x):\n    return x\n\n\ndef g():\n    pass\n"
+PARALLEL_MODIFIED = "def f(x):\n    return x + 1\n\n\ndef g():\n    pass\n"
+PARALLEL_REMOVED = "def g():\n    pass\n"
+
+
+def _parallel_content(content, index, distinct):
+    """Make each file's version of the content unique when distinct is set."""
+    return content.replace("x", f"x{index}") if distinct else content
+
+
+def _setup_conflicting_tasks(orchestrator, project, file_count, distinct=False):
+    """Two tasks that conflict (modify vs. remove f) in every file."""
+    (project / "pkg").mkdir(exist_ok=True)
+    files = []
+    for i in range(file_count):
+        path = project / "pkg" / f"mod_{i}.py"
+        path.write_text(_parallel_content(PARALLEL_BASE, i, distinct))
+        files.append(path)
+    subprocess.run(["git", "add", "."], cwd=project, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "Add modules"], cwd=project, capture_output=True)
+
+    tracker = orchestrator.evolution_tracker
+    for task_id in ("task-001", "task-002"):
+        tracker.capture_baselines(task_id, files)
+    for i in range(file_count):
+        rel = f"pkg/mod_{i}.py"
+        base = _parallel_content(PARALLEL_BASE, i, distinct)
+        for task_id, after in (
+            ("task-001", PARALLEL_MODIFIED),
+            ("task-002", PARALLEL_REMOVED),
+        ):
+            tracker.record_modification(
+                task_id, rel, base, _parallel_content(after, i, distinct)
+            )
+
+    return [
+        TaskMergeRequest(task_id="task-001", worktree_path=project),
+        TaskMergeRequest(task_id="task-002", worktree_path=project),
+    ]
+
+
+class TestParallelFileMerge:
+    """Tests for the process-pool and concurrent AI merge stages."""
+
+    def test_parallel_matches_sequential(self, temp_project):
+        """Worker processes produce the same report as in-process merging."""
+        sequential = MergeOrchestrator(temp_project, enable_ai=False, dry_run=True)
+        requests = _setup_conflicting_tasks(sequential, temp_project, 6)
+        seq_report = sequential.merge_tasks(requests)
+
+        parallel = MergeOrchestrator(
+            temp_project, enable_ai=False, dry_run=True, max_workers=3
+        )
+        _setup_conflicting_tasks(parallel, temp_project, 6)
+        par_report = parallel.merge_tasks(requests)
+
+        assert list(par_report.file_results) == list(seq_report.file_results)
+        for path, result in seq_report.file_results.items():
+            other = par_report.file_results[path]
+            assert other.decision == result.decision
+            assert other.merged_content == result.merged_content
+        assert par_report.stats.to_dict() | {"duration_seconds": 0} == (
+            seq_report.stats.to_dict() | {"duration_seconds": 0}
+        )
+
+    def test_ai_stage_respects_concurrency_cap(self, temp_project):
+        """AI calls run concurrently but never above max_concurrent_ai."""
+        fake = FakeAIFunction(latency=0.05)
+        orchestrator = MergeOrchestrator(
+            temp_project,
+            dry_run=True,
+            # A one-token budget keeps every conflict in its own call
+            ai_resolver=AIResolver(ai_call_fn=fake, batch_token_budget=1),
+            max_concurrent_ai=2,
+        )
+        requests = _setup_conflicting_tasks(orchestrator, temp_project, 5, distinct=True)
+
+        report = orchestrator.merge_tasks(requests)
+
+        assert fake.call_count == 5
+        assert fake.max_in_flight == 2
+        assert report.stats.files_ai_merged == 5
+        assert report.stats.ai_calls_made == 5
+        assert list(report.file_results) == [f"pkg/mod_{i}.py" for i in range(5)]
+
+    def test_identical_conflicts_resolved_once(self, temp_project):
+        """The same conflict in several files costs a single AI call."""
+        fake = FakeAIFunction()
+        orchestrator = MergeOrchestrator(
+            temp_project, dry_run=True, ai_resolver=AIResolver(ai_call_fn=fake)
+        )
+        requests = _setup_conflicting_tasks(orchestrator, temp_project, 4)
+
+        report = orchestrator.merge_tasks(requests)
+
+        assert fake.call_count == 1
+        assert report.stats.files_ai_merged == 4
+        assert report.stats.ai_calls_made == 1
+
+    def test_distinct_conflicts_batched_across_files(self, temp_project):
+        """Different conflicts from several files share one batched call."""
+        fake = FakeAIFunction()
+        resolver = AIResolver(ai_call_fn=fake)
+        orchestrator = MergeOrchestrator(temp_project, dry_run=True, ai_resolver=resolver)
+        requests = _setup_conflicting_tasks(orchestrator, temp_project, 4, distinct=True)
+
+        report = orchestrator.merge_tasks(requests)
+
+        assert fake.call_count == 1
+        assert resolver.stats["batched_calls"] == 1
+        assert report.stats.files_ai_merged == 4
+
+    def test_report_has_stage_timings(self, temp_project):
+        """The report records time spent in each stage."""
+        orchestrator = MergeOrchestrator(temp_project, enable_ai=False, dry_run=True)
+        requests = _setup_conflicting_tasks(orchestrator, temp_project, 2)
+
+        report = orchestrator.merge_tasks(requests)
+
+        assert set(report.stage_timings) == {"refresh", "baseline", "deterministic", "ai"}
+        assert json.loads(json.dumps(report.to_dict()))["stage_timings"]
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Tests for OverlapIndex
+======================
+
+Tests the sweep-line overlap index and the line-overlap pass of conflict
+detection.
+
+Covers:
+- Overlapping pairs match a brute-force comparison
+- Inclusive range boundaries
+- Conflicts between changes that share lines under different locations
+- Suppression when a location conflict already covers the tasks
+- Stress benchmark with many concurrent tasks
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge import ChangeType, ConflictSeverity, FileAnalysis, SemanticChange
+from merge.overlap_index import OverlapIndex
+
+
+def _brute_force_pairs(intervals):
+    return {
+        frozenset((i, j))
+        for i, (s1, e1) in enumerate(intervals)
+        for j, (s2, e2) in enumerate(intervals)
+        if i < j and e1 >= s2 and e2 >= s1
+    }
+
+
+def _change(change_type, target, location, start, end):
+    return SemanticChange(
+        change_type=change_type,
+        target=target,
+        location=location,
+        line_start=start,
+        line_end=end,
+        content_after=f"# {target}",
+    )
+
+
+class TestOverlapIndex:
+    """Tests for the sweep-line index itself."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_brute_force(self, seed):
+        """Every overlapping pair is reported exactly once."""
+        rng = random.Random(seed)
+        intervals = []
+        for _ in range(200):
+            start = rng.randint(1, 1000)
+            intervals.append((start, start + rng.randint(0, 40)))
+
+        index = OverlapIndex()
+        for i, (start, end) in enumerate(intervals):
+            index.add(start, end, i)
+        pairs = [frozenset(pair) for pair in index.overlapping_pairs()]
+
+        assert len(pairs) == len(set(pairs))
+        assert set(pairs) == _brute_force_pairs(intervals)
+
+    def test_shared_boundary_line_overlaps(self):
+        """Ranges are inclusive: sharing one line is an overlap."""
+        index = OverlapIndex()
+        index.add(1, 5, "a")
+        index.add(5, 9, "b")
+        index.add(10, 12, "c")
+
+        assert list(index.overlapping_pairs()) == [("a", "b")]
+
+    def test_earlier_range_first(self):
+        """Pairs put the range that starts first first."""
+        index = OverlapIndex()
+        index.add(10, 20, "inner")
+        index.add(1, 30, "outer")
+
+        assert list(index.overlapping_pairs()) == [("outer", "inner")]
+
+    def test_empty(self):
+        """An empty index has no pairs."""
+        assert list(OverlapIndex().overlapping_pairs()) == []
+
+
+class TestOverlapConflicts:
+    """Tests for line-overlap conflicts in ConflictDetector."""
+
+    def test_class_and_method_overlap(self, conflict_detector):
+        """A class rewrite and a method edit conflict despite different locations."""
+        task_a = FileAnalysis(
+            file_path="models.py",
+            changes=[
+                _change(ChangeType.MODIFY_CLASS, "User", "class:User", 1, 30),
+            ],
+        )
+        task_b = FileAnalysis(
+            file_path="models.py",
+            changes=[
+                _change(ChangeType.MODIFY_METHOD, "save", "method:User.save", 10, 15),
+            ],
+        )
+
+        conflicts = conflict_detector.detect_conflicts(
+            {"task-001": task_a, "task-002": task_b}
+        )
+
+        assert len(conflicts) == 1
+        assert conflicts[0].location == "class:User"
+        assert conflicts[0].tasks_involved == ["task-001", "task-002"]
+        assert conflicts[0].severity == ConflictSeverity.CRITICAL
+        assert not conflicts[0].can_auto_merge
+
+    def test_covered_by_location_conflict(self, conflict_detector):
+        """No extra region when the tasks already conflict at one of the locations."""
+        task_a = FileAnalysis(
+            file_path="models.py",
+            changes=[
+                _change(ChangeType.MODIFY_CLASS, "User", "class:User", 1, 30),
+                _change(ChangeType.MODIFY_METHOD, "load", "method:User.load", 3, 8),
+            ],
+        )
+        task_b = FileAnalysis(
+            file_path="models.py",
+            changes=[
+                _change(ChangeType.MODIFY_CLASS, "User", "class:User", 1, 30),
+                _change(ChangeType.MODIFY_METHOD, "save", "method:User.save", 10, 15),
+            ],
+        )
+
+        conflicts = conflict_detector.detect_conflicts(
+            {"task-001": task_a, "task-002": task_b}
+        )
+
+        assert [c.location for c in conflicts] == ["class:User"]
+
+    def test_additive_changes_ignored(self, conflict_detector):
+        """Added code has no baseline lines, so it never overlaps."""
+        task_a = FileAnalysis(
+            file_path="app.py",
+            changes=[_change(ChangeType.ADD_FUNCTION, "helper", "function:helper", 5, 10)],
+        )
+        task_b = FileAnalysis(
+            file_path="app.py",
+            changes=[_change(ChangeType.MODIFY_FUNCTION, "main", "function:main", 1, 20)],
+        )
+
+        assert conflict_detector.detect_conflicts({"task-001": task_a, "task-002": task_b}) == []
+
+    def test_other_files_not_compared(self, conflict_detector):
+        """Line ranges in different files never overlap."""
+        task_a = FileAnalysis(
+            file_path="a.py",
+            changes=[_change(ChangeType.MODIFY_FUNCTION, "f", "function:f", 1, 10)],
+        )
+        task_b = FileAnalysis(
+            file_path="b.py",
+            changes=[_change(ChangeType.MODIFY_FUNCTION, "g", "function:g", 1, 10)],
+        )
+
+        assert conflict_detector.detect_conflicts({"task-001": task_a, "task-002": task_b}) == []
+
+    def test_chain_of_overlaps_is_one_region(self, conflict_detector):
+        """Overlaps linking three tasks produce a single region."""
+        analyses = {
+            "task-001": FileAnalysis(
+                file_path="app.py",
+                changes=[_change(ChangeType.MODIFY_FUNCTION, "a", "function:a", 1, 10)],
+            ),
+            "task-002": FileAnalysis(
+                file_path="app.py",
+                changes=[_change(ChangeType.MODIFY_FUNCTION, "b", "function:b", 8, 40)],
+            ),
+            "task-003": FileAnalysis(
+                file_path="app.py",
+                changes=[_change(ChangeType.MODIFY_FUNCTION, "c", "function:c", 35, 50)],
+            ),
+        }
+
+        conflicts = conflict_detector.detect_conflicts(analyses)
+
+        assert len(conflicts) == 1
+        assert conflicts[0].location == "function:b"
+        assert conflicts[0].tasks_involved == ["task-001", "task-002", "task-003"]
+
+    def test_shifted_lines_do_not_overlap(self, conflict_detector):
+        """Edits to different functions don't conflict after one task shifts lines."""
+        from merge import SemanticAnalyzer
+
+        base = "def g():\n    return 1\n\n\ndef h():\n    return 2\n"
+        # Task A adds imports at the top (moving g down to h's old lines)
+        # and edits g; task B edits h
+        after_a = "import os\nimport re\nimport sys\n\n" + base.replace(
+            "return 1", "return 10"
+        )
+        after_b = base.replace("return 2", "return 20")
+        analyzer = SemanticAnalyzer()
+        analyses = {
+            "task-001": analyzer.analyze_diff("mod.py", base, after_a),
+            "task-002": analyzer.analyze_diff("mod.py", base, after_b),
+        }
+
+        assert conflict_detector.detect_conflicts(analyses) == []
+
+        # Edits to the same baseline lines still conflict
+        analyses["task-002"] = analyzer.analyze_diff(
+            "mod.py", base, base.replace("def g():", "def g():\n    pass")
+        )
+        conflicts = conflict_detector.detect_conflicts(analyses)
+        assert [c.location for c in conflicts] == ["function:g"]
+
+
+@pytest.mark.slow
+class TestOverlapBenchmark:
+    """Stress benchmark with many tasks refactoring large functions."""
+
+    def test_many_tasks_many_changes(self, conflict_detector):
+        """12 tasks x 400 changes each stays fast and matches brute force."""
+        rng = random.Random(42)
+        analyses = {}
+        all_ranges = []
+        for t in range(12):
+            changes = []
+            for c in range(400):
+                start = rng.randint(1, 200_000)
+                end = start + rng.randint(0, 80)
+                changes.append(
+                    _change(
+                        ChangeType.MODIFY_FUNCTION,
+                        f"fn_{t}_{c}",
+                        f"function:fn_{t}_{c}",
+                        start,
+                        end,
+                    )
+                )
+                all_ranges.append((start, end))
+            analyses[f"task-{t:03d}"] = FileAnalysis(file_path="big.py", changes=changes)
+
+        index = OverlapIndex()
+        for i, (start, end) in enumerate(all_ranges):
+            index.add(start, end, i)
+
+        start_time = time.perf_counter()
+        pairs = {frozenset(pair) for pair in index.overlapping_pairs()}
+        sweep = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        expected = _brute_force_pairs(all_ranges)
+        brute = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        conflicts = conflict_detector.detect_conflicts(analyses)
+        detect = time.perf_counter() - start_time
+
+        print(
+            f"\n{len(all_ranges)} ranges, {len(pairs)} overlapping pairs: "
+            f"sweep={sweep * 1000:.1f}ms brute={brute * 1000:.1f}ms "
+            f"detect_conflicts={detect * 1000:.1f}ms ({len(conflicts)} regions)"
+        )
+
+        assert pairs == expected
+        assert conflicts
+        assert sweep < brute
+        assert detect < 5.0
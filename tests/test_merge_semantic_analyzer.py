@@ -11,9 +11,14 @@ Covers:
 - React hook detection
 - File structure analysis
 - Supported file types
+- Parse cache and line-offset index
+- Incremental reparsing matches full reparsing
+- Large TSX file benchmark
 """
 
+import random
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -23,7 +28,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
 # Add tests directory to path for test_fixtures
 sys.path.insert(0, str(Path(__file__).parent))
 
-from merge import ChangeType
+from merge import ChangeType, SemanticAnalyzer
+from merge.semantic_analysis import LineIndex
+from merge.semantic_analyzer import TREE_SITTER_AVAILABLE
 from test_fixtures import (
     SAMPLE_PYTHON_MODULE,
     SAMPLE_PYTHON_WITH_NEW_IMPORT,
@@ -33,6 +40,20 @@ from test_fixtures import (
 )
 
 
+@pytest.fixture(params=[False, True], ids=["full", "incremental"])
+def semantic_analyzer(request) -> SemanticAnalyzer:
+    """Run every analyzer test with both full and incremental reparsing."""
+    return SemanticAnalyzer(incremental=request.param)
+
+
+def _change_keys(analysis) -> list:
+    return sorted(
+        (c.change_type.value, c.target, c.location, c.line_start, c.line_end,
+         c.content_before, c.content_after)
+        for c in analysis.changes
+    )
+
+
 class TestSemanticAnalyzerBasics:
     """Basic functionality tests for SemanticAnalyzer."""
 
@@ -233,3 +254,202 @@ class TestEdgeCases:
         # Should complete without issues
         assert analysis is not None
         assert len(analysis.changes) > 0
+
+
+def _generate_tsx(components: int, marker: str = "") -> str:
+    """Generate a TSX module with many small components (~10 lines each)."""
+    parts = ["import React from 'react';", "import { useState } from 'react';", ""]
+    for i in range(components):
+        parts.extend([
+            f"export function Component{i}() {{",
+            "  const [value, setValue] = useState(0);",
+            f"  const label = 'component {i}{marker if i == components // 2 else ''}';",
+            "  return (",
+            "    <div onClick={() => setValue(value + 1)}>",
+            "      {label}: {value}",
+            "    </div>",
+            "  );",
+            "}",
+            "",
+        ])
+    return "\n".join(parts)
+
+
+class TestLineIndex:
+    """Tests for byte offset to line lookup."""
+
+    def test_matches_newline_count(self):
+        """Lookup matches counting newlines in the prefix."""
+        source = "a\nbb\n\nccc\n"
+        index = LineIndex(source.encode("utf-8"))
+        for pos in range(len(source) + 1):
+            assert index.line_for_byte(pos) == source[:pos].count("\n") + 1
+
+    def test_multibyte_characters(self):
+        """Byte offsets past multi-byte characters map to the right line."""
+        source = "# héllo wörld\n# ünïcode\ndef f():\n    pass\n"
+        source_bytes = source.encode("utf-8")
+        index = LineIndex(source_bytes)
+        assert index.line_for_byte(source_bytes.index(b"def")) == 3
+
+
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+class TestParseCache:
+    """Tests for the content-hash keyed element cache."""
+
+    def test_repeated_baseline_hits_cache(self):
+        """Same before content across tasks is parsed once."""
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze_diff("utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT, task_id="task-001")
+        analyzer.analyze_diff("utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION, task_id="task-002")
+
+        stats = analyzer.cache_stats
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+
+    def test_cached_results_match_uncached(self):
+        """Analysis is identical with a warm cache."""
+        analyzer = SemanticAnalyzer()
+        first = analyzer.analyze_diff("App.tsx", SAMPLE_REACT_COMPONENT, SAMPLE_REACT_WITH_HOOK)
+        second = analyzer.analyze_diff("App.tsx", SAMPLE_REACT_COMPONENT, SAMPLE_REACT_WITH_HOOK)
+
+        assert [c.to_dict() for c in first.changes] == [c.to_dict() for c in second.changes]
+        assert analyzer.cache_stats["hits"] == 2
+
+    def test_cache_is_per_extension(self):
+        """Same content under different languages is cached separately."""
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze_file("a.ts", "const x = 1;\n")
+        analyzer.analyze_file("a.tsx", "const x = 1;\n")
+        assert analyzer.cache_stats["hits"] == 0
+
+    def test_cache_is_bounded(self):
+        """Oldest entries are evicted beyond cache_size."""
+        analyzer = SemanticAnalyzer(cache_size=2)
+        for i in range(4):
+            analyzer.analyze_file("m.py", f"def f{i}():\n    pass\n")
+        assert analyzer.cache_stats["entries"] == 2
+
+    def test_clear_cache(self):
+        """clear_cache drops all entries."""
+        analyzer = SemanticAnalyzer()
+        analyzer.analyze_file("m.py", "x = 1\n")
+        analyzer.clear_cache()
+        assert analyzer.cache_stats["entries"] == 0
+
+
+INCREMENTAL_CASES = [
+    ("utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT),
+    ("utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION),
+    ("utils.py", SAMPLE_PYTHON_WITH_NEW_FUNCTION, SAMPLE_PYTHON_MODULE),
+    ("App.tsx", SAMPLE_REACT_COMPONENT, SAMPLE_REACT_WITH_HOOK),
+    ("App.tsx", SAMPLE_REACT_WITH_HOOK, SAMPLE_REACT_COMPONENT),
+    ("a.py", "def f():\n    pass\n", "def f():\n    return 1\n"),
+    ("a.py", "def f():\n    pass\n", "def f(:\n    pass\n"),
+    ("a.py", "x = 1\n", ""),
+    # Duplicate names: the last definition wins in both modes
+    ("a.py", "def f():\n    return 1\n\ndef f():\n    return 2\n",
+     "def f():\n    return 3\n\ndef f():\n    return 2\n"),
+    ("a.ts", "const a = 1;\nconst b = 2;", "const a = 1;\nconst b = 3;"),
+    ("a.ts", "const a = 1;\n", "const a = 1;\n\nexport function g() {}\n"),
+]
+
+
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+class TestIncrementalReparse:
+    """Incremental reparsing must produce the same output as a full reparse."""
+
+    @pytest.mark.parametrize("file_path,before,after", INCREMENTAL_CASES)
+    def test_matches_full_reparse(self, file_path, before, after):
+        """Changes are identical in both modes."""
+        full = SemanticAnalyzer().analyze_diff(file_path, before, after)
+        incremental = SemanticAnalyzer(incremental=True).analyze_diff(file_path, before, after)
+        assert _change_keys(incremental) == _change_keys(full)
+
+    def test_random_edits_match_full_reparse(self):
+        """Random line edits to a large TSX file agree with a full reparse."""
+        rng = random.Random(1234)
+        before = _generate_tsx(60)
+        full_analyzer = SemanticAnalyzer()
+        incremental_analyzer = SemanticAnalyzer(incremental=True)
+
+        for _ in range(25):
+            lines = before.split("\n")
+            for _ in range(rng.randint(1, 4)):
+                idx = rng.randrange(len(lines))
+                op = rng.choice(["insert", "delete", "replace"])
+                if op == "insert":
+                    lines.insert(idx, rng.choice(["  const extra = 1;", "", "}", "export const x = 2;"]))
+                elif op == "delete":
+                    del lines[idx]
+                else:
+                    lines[idx] = lines[idx].replace("value", "count")
+            after = "\n".join(lines)
+
+            full = full_analyzer.analyze_diff("Big.tsx", before, after)
+            incremental = incremental_analyzer.analyze_diff("Big.tsx", before, after)
+            assert _change_keys(incremental) == _change_keys(full)
+
+    def test_small_edit_reuses_unchanged_nodes(self):
+        """A one-line edit only re-extracts the touched component."""
+        before = _generate_tsx(200)
+        after = _generate_tsx(200, marker=" (edited)")
+        analyzer = SemanticAnalyzer(incremental=True)
+
+        analysis = analyzer.analyze_diff("Big.tsx", before, after)
+
+        assert [c.target for c in analysis.changes] == ["Component100"]
+        assert analyzer.cache_stats["incremental_runs"] == 1
+        assert analyzer.cache_stats["incremental_fallbacks"] == 0
+
+    def test_duplicate_key_falls_back(self):
+        """A changed name also defined in an unchanged node forces a full parse."""
+        before = "def f():\n    return 1\n\ndef f():\n    return 2\n"
+        after = "def f():\n    return 3\n\ndef f():\n    return 2\n"
+        analyzer = SemanticAnalyzer(incremental=True)
+
+        analyzer.analyze_diff("a.py", before, after)
+
+        assert analyzer.cache_stats["incremental_fallbacks"] == 1
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+class TestLargeFileBenchmark:
+    """Benchmark for semantic analysis of 5k-line TSX files."""
+
+    def test_5k_line_tsx(self):
+        """A 5k-line TSX diff analyzes quickly and reuses the parsed baseline."""
+        before = _generate_tsx(500)
+        after_a = _generate_tsx(500, marker=" (task a)")
+        after_b = _generate_tsx(500, marker=" (task b)")
+        assert before.count("\n") >= 5000
+
+        analyzer = SemanticAnalyzer()
+        start = time.perf_counter()
+        analysis_a = analyzer.analyze_diff("src/Big.tsx", before, after_a, task_id="task-a")
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        analysis_b = analyzer.analyze_diff("src/Big.tsx", before, after_b, task_id="task-b")
+        warm = time.perf_counter() - start
+
+        incremental_analyzer = SemanticAnalyzer(incremental=True)
+        incremental_analyzer.analyze_diff("src/Big.tsx", before, after_a, task_id="task-a")
+        start = time.perf_counter()
+        analysis_inc = incremental_analyzer.analyze_diff("src/Big.tsx", before, after_b, task_id="task-b")
+        incremental = time.perf_counter() - start
+
+        print(
+            f"\n5k-line TSX: cold={cold * 1000:.1f}ms warm={warm * 1000:.1f}ms "
+            f"incremental={incremental * 1000:.1f}ms"
+        )
+
+        assert _change_keys(analysis_inc) == _change_keys(analysis_b)
+
+        assert [c.target for c in analysis_a.changes] == ["Component250"]
+        assert [c.target for c in analysis_b.changes] == ["Component250"]
+        assert analysis_a.changes[0].line_start == 3 + 250 * 10 + 1
+        assert analyzer.cache_stats["hits"] == 1
+        # Line lookups are O(log n), so this stays well under a second
+        assert cold < 5.0
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Tests for the FileTimelineTracker daemon
+========================================
+
+Tests batched main-branch commit processing and the Unix socket daemon
+used by the post-commit hook.
+
+Covers:
+- Batched on_main_branch_commits
+- Coalescing bursts of commits into one update
+- Reloading timelines written by other processes
+- Client helpers and fallback when no daemon is running
+- The installed post-commit hook talking to the daemon
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge.install_hook import install_hook
+from merge.timeline_tracker import FileTimelineTracker
+from merge.tracker_daemon import (
+    TrackerDaemon,
+    get_socket_path,
+    is_daemon_running,
+    notify_daemon,
+    send_command,
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(__import__("socket"), "AF_UNIX"), reason="Unix sockets required"
+)
+
+
+def _commit(repo: Path, content: str, message: str) -> str:
+    (repo / "README.md").write_text(content)
+    subprocess.run(
+        ["git", "add", "README.md"], cwd=repo, capture_output=True, check=True
+    )
+    subprocess.run(
+        ["git", "commit", "-m", message], cwd=repo, capture_output=True, check=True
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture
+def tracked_repo(temp_git_repo: Path) -> Path:
+    """A repo whose README.md has a timeline with one active task."""
+    FileTimelineTracker(temp_git_repo).on_task_start(
+        "task-001", ["README.md"], task_title="Docs"
+    )
+    return temp_git_repo
+
+
+@pytest.fixture
+def daemon(tracked_repo: Path):
+    """A running daemon with a long coalesce window (tests flush explicitly)."""
+    daemon = TrackerDaemon(tracked_repo, coalesce_window=30.0, max_batch_delay=60.0)
+    daemon.start()
+    yield daemon
+    daemon.stop()
+
+
+def _main_events(repo: Path) -> list[str]:
+    timeline = FileTimelineTracker(repo).get_timeline("README.md")
+    return [event.commit_hash for event in timeline.main_branch_history]
+
+
+class TestBatchedCommits:
+    """Tests for FileTimelineTracker.on_main_branch_commits."""
+
+    def test_records_commits_in_order(self, tracked_repo):
+        """Each commit becomes one main event and increments drift."""
+        commits = [_commit(tracked_repo, f"v{i}\n", f"v{i}") for i in range(3)]
+
+        FileTimelineTracker(tracked_repo).on_main_branch_commits(commits)
+
+        assert _main_events(tracked_repo) == commits
+        view = (
+            FileTimelineTracker(tracked_repo)
+            .get_timeline("README.md")
+            .task_views["task-001"]
+        )
+        assert view.commits_behind_main == 3
+
+    def test_commit_info_fetched_once_per_commit(self, tracked_repo, monkeypatch):
+        """Metadata is looked up per commit, not per changed file."""
+        (tracked_repo / "other.md").write_text("other\n")
+        subprocess.run(["git", "add", "."], cwd=tracked_repo, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "add other"], cwd=tracked_repo, capture_output=True
+        )
+        tracker = FileTimelineTracker(tracked_repo)
+        tracker.on_task_start("task-002", ["other.md"])
+
+        (tracked_repo / "README.md").write_text("both\n")
+        (tracked_repo / "other.md").write_text("both\n")
+        subprocess.run(["git", "add", "."], cwd=tracked_repo, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "both"], cwd=tracked_repo, capture_output=True
+        )
+        head = tracker.git.get_current_main_commit()
+
+        calls = []
+        original = tracker.git.get_commit_info
+        monkeypatch.setattr(
+            tracker.git, "get_commit_info", lambda h: calls.append(h) or original(h)
+        )
+        tracker.on_main_branch_commit(head)
+
+        assert calls == [head]
+        assert (
+            tracker.get_timeline("other.md").main_branch_history[-1].commit_message
+            == "both"
+        )
+
+
+class TestTrackerDaemon:
+    """Tests for the socket daemon."""
+
+    def test_burst_processed_as_one_batch(self, daemon, tracked_repo):
+        """A series of commits is recorded with a single tracker update."""
+        commits = [_commit(tracked_repo, f"v{i}\n", f"v{i}") for i in range(5)]
+        for commit in commits:
+            assert notify_daemon(daemon.socket_path, commit)
+        assert _wait_for(lambda: daemon.stats.commits_received == 5)
+
+        assert send_command(daemon.socket_path, "flush", expect_reply=True) == "ok"
+
+        assert daemon.stats.batches_processed == 1
+        assert daemon.stats.commits_processed == 5
+        assert _main_events(tracked_repo) == commits
+
+    def test_quiet_period_triggers_batch(self, tracked_repo):
+        """Without a flush, the batch runs once commits stop arriving."""
+        daemon = TrackerDaemon(tracked_repo, coalesce_window=0.1)
+        daemon.start()
+        try:
+            commits = [_commit(tracked_repo, f"v{i}\n", f"v{i}") for i in range(3)]
+            for commit in commits:
+                daemon.submit(commit)
+
+            assert _wait_for(lambda: daemon.stats.commits_processed == 3)
+            assert daemon.stats.batches_processed == 1
+        finally:
+            daemon.stop()
+
+    def test_duplicate_notifications_recorded_once(self, daemon, tracked_repo):
+        """The same hash sent twice only becomes one event."""
+        commit = _commit(tracked_repo, "v1\n", "v1")
+        daemon.submit(commit)
+        daemon.submit(commit)
+        daemon.flush()
+
+        assert _main_events(tracked_repo) == [commit]
+
+    def test_sees_timelines_created_after_start(self, daemon, tracked_repo):
+        """Timelines written by other processes are reloaded before each batch."""
+        (tracked_repo / "new.md").write_text("new\n")
+        subprocess.run(["git", "add", "."], cwd=tracked_repo, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "add new"], cwd=tracked_repo, capture_output=True
+        )
+        FileTimelineTracker(tracked_repo).on_task_start("task-002", ["new.md"])
+
+        (tracked_repo / "new.md").write_text("changed\n")
+        subprocess.run(
+            ["git", "commit", "-am", "change new"],
+            cwd=tracked_repo,
+            capture_output=True,
+        )
+        head = FileTimelineTracker(tracked_repo).git.get_current_main_commit()
+        daemon.submit(head)
+        daemon.flush()
+
+        timeline = FileTimelineTracker(tracked_repo).get_timeline("new.md")
+        assert [e.commit_hash for e in timeline.main_branch_history] == [head]
+        assert FileTimelineTracker(tracked_repo).get_timeline("README.md").task_views
+
+    def test_second_daemon_refuses_to_start(self, daemon, tracked_repo):
+        """Only one daemon can own the socket."""
+        with pytest.raises(RuntimeError):
+            TrackerDaemon(tracked_repo).start()
+
+    def test_stale_socket_replaced(self, tracked_repo):
+        """A socket file left by a crashed daemon doesn't block startup."""
+        socket_path = get_socket_path(tracked_repo)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        socket_path.write_text("")
+
+        daemon = TrackerDaemon(tracked_repo)
+        daemon.start()
+        try:
+            assert is_daemon_running(socket_path)
+        finally:
+            daemon.stop()
+        assert not socket_path.exists()
+
+    def test_shutdown_command(self, tracked_repo):
+        """The shutdown command processes queued commits and stops."""
+        daemon = TrackerDaemon(tracked_repo, coalesce_window=30.0)
+        daemon.start()
+        commit = _commit(tracked_repo, "v1\n", "v1")
+        daemon.submit(commit)
+
+        send_command(daemon.socket_path, "shutdown", expect_reply=True)
+
+        assert _wait_for(lambda: not daemon.socket_path.exists())
+        assert _main_events(tracked_repo) == [commit]
+
+
+class TestClientFallback:
+    """Tests for clients when no daemon is running."""
+
+    def test_notify_without_daemon(self, tracked_repo):
+        """notify_daemon reports failure so the caller can fall back."""
+        socket_path = get_socket_path(tracked_repo)
+
+        assert notify_daemon(socket_path, "abc123") is False
+        assert is_daemon_running(socket_path) is False
+
+
+class TestPostCommitHook:
+    """Tests for the installed hook."""
+
+    def test_hook_hands_commit_to_daemon(self, daemon, tracked_repo):
+        """With the daemon running, the hook sends the hash over the socket."""
+        assert install_hook(tracked_repo)
+
+        commit = _commit(tracked_repo, "via hook\n", "via hook")
+
+        assert _wait_for(lambda: daemon.stats.commits_received == 1)
+        daemon.flush()
+        assert _main_events(tracked_repo) == [commit]
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Tests for Multi-Spec Builds
+===========================
+
+Tests building several specs concurrently in one process (--specs).
+
+Covers:
+- Bounded concurrency, and one failing spec not stopping the others
+- Aggregating per-spec progress in .auto-claude-status
+- Per-spec task loggers and security profile caching
+- Worktrees sharing the project's index and security profile
+- One Graphiti client shared by every build
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from agents import spec_pool
+from agents.spec_pool import (
+    OUTCOME_BUILT,
+    OUTCOME_ERROR,
+    OUTCOME_INCOMPLETE,
+    SpecBuild,
+    run_spec_builds,
+)
+from ui.status import BuildState, BuildStatus, SpecStatusManager, StatusManager
+
+
+@pytest.fixture
+def builds(temp_dir: Path) -> list[SpecBuild]:
+    builds = []
+    for name in ("001-a", "002-b", "003-c"):
+        worktree = temp_dir / ".worktrees" / name
+        spec_dir = worktree / ".auto-claude" / "specs" / name
+        spec_dir.mkdir(parents=True)
+        builds.append(SpecBuild(name, spec_dir, worktree))
+    return builds
+
+
+@pytest.fixture
+def fake_agent(monkeypatch) -> dict:
+    """Replace the agent loop; a spec is complete once its 'done' file exists."""
+    state = {"running": 0, "peak": 0, "fail": set(), "stop_early": set()}
+
+    async def fake_run(project_dir, spec_dir, model, status_manager=None, **kwargs):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        try:
+            status_manager.set_active(spec_dir.name, BuildState.BUILDING)
+            status_manager.update_subtasks(completed=0, total=2)
+            await asyncio.sleep(0.02)
+            if spec_dir.name in state["fail"]:
+                raise RuntimeError("session crashed")
+            status_manager.update_subtasks(completed=2, total=2)
+            if spec_dir.name not in state["stop_early"]:
+                (spec_dir / "done").touch()
+        finally:
+            state["running"] -= 1
+
+    monkeypatch.setattr(spec_pool, "run_autonomous_agent", fake_run)
+    monkeypatch.setattr(
+        spec_pool, "is_build_complete", lambda spec_dir: (spec_dir / "done").exists()
+    )
+    return state
+
+
+def _run(builds, status_manager, max_workers):
+    return asyncio.run(
+        run_spec_builds(
+            builds, "sonnet", status_manager, max_workers=max_workers, skip_qa=True
+        )
+    )
+
+
+class TestRunSpecBuilds:
+    """Tests for run_spec_builds."""
+
+    def test_concurrency_is_bounded(self, temp_dir, builds, fake_agent):
+        results = _run(builds, StatusManager(temp_dir), max_workers=2)
+
+        assert fake_agent["peak"] == 2
+        assert [r.spec_name for r in results] == ["001-a", "002-b", "003-c"]
+        assert all(r.outcome == OUTCOME_BUILT for r in results)
+
+    def test_failure_does_not_stop_other_specs(self, temp_dir, builds, fake_agent):
+        fake_agent["fail"].add("002-b")
+        fake_agent["stop_early"].add("003-c")
+
+        results = _run(builds, StatusManager(temp_dir), max_workers=3)
+
+        assert [r.outcome for r in results] == [
+            OUTCOME_BUILT,
+            OUTCOME_ERROR,
+            OUTCOME_INCOMPLETE,
+        ]
+        assert results[1].error == "session crashed"
+        assert not results[1].succeeded
+
+    def test_status_file_aggregates_specs(self, temp_dir, builds, fake_agent):
+        fake_agent["fail"].add("003-c")
+
+        _run(builds, StatusManager(temp_dir), max_workers=3)
+
+        data = json.loads((temp_dir / ".auto-claude-status").read_text())
+        assert data["subtasks"]["completed"] == 4
+        assert data["subtasks"]["total"] == 6
+        assert data["specs"]["003-c"]["state"] == "error"
+        assert data["specs"]["001-a"]["subtasks"] == {
+            "completed": 2,
+            "total": 2,
+            "in_progress": 0,
+            "failed": 0,
+        }
+        # Worktrees don't get status files of their own
+        assert not (builds[0].working_dir / ".auto-claude-status").exists()
+
+
+class TestSpecStatusManager:
+    """Tests for reporting per-spec status to the aggregate."""
+
+    def test_active_specs_count_as_workers(self, temp_dir):
+        parent = StatusManager(temp_dir)
+        first = SpecStatusManager(parent, "001-a")
+        second = SpecStatusManager(parent, "002-b")
+
+        first.set_active("001-a", BuildState.BUILDING)
+        second.set_active("002-b", BuildState.PLANNING)
+        first.update(state=BuildState.COMPLETE)
+
+        status = parent.read()
+        assert status.workers_active == 1
+        assert set(status.specs) == {"001-a", "002-b"}
+
+    def test_round_trip(self):
+        status = BuildStatus(specs={"001-a": {"state": "qa"}})
+
+        assert BuildStatus.from_dict(status.to_dict()).specs == status.specs
+        assert BuildStatus.from_dict({}).specs == {}
+
+
+class TestSharedState:
+    """Tests for process-wide state used by concurrent specs."""
+
+    def test_task_logger_per_spec(self, temp_dir: Path):
+        # Imported here: other test modules mock task_logger while collecting
+        from task_logger.utils import clear_task_logger, get_task_logger
+
+        first_dir, second_dir = temp_dir / "001-a", temp_dir / "002-b"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        try:
+            first = get_task_logger(first_dir)
+            second = get_task_logger(second_dir)
+
+            assert get_task_logger(first_dir) is first
+            assert get_task_logger(second_dir) is second
+        finally:
+            clear_task_logger()
+
+    def test_security_profile_cached_per_directory(self, temp_dir, monkeypatch):
+        from security import profile
+
+        analyzed = []
+
+        def fake_profile(project_dir, spec_dir=None):
+            analyzed.append(project_dir)
+            return object()
+
+        monkeypatch.setattr(profile, "get_or_create_profile", fake_profile)
+        profile.reset_profile_cache()
+        try:
+            for _ in range(3):
+                for name in ("001-a", "002-b"):
+                    profile.get_security_profile(temp_dir / name)
+        finally:
+            profile.reset_profile_cache()
+
+        assert len(analyzed) == 2
+
+    def test_worktrees_share_security_profile(self, temp_dir, monkeypatch):
+        from security import profile
+
+        analyzed = []
+
+        def fake_profile(project_dir, spec_dir=None):
+            analyzed.append(project_dir)
+            return object()
+
+        monkeypatch.setattr(profile, "get_or_create_profile", fake_profile)
+        worktrees = [temp_dir / ".worktrees" / name for name in ("001-a", "002-b")]
+        profile.reset_profile_cache()
+        try:
+            shared = profile.share_security_profile(temp_dir, worktrees)
+            seen = [profile.get_security_profile(w) for w in worktrees]
+        finally:
+            profile.reset_profile_cache()
+
+        assert analyzed == [temp_dir.resolve()]
+        assert seen == [shared, shared]
+
+    def test_worktrees_share_project_index(self, temp_dir, monkeypatch):
+        from prompts_pkg import project_context
+
+        monkeypatch.setattr(project_context, "_index_sources", {})
+        index = {"services": {"web": {"framework": "nextjs"}}}
+        (temp_dir / ".auto-claude").mkdir()
+        (temp_dir / ".auto-claude" / "project_index.json").write_text(json.dumps(index))
+        worktree = temp_dir / ".worktrees" / "001-a"
+        worktree.mkdir(parents=True)
+
+        assert project_context.load_project_index(worktree) == {}
+        assert project_context.share_project_index(temp_dir, [worktree]) == index
+        assert project_context.load_project_index(worktree) == index
+        assert project_context.project_index_file(worktree) == (
+            temp_dir.resolve() / ".auto-claude" / "project_index.json"
+        )
+
+    def test_graphiti_client_shared(self, builds):
+        from integrations.graphiti.queries_pkg import GraphitiMemory, shared_client
+        from integrations.graphiti.queries_pkg.client import get_shared_client
+
+        initialized = []
+
+        async def fake_initialize(state=None):
+            initialized.append(state)
+            return True
+
+        async def run():
+            async with shared_client() as client:
+                client.initialize = fake_initialize
+                memories = [GraphitiMemory(b.spec_dir, b.working_dir) for b in builds]
+                for memory in memories:
+                    # Configured as if GRAPHITI_ENABLED were set
+                    memory._available = True
+                    assert await memory.initialize()
+                clients = {id(memory._client) for memory in memories}
+                for memory in memories:
+                    await memory.close()
+                still_open = get_shared_client() is client
+            return clients == {id(client)}, still_open, get_shared_client()
+
+        assert asyncio.run(run()) == (True, True, None)
+        assert len(initialized) == len(builds)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Tests for the Plan Store
+========================
+
+Tests cached, lock-protected access to implementation_plan.json.
+
+Covers:
+- Parsing once and revalidating by mtime, inode and size
+- Atomic writes
+- Locked read-modify-write updates from concurrent writers
+- Change notifications
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from core.plan_store import PlanStore, get_plan_store
+
+
+def _plan(status: str = "pending") -> dict:
+    return {
+        "feature": "Test",
+        "phases": [{"id": "p1", "subtasks": [{"id": "s1", "status": status}]}],
+    }
+
+
+def _write(plan_file: Path, plan: dict, age_seconds: float = 10.0) -> None:
+    """Write a plan in place, dated in the past so the cache can trust it."""
+    plan_file.write_text(json.dumps(plan))
+    mtime = os.stat(plan_file).st_mtime - age_seconds
+    os.utime(plan_file, (mtime, mtime))
+
+
+@pytest.fixture
+def plan_file(spec_dir: Path) -> Path:
+    plan_file = spec_dir / "implementation_plan.json"
+    _write(plan_file, _plan())
+    return plan_file
+
+
+class TestReading:
+    """Tests for the parse cache."""
+
+    def test_parses_once(self, plan_file: Path):
+        store = PlanStore(plan_file)
+
+        assert store.get() is store.get()
+
+    def test_detects_in_place_change(self, plan_file: Path):
+        store = PlanStore(plan_file)
+        store.get()
+
+        _write(plan_file, _plan("completed"), age_seconds=5.0)
+
+        assert store.get() == _plan("completed")
+
+    def test_recent_file_is_reread(self, plan_file: Path):
+        store = PlanStore(plan_file)
+        plan_file.write_text(json.dumps(_plan("failed")))
+        store.get()
+
+        # Same size and, with coarse timestamps, possibly the same mtime
+        stat = os.stat(plan_file)
+        plan_file.write_text(json.dumps(_plan("passed")))
+        os.utime(plan_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert store.get() == _plan("passed")
+
+    def test_load_returns_private_copy(self, plan_file: Path):
+        store = PlanStore(plan_file)
+
+        store.load()["feature"] = "Changed"
+
+        assert store.get()["feature"] == "Test"
+
+    def test_missing_and_invalid(self, spec_dir: Path):
+        store = PlanStore(spec_dir / "implementation_plan.json")
+        assert store.get() is None
+
+        _write(store.plan_file, _plan())
+        assert store.get() == _plan()
+
+        store.plan_file.write_text("{not json")
+        assert store.get() is None
+
+    def test_shared_store_per_spec_dir(self, spec_dir: Path):
+        assert get_plan_store(spec_dir) is get_plan_store(
+            spec_dir / ".." / spec_dir.name
+        )
+
+
+class TestWriting:
+    """Tests for atomic, locked writes."""
+
+    def test_update_writes_atomically(self, plan_file: Path):
+        store = PlanStore(plan_file)
+        inode = os.stat(plan_file).st_ino
+
+        store.update(lambda plan: plan.update(feature="Updated"))
+
+        assert json.loads(plan_file.read_text())["feature"] == "Updated"
+        # Renamed into place rather than rewritten
+        assert os.stat(plan_file).st_ino != inode
+        assert [p.name for p in plan_file.parent.glob("*.tmp")] == []
+
+    def test_update_sees_changes_from_other_stores(self, plan_file: Path):
+        first = PlanStore(plan_file)
+        second = PlanStore(plan_file)
+        first.get()
+
+        second.update(lambda plan: plan.update(feature="Second"))
+        first.update(lambda plan: plan.update(status="done"))
+
+        plan = json.loads(plan_file.read_text())
+        assert (plan["feature"], plan["status"]) == ("Second", "done")
+
+    def test_update_returning_false_writes_nothing(self, plan_file: Path):
+        store = PlanStore(plan_file)
+        before = plan_file.read_text()
+
+        def mutate(plan):
+            plan["feature"] = "Discarded"
+            return False
+
+        assert store.update(mutate) is False
+        assert plan_file.read_text() == before
+        assert store.get()["feature"] == "Test"
+
+    def test_failed_mutation_keeps_cache(self, plan_file: Path):
+        store = PlanStore(plan_file)
+
+        def mutate(plan):
+            plan["feature"] = "Half done"
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            store.update(mutate)
+
+        assert store.get()["feature"] == "Test"
+
+    def test_update_keeps_permissions(self, plan_file: Path):
+        os.chmod(plan_file, 0o640)
+
+        PlanStore(plan_file).update(lambda plan: plan.update(feature="Updated"))
+
+        assert os.stat(plan_file).st_mode & 0o777 == 0o640
+
+    def test_concurrent_updates_are_not_lost(self, plan_file: Path):
+        # Separate stores behave like separate processes sharing the lock file
+        stores = [PlanStore(plan_file) for _ in range(4)]
+
+        def increment(plan):
+            plan["count"] = plan.get("count", 0) + 1
+
+        def worker(store):
+            for _ in range(25):
+                store.update(increment)
+
+        threads = [threading.Thread(target=worker, args=(s,)) for s in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert json.loads(plan_file.read_text())["count"] == 100
+
+
+class TestNotifications:
+    """Tests for change notifications."""
+
+    def test_notified_on_update(self, plan_file: Path):
+        store = PlanStore(plan_file)
+        seen = []
+        store.subscribe(lambda plan: seen.append(plan["feature"]))
+
+        store.update(lambda plan: plan.update(feature="Updated"))
+        store.update(lambda plan: None)  # No change, no notification
+
+        assert seen == ["Updated"]
+
+    def test_notified_on_external_change(self, plan_file: Path):
+        store = PlanStore(plan_file)
+        store.get()
+        seen = []
+        store.subscribe(lambda plan: seen.append(plan["phases"][0]["subtasks"]))
+
+        _write(plan_file, _plan("completed"), age_seconds=5.0)
+        store.get()
+        store.get()
+
+        assert seen == [[{"id": "s1", "status": "completed"}]]
+
+    def test_unsubscribe_and_failing_subscriber(self, plan_file: Path):
+        store = PlanStore(plan_file)
+        seen = []
+
+        def broken(plan):
+            raise RuntimeError("subscriber bug")
+
+        store.subscribe(broken)
+        unsubscribe = store.subscribe(seen.append)
+        store.update(lambda plan: plan.update(feature="First"))
+        unsubscribe()
+        store.update(lambda plan: plan.update(feature="Second"))
+
+        assert [plan["feature"] for plan in seen] == ["First"]
+
+    def test_subscriber_can_update(self, plan_file: Path):
+        store = PlanStore(plan_file)
+
+        def on_change(plan):
+            if plan.get("feature") == "Updated":
+                store.update(lambda p: p.update(feature="Reacted"))
+
+        store.subscribe(on_change)
+        store.update(lambda plan: plan.update(feature="Updated"))
+
+        assert store.get()["feature"] == "Reacted"
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Tests for the Background Post-Session Queue
+===========================================
+
+Tests running post-session work alongside the next session.
+
+Covers:
+- Bounded concurrency
+- Retrying failed jobs
+- Keeping jobs with the same key in order
+- Flushing before the build ends
+- Waiting for the jobs of one key
+- Post-session processing submitting its slow work to the queue
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from agents import session
+from agents.post_session_queue import PostSessionQueue
+from agents.session import post_session_processing
+
+
+class TestQueue:
+    """Tests for PostSessionQueue."""
+
+    def test_concurrency_is_bounded(self):
+        running = []
+        peak = []
+
+        async def job():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        async def run():
+            queue = PostSessionQueue(max_concurrent=2, retry_delay=0)
+            for i in range(6):
+                queue.submit(f"job-{i}", job)
+            return await queue.flush()
+
+        assert asyncio.run(run())
+        assert max(peak) == 2
+
+    def test_failed_job_is_retried(self):
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError("Graphiti unavailable")
+
+        async def run():
+            queue = PostSessionQueue(max_attempts=3, retry_delay=0)
+            queue.submit("memory", flaky)
+            await queue.flush()
+            return queue
+
+        queue = asyncio.run(run())
+
+        assert len(attempts) == 3
+        assert queue.failures == []
+
+    def test_failure_recorded_after_last_attempt(self):
+        async def broken():
+            raise RuntimeError("Linear down")
+
+        async def run():
+            queue = PostSessionQueue(max_attempts=2, retry_delay=0)
+            queue.submit("linear", broken)
+            await queue.flush()
+            return queue
+
+        queue = asyncio.run(run())
+
+        assert [(f.name, f.attempts, f.error) for f in queue.failures] == [
+            ("linear", 2, "Linear down")
+        ]
+
+    def test_same_key_runs_in_order(self):
+        order = []
+
+        def job(name, delay):
+            async def run_job():
+                await asyncio.sleep(delay)
+                order.append(name)
+
+            return run_job
+
+        async def run():
+            queue = PostSessionQueue(max_concurrent=4, retry_delay=0)
+            queue.submit("first", job("first", 0.03), key="linear")
+            queue.submit("other", job("other", 0), key="memory")
+            queue.submit("second", job("second", 0), key="linear")
+            await queue.flush()
+
+        asyncio.run(run())
+
+        assert order.index("first") < order.index("second")
+        assert order[0] == "other"
+
+    def test_flush_timeout_cancels_unfinished(self):
+        async def slow():
+            await asyncio.sleep(10)
+
+        async def run():
+            queue = PostSessionQueue()
+            queue.submit("slow", slow)
+            finished = await queue.flush(timeout=0.01)
+            await asyncio.sleep(0)
+            return finished, queue.pending
+
+        assert asyncio.run(run()) == (False, 0)
+
+    def test_wait_for_key(self):
+        done = []
+
+        def job(name, delay):
+            async def run_job():
+                await asyncio.sleep(delay)
+                done.append(name)
+
+            return run_job
+
+        async def run():
+            queue = PostSessionQueue(max_concurrent=4)
+            assert await queue.wait_for_key("memory")
+            queue.submit("memory 1", job("memory 1", 0.02), key="memory")
+            queue.submit("memory 2", job("memory 2", 0), key="memory")
+            queue.submit("linear", job("linear", 10), key="linear")
+            finished = await queue.wait_for_key("memory")
+            waited_for = list(done)
+            # Left running, unlike flush()
+            timed_out = await queue.wait_for_key("linear", timeout=0.01)
+            pending = queue.pending
+            await queue.flush(timeout=0)
+            return finished, waited_for, timed_out, pending
+
+        assert asyncio.run(run()) == (True, ["memory 1", "memory 2"], False, 1)
+
+
+@pytest.fixture
+def processing(temp_dir: Path, monkeypatch) -> tuple[Path, list]:
+    """A spec with one completed subtask, and recorded slow post-session calls."""
+    spec_dir = temp_dir / "spec"
+    spec_dir.mkdir()
+    plan = {
+        "phases": [
+            {"id": "p1", "subtasks": [{"id": "s1", "status": "completed"}]},
+        ]
+    }
+    (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+    calls = []
+
+    async def fake_commit(project_dir):
+        return "abc123"
+
+    async def fake_count(project_dir):
+        return 1
+
+    async def fake_extract(**kwargs):
+        calls.append("extract")
+        await asyncio.sleep(0.01)
+        return {"file_insights": [], "patterns_discovered": []}
+
+    async def fake_save(**kwargs):
+        calls.append("save")
+        return True, "file"
+
+    async def fake_linear(**kwargs):
+        calls.append(("linear", kwargs["completed_count"], kwargs["total_count"]))
+        return True
+
+    monkeypatch.setattr(session, "get_latest_commit_async", fake_commit)
+    monkeypatch.setattr(session, "get_commit_count_async", fake_count)
+    monkeypatch.setattr(session, "extract_session_insights", fake_extract)
+    monkeypatch.setattr(session, "save_session_memory", fake_save)
+    monkeypatch.setattr(session, "linear_subtask_completed", fake_linear)
+    return spec_dir, calls
+
+
+def _process(spec_dir: Path, queue: PostSessionQueue | None):
+    return post_session_processing(
+        spec_dir=spec_dir,
+        project_dir=spec_dir,
+        subtask_id="s1",
+        session_num=1,
+        commit_before=None,
+        commit_count_before=0,
+        recovery_manager=MagicMock(),
+        linear_enabled=True,
+        post_session_queue=queue,
+    )
+
+
+class TestPostSessionProcessing:
+    """Tests for post_session_processing with and without a queue."""
+
+    def test_slow_work_runs_in_background(self, processing):
+        spec_dir, calls = processing
+
+        async def run():
+            queue = PostSessionQueue(retry_delay=0)
+            success = await _process(spec_dir, queue)
+            before_flush = list(calls)
+            await queue.flush()
+            return success, before_flush
+
+        success, before_flush = asyncio.run(run())
+
+        assert success
+        # Nothing slow was awaited before returning
+        assert "save" not in before_flush
+        assert len(calls) == 3
+        assert {("linear", 1, 1), "extract", "save"} == set(calls)
+
+    def test_failed_save_retries_without_re_extracting(self, processing, monkeypatch):
+        spec_dir, calls = processing
+        results = [(False, None), (True, "graphiti")]
+
+        async def flaky_save(**kwargs):
+            calls.append("save")
+            return results.pop(0)
+
+        monkeypatch.setattr(session, "save_session_memory", flaky_save)
+
+        async def run():
+            queue = PostSessionQueue(retry_delay=0)
+            await _process(spec_dir, queue)
+            await queue.flush()
+            return queue
+
+        queue = asyncio.run(run())
+
+        assert calls.count("extract") == 1
+        assert calls.count("save") == 2
+        assert queue.failures == []
+
+    def test_without_queue_runs_inline(self, processing):
+        spec_dir, calls = processing
+
+        assert asyncio.run(_process(spec_dir, None))
+        assert calls == [("linear", 1, 1), "extract", "save"]
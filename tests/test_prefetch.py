@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Tests for Subtask Prompt Prefetching
+====================================
+
+Tests building the next subtask's prompt while the current session runs.
+
+Covers:
+- Predicting the next subtask
+- Using a prefetched prompt when it's still valid
+- Throwing it away when the next subtask or its recovery state changed
+- Re-reading referenced files that changed
+- Fetching Graphiti context again when the prefetched prompt is used, after
+  the queued memory saves
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from agents import prefetch
+from agents.post_session_queue import PostSessionQueue
+from agents.prefetch import SubtaskPrefetcher, build_prompt_bundle
+from core.plan_store import get_plan_store
+
+
+def _plan() -> dict:
+    return {
+        "phases": [
+            {
+                "id": "phase-1",
+                "name": "Backend",
+                "subtasks": [
+                    {
+                        "id": "model",
+                        "description": "Add model",
+                        "status": "pending",
+                        "files_to_modify": ["app.py"],
+                    },
+                    {
+                        "id": "route",
+                        "description": "Add route",
+                        "status": "pending",
+                        "files_to_modify": ["app.py"],
+                        "patterns_from": ["views.py"],
+                    },
+                ],
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def project(temp_dir: Path, monkeypatch) -> tuple[Path, Path, list]:
+    """A project with a plan, and a Graphiti stub that records queries."""
+    project_dir = temp_dir / "project"
+    project_dir.mkdir()
+    (project_dir / "app.py").write_text("app = create_app()\n")
+    (project_dir / "views.py").write_text("def index(): ...\n")
+    spec_dir = project_dir / ".auto-claude" / "specs" / "001-api"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "implementation_plan.json").write_text(json.dumps(_plan()))
+
+    queries = []
+
+    async def fake_graphiti_context(spec_dir, project_dir, subtask):
+        queries.append(subtask["id"])
+        return f"## Memory for {subtask['id']}"
+
+    monkeypatch.setattr(prefetch, "get_graphiti_context", fake_graphiti_context)
+    return project_dir, spec_dir, queries
+
+
+def _recovery_manager(attempts: int = 0) -> MagicMock:
+    recovery_manager = MagicMock()
+    recovery_manager.get_attempt_count.return_value = attempts
+    recovery_manager.get_recovery_hints.return_value = ["Try something else"]
+    return recovery_manager
+
+
+def _route(spec_dir: Path) -> tuple[dict, dict]:
+    plan = get_plan_store(spec_dir).get()
+    phase = plan["phases"][0]
+    return phase["subtasks"][1], phase
+
+
+class TestPrefetch:
+    """Tests for the prefetcher."""
+
+    def test_predicts_subtask_after_current(self, project):
+        project_dir, spec_dir, _ = project
+        prefetcher = SubtaskPrefetcher(spec_dir, project_dir, _recovery_manager())
+
+        assert prefetcher.predict_next("model")["id"] == "route"
+        assert prefetcher.predict_next(None)["id"] == "model"
+
+    def test_prefetched_prompt_matches_fresh_build(self, project):
+        project_dir, spec_dir, queries = project
+        prefetcher = SubtaskPrefetcher(spec_dir, project_dir, _recovery_manager())
+        subtask, phase = _route(spec_dir)
+
+        async def run():
+            assert prefetcher.start("model") == "route"
+            prefetched = await prefetcher.take(subtask, phase)
+            fresh = await build_prompt_bundle(spec_dir, project_dir, subtask, phase)
+            return prefetched, fresh
+
+        prefetched, fresh = asyncio.run(run())
+
+        assert prefetched.prompt == fresh.prompt
+        assert "def index(): ..." in prefetched.prompt
+        assert "## Memory for route" in prefetched.prompt
+        # Prefetch, again when it's taken, and the fresh build
+        assert queries == ["route", "route", "route"]
+
+    def test_status_change_does_not_invalidate(self, project):
+        project_dir, spec_dir, _ = project
+        prefetcher = SubtaskPrefetcher(spec_dir, project_dir, _recovery_manager())
+
+        async def run():
+            prefetcher.start("model")
+            get_plan_store(spec_dir).update(
+                lambda plan: plan["phases"][0]["subtasks"][0].update(status="completed")
+            )
+            return await prefetcher.take(*_route(spec_dir))
+
+        assert asyncio.run(run()) is not None
+
+    def test_different_subtask_misses(self, project):
+        project_dir, spec_dir, _ = project
+        prefetcher = SubtaskPrefetcher(spec_dir, project_dir, _recovery_manager())
+        plan = get_plan_store(spec_dir).get()
+
+        async def run():
+            prefetcher.start("model")
+            # model failed, so it runs again instead of route
+            return await prefetcher.take(
+                plan["phases"][0]["subtasks"][0], plan["phases"][0]
+            )
+
+        assert asyncio.run(run()) is None
+
+    def test_changed_recovery_state_misses(self, project):
+        project_dir, spec_dir, _ = project
+        prefetcher = SubtaskPrefetcher(spec_dir, project_dir, _recovery_manager())
+        subtask, phase = _route(spec_dir)
+
+        async def run():
+            prefetcher.start("model")
+            return await prefetcher.take(subtask, phase, 1, ["Try something else"])
+
+        assert asyncio.run(run()) is None
+
+    def test_changed_files_are_reread(self, project):
+        project_dir, spec_dir, queries = project
+        prefetcher = SubtaskPrefetcher(spec_dir, project_dir, _recovery_manager())
+        subtask, phase = _route(spec_dir)
+
+        async def run():
+            prefetcher.start("model")
+            await asyncio.sleep(0.05)
+            # The running session edits a file the next subtask modifies
+            (project_dir / "app.py").write_text("app = create_app()\nmodel = Model()\n")
+            return await prefetcher.take(subtask, phase)
+
+        bundle = asyncio.run(run())
+
+        assert "model = Model()" in bundle.prompt
+        # Only the file context and Graphiti context were rebuilt
+        assert queries == ["route", "route"]
+
+    def test_graphiti_context_is_refreshed(self, project, monkeypatch):
+        project_dir, spec_dir, _ = project
+        prefetcher = SubtaskPrefetcher(spec_dir, project_dir, _recovery_manager())
+        subtask, phase = _route(spec_dir)
+        insights = []
+
+        async def fake_graphiti_context(spec_dir, project_dir, subtask):
+            return "\n".join([f"## Memory for {subtask['id']}", *insights])
+
+        monkeypatch.setattr(prefetch, "get_graphiti_context", fake_graphiti_context)
+
+        async def run():
+            prefetcher.start("model")
+            await asyncio.sleep(0.05)
+            # The session's insights are saved before the next one starts
+            insights.append("- insight")
+            return await prefetcher.take(subtask, phase)
+
+        bundle = asyncio.run(run())
+
+        assert bundle.graphiti_context == "## Memory for route\n- insight"
+        assert bundle.budget.used["graphiti"] > 0
+        assert bundle.budget.used["files"] > 0
+
+    def test_graphiti_waits_for_memory_saves(self, project, monkeypatch):
+        project_dir, spec_dir, _ = project
+        subtask, phase = _route(spec_dir)
+        insights = []
+
+        async def fake_graphiti_context(spec_dir, project_dir, subtask):
+            return "\n".join([f"## Memory for {subtask['id']}", *insights])
+
+        async def save_memory():
+            await asyncio.sleep(0.05)
+            insights.append("- insight")
+
+        monkeypatch.setattr(prefetch, "get_graphiti_context", fake_graphiti_context)
+
+        async def run():
+            queue = PostSessionQueue()
+            prefetcher = SubtaskPrefetcher(
+                spec_dir, project_dir, _recovery_manager(), post_session_queue=queue
+            )
+            prefetcher.start("model")
+            # The session ends and its memory save is queued
+            queue.submit("Memory save for model", save_memory, key="memory")
+            prefetched = await prefetcher.take(subtask, phase)
+
+            queue.submit("Memory save for route", save_memory, key="memory")
+            fresh = await build_prompt_bundle(
+                spec_dir, project_dir, subtask, phase, post_session_queue=queue
+            )
+            return prefetched, fresh
+
+        prefetched, fresh = asyncio.run(run())
+
+        assert prefetched.graphiti_context.endswith("- insight")
+        assert fresh.graphiti_context.endswith("- insight\n- insight")
+
+    def test_nothing_to_prefetch(self, project):
+        project_dir, spec_dir, _ = project
+        get_plan_store(spec_dir).update(
+            lambda plan: plan["phases"][0]["subtasks"][0].update(status="completed")
+        )
+        prefetcher = SubtaskPrefetcher(spec_dir, project_dir, _recovery_manager())
+
+        async def run():
+            started = prefetcher.start("route")
+            return started, await prefetcher.take(*_route(spec_dir))
+
+        assert asyncio.run(run()) == (None, None)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Tests for the API Rate Limiter
+==============================
+
+Tests the process-wide scheduler shared by all SDK clients.
+
+Covers:
+- Token bucket limits per model
+- Serving waiting requests by priority class
+- Pausing a model after rate limit errors
+- Cleaning up after cancelled waits
+- Queue wait statistics for the status file
+- Priority classes of create_client() agent types
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from core.rate_limiter import (
+    BACKOFF_BASE_SECONDS,
+    Priority,
+    RateLimitedClient,
+    RateLimiter,
+    agent_priority,
+)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestBucket:
+    """Tests for the per-model token bucket."""
+
+    def test_burst_then_waits(self):
+        limiter = RateLimiter(requests_per_minute=600, burst=2)
+
+        async def run():
+            return [await limiter.acquire("sonnet") for _ in range(3)]
+
+        waits = _run(run())
+
+        assert max(waits[:2]) < 0.05
+        # One slot every 0.1s once the burst is used
+        assert 0.05 < waits[2] < 0.5
+
+    def test_models_have_separate_buckets(self):
+        limiter = RateLimiter(requests_per_minute=1, burst=1)
+
+        async def run():
+            return [await limiter.acquire(m) for m in ("sonnet", "haiku")]
+
+        assert max(_run(run())) < 0.05
+
+    def test_zero_rate_disables_limit(self):
+        limiter = RateLimiter(requests_per_minute=600, burst=1)
+        limiter.configure("haiku", 0, 1)
+
+        async def run():
+            return [await limiter.acquire("haiku") for _ in range(5)]
+
+        assert _run(run()) == [0.0] * 5
+
+    def test_env_defaults(self, monkeypatch):
+        monkeypatch.setenv("AGENT_RATE_LIMIT_RPM", "120")
+        monkeypatch.setenv("AGENT_RATE_LIMIT_BURST", "3")
+
+        limiter = RateLimiter()
+
+        assert (limiter.requests_per_minute, limiter.burst) == (120.0, 3)
+
+
+class TestPriority:
+    """Tests for serving waiting requests by priority class."""
+
+    def test_higher_priority_served_first(self):
+        limiter = RateLimiter(requests_per_minute=1200, burst=1)
+        order = []
+
+        async def request(name, priority):
+            await limiter.acquire("sonnet", priority)
+            order.append(name)
+
+        async def run():
+            await limiter.acquire("sonnet")  # Use up the burst
+            await asyncio.gather(
+                request("insights", Priority.INSIGHTS),
+                request("ideation", Priority.IDEATION),
+                request("qa", Priority.QA),
+                request("coding", Priority.CODING),
+            )
+
+        _run(run())
+
+        assert order == ["coding", "qa", "ideation", "insights"]
+
+    def test_same_priority_first_come_first_served(self):
+        limiter = RateLimiter(requests_per_minute=1200, burst=1)
+        order = []
+
+        async def request(name):
+            await limiter.acquire("sonnet", Priority.QA)
+            order.append(name)
+
+        async def run():
+            await limiter.acquire("sonnet")
+            await asyncio.gather(*(request(f"qa-{i}") for i in range(3)))
+
+        _run(run())
+
+        assert order == ["qa-0", "qa-1", "qa-2"]
+
+    def test_agent_types(self):
+        assert agent_priority("coder") == Priority.CODING
+        assert agent_priority("planner") == Priority.CODING
+        assert agent_priority("qa_reviewer") == Priority.QA
+        assert agent_priority("qa_fixer") == Priority.QA
+
+
+class FakeClient:
+    """Stands in for ClaudeSDKClient."""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.queries = []
+        self.options = "options"
+        self.entered = False
+
+    async def __aenter__(self):
+        self.entered = True
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.entered = False
+
+    async def query(self, prompt):
+        self.queries.append(prompt)
+
+    async def receive_response(self):
+        yield "message"
+        if self.error:
+            raise self.error
+
+
+class TestRateLimitedClient:
+    """Tests for RateLimitedClient."""
+
+    def test_passes_through(self):
+        limiter = RateLimiter(requests_per_minute=600, burst=5)
+        fake = FakeClient()
+        client = RateLimitedClient(fake, "sonnet", Priority.QA, limiter=limiter)
+
+        async def run():
+            async with client as entered:
+                assert entered is client
+                assert fake.entered
+                await client.query("hello")
+                return [msg async for msg in client.receive_response()]
+
+        assert _run(run()) == ["message"]
+        assert fake.queries == ["hello"]
+        assert client.options == "options"
+        assert limiter.stats().grants == 1
+
+    def test_rate_limit_error_pauses_model(self):
+        limiter = RateLimiter(requests_per_minute=600, burst=5)
+        client = RateLimitedClient(
+            FakeClient(Exception("Error 429: rate_limit_error")),
+            "sonnet",
+            limiter=limiter,
+        )
+
+        async def run():
+            await client.query("hello")
+            with pytest.raises(Exception, match="429"):
+                async for _ in client.receive_response():
+                    pass
+
+        _run(run())
+
+        bucket = limiter._buckets["sonnet"]
+        assert limiter.stats().rate_limited == 1
+        assert bucket.backoff == BACKOFF_BASE_SECONDS
+        assert bucket.blocked_until > time.monotonic()
+
+    def test_other_errors_do_not_pause(self):
+        limiter = RateLimiter(requests_per_minute=600, burst=5)
+        client = RateLimitedClient(
+            FakeClient(ValueError("bad input")), "sonnet", limiter=limiter
+        )
+
+        async def run():
+            await client.query("hello")
+            with pytest.raises(ValueError):
+                async for _ in client.receive_response():
+                    pass
+
+        _run(run())
+
+        assert limiter.stats().rate_limited == 0
+
+
+class TestBackoff:
+    """Tests for pausing a model after rate limit errors."""
+
+    def test_waits_until_retry_after(self):
+        limiter = RateLimiter(requests_per_minute=600, burst=5)
+
+        async def run():
+            await limiter.acquire("sonnet")
+            # The pause starts at the report, before the next request queues
+            start = time.monotonic()
+            limiter.report_rate_limited("sonnet", retry_after=0.1)
+            await limiter.acquire("sonnet")
+            return time.monotonic() - start
+
+        assert _run(run()) >= 0.1
+
+    def test_backoff_doubles_and_resets(self):
+        limiter = RateLimiter(requests_per_minute=600, burst=5)
+
+        limiter.report_rate_limited("sonnet")
+        limiter.report_rate_limited("sonnet")
+        assert limiter._buckets["sonnet"].backoff == BACKOFF_BASE_SECONDS * 2
+
+        limiter.report_success("sonnet")
+        assert limiter._buckets["sonnet"].backoff == 0.0
+
+
+class TestStats:
+    """Tests for cancelled waits and wait statistics."""
+
+    def test_cancelled_wait_leaves_queue(self):
+        limiter = RateLimiter(requests_per_minute=60, burst=1)
+
+        async def run():
+            await limiter.acquire("sonnet")
+            task = asyncio.create_task(limiter.acquire("sonnet"))
+            await asyncio.sleep(0.01)
+            assert limiter.stats().waiting == 1
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        _run(run())
+
+        assert limiter.stats().waiting == 0
+        assert limiter._buckets["sonnet"].waiters == []
+
+    def test_listener_sees_waits(self):
+        limiter = RateLimiter(requests_per_minute=600, burst=1)
+        seen = []
+        remove = limiter.add_listener(lambda stats: seen.append(stats.to_dict()))
+
+        async def run():
+            await limiter.acquire("sonnet")
+            await limiter.acquire("sonnet")
+
+        _run(run())
+        remove()
+        _run(run())
+
+        assert [s["waiting"] for s in seen] == [1, 0, 1, 0]
+        assert seen[-1]["grants"] == 2
+        assert seen[-1]["last_wait_seconds"] > 0
+        assert 0 < seen[-1]["average_wait_seconds"] < seen[-1]["last_wait_seconds"]
+
+    def test_status_file(self, temp_dir: Path):
+        from ui.status import BuildStatus, StatusManager
+
+        manager = StatusManager(temp_dir)
+        manager.update_rate_limit(2, 1.5, 0.75)
+
+        status = manager.read()
+
+        assert (
+            status.rate_limit_waiting,
+            status.rate_limit_last_wait,
+            status.rate_limit_average_wait,
+        ) == (2, 1.5, 0.75)
+        assert BuildStatus.from_dict({}).rate_limit_waiting == 0
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for Session Response Streaming
+====================================
+
+Tests assembling streamed session output without per-block rewrites.
+
+Covers:
+- ResponseBuffer joining chunks once and keeping a bounded tail
+- Batched task log writes
+- Replaying recorded message streams through run_agent_session
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from agents.response_buffer import ResponseBuffer
+
+# task_logger (and agents.benchmark, which uses it) are imported inside the
+# tests: other test modules replace task_logger with a mock while collecting
+
+
+class TestResponseBuffer:
+    """Tests for ResponseBuffer."""
+
+    def test_joins_chunks(self):
+        buffer = ResponseBuffer()
+        for chunk in ["Reading ", "", "the file", "..."]:
+            buffer.append(chunk)
+
+        assert buffer.getvalue() == "Reading the file..."
+        assert len(buffer) == len("Reading the file...")
+        assert buffer.getvalue() is buffer.getvalue()
+
+        buffer.append(" done")
+        assert buffer.getvalue() == "Reading the file... done"
+
+    def test_tail_is_bounded(self):
+        buffer = ResponseBuffer(tail_chars=10)
+        for i in range(1000):
+            buffer.append(f"chunk {i}\n")
+
+        assert buffer.tail == "chunk 999\n"[-10:]
+        assert buffer.getvalue().endswith(buffer.tail)
+        # Only the chunks needed for the tail are kept
+        assert len(buffer._tail) <= 2
+
+    def test_tail_of_short_response(self):
+        buffer = ResponseBuffer(tail_chars=100)
+        buffer.append("All done")
+
+        assert buffer.tail == "All done"
+
+    def test_tail_disabled(self):
+        buffer = ResponseBuffer(tail_chars=0)
+        buffer.append("All ")
+        buffer.append("done")
+
+        assert buffer.tail == ""
+        assert buffer.getvalue() == "All done"
+        assert not buffer._tail
+
+
+@pytest.fixture
+def storage_module():
+    from task_logger import storage
+
+    return storage
+
+
+def _entry(storage_module, content: str):
+    return storage_module.LogEntry(
+        timestamp="2026-01-01T00:00:00+00:00",
+        type="text",
+        content=content,
+        phase=storage_module.LogPhase.CODING.value,
+    )
+
+
+def _saved_entries(spec_dir: Path) -> list[str]:
+    data = json.loads((spec_dir / "task_logs.json").read_text())
+    return [e["content"] for e in data["phases"]["coding"]["entries"]]
+
+
+class TestBatchedLogWrites:
+    """Tests for LogStorage.batched."""
+
+    def test_unbatched_entries_saved_immediately(self, spec_dir: Path):
+        from task_logger.logger import TaskLogger
+
+        logger = TaskLogger(spec_dir, emit_markers=False)
+
+        logger.log("first", print_to_console=False)
+
+        assert _saved_entries(spec_dir) == ["first"]
+
+    def test_batched_entries_saved_on_exit(
+        self, spec_dir: Path, storage_module, monkeypatch
+    ):
+        monkeypatch.setattr(storage_module, "BATCH_MAX_SECONDS", 60.0)
+        storage = storage_module.LogStorage(spec_dir)
+        saves = []
+        original_save = storage.save
+        monkeypatch.setattr(storage, "save", lambda: (saves.append(1), original_save()))
+
+        with storage.batched():
+            for i in range(120):
+                storage.add_entry(_entry(storage_module, f"entry {i}"))
+            with storage.batched():
+                storage.add_entry(_entry(storage_module, "nested"))
+
+        # Every BATCH_MAX_ENTRIES entries, then the rest on exit
+        assert len(saves) == 3
+        assert len(_saved_entries(spec_dir)) == 121
+
+    def test_saved_after_interval(self, spec_dir: Path, storage_module, monkeypatch):
+        monkeypatch.setattr(storage_module, "BATCH_MAX_SECONDS", 0.0)
+        storage = storage_module.LogStorage(spec_dir)
+
+        with storage.batched():
+            storage.add_entry(_entry(storage_module, "first"))
+            assert _saved_entries(spec_dir) == ["first"]
+
+    def test_saved_when_block_raises(self, spec_dir: Path, storage_module):
+        storage = storage_module.LogStorage(spec_dir)
+
+        with pytest.raises(RuntimeError):
+            with storage.batched():
+                storage.add_entry(_entry(storage_module, "before error"))
+                raise RuntimeError("stream broke")
+
+        assert _saved_entries(spec_dir) == ["before error"]
+
+
+class TestSessionReplay:
+    """Tests for replaying message streams through run_agent_session."""
+
+    def test_replay_assembles_response(self, temp_dir: Path):
+        from agents.benchmark import ReplayConfig, run_replay, synthetic_recording
+
+        config = ReplayConfig(text_blocks=120, text_chars=10, tool_calls=4)
+
+        report = run_replay(synthetic_recording(config), temp_dir)
+
+        assert report["response_chars"] == 120 * 10
+        # 120 text and 8 tool entries, written in batches
+        assert 0 < report["replay"]["log_writes"] < 10
+        logs = json.loads((temp_dir / "spec" / "task_logs.json").read_text())
+        assert len(logs["phases"]["coding"]["entries"]) == 128
+
+    def test_recording_round_trip(self, temp_dir: Path):
+        from agents.benchmark import run_replay, serialize_message
+
+        class TextBlock:
+            text = "Looks good"
+
+        class AssistantMessage:
+            content = [TextBlock()]
+
+        recording = json.loads(json.dumps([serialize_message(AssistantMessage())]))
+
+        assert recording == [
+            {
+                "type": "AssistantMessage",
+                "content": [{"type": "TextBlock", "text": "Looks good"}],
+            }
+        ]
+        assert run_replay(recording, temp_dir)["response_chars"] == len("Looks good")
+
+    def test_compare_flags_regressions(self):
+        from agents.benchmark import compare_reports
+
+        baseline = {"replay": {"wall_seconds": 1.0, "log_writes": 10}}
+        current = {"replay": {"wall_seconds": 1.05, "log_writes": 100}}
+
+        rows = {row["metric"]: row for row in compare_reports(baseline, current)}
+
+        assert not rows["wall_seconds"]["regressed"]
+        assert rows["log_writes"]["regressed"]
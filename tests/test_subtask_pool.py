@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Tests for the Parallel Subtask Pool
+===================================
+
+Tests running subtasks of parallel-safe phases concurrently (--parallel N).
+
+Covers:
+- Picking parallel batches from the implementation plan
+- Worker worktrees and folding their commits back
+- Overlapping changes merged through the MergeOrchestrator
+- Overlapping changes that can't be merged
+- A full batch with simulated agent sessions
+"""
+
+import asyncio
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from agents import subtask_pool
+from agents.subtask_pool import (
+    create_subtask_worktree,
+    fold_subtask_branch,
+    remove_subtask_worktree,
+    run_parallel_subtasks,
+    set_subtask_status,
+)
+from core.plan_store import get_plan_store
+from core.progress import get_parallel_subtasks
+from core.subtask_scheduler import SubtaskScheduler
+from merge import git_object_reader
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _plan(parallel_safe: bool) -> dict:
+    return {
+        "feature": "Test",
+        "phases": [
+            {
+                "id": "phase-1",
+                "name": "Setup",
+                "subtasks": [{"id": "setup", "status": "completed"}],
+            },
+            {
+                "id": "phase-2",
+                "name": "Endpoints",
+                "depends_on": ["phase-1"],
+                "parallel_safe": parallel_safe,
+                "subtasks": [
+                    {"id": "users", "description": "Users", "status": "pending"},
+                    {"id": "orders", "description": "Orders", "status": "pending"},
+                    {"id": "items", "description": "Items", "status": "pending"},
+                ],
+            },
+        ],
+    }
+
+
+def _statuses(spec_dir: Path) -> dict[str, str]:
+    plan = json.loads((spec_dir / "implementation_plan.json").read_text())
+    return {s["id"]: s["status"] for phase in plan["phases"] for s in phase["subtasks"]}
+
+
+@pytest.fixture
+def build(temp_git_repo: Path) -> tuple[Path, Path]:
+    """A repository with a spec whose second phase is parallel-safe."""
+    (temp_git_repo / ".gitignore").write_text(".auto-claude/\n.worktrees/\n")
+    _git(temp_git_repo, "add", ".gitignore")
+    _git(temp_git_repo, "commit", "-m", "Ignore auto-claude files")
+
+    spec_dir = temp_git_repo / ".auto-claude" / "specs" / "001-api"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "implementation_plan.json").write_text(json.dumps(_plan(True)))
+    return temp_git_repo, spec_dir
+
+
+class TestGetParallelSubtasks:
+    """Tests for picking a parallel batch."""
+
+    def test_parallel_safe_phase(self, build):
+        _, spec_dir = build
+
+        batch = get_parallel_subtasks(spec_dir, 2)
+
+        assert [s["id"] for s in batch] == ["users", "orders"]
+        assert all(s["phase_id"] == "phase-2" for s in batch)
+
+    def test_serial_phase(self, build):
+        _, spec_dir = build
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(_plan(False)))
+
+        assert [s["id"] for s in get_parallel_subtasks(spec_dir, 3)] == ["users"]
+
+    def test_skips_subtasks_already_running(self, build):
+        _, spec_dir = build
+        set_subtask_status(spec_dir, "users", "in_progress")
+
+        batch = get_parallel_subtasks(spec_dir, 3)
+
+        assert [s["id"] for s in batch] == ["orders", "items"]
+
+    def test_all_complete(self, build):
+        _, spec_dir = build
+        for subtask_id in ("users", "orders", "items"):
+            set_subtask_status(spec_dir, subtask_id, "completed")
+
+        assert get_parallel_subtasks(spec_dir, 3) == []
+
+
+class TestFoldSubtaskBranch:
+    """Tests for merging worker commits into the build branch."""
+
+    def _commit_in(self, worker, name: str, content: str) -> None:
+        (worker.worktree_path / name).write_text(content)
+        _git(worker.worktree_path, "add", name)
+        _git(worker.worktree_path, "commit", "-m", f"Write {name}")
+
+    def test_disjoint_changes_merge_with_git(self, build):
+        repo, spec_dir = build
+
+        async def run():
+            first = await create_subtask_worktree(repo, spec_dir, {"id": "users"})
+            second = await create_subtask_worktree(repo, spec_dir, {"id": "orders"})
+            self._commit_in(first, "users.py", "users\n")
+            self._commit_in(second, "orders.py", "orders\n")
+            methods = [
+                await fold_subtask_branch(repo, first),
+                await fold_subtask_branch(repo, second),
+            ]
+            await remove_subtask_worktree(repo, first)
+            await remove_subtask_worktree(repo, second)
+            return first, methods
+
+        first, methods = asyncio.run(run())
+
+        assert methods == ["git", "git"]
+        assert (repo / "users.py").exists() and (repo / "orders.py").exists()
+        assert not first.worktree_path.exists()
+        assert "subtask" not in _git(repo, "branch", "--list")
+        # The worker's copy of the plan lives in its own worktree
+        assert first.spec_dir.parts[-3:] == (".auto-claude", "specs", "001-api")
+
+    def test_no_changes(self, build):
+        repo, spec_dir = build
+
+        async def run():
+            worker = await create_subtask_worktree(repo, spec_dir, {"id": "users"})
+            method = await fold_subtask_branch(repo, worker)
+            await remove_subtask_worktree(repo, worker)
+            return method
+
+        assert asyncio.run(run()) == "no_changes"
+
+    def test_overlapping_additions_merge_with_orchestrator(self, build):
+        repo, spec_dir = build
+        base = "import os\n\n\ndef base():\n    return os.getcwd()\n"
+        (repo / "a.py").write_text(base)
+        _git(repo, "add", "a.py")
+        _git(repo, "commit", "-m", "Add a.py")
+
+        async def run():
+            first = await create_subtask_worktree(repo, spec_dir, {"id": "users"})
+            second = await create_subtask_worktree(repo, spec_dir, {"id": "orders"})
+            self._commit_in(first, "a.py", base + "\n\ndef users():\n    return []\n")
+            self._commit_in(second, "a.py", base + "\n\ndef orders():\n    return {}\n")
+            self._commit_in(second, "orders.py", "orders\n")
+            methods = [
+                await fold_subtask_branch(repo, first),
+                await fold_subtask_branch(repo, second),
+            ]
+            await remove_subtask_worktree(repo, first)
+            await remove_subtask_worktree(repo, second)
+            return second, methods
+
+        second, methods = asyncio.run(run())
+
+        assert methods == ["git", "orchestrator"]
+        # The orchestrator's reader for the removed worktree was closed
+        assert second.worktree_path.resolve() not in git_object_reader._readers
+        merged = (repo / "a.py").read_text()
+        assert "def base():" in merged
+        assert "def users():" in merged and "def orders():" in merged
+        assert (repo / "orders.py").read_text() == "orders\n"
+        assert _git(repo, "status", "--porcelain") == ""
+        # A merge commit with both the build and the worker as parents
+        assert len(_git(repo, "rev-list", "--parents", "-1", "HEAD").split()) == 3
+
+    def test_unmergeable_overlap_leaves_branch_clean(self, build, monkeypatch):
+        repo, spec_dir = build
+
+        async def no_orchestrator(*args):
+            return False
+
+        monkeypatch.setattr(subtask_pool, "_merge_with_orchestrator", no_orchestrator)
+
+        async def run():
+            first = await create_subtask_worktree(repo, spec_dir, {"id": "users"})
+            second = await create_subtask_worktree(repo, spec_dir, {"id": "orders"})
+            self._commit_in(first, "README.md", "users\n")
+            self._commit_in(second, "README.md", "orders\n")
+            methods = [
+                await fold_subtask_branch(repo, first),
+                await fold_subtask_branch(repo, second),
+            ]
+            await remove_subtask_worktree(repo, first)
+            await remove_subtask_worktree(repo, second)
+            return methods
+
+        assert asyncio.run(run()) == ["git", "failed"]
+        assert (repo / "README.md").read_text() == "users\n"
+        assert _git(repo, "status", "--porcelain") == ""
+
+
+class TestRunParallelSubtasks:
+    """A full batch with simulated agent sessions."""
+
+    def test_batch_updates_plan_and_merges(self, build, monkeypatch):
+        repo, spec_dir = build
+        seen_in_progress = []
+        processed = []
+
+        async def fake_worker(worker, model, recovery_manager, verbose):
+            # The pool marks every subtask of the batch before workers start
+            seen_in_progress.append(_statuses(spec_dir)[worker.subtask_id])
+            await asyncio.sleep(0)
+            if worker.subtask_id == "orders":
+                return "in_progress"
+            name = f"{worker.subtask_id}.py"
+            (worker.worktree_path / name).write_text("pass\n")
+            _git(worker.worktree_path, "add", name)
+            _git(worker.worktree_path, "commit", "-m", f"Add {name}")
+            set_subtask_status(worker.spec_dir, worker.subtask_id, "completed")
+            return "completed"
+
+        async def fake_post_processing(**kwargs):
+            processed.append(
+                (kwargs["subtask_id"], _statuses(spec_dir)[kwargs["subtask_id"]])
+            )
+            return True
+
+        monkeypatch.setattr(subtask_pool, "_run_worker", fake_worker)
+        monkeypatch.setattr(
+            subtask_pool, "post_session_processing", fake_post_processing
+        )
+        recovery_manager = MagicMock()
+        recovery_manager.get_attempt_count.return_value = 1
+        status_manager = MagicMock()
+        store = get_plan_store(spec_dir)
+        scheduler = SubtaskScheduler(store.get())
+        stop_following = scheduler.follow(store)
+
+        results = asyncio.run(
+            run_parallel_subtasks(
+                project_dir=repo,
+                spec_dir=spec_dir,
+                subtasks=scheduler.claim(3),
+                model="test-model",
+                session_num=2,
+                recovery_manager=recovery_manager,
+                status_manager=status_manager,
+                max_workers=3,
+                scheduler=scheduler,
+            )
+        )
+        stop_following()
+
+        assert seen_in_progress == ["in_progress"] * 3
+        assert {r.subtask_id: r.completed for r in results} == {
+            "users": True,
+            "orders": False,
+            "items": True,
+        }
+        assert _statuses(spec_dir) == {
+            "setup": "completed",
+            "users": "completed",
+            "orders": "pending",
+            "items": "completed",
+        }
+        # Post-processing sees the plan already updated for each subtask
+        assert processed == [
+            ("users", "completed"),
+            ("orders", "pending"),
+            ("items", "completed"),
+        ]
+        assert (repo / "users.py").exists() and (repo / "items.py").exists()
+        status_manager.update_workers.assert_any_call(3, 3)
+        status_manager.update_workers.assert_called_with(0)
+        assert not list((repo / ".worktrees" / ".subtasks").iterdir())
+        # The scheduler followed the batch without being rebuilt
+        assert not scheduler.claimed
+        assert scheduler.status("users") == "completed"
+        assert [s["id"] for s in scheduler.next_ready(3)] == ["orders"]
+
+    def test_interrupted_batch_is_reset(self, build, monkeypatch):
+        repo, spec_dir = build
+        started = []
+
+        async def hanging_worker(worker, model, recovery_manager, verbose):
+            started.append(worker.subtask_id)
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(subtask_pool, "_run_worker", hanging_worker)
+
+        async def run():
+            batch = asyncio.create_task(
+                run_parallel_subtasks(
+                    project_dir=repo,
+                    spec_dir=spec_dir,
+                    subtasks=get_parallel_subtasks(spec_dir, 2),
+                    model="test-model",
+                    session_num=2,
+                    recovery_manager=MagicMock(),
+                    status_manager=MagicMock(),
+                    max_workers=2,
+                )
+            )
+            while len(started) < 2:
+                await asyncio.sleep(0.01)
+            batch.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await batch
+
+        asyncio.run(run())
+
+        assert _statuses(spec_dir)["users"] == "pending"
+        assert _statuses(spec_dir)["orders"] == "pending"
+        assert not list((repo / ".worktrees" / ".subtasks").iterdir())
+        assert "subtask" not in _git(repo, "branch", "--list")
+
+    def test_stuck_subtask_is_not_retried(self, build, monkeypatch):
+        repo, spec_dir = build
+
+        async def failing_worker(worker, model, recovery_manager, verbose):
+            raise RuntimeError("session crashed")
+
+        async def fake_post_processing(**kwargs):
+            return False
+
+        monkeypatch.setattr(subtask_pool, "_run_worker", failing_worker)
+        monkeypatch.setattr(
+            subtask_pool, "post_session_processing", fake_post_processing
+        )
+        recovery_manager = MagicMock()
+        recovery_manager.get_attempt_count.return_value = 3
+
+        results = asyncio.run(
+            run_parallel_subtasks(
+                project_dir=repo,
+                spec_dir=spec_dir,
+                subtasks=get_parallel_subtasks(spec_dir, 2),
+                model="test-model",
+                session_num=5,
+                recovery_manager=recovery_manager,
+                status_manager=MagicMock(),
+                max_workers=2,
+            )
+        )
+
+        assert [r.error for r in results] == ["session crashed"] * 2
+        assert _statuses(spec_dir)["users"] == "failed"
+        assert recovery_manager.mark_subtask_stuck.call_count == 2
+        assert [s["id"] for s in get_parallel_subtasks(spec_dir, 2)] == ["items"]
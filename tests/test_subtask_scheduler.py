@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Tests for the Subtask Scheduler
+===============================
+
+Tests scheduling implementation plan subtasks from a dependency DAG.
+
+Covers:
+- Phase and subtask dependencies
+- Critical path and priority ordering
+- Serial vs parallel-safe phases
+- Claiming, completing, failing and releasing subtasks
+- Catching up with a changed plan, and following a PlanStore
+- get_next_subtask / get_parallel_subtasks on top of the scheduler
+"""
+
+import json
+from pathlib import Path
+
+from core.plan_store import get_plan_store
+from core.progress import get_next_subtask, get_parallel_subtasks
+from core.subtask_scheduler import SubtaskScheduler
+
+
+def _subtask(subtask_id: str, status: str = "pending", **extra) -> dict:
+    return {"id": subtask_id, "description": subtask_id, "status": status, **extra}
+
+
+def _plan() -> dict:
+    """
+    setup -> (api: a1, a2 | ui: u1) -> docs
+
+    api is parallel-safe and longer than ui, so it's on the critical path.
+    """
+    return {
+        "phases": [
+            {"id": "setup", "phase": 1, "subtasks": [_subtask("s1")]},
+            {
+                "id": "api",
+                "phase": 2,
+                "depends_on": ["setup"],
+                "parallel_safe": True,
+                "subtasks": [_subtask("a1"), _subtask("a2")],
+            },
+            {
+                "id": "ui",
+                "phase": 3,
+                "depends_on": [1],  # By phase number
+                "subtasks": [_subtask("u1")],
+            },
+            {
+                "id": "docs",
+                "phase": 4,
+                "depends_on": ["api"],
+                "subtasks": [_subtask("d1"), _subtask("d2")],
+            },
+        ]
+    }
+
+
+def _ids(subtasks: list[dict]) -> list[str]:
+    return [s["id"] for s in subtasks]
+
+
+class TestDependencies:
+    """Tests for building the DAG."""
+
+    def test_only_roots_are_ready(self):
+        scheduler = SubtaskScheduler(_plan())
+
+        assert _ids(scheduler.next_ready(5)) == ["s1"]
+
+    def test_completion_unblocks_dependents(self):
+        scheduler = SubtaskScheduler(_plan())
+
+        unblocked = scheduler.mark_completed("s1")
+
+        assert sorted(unblocked) == ["a1", "a2", "u1"]
+        assert _ids(scheduler.next_ready(5)) == ["a1", "a2", "u1"]
+
+    def test_subtask_level_dependencies(self):
+        plan = _plan()
+        plan["phases"][1]["subtasks"][1]["depends_on"] = ["u1"]
+        scheduler = SubtaskScheduler(plan)
+        scheduler.mark_completed("s1")
+
+        # u1 is now on the critical path (u1 -> a2 -> d1 -> d2)
+        assert _ids(scheduler.next_ready(5)) == ["u1", "a1"]
+        scheduler.mark_completed("u1")
+        assert "a2" in _ids(scheduler.next_ready(5))
+
+    def test_unknown_phase_dependency_blocks(self):
+        plan = _plan()
+        plan["phases"][0]["depends_on"] = ["missing"]
+
+        assert SubtaskScheduler(plan).next_ready(5) == []
+
+    def test_cycle_does_not_hang(self):
+        plan = {
+            "phases": [
+                {"id": "a", "depends_on": ["b"], "subtasks": [_subtask("x")]},
+                {"id": "b", "depends_on": ["a"], "subtasks": [_subtask("y")]},
+                {"id": "c", "subtasks": [_subtask("z")]},
+            ]
+        }
+
+        assert _ids(SubtaskScheduler(plan).next_ready(5)) == ["z"]
+
+    def test_statuses_from_plan(self):
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        plan["phases"][1]["subtasks"][0]["status"] = "in_progress"
+
+        assert _ids(SubtaskScheduler(plan).next_ready(5)) == ["a2", "u1"]
+
+
+class TestOrdering:
+    """Tests for critical path and priority ordering."""
+
+    def test_critical_path_first(self):
+        plan = _plan()
+        # ui is listed before api, but api leads to docs
+        plan["phases"][1], plan["phases"][2] = plan["phases"][2], plan["phases"][1]
+        scheduler = SubtaskScheduler(plan)
+        scheduler.mark_completed("s1")
+
+        assert scheduler.critical_path("a1") == 3
+        assert scheduler.critical_path("u1") == 1
+        assert _ids(scheduler.next_ready(1)) == ["a1"]
+
+    def test_priority_breaks_ties(self):
+        plan = _plan()
+        plan["phases"][1]["subtasks"][1]["priority"] = 5
+        scheduler = SubtaskScheduler(plan)
+        scheduler.mark_completed("s1")
+
+        assert _ids(scheduler.next_ready(2)) == ["a2", "a1"]
+
+    def test_serial_phase_one_at_a_time_in_order(self):
+        scheduler = SubtaskScheduler(_plan())
+        for subtask_id in ("s1", "a1", "a2"):
+            scheduler.mark_completed(subtask_id)
+
+        assert _ids(scheduler.next_ready(5)) == ["d1", "u1"]
+        scheduler.claim(1)
+        # d2 waits for d1, even though it has no unmet dependencies
+        assert _ids(scheduler.next_ready(5)) == ["u1"]
+
+    def test_result_shape(self):
+        subtask = SubtaskScheduler(_plan()).next_ready()[0]
+
+        assert subtask["phase_id"] == "setup"
+        assert subtask["phase_num"] == 1
+        assert subtask["status"] == "pending"
+
+
+class TestClaims:
+    """Tests for handing out subtasks to workers."""
+
+    def test_claimed_subtasks_are_not_handed_out_again(self):
+        scheduler = SubtaskScheduler(_plan())
+        scheduler.mark_completed("s1")
+
+        first = scheduler.claim(2)
+        second = scheduler.claim(2)
+
+        assert _ids(first) == ["a1", "a2"]
+        assert _ids(second) == ["u1"]
+        assert scheduler.claimed == {"a1", "a2", "u1"}
+
+    def test_release_returns_to_queue(self):
+        scheduler = SubtaskScheduler(_plan())
+        scheduler.claim(1)
+
+        scheduler.release("s1")
+
+        assert _ids(scheduler.next_ready(1)) == ["s1"]
+
+    def test_release_keeps_status(self):
+        scheduler = SubtaskScheduler(_plan())
+        scheduler.claim(1)
+        scheduler.mark_completed("s1")
+
+        scheduler.release("s1")
+
+        assert scheduler.status("s1") == "completed"
+        assert _ids(scheduler.next_ready(5)) == ["a1", "a2", "u1"]
+
+    def test_next_ready_after_changes_nothing(self):
+        scheduler = SubtaskScheduler(_plan())
+        scheduler.claim(1)
+
+        assert _ids(scheduler.next_ready_after("s1", 5)) == ["a1", "a2", "u1"]
+        assert scheduler.status("s1") == "pending"
+        assert scheduler.claimed == {"s1"}
+        assert scheduler.next_ready(5) == []
+
+    def test_failed_subtask_blocks_dependents(self):
+        scheduler = SubtaskScheduler(_plan())
+        scheduler.mark_completed("s1")
+        scheduler.mark_completed("a1")
+
+        scheduler.mark_failed("a2")
+
+        assert _ids(scheduler.next_ready(5)) == ["u1"]
+        assert scheduler.status("a2") == "failed"
+
+    def test_is_complete(self):
+        scheduler = SubtaskScheduler(_plan())
+        for subtask_id in ("s1", "a1", "a2", "u1", "d1", "d2"):
+            scheduler.mark_completed(subtask_id)
+
+        assert scheduler.is_complete()
+        assert scheduler.next_ready(5) == []
+
+
+class TestRefresh:
+    """Tests for catching up with a changed plan."""
+
+    def test_status_changes_applied_incrementally(self):
+        scheduler = SubtaskScheduler(_plan())
+        scheduler.claim(1)
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+
+        scheduler.refresh(plan)
+
+        assert scheduler.claimed == set()
+        assert _ids(scheduler.next_ready(5)) == ["a1", "a2", "u1"]
+
+    def test_uncompleting_blocks_again(self):
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        scheduler = SubtaskScheduler(plan)
+
+        scheduler.refresh(_plan())
+
+        assert _ids(scheduler.next_ready(5)) == ["s1"]
+
+    def test_new_subtasks_rebuild_graph_and_keep_claims(self):
+        scheduler = SubtaskScheduler(_plan())
+        scheduler.mark_completed("s1")
+        scheduler.claim(1)
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        plan["phases"][1]["subtasks"].append(_subtask("a3"))
+
+        scheduler.refresh(plan)
+
+        assert scheduler.claimed == {"a1"}
+        assert _ids(scheduler.next_ready(5)) == ["a2", "a3", "u1"]
+
+    def test_status_changes_keep_graph(self):
+        scheduler = SubtaskScheduler(_plan())
+        nodes = scheduler._nodes
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        plan["phases"][1]["subtasks"][0]["notes"] = "Started"
+
+        scheduler.refresh(plan)
+
+        assert scheduler._nodes is nodes
+        assert scheduler.next_ready(1)[0]["notes"] == "Started"
+
+    def test_follows_plan_store(self, spec_dir: Path):
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(_plan()))
+        store = get_plan_store(spec_dir)
+        scheduler = SubtaskScheduler(store.get())
+        stop_following = scheduler.follow(store)
+
+        def complete(subtask_id):
+            def apply(plan):
+                for phase in plan["phases"]:
+                    for subtask in phase["subtasks"]:
+                        if subtask["id"] == subtask_id:
+                            subtask["status"] = "completed"
+
+            store.update(apply)
+
+        complete("s1")
+        assert _ids(scheduler.next_ready(5)) == ["a1", "a2", "u1"]
+
+        stop_following()
+        complete("a1")
+        assert scheduler.status("a1") == "pending"
+
+
+class TestProgressFunctions:
+    """get_next_subtask and get_parallel_subtasks use the scheduler."""
+
+    def _write(self, spec_dir: Path, plan: dict) -> None:
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+    def test_get_next_subtask(self, spec_dir: Path):
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        self._write(spec_dir, plan)
+
+        assert get_next_subtask(spec_dir)["id"] == "a1"
+
+    def test_parallel_subtasks_span_independent_phases(self, spec_dir: Path):
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        self._write(spec_dir, plan)
+
+        assert _ids(get_parallel_subtasks(spec_dir, 5)) == ["a1", "a2", "u1"]
+
+    def test_missing_plan(self, spec_dir: Path):
+        assert get_next_subtask(spec_dir) is None
+        assert get_parallel_subtasks(spec_dir, 3) == []
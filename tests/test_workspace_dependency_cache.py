@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Tests for the Dependency Cache
+==============================
+
+Tests sharing installed dependencies between spec worktrees.
+
+Covers:
+- Lockfile discovery and cache keys
+- Sharing being opt-in
+- Seeding the cache from the main project and copying node_modules
+- Worktree copies staying private to the worktree
+- Copied virtualenvs with relocated scripts and editable installs
+- Skipping mismatched lockfiles and paths git doesn't ignore
+- Concurrent worktrees sharing one cache entry
+"""
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from core.workspace.dependency_cache import (
+    DEPENDENCY_CACHE_DIR,
+    find_dependency_sets,
+    is_dependency_sharing_enabled,
+    share_dependencies,
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+def _add_worktree(repo: Path, name: str) -> Path:
+    path = repo / ".worktrees" / name
+    _git(repo, "worktree", "add", "-b", f"auto-claude/{name}", str(path), "main")
+    return path
+
+
+@pytest.fixture
+def node_project(temp_git_repo: Path) -> Path:
+    """A project with a lockfile and node_modules installed in the main checkout."""
+    (temp_git_repo / ".gitignore").write_text("node_modules/\n.venv\n.worktrees/\n")
+    (temp_git_repo / "package-lock.json").write_text('{"lockfileVersion": 3}\n')
+    _git(temp_git_repo, "add", ".")
+    _git(temp_git_repo, "commit", "-m", "Add lockfile")
+
+    package = temp_git_repo / "node_modules" / "left-pad"
+    package.mkdir(parents=True)
+    (package / "index.js").write_text("module.exports = 1;\n")
+    (temp_git_repo / "node_modules" / ".bin").mkdir()
+    os.symlink("../left-pad/index.js", temp_git_repo / "node_modules" / ".bin" / "pad")
+    return temp_git_repo
+
+
+class TestFindDependencySets:
+    """Tests for lockfile discovery."""
+
+    def test_groups_lockfiles_by_directory(self, node_project):
+        service = node_project / "services" / "api"
+        service.mkdir(parents=True)
+        (service / "requirements.txt").write_text("flask\n")
+        (service / "poetry.lock").write_text("# lock\n")
+        _git(node_project, "add", ".")
+        _git(node_project, "commit", "-m", "Add service")
+
+        sets = {(s.ecosystem, s.directory): s for s in find_dependency_sets(node_project)}
+
+        assert set(sets) == {("node", ""), ("python", "services/api")}
+        assert sets[("python", "services/api")].lockfiles == [
+            "poetry.lock",
+            "requirements.txt",
+        ]
+        assert sets[("python", "services/api")].dependency_path == "services/api/.venv"
+
+    def test_key_follows_lockfile_content(self, node_project):
+        before = find_dependency_sets(node_project)[0].key
+        (node_project / "package-lock.json").write_text('{"lockfileVersion": 2}\n')
+
+        assert find_dependency_sets(node_project)[0].key != before
+
+
+class TestShareDependencies:
+    """Tests for copying dependencies into worktrees."""
+
+    def test_opt_in(self, monkeypatch):
+        monkeypatch.delenv("WORKTREE_SHARE_DEPENDENCIES", raising=False)
+        assert not is_dependency_sharing_enabled()
+
+        monkeypatch.setenv("WORKTREE_SHARE_DEPENDENCIES", "true")
+        assert is_dependency_sharing_enabled()
+
+    def test_node_modules_copied(self, node_project):
+        worktree = _add_worktree(node_project, "spec-1")
+
+        results = share_dependencies(node_project, worktree)
+
+        assert [(r.dependency_path, r.status, r.cache_created) for r in results] == [
+            ("node_modules", "copied", True)
+        ]
+        shared = worktree / "node_modules" / "left-pad" / "index.js"
+        original = node_project / "node_modules" / "left-pad" / "index.js"
+        assert shared.read_text() == "module.exports = 1;\n"
+        assert os.stat(shared).st_ino != os.stat(original).st_ino
+        assert os.readlink(worktree / "node_modules" / ".bin" / "pad") == (
+            "../left-pad/index.js"
+        )
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=worktree, capture_output=True, text=True
+        )
+        assert status.stdout == ""
+
+    def test_writes_stay_in_worktree(self, node_project):
+        """In-place writes (postinstall, patch-package) don't reach other trees."""
+        first = _add_worktree(node_project, "spec-1")
+        second = _add_worktree(node_project, "spec-2")
+        share_dependencies(node_project, first)
+        share_dependencies(node_project, second)
+
+        with open(first / "node_modules" / "left-pad" / "index.js", "r+") as f:
+            f.write("patched")
+
+        for tree in (node_project, second):
+            index = tree / "node_modules" / "left-pad" / "index.js"
+            assert index.read_text() == "module.exports = 1;\n"
+        cached = next((node_project / DEPENDENCY_CACHE_DIR).glob("node-*"))
+        assert (cached / "node_modules" / "left-pad" / "index.js").read_text() == (
+            "module.exports = 1;\n"
+        )
+
+    def test_cache_reused_and_rerun_is_noop(self, node_project):
+        first = _add_worktree(node_project, "spec-1")
+        second = _add_worktree(node_project, "spec-2")
+        share_dependencies(node_project, first)
+
+        # The main project's install can go away - the cache entry remains
+        subprocess.run(["rm", "-rf", str(node_project / "node_modules")])
+        results = share_dependencies(node_project, second)
+
+        assert results[0].status == "copied"
+        assert not results[0].cache_created
+        assert (second / "node_modules" / "left-pad" / "index.js").exists()
+        assert share_dependencies(node_project, second)[0].status == "exists"
+
+    def test_mismatched_lockfile_not_shared(self, node_project):
+        worktree = _add_worktree(node_project, "spec-1")
+        (worktree / "package-lock.json").write_text('{"lockfileVersion": 2}\n')
+
+        results = share_dependencies(node_project, worktree)
+
+        assert results[0].status == "unavailable"
+        assert not (worktree / "node_modules").exists()
+
+    def test_not_ignored_not_shared(self, node_project):
+        (node_project / ".gitignore").write_text(".worktrees/\n")
+        _git(node_project, "commit", "-am", "Track everything")
+        worktree = _add_worktree(node_project, "spec-1")
+
+        results = share_dependencies(node_project, worktree)
+
+        assert results[0].status == "not_ignored"
+        assert not (worktree / "node_modules").exists()
+
+    def test_virtualenv_copied_and_relocated(self, node_project):
+        (node_project / "requirements.txt").write_text("-e .\n")
+        _git(node_project, "add", ".")
+        _git(node_project, "commit", "-m", "Add requirements")
+        project = node_project.resolve()
+        venv = node_project / ".venv"
+        site_packages = venv / "lib" / "python3.11" / "site-packages"
+        site_packages.mkdir(parents=True)
+        (venv / "bin").mkdir()
+        (venv / "bin" / "pip").write_text(f"#!{project}/.venv/bin/python\n")
+        os.symlink(f"{project}/.venv/bin/pip", venv / "bin" / "pip3")
+        # Editable install of the project itself
+        (site_packages / "_app.pth").write_text(f"{project}/src\n")
+        (site_packages / "__editable___app_finder.py").write_text(
+            f"MAPPING = {{'app': '{project}/src/app'}}\n"
+        )
+        worktree = _add_worktree(node_project, "spec-1")
+
+        results = {r.ecosystem: r for r in share_dependencies(node_project, worktree)}
+
+        assert results["python"].status == "copied"
+        copied = worktree / ".venv"
+        tree = worktree.resolve()
+        assert not copied.is_symlink()
+        assert (copied / "bin" / "pip").read_text() == f"#!{tree}/.venv/bin/python\n"
+        assert os.readlink(copied / "bin" / "pip3") == f"{tree}/.venv/bin/pip"
+        copied_site = copied / "lib" / "python3.11" / "site-packages"
+        assert (copied_site / "_app.pth").read_text() == f"{tree}/src\n"
+        assert f"'{tree}/src/app'" in (
+            copied_site / "__editable___app_finder.py"
+        ).read_text()
+        # The main project's environment is untouched
+        assert (venv / "bin" / "pip").read_text() == f"#!{project}/.venv/bin/python\n"
+        assert (site_packages / "_app.pth").read_text() == f"{project}/src\n"
+
+    def test_concurrent_worktrees(self, node_project):
+        worktrees = [_add_worktree(node_project, f"spec-{i}") for i in range(4)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(lambda w: share_dependencies(node_project, w), worktrees)
+            )
+
+        assert all(r[0].status == "copied" for r in results)
+        assert sum(r[0].cache_created for r in results) == 1
+        entries = list((node_project / DEPENDENCY_CACHE_DIR).iterdir())
+        assert [entry.name.split("-")[0] for entry in entries] == ["node"]
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for Merge Preflight
+=========================
+
+Tests the batched, non-destructive merge conflict check used for spec
+conflict badges and the merge preview.
+
+Covers:
+- Conflicting, clean and missing spec branches in one batch
+- Commits behind/ahead of the base branch
+- Caching by (base SHA, branch SHA) pair
+- Filtering of .auto-claude files
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from core.workspace import merge_preflight
+from core.workspace.merge_preflight import (
+    clear_preflight_cache,
+    preflight_merge,
+    preflight_merges,
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+def _commit_on(repo: Path, branch: str, files: dict[str, str], create=False) -> None:
+    _git(repo, "checkout", "-b" if create else "-q", branch)
+    for name, content in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", f"update {branch}")
+    _git(repo, "checkout", "main")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_preflight_cache()
+    yield
+    clear_preflight_cache()
+
+
+@pytest.fixture
+def spec_repo(temp_git_repo: Path) -> Path:
+    """main plus a conflicting spec, a clean spec, and a main commit after both."""
+    _commit_on(
+        temp_git_repo, "auto-claude/001-conflict", {"README.md": "# Spec\n"}, True
+    )
+    _commit_on(temp_git_repo, "auto-claude/002-clean", {"new.py": "x = 1\n"}, True)
+    (temp_git_repo / "README.md").write_text("# Main\n")
+    _git(temp_git_repo, "commit", "-am", "main change")
+    return temp_git_repo
+
+
+class TestPreflightMerges:
+    """Tests for the batched API."""
+
+    def test_batch_reports_each_branch(self, spec_repo):
+        """Conflicting and clean branches are checked in one call."""
+        results = preflight_merges(spec_repo)
+
+        assert list(results) == ["001-conflict", "002-clean"]
+        conflict = results["001-conflict"]
+        assert conflict.has_conflicts
+        assert conflict.conflicting_files == ["README.md"]
+        assert conflict.base_branch == "main"
+        assert conflict.commits_behind == 1
+        assert conflict.commits_ahead == 1
+        assert conflict.needs_rebase
+
+        clean = results["002-clean"]
+        assert not clean.has_conflicts
+        assert clean.conflicting_files == []
+        assert clean.error is None
+
+    def test_missing_branch_reported(self, spec_repo):
+        """A spec without a branch gets an error instead of raising."""
+        results = preflight_merges(spec_repo, ["002-clean", "999-missing"])
+
+        assert results["999-missing"].error
+        assert not results["999-missing"].has_conflicts
+        assert results["002-clean"].error is None
+
+    def test_explicit_base_branch(self, spec_repo):
+        """Checking against the spec's own fork point finds no conflict."""
+        _git(spec_repo, "branch", "fork-point", "HEAD~1")
+
+        result = preflight_merge(spec_repo, "001-conflict", base_branch="fork-point")
+
+        assert result.base_branch == "fork-point"
+        assert not result.has_conflicts
+        assert result.commits_behind == 0
+
+    def test_auto_claude_files_ignored(self, spec_repo):
+        """Conflicts in .auto-claude/ are not reported as conflicting files."""
+        _commit_on(
+            spec_repo, "auto-claude/003-meta", {".auto-claude/state.json": "{}\n"}, True
+        )
+        _commit_on(spec_repo, "main", {".auto-claude/state.json": "[]\n"})
+
+        result = preflight_merge(spec_repo, "003-meta")
+
+        assert result.conflicting_files == []
+
+
+class TestPreflightCache:
+    """Tests for caching by commit pair."""
+
+    def test_unchanged_branches_skip_git(self, spec_repo, monkeypatch):
+        """A second check with the same SHAs runs no merge-tree."""
+        preflight_merges(spec_repo)
+
+        calls = []
+        original = merge_preflight._merge_tree
+        monkeypatch.setattr(
+            merge_preflight,
+            "_merge_tree",
+            lambda *args: calls.append(args) or original(*args),
+        )
+        results = preflight_merges(spec_repo)
+
+        assert calls == []
+        assert all(result.cached for result in results.values())
+        assert results["001-conflict"].conflicting_files == ["README.md"]
+
+    def test_moved_branch_rechecked(self, spec_repo):
+        """A new commit on the spec branch invalidates only that branch."""
+        preflight_merges(spec_repo)
+        _commit_on(spec_repo, "auto-claude/001-conflict", {"README.md": "# Main\n"})
+
+        results = preflight_merges(spec_repo)
+
+        assert not results["001-conflict"].cached
+        assert not results["001-conflict"].has_conflicts
+        assert results["002-clean"].cached
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for Sparse Checkout Scoping
+=================================
+
+Tests how the sparse-checkout cone of a spec's worktree is seeded.
+
+Covers:
+- Services from the spec mapped through project_index.json
+- Directories of planned files
+- Falling back to a full checkout
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from core.workspace.sparse_checkout import compute_sparse_cone
+
+
+def _write(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def monorepo(tmp_path: Path) -> Path:
+    for service in ["services/api", "services/web", "libs/shared"]:
+        (tmp_path / service).mkdir(parents=True)
+    _write(
+        tmp_path / ".auto-claude" / "project_index.json",
+        {
+            "project_type": "monorepo",
+            "services": {
+                "api": {"path": str(tmp_path / "services" / "api")},
+                "web": {"path": "services/web"},
+                "shared": {"path": "libs/shared"},
+            },
+        },
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def spec_dir(monorepo: Path) -> Path:
+    path = monorepo / ".auto-claude" / "specs" / "001-feature"
+    path.mkdir(parents=True)
+    return path
+
+
+class TestComputeSparseCone:
+    """Tests for compute_sparse_cone."""
+
+    def test_services_and_planned_files(self, monorepo, spec_dir):
+        _write(spec_dir / "requirements.json", {"services_involved": ["api"]})
+        _write(
+            spec_dir / "implementation_plan.json",
+            {
+                "phases": [
+                    {
+                        "subtasks": [
+                            {
+                                "service": "web",
+                                "files_to_modify": ["services/web/src/App.tsx"],
+                            },
+                            {
+                                "files_to_modify": ["docs/api.md", "package.json"],
+                                "files_to_create": ["services/api/new/handler.py"],
+                            },
+                        ]
+                    }
+                ]
+            },
+        )
+
+        cone = compute_sparse_cone(monorepo, spec_dir)
+
+        # Files inside a service are covered by its directory
+        assert cone == ["docs", "services/api", "services/web"]
+
+    def test_context_files_and_services(self, monorepo, spec_dir):
+        _write(
+            spec_dir / "context.json",
+            {
+                "scoped_services": ["shared"],
+                "files_to_modify": [{"path": "tools/build.py"}],
+            },
+        )
+
+        assert compute_sparse_cone(monorepo, spec_dir) == ["libs/shared", "tools"]
+
+    def test_spec_project_index_preferred(self, monorepo, spec_dir):
+        _write(
+            spec_dir / "project_index.json",
+            {"services": {"api": {"path": "services/web"}}},
+        )
+        _write(spec_dir / "requirements.json", {"services_involved": ["api"]})
+
+        assert compute_sparse_cone(monorepo, spec_dir) == ["services/web"]
+
+    @pytest.mark.parametrize(
+        "plan",
+        [
+            # Nothing to seed the cone from
+            {"phases": []},
+            # A subtask spans every service
+            {"phases": [{"subtasks": [{"all_services": True}]}]},
+            # The service is the whole project
+            {"services_involved": ["main"]},
+        ],
+    )
+    def test_full_checkout(self, monorepo, spec_dir, plan):
+        index_path = monorepo / ".auto-claude" / "project_index.json"
+        index = json.loads(index_path.read_text())
+        index["services"]["main"] = {"path": str(monorepo)}
+        _write(index_path, index)
+        _write(spec_dir / "implementation_plan.json", plan)
+
+        assert compute_sparse_cone(monorepo, spec_dir) is None
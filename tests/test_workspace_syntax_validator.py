@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for the Syntax Validator
+==============================
+
+Tests batched syntax validation of merged files.
+
+Covers:
+- In-process Python and JSON validation
+- One esbuild run per batch of TypeScript/JavaScript files
+- Mapping esbuild errors back to the original file paths
+- Content-hash caching
+- Skipping validation when esbuild is unavailable
+"""
+
+import shutil
+import stat
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from core.workspace.git_utils import validate_merged_files, validate_merged_syntax
+from core.workspace.syntax_validator import (
+    SyntaxValidator,
+    find_esbuild,
+    parse_esbuild_errors,
+)
+
+ESBUILD_OUTPUT = """\
+✘ [ERROR] Expected ";" but found "y"
+
+    0.ts:1:6:
+      1 │ let x y
+        │       ^
+        ╵       ;
+
+✘ [ERROR] Unexpected "}"
+
+    2.tsx:3:0:
+      3 │ }
+        ╵ ^
+
+2 errors
+"""
+
+
+@pytest.fixture
+def fake_esbuild(tmp_path: Path) -> Path:
+    """
+    An executable that reports esbuild-style errors for inputs containing
+    "SYNTAX_ERROR" and logs each invocation.
+    """
+    script = tmp_path / "bin" / "esbuild"
+    script.parent.mkdir()
+    script.write_text(
+        textwrap.dedent(
+            f"""\
+            #!{sys.executable}
+            import sys
+            from pathlib import Path
+
+            with open({str(tmp_path / "calls.log")!r}, "a") as log:
+                log.write(" ".join(sys.argv[1:]) + "\\n")
+            failed = False
+            for name in sys.argv[1:]:
+                if name.startswith("--"):
+                    continue
+                for lineno, line in enumerate(Path(name).read_text().splitlines(), 1):
+                    if "SYNTAX_ERROR" in line:
+                        failed = True
+                        sys.stderr.write(
+                            f"✘ [ERROR] Unexpected token\\n\\n    {{name}}:{{lineno}}:0:\\n\\n"
+                        )
+            sys.exit(1 if failed else 0)
+            """
+        )
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return script
+
+
+def _esbuild_calls(tmp_path: Path) -> int:
+    log = tmp_path / "calls.log"
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+class TestInProcessValidation:
+    """Tests for Python and JSON checks."""
+
+    def test_python(self, tmp_path):
+        validator = SyntaxValidator(tmp_path)
+
+        assert validator.validate("ok.py", "x = 1\n") == (True, "")
+        is_valid, error = validator.validate("bad.py", "def f(:\n")
+        assert not is_valid
+        assert error.startswith("Python syntax error:")
+        assert "line 1" in error
+
+    def test_json(self, tmp_path):
+        validator = SyntaxValidator(tmp_path)
+
+        assert validator.validate("a.json", '{"a": 1}') == (True, "")
+        assert not validator.validate("b.json", '{"a": }')[0]
+
+    def test_unknown_types_pass(self, tmp_path):
+        assert SyntaxValidator(tmp_path).validate("style.css", "}{") == (True, "")
+
+
+class TestEsbuildValidation:
+    """Tests for batched TypeScript/JavaScript checks."""
+
+    def test_batch_uses_one_run(self, tmp_path, fake_esbuild):
+        """Every TS/JS file of a batch goes through a single esbuild run."""
+        validator = SyntaxValidator(tmp_path, esbuild_path=str(fake_esbuild))
+        files = {
+            f"src/components/File{i}.tsx": f"export const a{i} = {i};\n"
+            for i in range(10)
+        }
+        files["src/broken.ts"] = "const a = 1;\nSYNTAX_ERROR\n"
+        files["app.py"] = "x = 1\n"
+
+        results = validator.validate_many(files)
+
+        assert _esbuild_calls(tmp_path) == 1
+        assert validator.stats.esbuild_runs == 1
+        assert results["src/broken.ts"] == (
+            False,
+            "Syntax error: Unexpected token at line 2",
+        )
+        assert all(
+            results[path] == (True, "") for path in files if path != "src/broken.ts"
+        )
+
+    def test_same_name_in_different_dirs(self, tmp_path, fake_esbuild):
+        """Errors map back to the right file when base names collide."""
+        validator = SyntaxValidator(tmp_path, esbuild_path=str(fake_esbuild))
+
+        results = validator.validate_many(
+            {"a/index.ts": "ok\n", "b/index.ts": "SYNTAX_ERROR\n"}
+        )
+
+        assert results["a/index.ts"][0]
+        assert not results["b/index.ts"][0]
+
+    def test_results_cached_by_content(self, tmp_path, fake_esbuild):
+        """Unchanged content isn't re-validated, even under another path."""
+        validator = SyntaxValidator(tmp_path, esbuild_path=str(fake_esbuild))
+        validator.validate_many({"a.ts": "SYNTAX_ERROR\n", "b.ts": "ok\n"})
+
+        results = validator.validate_many({"c.ts": "SYNTAX_ERROR\n", "b.ts": "ok\n"})
+
+        assert _esbuild_calls(tmp_path) == 1
+        assert validator.stats.cache_hits == 2
+        assert not results["c.ts"][0]
+        assert results["b.ts"][0]
+
+    def test_missing_esbuild_skips_validation(self, tmp_path, monkeypatch):
+        """Without esbuild, TS/JS files are reported valid and not cached."""
+        monkeypatch.setattr(shutil, "which", lambda name: None)
+        validator = SyntaxValidator(tmp_path)
+
+        assert validator.validate("a.ts", "SYNTAX_ERROR\n") == (True, "")
+        assert validator.esbuild_path is None
+        assert validator.stats.esbuild_runs == 0
+
+    def test_esbuild_located_once(self, tmp_path, fake_esbuild):
+        """The node_modules search runs once per validator."""
+        bin_dir = tmp_path / "node_modules" / ".bin"
+        bin_dir.mkdir(parents=True)
+        shutil.copy(fake_esbuild, bin_dir / "esbuild")
+
+        assert find_esbuild(tmp_path) == str(bin_dir / "esbuild")
+
+        validator = SyntaxValidator(tmp_path)
+        validator.validate_many({"a.ts": "ok\n"})
+        shutil.rmtree(tmp_path / "node_modules")
+        validator.validate_many({"b.ts": "SYNTAX_ERROR\n"})
+
+        assert validator.esbuild_path == str(bin_dir / "esbuild")
+
+
+class TestHelpers:
+    """Tests for module-level helpers."""
+
+    def test_parse_esbuild_errors(self):
+        errors = parse_esbuild_errors(ESBUILD_OUTPUT)
+
+        assert errors == {
+            "0.ts": ['Expected ";" but found "y" at line 1'],
+            "2.tsx": ['Unexpected "}" at line 3'],
+        }
+
+    def test_git_utils_wrappers(self, tmp_path):
+        """The git_utils entry points delegate to the shared validator."""
+        assert validate_merged_syntax("a.py", "x = (\n", tmp_path)[0] is False
+        results = validate_merged_files({"a.py": "x = 1\n", "b.json": "[]"}, tmp_path)
+        assert results == {"a.py": (True, ""), "b.json": (True, "")}
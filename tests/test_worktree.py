@@ -11,12 +11,21 @@ Tests the worktree.py module functionality including:
 - Change tracking
 """
 
+import asyncio
 import subprocess
 from pathlib import Path
 
 import pytest
 
-from worktree import WorktreeManager, WorktreeInfo, WorktreeError, STAGING_WORKTREE_NAME
+from worktree import (
+    WorktreeManager,
+    WorktreeInfo,
+    WorktreeError,
+    STAGING_WORKTREE_NAME,
+    clear_worktree_stats_cache,
+    create_sparse_checkout_hook,
+    sparse_cone_covers,
+)
 
 
 class TestWorktreeManagerInitialization:
@@ -194,6 +203,21 @@ class TestWorktreeRemoval:
 
         assert not info.path.exists()
 
+    def test_remove_worktree_closes_object_reader(self, temp_git_repo: Path):
+        """Removing a worktree closes its git cat-file reader."""
+        from merge import git_object_reader
+
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        info = manager.create_worktree("test-spec")
+        reader = git_object_reader.get_object_reader(info.path)
+        assert reader.resolve("HEAD")
+
+        manager.remove_worktree("test-spec")
+
+        assert reader._check._proc is None
+        assert info.path.resolve() not in git_object_reader._readers
+
     def test_remove_staging(self, temp_git_repo: Path):
         """Can remove staging worktree."""
         manager = WorktreeManager(temp_git_repo)
@@ -439,3 +463,313 @@ class TestWorktreeUtilities:
         commands = manager.get_test_commands("test-spec")
 
         assert any("npm" in cmd for cmd in commands)
+
+
+class TestWorktreePool:
+    """Tests for the opt-in warm worktree pool."""
+
+    def _git(self, cwd: Path, *args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True
+        ).stdout.strip()
+
+    def test_pool_disabled_by_default(self, temp_git_repo: Path, monkeypatch):
+        """Without a configured size, no pool worktrees are created."""
+        monkeypatch.delenv("WORKTREE_POOL_SIZE", raising=False)
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+
+        manager.create_worktree("test-spec")
+        manager.wait_for_pool()
+
+        assert manager.pool_size == 0
+        assert not manager.pool_dir.exists()
+
+    def test_pool_size_from_env(self, temp_git_repo: Path, monkeypatch):
+        """WORKTREE_POOL_SIZE enables the pool."""
+        monkeypatch.setenv("WORKTREE_POOL_SIZE", "3")
+
+        assert WorktreeManager(temp_git_repo).pool_size == 3
+
+    def test_fill_pool(self, temp_git_repo: Path):
+        """fill_pool adds detached worktrees at the base tip up to the size."""
+        manager = WorktreeManager(temp_git_repo, pool_size=2)
+        manager.setup()
+
+        assert manager.fill_pool() == 2
+        assert manager.fill_pool() == 0
+
+        base = self._git(temp_git_repo, "rev-parse", "main")
+        slots = manager._pooled_worktrees()
+        assert len(slots) == 2
+        for slot in slots:
+            assert self._git(slot, "rev-parse", "HEAD") == base
+            assert self._git(slot, "branch", "--show-current") == ""
+
+    def test_create_claims_pooled_worktree(self, temp_git_repo: Path):
+        """create_worktree switches a pooled worktree to the spec branch."""
+        manager = WorktreeManager(temp_git_repo, pool_size=1)
+        manager.setup()
+        manager.fill_pool()
+        slot = manager._pooled_worktrees()[0]
+
+        info = manager.create_worktree("test-spec")
+
+        assert not slot.exists()
+        assert info.path == manager.get_worktree_path("test-spec")
+        assert self._git(info.path, "branch", "--show-current") == "auto-claude/test-spec"
+        assert (info.path / "README.md").exists()
+
+        manager.wait_for_pool()
+        assert len(manager._pooled_worktrees()) == 1
+
+    def test_claim_resets_to_new_base_tip(self, temp_git_repo: Path):
+        """A pooled worktree made before main moved starts at the new tip."""
+        manager = WorktreeManager(temp_git_repo, pool_size=1)
+        manager.setup()
+        manager.fill_pool()
+        (temp_git_repo / "new.txt").write_text("new\n")
+        self._git(temp_git_repo, "add", "new.txt")
+        self._git(temp_git_repo, "commit", "-m", "Advance main")
+
+        info = manager.create_worktree("test-spec")
+
+        assert self._git(info.path, "rev-parse", "HEAD") == self._git(
+            temp_git_repo, "rev-parse", "main"
+        )
+        assert (info.path / "new.txt").exists()
+        manager.wait_for_pool()
+
+    def test_remove_recycles_clean_worktree(self, temp_git_repo: Path):
+        """Removing a spec worktree cleans it and returns it to the pool."""
+        manager = WorktreeManager(temp_git_repo, pool_size=1)
+        manager.setup()
+        info = manager.create_worktree("test-spec")
+        manager.wait_for_pool()
+        manager.drain_pool()
+
+        (info.path / "scratch.txt").write_text("untracked\n")
+        (info.path / "README.md").write_text("modified\n")
+        manager.remove_worktree("test-spec", delete_branch=True)
+
+        assert not info.path.exists()
+        slots = manager._pooled_worktrees()
+        assert len(slots) == 1
+        assert not (slots[0] / "scratch.txt").exists()
+        assert (slots[0] / "README.md").read_text() == "# Test Project\n"
+        assert "auto-claude/test-spec" not in self._git(temp_git_repo, "branch")
+
+    def test_pool_hidden_from_listing_and_cleanup(self, temp_git_repo: Path):
+        """Pool worktrees are not listed as specs or removed as stale."""
+        manager = WorktreeManager(temp_git_repo, pool_size=1)
+        manager.setup()
+        manager.fill_pool()
+
+        manager.cleanup_stale_worktrees()
+
+        assert manager.list_all_worktrees() == []
+        assert len(manager._pooled_worktrees()) == 1
+
+        manager.cleanup_all()
+        assert not manager.pool_dir.exists()
+
+
+class TestWorktreeStatusListing:
+    """Tests for the batched worktree status listing."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        clear_worktree_stats_cache()
+        yield
+        clear_worktree_stats_cache()
+
+    def _commit(self, path: Path, name: str, content: str) -> None:
+        (path / name).write_text(content)
+        subprocess.run(["git", "add", "."], cwd=path, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", f"Add {name}"], cwd=path, capture_output=True
+        )
+
+    def _count_git(self, manager: WorktreeManager, monkeypatch) -> list:
+        calls = []
+        original = manager._run_git
+
+        def counting(args, *rest, **kwargs):
+            calls.append(args[0])
+            return original(args, *rest, **kwargs)
+
+        monkeypatch.setattr(manager, "_run_git", counting)
+        return calls
+
+    def test_matches_per_worktree_info(self, temp_git_repo: Path):
+        """Batched listing reports the same stats as get_worktree_info."""
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        first = manager.create_worktree("spec-1")
+        manager.create_worktree("spec-2")
+        self._commit(first.path, "a.txt", "one\ntwo\n")
+        self._commit(first.path, "b.txt", "three\n")
+
+        listed = {info.spec_name: info for info in manager.list_all_worktrees()}
+
+        assert set(listed) == {"spec-1", "spec-2"}
+        assert listed["spec-1"].branch == "auto-claude/spec-1"
+        assert listed["spec-1"].commit_count == 2
+        assert listed["spec-1"].files_changed == 2
+        assert listed["spec-1"].additions == 3
+        assert listed["spec-2"].commit_count == 0
+        for name, info in listed.items():
+            single = manager.get_worktree_info(name)
+            assert (info.commit_count, info.files_changed, info.additions) == (
+                single.commit_count,
+                single.files_changed,
+                single.additions,
+            )
+
+    def test_unchanged_branches_use_cache(self, temp_git_repo: Path, monkeypatch):
+        """A second listing runs only the single for-each-ref."""
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        manager.create_worktree("spec-1")
+        manager.create_worktree("spec-2")
+        manager.list_all_worktrees()
+
+        calls = self._count_git(manager, monkeypatch)
+        manager.list_all_worktrees()
+
+        assert calls == ["for-each-ref"]
+
+    def test_moved_branch_recomputed(self, temp_git_repo: Path):
+        """A new commit on a spec branch refreshes its stats."""
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        info = manager.create_worktree("spec-1")
+        assert manager.list_all_worktrees()[0].commit_count == 0
+
+        self._commit(info.path, "a.txt", "one\n")
+
+        assert manager.list_all_worktrees()[0].commit_count == 1
+
+
+class TestSparseWorktree:
+    """Tests for sparse-checkout worktrees."""
+
+    @pytest.fixture
+    def monorepo(self, temp_git_repo: Path) -> Path:
+        for name in ["services/api/app.py", "services/web/index.js", "libs/util.py"]:
+            path = temp_git_repo / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"# {name}\n")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add services"],
+            cwd=temp_git_repo,
+            capture_output=True,
+        )
+        return temp_git_repo
+
+    def test_only_cone_checked_out(self, monorepo: Path):
+        """A sparse worktree has top-level files and the cone directories only."""
+        manager = WorktreeManager(monorepo, sparse=True)
+        manager.setup()
+
+        info = manager.create_worktree("test-spec", sparse_cone=["services/api"])
+
+        assert info.sparse_cone == ["services/api"]
+        assert info.creation_seconds is not None
+        assert (info.path / "README.md").exists()
+        assert (info.path / "services" / "api" / "app.py").exists()
+        assert not (info.path / "services" / "web").exists()
+        assert not (info.path / "libs").exists()
+        assert manager.get_sparse_cone("test-spec") == ["services/api"]
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=info.path,
+            capture_output=True,
+            text=True,
+        )
+        assert status.stdout == ""
+
+    def test_full_checkout_without_cone(self, monorepo: Path):
+        """Without a cone, worktrees are full checkouts."""
+        manager = WorktreeManager(monorepo, sparse=True)
+        manager.setup()
+
+        info = manager.create_worktree("test-spec")
+
+        assert info.sparse_cone is None
+        assert (info.path / "libs" / "util.py").exists()
+        assert manager.get_sparse_cone("test-spec") is None
+
+    def test_disk_usage_smaller_than_full(self, monorepo: Path):
+        """Disk use only counts checked-out files."""
+        manager = WorktreeManager(monorepo)
+        manager.setup()
+        manager.create_worktree("sparse", sparse_cone=["libs"])
+        manager.create_worktree("full")
+
+        assert 0 < manager.get_disk_usage("sparse") < manager.get_disk_usage("full")
+
+    def test_expand_cone(self, monorepo: Path):
+        """Expanding the cone checks out the directory, once."""
+        manager = WorktreeManager(monorepo)
+        manager.setup()
+        info = manager.create_worktree("test-spec", sparse_cone=["services/api"])
+
+        assert manager.expand_sparse_cone("test-spec", ["libs"]) == ["libs"]
+        assert manager.expand_sparse_cone("test-spec", ["libs", "services/api"]) == []
+        assert (info.path / "libs" / "util.py").exists()
+
+    def test_hook_expands_for_tool_paths(self, monorepo: Path):
+        """File tools outside the cone expand it; paths inside it don't."""
+        manager = WorktreeManager(monorepo)
+        manager.setup()
+        info = manager.create_worktree("test-spec", sparse_cone=["services/api"])
+        hook = create_sparse_checkout_hook(info.path)
+
+        def run(tool_name, **tool_input):
+            return asyncio.run(
+                hook({"tool_name": tool_name, "tool_input": tool_input})
+            )
+
+        assert run("Read", file_path=str(info.path / "services/web/index.js")) == {}
+        assert run("Write", file_path="libs/new/module.py") == {}
+        assert run("Read", file_path="README.md") == {}
+        assert run("Bash", command="ls libs") == {}
+
+        assert (info.path / "services" / "web" / "index.js").exists()
+        assert manager.get_sparse_cone("test-spec") == [
+            "libs/new",
+            "services/api",
+            "services/web",
+        ]
+
+        # A file written in the new directory can be committed
+        (info.path / "libs" / "new").mkdir(parents=True)
+        (info.path / "libs" / "new" / "module.py").write_text("x = 1\n")
+        result = subprocess.run(
+            ["git", "add", "libs/new/module.py"], cwd=info.path, capture_output=True
+        )
+        assert result.returncode == 0
+
+    def test_sparse_worktree_not_recycled(self, monorepo: Path):
+        """Sparse worktrees are removed rather than returned to the pool."""
+        manager = WorktreeManager(monorepo, pool_size=1)
+        manager.setup()
+        info = manager.create_worktree("test-spec", sparse_cone=["libs"])
+
+        manager.remove_worktree("test-spec", delete_branch=True)
+
+        assert not info.path.exists()
+        assert manager._pooled_worktrees() == []
+
+    def test_cone_covers(self):
+        cone = ["services/api"]
+
+        assert sparse_cone_covers(cone, "README.md")
+        assert sparse_cone_covers(cone, "services/api/src/app.py")
+        assert sparse_cone_covers(cone, "services/top.py")
+        assert not sparse_cone_covers(cone, "services/web/index.js")
+        assert sparse_cone_covers(cone, "services/api/src", is_dir=True)
+        assert not sparse_cone_covers(cone, "services", is_dir=True)
+